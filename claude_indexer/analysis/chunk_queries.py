@@ -0,0 +1,161 @@
+"""Compiled tree-sitter queries for implementation chunk metadata."""
+
+from collections.abc import Iterable
+from typing import Any
+
+try:
+    from tree_sitter import Query
+
+    try:
+        from tree_sitter import QueryCursor
+    except ImportError:  # tree-sitter < 0.25 runs queries on the Query itself
+        QueryCursor = None
+
+    TREE_SITTER_AVAILABLE = True
+except ImportError:
+    TREE_SITTER_AVAILABLE = False
+
+
+PYTHON_CHUNK_QUERY = """
+(call function: [
+  (identifier) @call
+  (attribute attribute: (identifier) @call)
+])
+
+(attribute object: (identifier) attribute: (identifier)) @attribute
+
+(raise_statement . [(identifier) (attribute)] @raise)
+(raise_statement . (call function: [(identifier) (attribute)] @raise))
+
+(except_clause [(identifier) (attribute)] @except)
+(except_clause (tuple [(identifier) (attribute)] @except))
+(except_clause (as_pattern . [(identifier) (attribute)] @except))
+(except_clause (as_pattern . (tuple [(identifier) (attribute)] @except)))
+
+[
+  (if_statement)
+  (elif_clause)
+  (for_statement)
+  (while_statement)
+  (try_statement)
+  (except_clause)
+  (with_statement)
+  (conditional_expression)
+  (for_in_clause)
+  (if_clause)
+  (case_clause)
+] @branch
+
+(function_definition) @function
+"""
+
+JAVASCRIPT_CHUNK_QUERY = """
+(call_expression function: [
+  (identifier) @call
+  (member_expression property: (property_identifier) @call)
+])
+(new_expression constructor: (identifier) @call)
+
+[
+  (if_statement)
+  (for_statement)
+  (for_in_statement)
+  (while_statement)
+  (do_statement)
+  (switch_case)
+  (catch_clause)
+  (ternary_expression)
+] @branch
+(binary_expression operator: ["&&" "||" "??"]) @branch
+"""
+
+
+class ChunkQuery:
+    """One compiled query, run over the subtree of each implementation chunk.
+
+    Compiling a query is far more expensive than running it, so parsers build
+    one per language and reuse it for every chunk. A single pass over the
+    chunk's syntax tree then yields calls, attribute accesses, exceptions and
+    branches, skipping strings and comments that text patterns would match.
+    """
+
+    def __init__(self, language: Any, source: str):
+        self._query = Query(language, source)
+
+    def captures(self, node: Any) -> dict[str, list[Any]]:
+        """Run the query over ``node``'s subtree.
+
+        Returns:
+            Captured nodes by capture name, each list in source order
+        """
+        if QueryCursor is not None:
+            captures = QueryCursor(self._query).captures(node)
+        else:
+            captures = self._query.captures(node)
+            if isinstance(captures, list):  # tree-sitter < 0.23
+                grouped: dict[str, list[Any]] = {}
+                for captured, name in captures:
+                    grouped.setdefault(name, []).append(captured)
+                captures = grouped
+        return {
+            name: sorted(nodes, key=lambda n: n.start_byte)
+            for name, nodes in captures.items()
+        }
+
+
+def python_chunk_metadata(query: ChunkQuery, node: Any) -> dict[str, Any]:
+    """Semantic metadata for a Python function or class implementation chunk.
+
+    Calls made inside a class's methods belong to the methods' own chunks,
+    so class chunks only report calls made at class level (base classes,
+    decorators, attribute initializers).
+
+    Args:
+        query: Query compiled from PYTHON_CHUNK_QUERY
+        node: ``function_definition`` or ``class_definition`` node
+
+    Returns:
+        Dict with calls, imports_used, exceptions_handled, exceptions_raised
+        and complexity
+    """
+    captures = query.captures(node)
+    calls = captures.get("call", [])
+    if node.type == "class_definition":
+        methods = [
+            (f.start_byte, f.end_byte) for f in captures.get("function", []) if f != node
+        ]
+        calls = [
+            call
+            for call in calls
+            if not any(start <= call.start_byte < end for start, end in methods)
+        ]
+
+    return {
+        "calls": _unique_texts(calls),
+        "imports_used": _unique_texts(captures.get("attribute", [])),
+        "exceptions_handled": _unique_texts(captures.get("except", [])),
+        "exceptions_raised": _unique_texts(captures.get("raise", [])),
+        "complexity": 1 + len(captures.get("branch", [])),
+    }
+
+
+def javascript_chunk_metadata(query: ChunkQuery, node: Any) -> dict[str, Any]:
+    """Semantic metadata for a JavaScript or TypeScript function chunk.
+
+    Args:
+        query: Query compiled from JAVASCRIPT_CHUNK_QUERY for the file's grammar
+        node: Function node
+
+    Returns:
+        Dict with calls and complexity
+    """
+    captures = query.captures(node)
+    return {
+        "calls": _unique_texts(captures.get("call", [])),
+        "complexity": 1 + len(captures.get("branch", [])),
+    }
+
+
+def _unique_texts(nodes: Iterable[Any]) -> list[str]:
+    """Node texts without duplicates, in order of first appearance."""
+    return list(dict.fromkeys(n.text.decode("utf-8") for n in nodes))
@@ -3,6 +3,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Literal
 
@@ -64,15 +65,20 @@ class EntityChunk:
                 f"chunk_type must be 'metadata' or 'implementation', got: {self.chunk_type}"
             )
 
-    def to_vector_payload(self) -> dict[str, Any]:
-        """Convert to Qdrant payload format with progressive disclosure support."""
+    @cached_property
+    def content_hash(self) -> str:
+        """SHA256 of the chunk content, computed once per chunk."""
         from ..storage.qdrant import ContentHashMixin
 
+        return ContentHashMixin.compute_content_hash(self.content)
+
+    def to_vector_payload(self) -> dict[str, Any]:
+        """Convert to Qdrant payload format with progressive disclosure support."""
         payload = {
             "entity_name": self.entity_name,
             "chunk_type": self.chunk_type,
             "content": self.content,
-            "content_hash": ContentHashMixin.compute_content_hash(self.content),
+            "content_hash": self.content_hash,
             "created_at": datetime.now().isoformat(),
             "metadata": self.metadata,
         }
@@ -252,6 +258,13 @@ class RelationChunk:
         if not (0.0 <= self.confidence <= 1.0):
             raise ValueError("Confidence must be between 0.0 and 1.0")
 
+    @cached_property
+    def content_hash(self) -> str:
+        """SHA256 of the chunk content, computed once per chunk."""
+        from ..storage.qdrant import ContentHashMixin
+
+        return ContentHashMixin.compute_content_hash(self.content)
+
     @classmethod
     def from_relation(cls, relation: "Relation") -> "RelationChunk":
         """Create a RelationChunk from a Relation."""
@@ -290,15 +303,13 @@ class RelationChunk:
 
     def to_vector_payload(self) -> dict[str, Any]:
         """Convert relation chunk to vector storage payload."""
-        from ..storage.qdrant import ContentHashMixin
-
         payload: dict[str, Any] = {
             "chunk_type": "relation",
             "entity_name": self.from_entity,  # Primary entity for search
             "relation_target": self.to_entity,
             "relation_type": self.relation_type.value,
             "content": self.content,
-            "content_hash": ContentHashMixin.compute_content_hash(self.content),
+            "content_hash": self.content_hash,
             "created_at": datetime.now().isoformat(),
             "type": "chunk",
         }
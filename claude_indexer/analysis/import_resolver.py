@@ -0,0 +1,289 @@
+"""Jedi-free resolution of Python imports from a tree-sitter syntax tree."""
+
+import ast
+import sys
+from importlib.machinery import EXTENSION_SUFFIXES
+from pathlib import Path
+from typing import Any, NamedTuple
+
+# Suffixes of files that make a name importable as a module
+MODULE_SUFFIXES = (".py", ".pyi", *EXTENSION_SUFFIXES)
+PACKAGE_INITS = ("__init__.py", "__init__.pyi")
+
+# Statements that can contain other statements (and so nested imports)
+_NON_STATEMENT_CONTAINERS = frozenset(
+    {"expression_statement", "return_statement", "comment", "pass_statement"}
+)
+
+
+class ImportedName(NamedTuple):
+    """A name bound by an import statement, as Jedi's get_names reports it."""
+
+    name: str  # Name bound in the importing module
+    full_name: str | None  # Dotted path of the import, None for relative imports
+    is_module: bool  # Whether the bound value is a module
+
+
+class _ModuleLocation(NamedTuple):
+    kind: str  # "package", "module", "builtin" or "missing"
+    dirs: tuple[Path, ...] = ()
+    source: Path | None = None  # Module file or package __init__, if Python source
+
+
+_MISSING = _ModuleLocation("missing")
+
+
+def _default_search_paths(project_path: Path) -> list[Path]:
+    """Directories Jedi searches for imports made from the project.
+
+    The project comes first, then Jedi's bundled standard library stubs, then
+    the sys.path of the environment Jedi analyzes against (which, unlike this
+    process's sys.path, has not been modified at runtime).
+    """
+    try:
+        import jedi
+    except ImportError:
+        return [project_path, *(Path(p) for p in sys.path if p)]
+
+    typeshed = Path(jedi.__file__).parent / "third_party" / "typeshed" / "stdlib"
+    try:
+        environment = jedi.Project(str(project_path)).get_environment()
+        sys_path = environment.get_sys_path()
+    except Exception:
+        sys_path = sys.path
+    return [
+        project_path,
+        *(p for p in (typeshed, typeshed / "3", typeshed / "2and3") if p.is_dir()),
+        *(Path(p) for p in sys_path if p),
+    ]
+
+
+class ImportResolver:
+    """Finds the names import statements bind and whether each is a module.
+
+    This reproduces the module names ``jedi.Script.get_names`` reports for a
+    file using only the tree-sitter tree and the filesystem, so IMPORTS
+    relations can be built without Jedi. ``import a.b`` binds the module
+    ``a``; ``from a import b`` binds a module when ``b`` is a submodule of
+    ``a``, or when Jedi could not infer ``b`` and falls back to reporting a
+    module: ``a`` cannot be found, or ``a`` is a project module that does not
+    define ``b``.
+
+    Lookups search the project first, then Jedi's bundled stdlib stubs, then
+    ``sys.path``. Module locations are cached until clear_cache(); the names
+    a module defines are cached per file size and mtime.
+    """
+
+    def __init__(self, project_path: Path, search_paths: list[Path] | None = None):
+        self.project_path = Path(project_path)
+        self._search_paths: tuple[Path, ...] | None = None
+        if search_paths is not None:
+            self._search_paths = tuple(p for p in search_paths if p.is_dir())
+        self._locations: dict[tuple[Any, ...], _ModuleLocation] = {}
+        self._definitions: dict[tuple[Path, int, int], frozenset[str] | None] = {}
+
+    def imported_names(self, root: "Any", file_path: Path) -> list[ImportedName]:
+        """Collect names bound by imports anywhere in a module, in source order.
+
+        Args:
+            root: Root node of the file's tree-sitter tree
+            file_path: Path of the parsed file, for relative imports
+
+        Returns:
+            One entry per bound name, including imports nested in functions
+        """
+        names: list[ImportedName] = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if node.type == "import_statement":
+                names.extend(self._names_from_import(node))
+            elif node.type == "import_from_statement":
+                names.extend(self._names_from_import_from(node, file_path))
+            elif node.type not in _NON_STATEMENT_CONTAINERS:
+                stack.extend(reversed(node.children))
+        return names
+
+    def _get_search_paths(self) -> tuple[Path, ...]:
+        # Resolved on first use; querying Jedi's environment starts a subprocess
+        if self._search_paths is None:
+            self._search_paths = tuple(
+                p for p in _default_search_paths(self.project_path) if p.is_dir()
+            )
+        return self._search_paths
+
+    def clear_cache(self) -> None:
+        """Forget cached module locations, e.g. after files were added."""
+        self._locations.clear()
+        self._definitions.clear()
+
+    def _names_from_import(self, node: Any) -> list[ImportedName]:
+        """``import a.b`` binds ``a``; ``import a.b as c`` binds ``c``."""
+        names = []
+        for child in node.named_children:
+            if child.type == "dotted_name":
+                first = _text(child.named_children[0])
+                names.append(ImportedName(first, first, True))
+            elif child.type == "aliased_import":
+                alias = child.child_by_field_name("alias")
+                dotted = child.child_by_field_name("name")
+                if alias is not None and dotted is not None:
+                    names.append(ImportedName(_text(alias), _text(dotted), True))
+        return names
+
+    def _names_from_import_from(
+        self, node: Any, file_path: Path
+    ) -> list[ImportedName]:
+        module_node = node.child_by_field_name("module_name")
+        if module_node is None:
+            return []
+
+        level, module_parts = _split_module(module_node)
+        names = []
+        for child in node.children_by_field_name("name"):
+            if child.type == "aliased_import":
+                target = child.child_by_field_name("name")
+                alias = child.child_by_field_name("alias")
+                if target is None or alias is None:
+                    continue
+                imported, bound = _text(target), _text(alias)
+            else:
+                imported = bound = _text(child)
+
+            # Jedi has no dotted path for relative imports
+            full_name = None if level else ".".join((*module_parts, imported))
+            is_module = self._is_submodule(file_path, level, module_parts, imported)
+            names.append(ImportedName(bound, full_name, is_module))
+        return names
+
+    def _is_submodule(
+        self, file_path: Path, level: int, module_parts: tuple[str, ...], name: str
+    ) -> bool:
+        """Check whether ``from <module> import <name>`` imports a module."""
+        location = self._locate(file_path, level, module_parts)
+        if location.kind == "missing":
+            return True
+        if location.kind == "package" and self._find_in(location.dirs, name).kind != "missing":
+            return True
+        # Names a project module does not define cannot be inferred either
+        if location.source is not None and location.source.is_relative_to(
+            self.project_path
+        ):
+            defined = self._defined_names(location.source)
+            return defined is not None and name not in defined
+        return False
+
+    def _defined_names(self, module_file: Path) -> frozenset[str] | None:
+        """Names bound at module level, or None if they cannot be known statically."""
+        try:
+            stat = module_file.stat()
+        except OSError:
+            return None
+        # Edited modules get a new key; stale entries are dropped by clear_cache()
+        key = (module_file, stat.st_mtime_ns, stat.st_size)
+        if key in self._definitions:
+            return self._definitions[key]
+
+        names: set[str] | None = set()
+        try:
+            body = list(ast.parse(module_file.read_bytes()).body)
+        except (OSError, SyntaxError, ValueError):
+            body, names = [], None
+        while body and names is not None:
+            node = body.pop()
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                names.add(node.name)
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                for alias in node.names:
+                    if alias.name == "*":
+                        names = None
+                        break
+                    names.add(alias.asname or alias.name.split(".")[0])
+            elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+                targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                for target in targets:
+                    names.update(
+                        n.id for n in ast.walk(target) if isinstance(n, ast.Name)
+                    )
+            elif isinstance(node, (ast.If, ast.Try, ast.With, ast.For, ast.While)):
+                # Module-level bindings inside blocks, e.g. try/except imports
+                for field in ("body", "orelse", "finalbody"):
+                    body.extend(getattr(node, field, []))
+                for handler in getattr(node, "handlers", []):
+                    body.extend(handler.body)
+
+        result = frozenset(names) if names is not None else None
+        self._definitions[key] = result
+        return result
+
+    def _locate(
+        self, file_path: Path, level: int, parts: tuple[str, ...]
+    ) -> _ModuleLocation:
+        """Find a module the way the import system would, without importing it."""
+        anchor = file_path.parent if level else None
+        key = (anchor, level, parts)
+        location = self._locations.get(key)
+        if location is not None:
+            return location
+
+        if level:
+            package = file_path.parent
+            for _ in range(level - 1):
+                package = package.parent
+            location = _ModuleLocation("package", (package,))
+        elif parts and parts[0] in sys.builtin_module_names:
+            location = _ModuleLocation("builtin")
+            parts = ()
+        else:
+            location = _ModuleLocation("package", self._get_search_paths())
+
+        for part in parts:
+            if location.kind != "package":
+                location = _MISSING
+                break
+            location = self._find_in(location.dirs, part)
+
+        self._locations[key] = location
+        return location
+
+    @staticmethod
+    def _find_in(dirs: tuple[Path, ...], name: str) -> _ModuleLocation:
+        """Find ``name`` as a package or module in the first directory that has it.
+
+        Regular packages and modules win over namespace package portions,
+        which are merged across directories.
+        """
+        namespace_dirs = []
+        for directory in dirs:
+            candidate = directory / name
+            if candidate.is_dir():
+                for init in PACKAGE_INITS:
+                    if (candidate / init).is_file():
+                        return _ModuleLocation("package", (candidate,), candidate / init)
+                namespace_dirs.append(candidate)
+            for suffix in MODULE_SUFFIXES:
+                module_file = directory / f"{name}{suffix}"
+                if module_file.is_file():
+                    is_source = suffix in (".py", ".pyi")
+                    return _ModuleLocation("module", (), module_file if is_source else None)
+        if namespace_dirs:
+            return _ModuleLocation("package", tuple(namespace_dirs))
+        return _MISSING
+
+
+def _split_module(module_node: Any) -> tuple[int, tuple[str, ...]]:
+    """Split a from-import module into its relative level and dotted parts."""
+    if module_node.type == "relative_import":
+        level = 0
+        parts: tuple[str, ...] = ()
+        for child in module_node.children:
+            if child.type == "import_prefix":
+                level = len(_text(child).strip())
+            elif child.type == "dotted_name":
+                parts = tuple(_text(part) for part in child.named_children)
+        return level, parts
+    return 0, tuple(_text(part) for part in module_node.named_children)
+
+
+def _text(node: Any) -> str:
+    return node.text.decode("utf-8")
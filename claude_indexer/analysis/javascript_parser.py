@@ -5,6 +5,7 @@ from typing import Any
 from tree_sitter import Node
 
 from .base_parsers import TreeSitterParser
+from .chunk_queries import JAVASCRIPT_CHUNK_QUERY, ChunkQuery, javascript_chunk_metadata
 from .entities import (
     Entity,
     EntityChunk,
@@ -14,12 +15,14 @@ from .entities import (
     RelationFactory,
 )
 from .parser import ParserResult
+from .symbol_index import SymbolIndex
 
 
 class JavaScriptParser(TreeSitterParser):
     """Parse JS/TS files with tree-sitter, optional TSServer for semantics."""
 
     SUPPORTED_EXTENSIONS = [".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs"]
+    resolves_project_calls = True
 
     def __init__(self, config: dict[str, Any] = None):
         import tree_sitter_javascript as tsjs
@@ -39,6 +42,9 @@ class JavaScriptParser(TreeSitterParser):
             self.ts_language = None
             self.tsx_language = None
 
+        # Chunk metadata queries, compiled once per grammar on first use
+        self._chunk_queries: dict[str, ChunkQuery] = {}
+
     def parse_tree(self, content: str, file_path: Path = None):
         """Parse content with appropriate language based on file extension."""
         if file_path and file_path.suffix in [".ts"] and self.ts_language:
@@ -57,6 +63,29 @@ class JavaScriptParser(TreeSitterParser):
             # Use JavaScript grammar for .js, .jsx, .mjs, .cjs files
             return super().parse_tree(content)
 
+    def _get_chunk_query(self, file_path: Path) -> ChunkQuery:
+        """Chunk metadata query for the grammar parse_tree uses on this file."""
+        from tree_sitter import Language
+
+        if file_path.suffix == ".ts" and self.ts_language:
+            grammar = ".ts"
+        elif file_path.suffix == ".tsx" and self.tsx_language:
+            grammar = ".tsx"
+        else:
+            grammar = ".js"
+
+        query = self._chunk_queries.get(grammar)
+        if query is None:
+            if grammar == ".ts":
+                language = Language(self.ts_language)
+            elif grammar == ".tsx":
+                language = Language(self.tsx_language)
+            else:
+                language = self.parser.language
+            query = ChunkQuery(language, JAVASCRIPT_CHUNK_QUERY)
+            self._chunk_queries[grammar] = query
+        return query
+
     def parse(
         self, file_path: Path, _batch_callback=None, global_entity_names=None
     ) -> ParserResult:
@@ -186,22 +215,12 @@ class JavaScriptParser(TreeSitterParser):
                     relations.append(relation)
 
             # Create function call relations from semantic metadata
-            # Combine current file entities with global entities for comprehensive validation
-            all_entity_names = set()
-
-            # Add current file entities
-            for entity in entities:
-                all_entity_names.add(entity.name)
-
-            # Add global entities if available
-            if global_entity_names:
-                all_entity_names.update(global_entity_names)
-
-            # Convert to list for compatibility with existing method signature
-            entity_names_list = list(all_entity_names)
-
+            # Resolve against this file's entities plus the shared project index
             function_call_relations = self._create_function_call_relations(
-                chunks, file_path, entity_names_list
+                chunks,
+                file_path,
+                entities,
+                SymbolIndex.of(global_entity_names),
             )
             relations.extend(function_call_relations)
 
@@ -274,10 +293,9 @@ class JavaScriptParser(TreeSitterParser):
                 "file_path": str(file_path),
                 "start_line": start_line,
                 "end_line": end_line,
-                "semantic_metadata": {
-                    "calls": self._extract_function_calls(implementation),
-                    "complexity": self._calculate_complexity(implementation),
-                },
+                "semantic_metadata": javascript_chunk_metadata(
+                    self._get_chunk_query(file_path), node
+                ),
             },
         )
         chunks.append(impl_chunk)
@@ -330,35 +348,6 @@ class JavaScriptParser(TreeSitterParser):
         else:
             return f"function {name}{params}{return_type}"
 
-    def _extract_function_calls(self, implementation: str) -> list[str]:
-        """Extract function calls using simple pattern matching."""
-        import re
-
-        # Simple regex to find function calls
-        call_pattern = r"(\w+)\s*\("
-        calls = re.findall(call_pattern, implementation)
-
-        # No filtering for built-ins - let entity validation handle it
-        return list(set(calls))
-
-    def _calculate_complexity(self, implementation: str) -> int:
-        """Calculate cyclomatic complexity (simplified)."""
-        complexity = 1
-        complexity_keywords = [
-            "if",
-            "else if",
-            "for",
-            "while",
-            "case",
-            "catch",
-            "?",
-            "&&",
-            "||",
-        ]
-        for keyword in complexity_keywords:
-            complexity += implementation.count(keyword)
-        return complexity
-
     def _create_class_entity(
         self, node: Node, file_path: Path, content: str
     ) -> tuple[Entity | None, list[EntityChunk]]:
@@ -568,11 +557,27 @@ class JavaScriptParser(TreeSitterParser):
                         return string_value.strip("'\"")
         return None
 
+    def resolve_calls(
+        self, result: ParserResult, global_entity_names: Any = None
+    ) -> list[Relation]:
+        """Rebuild the CALLS relations parse() derives from implementation chunks."""
+        return self._create_function_call_relations(
+            result.implementation_chunks or [],
+            result.file_path,
+            result.entities,
+            SymbolIndex.of(global_entity_names),
+        )
+
     def _create_function_call_relations(
-        self, chunks: list[EntityChunk], file_path: Path, entities_or_names
+        self,
+        chunks: list[EntityChunk],
+        file_path: Path,
+        entities_or_names,
+        symbols: SymbolIndex | None = None,
     ) -> list[Relation]:
         """Create CALLS relations only for project-defined entities."""
         relations = []
+        symbols = SymbolIndex.of(symbols)
 
         # Build set of available entity names for validation
         if isinstance(entities_or_names, list) and entities_or_names:
@@ -592,7 +597,10 @@ class JavaScriptParser(TreeSitterParser):
                 for called_function in calls:
                     # Only create relations to entities we actually indexed
                     # Skip self-referential relations (function calling itself)
-                    if called_function in entity_names and called_function != chunk.entity_name:
+                    if (
+                        symbols.resolves(called_function, entity_names)
+                        and called_function != chunk.entity_name
+                    ):
                         relation = RelationFactory.create_calls_relation(
                             caller=chunk.entity_name,
                             callee=called_function,
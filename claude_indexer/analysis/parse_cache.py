@@ -4,35 +4,202 @@ Saves 10-15s during re-indexing by skipping re-parsing of unchanged files.
 """
 
 import hashlib
-import json
+import marshal
+import os
+import sqlite3
 import time
-from dataclasses import asdict, is_dataclass
+from collections.abc import Callable
+from dataclasses import fields
 from pathlib import Path
 from threading import Lock
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
 from ..indexer_logging import get_logger
+from .entities import Entity, EntityChunk, EntityType, Relation, RelationType
+from .parser import ParserResult
 
-if TYPE_CHECKING:
-    from .parser import ParserResult
+# Field order of the encoded rows; changing a dataclass changes the layout,
+# so CACHE_VERSION must be bumped with it
+ENTITY_FIELDS = tuple(f.name for f in fields(Entity))
+RELATION_FIELDS = tuple(f.name for f in fields(Relation))
+CHUNK_FIELDS = tuple(f.name for f in fields(EntityChunk))
+
+
+def encode_result(result: ParserResult) -> bytes:
+    """Encode a ParserResult as compact, positional rows.
+
+    Raises:
+        ValueError: If the result holds values marshal cannot encode
+    """
+    entity_rows = []
+    for entity in result.entities:
+        row = [getattr(entity, name) for name in ENTITY_FIELDS]
+        row[1] = entity.entity_type.value
+        row[3] = str(entity.file_path) if entity.file_path else None
+        entity_rows.append(tuple(row))
+
+    relation_rows = []
+    for relation in result.relations:
+        row = [getattr(relation, name) for name in RELATION_FIELDS]
+        row[2] = relation.relation_type.value
+        relation_rows.append(tuple(row))
+
+    chunk_rows = [
+        tuple(getattr(chunk, name) for name in CHUNK_FIELDS)
+        for chunk in result.implementation_chunks or []
+    ]
+
+    return marshal.dumps(
+        (
+            str(result.file_path),
+            result.parsing_time,
+            result.file_hash,
+            list(result.errors or []),
+            list(result.warnings or []),
+            entity_rows,
+            relation_rows,
+            chunk_rows,
+        )
+    )
+
+
+def _hydrate(cls: type, names: tuple[str, ...], row: tuple[Any, ...]) -> Any:
+    # Rows were validated when the objects were first built, so skip
+    # __init__/__post_init__ and fill the instance directly
+    obj = object.__new__(cls)
+    obj.__dict__.update(zip(names, row, strict=True))
+    return obj
+
+
+class CachedParserResult(ParserResult):
+    """ParserResult decoded from encode_result rows.
+
+    Used for parse cache hits and for results sent back by parallel parse
+    workers. Entities, relations and chunks stay encoded until first accessed, so
+    results that are only counted or checked for success never build the
+    objects.
+    """
+
+    def __init__(self, file_path: Path, payload: tuple[Any, ...]):
+        # ParserResult.__init__ is skipped; the lists are built on demand
+        (
+            _,
+            self.parsing_time,
+            self.file_hash,
+            self.errors,
+            self.warnings,
+            self._entity_rows,
+            self._relation_rows,
+            self._chunk_rows,
+        ) = payload
+        self.file_path = file_path
+        self._entities: list[Entity] | None = None
+        self._relations: list[Relation] | None = None
+        self._chunks: list[EntityChunk] | None = None
+        self._build_relations: Callable[[], list[Relation]] | None = None
+        self._built_relations: list[Relation] = []
+
+    def add_relations_on_load(self, build: Callable[[], list[Relation]]) -> None:
+        """Append relations derived from the decoded result, e.g. resolved CALLS.
+
+        ``build`` runs once, when relations or their count are first read.
+        """
+        self._build_relations = build
+
+    def _deferred_relations(self) -> list[Relation]:
+        if self._build_relations is not None:
+            build, self._build_relations = self._build_relations, None
+            self._built_relations = build()
+        return self._built_relations
+
+    @property  # type: ignore[override]
+    def entities(self) -> list[Entity]:
+        if self._entities is None:
+            paths: dict[str, Path] = {}
+            entities = []
+            for row in self._entity_rows:
+                row = list(row)
+                row[1] = EntityType(row[1])
+                if row[3] is not None:
+                    # One Path per distinct file instead of one per entity
+                    path = paths.get(row[3])
+                    if path is None:
+                        path = paths[row[3]] = Path(row[3])
+                    row[3] = path
+                entities.append(_hydrate(Entity, ENTITY_FIELDS, row))
+            self._entities = entities
+        return self._entities
+
+    @entities.setter
+    def entities(self, value: list[Entity]) -> None:
+        self._entities = value
+
+    @property  # type: ignore[override]
+    def relations(self) -> list[Relation]:
+        if self._relations is None:
+            relations = []
+            for row in self._relation_rows:
+                row = list(row)
+                row[2] = RelationType(row[2])
+                relations.append(_hydrate(Relation, RELATION_FIELDS, row))
+            relations.extend(self._deferred_relations())
+            self._relations = relations
+        return self._relations
+
+    @relations.setter
+    def relations(self, value: list[Relation]) -> None:
+        self._relations = value
+
+    @property  # type: ignore[override]
+    def implementation_chunks(self) -> list[EntityChunk]:
+        if self._chunks is None:
+            self._chunks = [
+                _hydrate(EntityChunk, CHUNK_FIELDS, row) for row in self._chunk_rows
+            ]
+        return self._chunks
+
+    @implementation_chunks.setter
+    def implementation_chunks(self, value: list[EntityChunk]) -> None:
+        self._chunks = value
+
+    @property
+    def entity_count(self) -> int:
+        if self._entities is None:
+            return len(self._entity_rows)
+        return len(self._entities)
+
+    @property
+    def relation_count(self) -> int:
+        if self._relations is None:
+            return len(self._relation_rows) + len(self._deferred_relations())
+        return len(self._relations)
 
 
 class ParseResultCache:
     """Cache parsed entities/relations/chunks by file content hash.
 
-    Stores serialized ParserResult objects to disk, keyed by content hash.
-    When a file's content hash matches a cached entry, parsing is skipped.
+    Stores encoded ParserResult rows in one SQLite database, keyed by
+    content hash. When a file's content hash matches a cached entry,
+    parsing is skipped. A manifest of each file's size, mtime and content
+    hash lets unchanged files skip reading and hashing too, so a warm
+    re-index costs a stat and an indexed lookup per file.
+
+    Writes are buffered and committed in batches of WRITE_BATCH_SIZE; call
+    flush() when a run finishes.
 
     Cache Structure:
         .index_cache/
             parse_cache/
-                {model_version}/
-                    abc123.json
-                    def456.json
+                {version}.sqlite
+                    results(content_hash, payload, last_access)
+                    manifest(path, mtime_ns, size, content_hash)
     """
 
     # Increment when parser output format changes to invalidate old cache
-    CACHE_VERSION = "v1"
+    CACHE_VERSION = "v3"
+
+    # Pending writes committed per transaction
+    WRITE_BATCH_SIZE = 256
 
     def __init__(
         self,
@@ -46,14 +213,19 @@ class ParseResultCache:
             max_entries: Maximum number of cached parse results
         """
         self.logger = get_logger()
-        self.cache_dir = Path(cache_dir) / "parse_cache" / self.CACHE_VERSION
+        self.cache_dir = Path(cache_dir) / "parse_cache"
+        self.db_path = self.cache_dir / f"{self.CACHE_VERSION}.sqlite"
         self.max_entries = max_entries
 
         # Thread safety
         self._lock = Lock()
+        self._conn: sqlite3.Connection | None = None
 
-        # In-memory index for fast lookups: {content_hash: metadata}
-        self._index: dict[str, dict[str, Any]] = {}
+        # Buffered writes: {content_hash: payload}, {path: manifest row}
+        self._pending_results: dict[str, bytes] = {}
+        self._pending_manifest: dict[str, tuple[int, int, str]] = {}
+        self._accessed: set[str] = set()
+        self._entry_count = 0
 
         # Statistics
         self._hits = 0
@@ -63,182 +235,238 @@ class ParseResultCache:
         self._init_cache()
 
     def _init_cache(self) -> None:
-        """Initialize cache directory and load index."""
+        """Open the cache database, creating its tables if needed."""
         try:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
-            self._load_index()
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "content_hash TEXT PRIMARY KEY, payload BLOB NOT NULL, "
+                "last_access REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS manifest ("
+                "path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, "
+                "size INTEGER NOT NULL, content_hash TEXT NOT NULL)"
+            )
+            conn.commit()
+            self._entry_count = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            self._conn = conn
+            self.logger.debug(f"Opened parse cache with {self._entry_count} entries")
         except Exception as e:
             self.logger.warning(f"Failed to initialize parse cache: {e}")
-            self._index = {}
-
-    def _load_index(self) -> None:
-        """Scan cache directory to build in-memory index."""
-        self._index = {}
-        try:
-            for cache_file in self.cache_dir.glob("*.json"):
-                content_hash = cache_file.stem
-                stat = cache_file.stat()
-                self._index[content_hash] = {
-                    "path": cache_file,
-                    "mtime": stat.st_mtime,
-                    "size": stat.st_size,
-                }
-            self.logger.debug(f"Loaded parse cache index with {len(self._index)} entries")
-        except Exception as e:
-            self.logger.warning(f"Failed to load parse cache index: {e}")
+            self._conn = None
 
     @staticmethod
     def compute_content_hash(content: str) -> str:
         """Compute SHA256 hash of file content."""
         return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
 
-    def get(self, content_hash: str) -> dict[str, Any] | None:
+    def lookup(self, file_path: Path, stat: os.stat_result) -> str | None:
+        """Get the content hash recorded for a file if it is unchanged.
+
+        Args:
+            file_path: File to look up
+            stat: Current stat of the file
+
+        Returns:
+            Content hash if size and mtime match the manifest, None otherwise
+        """
+        key = str(file_path)
+        with self._lock:
+            row = self._pending_manifest.get(key)
+            if row is None and self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT mtime_ns, size, content_hash FROM manifest WHERE path = ?",
+                        (key,),
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    self.logger.debug(f"Parse cache manifest lookup failed: {e}")
+        if row is not None and row[0] == stat.st_mtime_ns and row[1] == stat.st_size:
+            return row[2]
+        return None
+
+    def get(self, content_hash: str, file_path: Path) -> ParserResult | None:
         """Get cached parse result by content hash.
 
         Args:
             content_hash: SHA256 hash of file content
+            file_path: File being parsed; results cached for another path
+                with the same content are not reused
 
         Returns:
-            Serialized ParserResult dict if found, None otherwise
+            Lazily hydrated ParserResult if found, None otherwise
         """
         with self._lock:
-            if content_hash not in self._index:
-                self._misses += 1
-                return None
+            data = self._pending_results.get(content_hash)
+            if data is None and self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT payload FROM results WHERE content_hash = ?",
+                        (content_hash,),
+                    ).fetchone()
+                    data = row[0] if row is not None else None
+                except sqlite3.Error as e:
+                    self.logger.debug(f"Failed to read cached parse result: {e}")
+
+            payload = None
+            if data is not None:
+                try:
+                    payload = marshal.loads(data)
+                except (EOFError, ValueError, TypeError) as e:
+                    self.logger.debug(f"Corrupted parse cache entry: {e}")
 
-            cache_file = self._index[content_hash]["path"]
-
-            try:
-                with open(cache_file, "r") as f:
-                    data = json.load(f)
-                    self._hits += 1
-                    # Update access time for LRU
-                    self._index[content_hash]["last_access"] = time.time()
-                    return data
-            except Exception as e:
-                self.logger.debug(f"Failed to read cached parse result: {e}")
-                # Remove corrupted entry
-                del self._index[content_hash]
+            if payload is None or payload[0] != str(file_path):
                 self._misses += 1
                 return None
 
-    def set(self, content_hash: str, result: "ParserResult") -> None:
+            self._hits += 1
+            self._accessed.add(content_hash)
+        return CachedParserResult(file_path, payload)
+
+    def set(
+        self,
+        content_hash: str,
+        result: ParserResult,
+        stat: os.stat_result | None = None,
+    ) -> None:
         """Store parsed result in cache.
 
         Args:
             content_hash: SHA256 hash of file content
             result: ParserResult to cache
+            stat: Stat of the parsed file, to record it in the manifest
         """
+        try:
+            data = encode_result(result)
+        except (ValueError, AttributeError, TypeError) as e:
+            self.logger.debug(f"Failed to cache parse result: {e}")
+            return
+
         with self._lock:
-            try:
-                # Check if we need to evict
-                self._maybe_evict()
-
-                # Serialize ParserResult
-                serialized = self._serialize_result(result)
-
-                # Write to disk
-                cache_file = self.cache_dir / f"{content_hash}.json"
-                with open(cache_file, "w") as f:
-                    json.dump(serialized, f)
-
-                # Update index
-                self._index[content_hash] = {
-                    "path": cache_file,
-                    "mtime": time.time(),
-                    "size": cache_file.stat().st_size,
-                    "last_access": time.time(),
-                }
-            except Exception as e:
-                self.logger.debug(f"Failed to cache parse result: {e}")
-
-    def _serialize_result(self, result: "ParserResult") -> dict[str, Any]:
-        """Serialize ParserResult to JSON-compatible dict."""
-        data: dict[str, Any] = {
-            "file_path": str(result.file_path),
-            "parsing_time": result.parsing_time,
-            "file_hash": result.file_hash,
-            "errors": result.errors,
-            "warnings": result.warnings,
-            "entities": [],
-            "relations": [],
-            "implementation_chunks": None,
-        }
-
-        # Serialize entities
-        for entity in result.entities:
-            if is_dataclass(entity) and not isinstance(entity, type):
-                entity_dict = asdict(entity)
-                # Convert Path objects to strings
-                if "file_path" in entity_dict and entity_dict["file_path"]:
-                    entity_dict["file_path"] = str(entity_dict["file_path"])
-                data["entities"].append(entity_dict)
-
-        # Serialize relations
-        for relation in result.relations:
-            if is_dataclass(relation) and not isinstance(relation, type):
-                data["relations"].append(asdict(relation))
-
-        # Serialize implementation chunks if present
-        if result.implementation_chunks:
-            data["implementation_chunks"] = []
-            for chunk in result.implementation_chunks:
-                if is_dataclass(chunk) and not isinstance(chunk, type):
-                    chunk_dict = asdict(chunk)
-                    if "file_path" in chunk_dict and chunk_dict["file_path"]:
-                        chunk_dict["file_path"] = str(chunk_dict["file_path"])
-                    data["implementation_chunks"].append(chunk_dict)
-
-        return data
+            self._pending_results[content_hash] = data
+            if stat is not None:
+                self._pending_manifest[str(result.file_path)] = (
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    content_hash,
+                )
+            self._maybe_flush()
+
+    def record(self, file_path: Path, stat: os.stat_result, content_hash: str) -> None:
+        """Record a file's stat and content hash in the manifest.
 
-    def _maybe_evict(self) -> None:
-        """Evict oldest entries if cache exceeds size limit."""
-        if len(self._index) < self.max_entries:
+        Args:
+            file_path: File that was hashed
+            stat: Stat of the file when it was read
+            content_hash: Hash of the content read
+        """
+        with self._lock:
+            self._pending_manifest[str(file_path)] = (
+                stat.st_mtime_ns,
+                stat.st_size,
+                content_hash,
+            )
+            self._maybe_flush()
+
+    def flush(self) -> None:
+        """Commit buffered writes and access times."""
+        with self._lock:
+            self._flush()
+
+    def _maybe_flush(self) -> None:
+        if len(self._pending_results) + len(self._pending_manifest) >= self.WRITE_BATCH_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Write pending entries in one transaction. Caller holds the lock."""
+        if self._conn is None:
+            return
+        if not (self._pending_results or self._pending_manifest or self._accessed):
             return
 
-        # Sort by last access time (oldest first)
-        sorted_entries = sorted(
-            self._index.items(),
-            key=lambda x: x[1].get("last_access", x[1].get("mtime", 0))
-        )
+        now = time.time()
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                    [(h, data, now) for h, data in self._pending_results.items()],
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO manifest VALUES (?, ?, ?, ?)",
+                    [(path, *row) for path, row in self._pending_manifest.items()],
+                )
+                self._conn.executemany(
+                    "UPDATE results SET last_access = ? WHERE content_hash = ?",
+                    [(now, h) for h in self._accessed],
+                )
+            self._entry_count = self._conn.execute(
+                "SELECT COUNT(*) FROM results"
+            ).fetchone()[0]
+            self._maybe_evict()
+        except sqlite3.Error as e:
+            self.logger.debug(f"Failed to write parse cache batch: {e}")
+        finally:
+            self._pending_results.clear()
+            self._pending_manifest.clear()
+            self._accessed.clear()
 
-        # Remove oldest 25%
-        entries_to_remove = len(sorted_entries) // 4
-        entries_to_remove = max(entries_to_remove, 1)
-
-        for content_hash, entry in sorted_entries[:entries_to_remove]:
-            try:
-                cache_file = entry["path"]
-                if cache_file.exists():
-                    cache_file.unlink()
-                del self._index[content_hash]
-            except Exception as e:
-                self.logger.debug(f"Failed to evict cache entry: {e}")
+    def _maybe_evict(self) -> None:
+        """Evict least recently used entries if cache exceeds size limit."""
+        if self._conn is None or self._entry_count <= self.max_entries:
+            return
 
+        # Remove oldest 25%
+        entries_to_remove = max(self._entry_count // 4, 1)
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM results WHERE content_hash IN ("
+                "SELECT content_hash FROM results ORDER BY last_access LIMIT ?)",
+                (entries_to_remove,),
+            )
+            self._conn.execute(
+                "DELETE FROM manifest WHERE content_hash NOT IN "
+                "(SELECT content_hash FROM results)"
+            )
+        self._entry_count -= entries_to_remove
         self.logger.debug(f"Evicted {entries_to_remove} parse cache entries")
 
     def clear(self) -> None:
         """Clear all cached parse results."""
         with self._lock:
-            for entry in self._index.values():
+            self._pending_results.clear()
+            self._pending_manifest.clear()
+            self._accessed.clear()
+            if self._conn is not None:
                 try:
-                    cache_file = entry["path"]
-                    if cache_file.exists():
-                        cache_file.unlink()
-                except Exception:
-                    pass
+                    with self._conn:
+                        self._conn.execute("DELETE FROM results")
+                        self._conn.execute("DELETE FROM manifest")
+                except sqlite3.Error as e:
+                    self.logger.debug(f"Failed to clear parse cache: {e}")
 
-            self._index = {}
+            self._entry_count = 0
             self._hits = 0
             self._misses = 0
             self.logger.info("Cleared parse cache")
 
+    def close(self) -> None:
+        """Flush pending writes and close the database."""
+        with self._lock:
+            self._flush()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
         with self._lock:
             total = self._hits + self._misses
             return {
-                "entries": len(self._index),
+                "entries": len(self),
                 "max_entries": self.max_entries,
                 "hits": self._hits,
                 "misses": self._misses,
@@ -248,4 +476,4 @@ class ParseResultCache:
 
     def __len__(self) -> int:
         """Return number of cached entries."""
-        return len(self._index)
+        return self._entry_count + len(self._pending_results)
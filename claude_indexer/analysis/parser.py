@@ -1,10 +1,10 @@
 """Code parsing abstractions with Tree-sitter and Jedi integration."""
 
-import hashlib
 import copy
+import hashlib
 import re
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any, Optional
 
@@ -37,7 +37,12 @@ except ImportError:
     ENTITIES_AVAILABLE = False
 
 # Import logger
+from ..categorization import FileCategorizationSystem
 from ..indexer_logging import get_logger
+from .chunk_queries import PYTHON_CHUNK_QUERY, ChunkQuery, python_chunk_metadata
+from .import_resolver import ImportResolver
+from .source_file import SourceFile
+from .symbol_index import SymbolIndex
 
 logger = get_logger()
 
@@ -86,6 +91,12 @@ class ParserResult:
 class CodeParser(ABC):
     """Abstract base class for code parsers."""
 
+    # Parsers that accept a pre-read SourceFile via parse(..., source=...)
+    accepts_source_file: bool = False
+
+    # Parsers whose CALLS relations depend on global_entity_names
+    resolves_project_calls: bool = False
+
     @abstractmethod
     def can_parse(self, file_path: Path) -> bool:
         """Check if this parser can handle the given file."""
@@ -101,6 +112,22 @@ class CodeParser(ABC):
         """Get list of supported file extensions."""
         pass
 
+    def resolve_calls(
+        self, result: ParserResult, global_entity_names: Any = None  # noqa: ARG002
+    ) -> list["Relation"]:
+        """Build the CALLS relations of a parsed file that depend on project names.
+
+        The parse cache stores results without these and rebuilds them on
+        every hit, so cached files see entities defined after their parse.
+        """
+        return []
+
+    def clear_cache(self) -> None:  # noqa: B027
+        """Forget lookups of other files kept between parses, e.g. at a run start.
+
+        Optional hook: parsers without such lookups have nothing to clear.
+        """
+
     def _create_chunk_id(
         self,
         file_path: Path,
@@ -149,13 +176,31 @@ class CodeParser(ABC):
 
 
 class PythonParser(CodeParser):
-    """Parser for Python files using Tree-sitter and Jedi."""
+    """Parser for Python files using Tree-sitter and Jedi.
+
+    Jedi is only used for files in the deep processing tier; other files
+    resolve imports from the tree-sitter tree with ImportResolver, which
+    produces the same IMPORTS relations at a fraction of the cost.
+    """
+
+    accepts_source_file = True
+    resolves_project_calls = True
 
-    def __init__(self, project_path: Path):
+    def __init__(self, project_path: Path, use_jedi: bool | None = None):
+        """Initialize the parser.
+
+        Args:
+            project_path: Root of the project being parsed
+            use_jedi: Always (True) or never (False) analyze files with Jedi;
+                None uses Jedi only for deep-tier files
+        """
         self.project_path = project_path
+        self.use_jedi = use_jedi
         self._parser: tree_sitter.Parser | None = None
         self._project: Any | None = None  # jedi.Project
         self._observation_extractor: Any | None = None  # ObservationExtractor
+        self._import_resolver = ImportResolver(project_path)
+        self._categorizer = FileCategorizationSystem()
 
         if TREE_SITTER_AVAILABLE:
             self._initialize_parsers()
@@ -166,6 +211,7 @@ class PythonParser(CodeParser):
             # Initialize Tree-sitter
             language = tree_sitter.Language(tspython.language())
             self._parser = tree_sitter.Parser(language)
+            self._chunk_query = ChunkQuery(language, PYTHON_CHUNK_QUERY)
 
             # Initialize Jedi project
             self._project = jedi.Project(str(self.project_path))
@@ -187,70 +233,76 @@ class PythonParser(CodeParser):
         return [".py"]
 
     def parse(
-        self, file_path: Path, batch_callback: Any = None, global_entity_names: set[str] | None = None  # noqa: ARG002
+        self,
+        file_path: Path,
+        batch_callback: Any = None,  # noqa: ARG002
+        global_entity_names: SymbolIndex | set[str] | None = None,
+        source: SourceFile | None = None,
     ) -> ParserResult:
-        """Parse Python file using Tree-sitter and Jedi."""
+        """Parse Python file using Tree-sitter and Jedi.
+
+        The file is read, hashed and parsed once; every stage works from the
+        same SourceFile. Pass ``source`` when the caller has already read it.
+        """
         import time
 
         start_time = time.time()
         result = ParserResult(file_path=file_path, entities=[], relations=[])
 
         try:
-            # Calculate file hash
-            result.file_hash = self._get_file_hash(file_path)
+            if source is None:
+                source = SourceFile.read(file_path)
+            result.file_hash = source.sha256
+
+            # Deep-tier files get Jedi; one script serves observations,
+            # imports and chunk metadata
+            use_jedi = self._should_use_jedi(file_path)
+            script = self._create_jedi_script(source) if use_jedi else None
 
             # Parse with Tree-sitter
-            tree = self._parse_with_tree_sitter(file_path)
+            tree = self._parse_with_tree_sitter(source)
+            source.tree = tree
             if tree:
                 # Check for syntax errors in the parse tree
                 if self._has_syntax_errors(tree) and result.errors is not None:
                     result.errors.append(f"Syntax errors detected in {file_path.name}")
 
-                ts_entities = self._extract_tree_sitter_entities(tree, file_path)
+                ts_entities = self._extract_tree_sitter_entities(
+                    tree, file_path, source, script
+                )
                 result.entities.extend(ts_entities)
 
                 # Extract Tree-sitter relations (inheritance, imports)
                 ts_relations = self._extract_tree_sitter_relations(tree, file_path)
                 result.relations.extend(ts_relations)
 
-            # Analyze with Jedi for semantic information (relations only - entities come from Tree-sitter)
-            jedi_analysis = self._analyze_with_jedi(file_path)
+            if use_jedi:
+                # Analyze with Jedi for semantic information (relations only - entities come from Tree-sitter)
+                jedi_analysis = self._analyze_with_jedi(source, script)
+            else:
+                jedi_analysis = self._analyze_imports_with_tree_sitter(source, tree)
             _, jedi_relations = self._process_jedi_analysis(jedi_analysis, file_path)
 
             # Only add relations from Jedi, not entities (Tree-sitter handles entities with enhanced observations)
             result.relations.extend(jedi_relations)
 
             # Progressive disclosure: Extract implementation chunks for v2.4
-            implementation_chunks = self._extract_implementation_chunks(file_path, tree)  # type: ignore[arg-type]
+            implementation_chunks = self._extract_implementation_chunks(source, tree, script)  # type: ignore[arg-type]
             result.implementation_chunks.extend(implementation_chunks)  # type: ignore[union-attr]
             # Create CALLS relations from extracted function calls (entity-aware to prevent orphans)
-            # Combine current file entities with global entities for comprehensive validation
-            all_entity_names = set()
-
-            # Add current file entities
-            for entity in result.entities:
-                all_entity_names.add(entity.name)
-
-            # Add global entities if available
-            if global_entity_names:
-                all_entity_names.update(global_entity_names)
-
-            # Convert to pseudo-entities for compatibility with existing method signature
-            entity_list_for_calls = [
-                type("Entity", (), {"name": name})() for name in all_entity_names
-            ]
-
+            # Resolve against this file's entities plus the shared project index
             calls_relations = self._create_calls_relations_from_chunks(
-                implementation_chunks, file_path, entity_list_for_calls
+                implementation_chunks,
+                file_path,
+                {entity.name for entity in result.entities},
+                SymbolIndex.of(global_entity_names),
             )
             result.relations.extend(calls_relations)
 
             # Extract file operations (open, json.load, etc.)
             if tree:
-                with open(file_path, encoding="utf-8") as f:
-                    content = f.read()
                 file_op_relations = self._extract_file_operations(
-                    tree, file_path, content
+                    tree, file_path, source.text
                 )
                 result.relations.extend(file_op_relations)
 
@@ -258,7 +310,7 @@ class PythonParser(CodeParser):
             file_entity = EntityFactory.create_file_entity(
                 file_path,
                 entity_count=len(result.entities),
-                parsing_method="tree-sitter+jedi",
+                parsing_method="tree-sitter+jedi" if use_jedi else "tree-sitter",
             )
             result.entities.insert(0, file_entity)  # File first
 
@@ -281,29 +333,27 @@ class PythonParser(CodeParser):
         result.parsing_time = time.time() - start_time
         return result
 
-    def _get_file_hash(self, file_path: Path) -> str:
-        """Calculate SHA256 hash of file contents."""
-        try:
-            with open(file_path, "rb") as f:
-                return hashlib.sha256(f.read()).hexdigest()
-        except OSError as e:
-            logger = get_logger()
-            logger.warning(f"Failed to read file for hashing {file_path}: {e}")
-            return ""
-        except Exception as e:
-            logger = get_logger()
-            logger.error(f"Unexpected error hashing file {file_path}: {e}")
-            return ""
-
-    def _parse_with_tree_sitter(self, file_path: Path) -> Optional["tree_sitter.Tree"]:
+    def _parse_with_tree_sitter(self, source: SourceFile) -> Optional["tree_sitter.Tree"]:
         """Parse file with Tree-sitter."""
         try:
-            with open(file_path, "rb") as f:
-                source_code = f.read()
-            return self._parser.parse(source_code)  # type: ignore[union-attr]
+            return self._parser.parse(source.data)  # type: ignore[union-attr]
         except Exception:
             return None
 
+    def _should_use_jedi(self, file_path: Path) -> bool:
+        """Decide whether a file is analyzed with Jedi or the tree-sitter fast path."""
+        if self.use_jedi is not None:
+            return self.use_jedi
+        return self._categorizer.should_use_semantic_analysis(file_path)
+
+    def _create_jedi_script(self, source: SourceFile) -> Optional["jedi.Script"]:
+        """Create the Jedi script for a file, or None if it cannot be analyzed."""
+        try:
+            return jedi.Script(source.text, path=str(source.path), project=self._project)
+        except Exception as e:
+            logger.debug(f"Jedi script creation failed for {source.path}: {e}")
+            return None
+
     def _has_syntax_errors(self, tree: "tree_sitter.Tree") -> bool:
         """Check if the parse tree contains syntax errors."""
 
@@ -317,7 +367,11 @@ class PythonParser(CodeParser):
         return check_node_for_errors(tree.root_node)
 
     def _extract_tree_sitter_entities(
-        self, tree: "tree_sitter.Tree", file_path: Path
+        self,
+        tree: "tree_sitter.Tree",
+        file_path: Path,
+        source: SourceFile,
+        script: Optional["jedi.Script"] = None,
     ) -> list["Entity"]:
         """Extract entities from Tree-sitter AST."""
 
@@ -362,7 +416,7 @@ class PythonParser(CodeParser):
                         entities.extend(assignment_variables)
                 else:
                     entity = self._extract_named_entity(
-                        node, entity_mapping[node.type], file_path
+                        node, entity_mapping[node.type], file_path, source, script
                     )
                     if entity:
                         entities.append(entity)
@@ -417,7 +471,12 @@ class PythonParser(CodeParser):
         return relations
 
     def _extract_named_entity(
-        self, node: "tree_sitter.Node", entity_type: "EntityType", file_path: Path
+        self,
+        node: "tree_sitter.Node",
+        entity_type: "EntityType",
+        file_path: Path,
+        source: SourceFile,
+        script: Optional["jedi.Script"] = None,
     ) -> Optional["Entity"]:
         """Extract named entity from Tree-sitter node with enhanced observations."""
 
@@ -462,25 +521,9 @@ class PythonParser(CodeParser):
         enhanced_observations = None
         if self._observation_extractor:
             try:
-                # Read source code for observation extraction
-                with open(file_path, encoding="utf-8") as f:
-                    source_code = f.read()
-
-                # Create Jedi script for semantic analysis
-                jedi_script = None
-                if self._project:
-                    try:
-                        jedi_script = jedi.Script(
-                            source_code, path=str(file_path), project=self._project
-                        )
-                    except ImportError as e:
-                        logger = get_logger()
-                        logger.warning(f"Jedi import error for file {file_path}: {e}")
-                    except Exception as e:
-                        logger = get_logger()
-                        logger.warning(
-                            f"Failed to create Jedi script for file {file_path}: {e}"
-                        )
+                # Observations reuse the file's text and Jedi script (deep tier only)
+                source_code = source.text
+                jedi_script = script
 
                 # Extract observations based on entity type
                 if entity_type == EntityType.FUNCTION:
@@ -837,15 +880,15 @@ class PythonParser(CodeParser):
 
         return False
 
-    def _analyze_with_jedi(self, file_path: Path) -> dict[str, Any]:
+    def _analyze_with_jedi(
+        self, source: SourceFile, script: Optional["jedi.Script"]
+    ) -> dict[str, Any]:
         """Analyze file with Jedi for semantic information."""
         try:
-            with open(file_path, encoding="utf-8") as f:
-                source_code = f.read()
-
-            script = jedi.Script(
-                source_code, path=str(file_path), project=self._project
-            )
+            if script is None:
+                raise ValueError("no Jedi script")
+            file_path = source.path
+            source_code = source.text
 
             # Get ALL names including imports (definitions=True)
             names = script.get_names(all_scopes=True, definitions=True)
@@ -853,36 +896,7 @@ class PythonParser(CodeParser):
             analysis: dict[str, list[Any]] = {"functions": [], "classes": [], "imports": [], "variables": []}
 
             # Also check for import statements directly
-            import_names = set()
-            for line in source_code.split("\n"):
-                line = line.strip()
-
-                # Only process lines that actually start with import statements (not strings containing 'import')
-                if line.startswith("import ") and not line.startswith(
-                    ('"""', "'''", '"', "'")
-                ):
-                    # Handle: import os, sys
-                    parts = line[7:].split(",")
-                    for part in parts:
-                        module = part.strip().split(" as ")[0].strip()
-                        # Filter out file modes that aren't real imports
-                        file_modes = {'r', 'w', 'a', 'x', 'b', 't', 'rb', 'wb', 'ab', 'rt', 'wt', 'at', 'r+', 'w+', 'a+', 'x+'}
-                        if module not in file_modes and self._is_internal_import(
-                            module, file_path, self.project_path
-                        ):
-                            import_names.add(module)
-                elif line.startswith("from ") and not line.startswith(
-                    ('"""', "'''", '"', "'")
-                ):
-                    # Handle: from pathlib import Path
-                    if " import " in line:
-                        module = line.split(" import ")[0][5:].strip()
-                        # Filter out file modes that aren't real imports
-                        file_modes = {'r', 'w', 'a', 'x', 'b', 't', 'rb', 'wb', 'ab', 'rt', 'wt', 'at', 'r+', 'w+', 'a+', 'x+'}
-                        if module not in file_modes and self._is_internal_import(
-                            module, file_path, self.project_path
-                        ):
-                            import_names.add(module)
+            import_names = self._scan_import_lines(source_code, file_path)
 
             # Add direct imports first
             for module in import_names:
@@ -923,6 +937,67 @@ class PythonParser(CodeParser):
             logger.debug(f"Jedi analysis failed: {e}")
             return {"functions": [], "classes": [], "imports": [], "variables": []}
 
+    def _scan_import_lines(self, source_code: str, file_path: Path) -> set[str]:
+        """Find internal modules named on lines that start with an import statement."""
+        import_names = set()
+        for line in source_code.split("\n"):
+            line = line.strip()
+
+            # Only process lines that actually start with import statements (not strings containing 'import')
+            if line.startswith("import ") and not line.startswith(
+                ('"""', "'''", '"', "'")
+            ):
+                # Handle: import os, sys
+                parts = line[7:].split(",")
+                for part in parts:
+                    module = part.strip().split(" as ")[0].strip()
+                    # Filter out file modes that aren't real imports
+                    file_modes = {'r', 'w', 'a', 'x', 'b', 't', 'rb', 'wb', 'ab', 'rt', 'wt', 'at', 'r+', 'w+', 'a+', 'x+'}
+                    if module not in file_modes and self._is_internal_import(
+                        module, file_path, self.project_path
+                    ):
+                        import_names.add(module)
+            elif line.startswith("from ") and not line.startswith(
+                ('"""', "'''", '"', "'")
+            ):
+                # Handle: from pathlib import Path
+                if " import " in line:
+                    module = line.split(" import ")[0][5:].strip()
+                    # Filter out file modes that aren't real imports
+                    file_modes = {'r', 'w', 'a', 'x', 'b', 't', 'rb', 'wb', 'ab', 'rt', 'wt', 'at', 'r+', 'w+', 'a+', 'x+'}
+                    if module not in file_modes and self._is_internal_import(
+                        module, file_path, self.project_path
+                    ):
+                        import_names.add(module)
+        return import_names
+
+    def _analyze_imports_with_tree_sitter(
+        self, source: SourceFile, tree: Optional["tree_sitter.Tree"]
+    ) -> dict[str, Any]:
+        """Build the import part of Jedi's analysis without running Jedi.
+
+        Produces the same ``imports`` entries as ``_analyze_with_jedi``: the
+        internal modules found by the line scan, followed by every module
+        name the file's import statements bind.
+        """
+        analysis: dict[str, list[Any]] = {"functions": [], "classes": [], "imports": [], "variables": []}
+        try:
+            import_names = self._scan_import_lines(source.text, source.path)
+            for module in import_names:
+                analysis["imports"].append({"name": module, "full_name": module})
+
+            if tree is not None:
+                for imported in self._import_resolver.imported_names(
+                    tree.root_node, source.path
+                ):
+                    if imported.is_module and imported.full_name not in import_names:
+                        analysis["imports"].append(
+                            {"name": imported.name, "full_name": imported.full_name}
+                        )
+        except Exception as e:
+            logger.debug(f"Tree-sitter import analysis failed: {e}")
+        return analysis
+
     def _process_jedi_analysis(
         self, analysis: dict[str, Any], file_path: Path
     ) -> tuple[list["Entity"], list["Relation"]]:
@@ -949,16 +1024,16 @@ class PythonParser(CodeParser):
         return entities, relations
 
     def _extract_implementation_chunks(
-        self, file_path: Path, tree: "tree_sitter.Tree"
+        self,
+        source: SourceFile,
+        tree: "tree_sitter.Tree",
+        script: Optional["jedi.Script"],
     ) -> list["EntityChunk"]:
         """Extract full implementation chunks using AST + Jedi for progressive disclosure."""
         chunks = []
+        file_path = source.path
 
         try:
-            # Read source code
-            with open(file_path, encoding="utf-8") as f:
-                source_code = f.read()
-
             # Debug logging
             from ..indexer_logging import get_logger
 
@@ -967,13 +1042,8 @@ class PythonParser(CodeParser):
                 f"🔧 Starting implementation chunk extraction for {file_path.name}"
             )
 
-            # Create Jedi script for semantic analysis
-            script = jedi.Script(
-                source_code, path=str(file_path), project=self._project
-            )
-            source_lines = source_code.split("\n")
             logger.debug(
-                f"🔧 Jedi script created, source has {len(source_lines)} lines"
+                f"🔧 Source has {len(source.line_offsets)} lines"
             )
 
             # Extract function and class implementations
@@ -985,7 +1055,7 @@ class PythonParser(CodeParser):
                     functions_found += 1
                     # logger.debug(f"🔧 Found {node.type}: attempting chunk extraction")
                     chunk = self._extract_implementation_chunk(
-                        node, source_lines, script, file_path
+                        node, source, script, file_path
                     )
                     if chunk:
                         chunks.append(chunk)
@@ -1017,8 +1087,8 @@ class PythonParser(CodeParser):
     def _extract_implementation_chunk(
         self,
         node: "tree_sitter.Node",
-        source_lines: list[str],
-        script: "jedi.Script",
+        source: SourceFile,
+        script: Optional["jedi.Script"],
         file_path: Path,
     ) -> Optional["EntityChunk"]:
         """Extract implementation chunk for function or class with semantic metadata."""
@@ -1045,48 +1115,22 @@ class PythonParser(CodeParser):
             # Extract source code lines
             start_line = node.start_point[0]
             end_line = node.end_point[0]
-            implementation_lines = source_lines[start_line : end_line + 1]
-            implementation = "\n".join(implementation_lines)
+            implementation = source.line_span(start_line, end_line)
 
-            # Extract semantic metadata using Jedi
-            semantic_metadata = {}
-            try:
-                # Get Jedi definition at the entity location
-                definitions = script.goto(start_line + 1, node.start_point[1])
-                if definitions:
-                    definition = definitions[0]
-                    semantic_metadata = {
-                        "inferred_types": self._get_type_hints(definition),
-                        "calls": self._extract_function_calls_from_source(
-                            implementation, node.type
-                        ),
-                        "imports_used": self._extract_imports_used_in_source(
-                            implementation
-                        ),
-                        "exceptions_handled": self._extract_exceptions_from_source(
-                            implementation
-                        ),
-                        "complexity": self._calculate_complexity_from_source(
-                            implementation
-                        ),
-                    }
-                else:
-                    semantic_metadata = {
-                        "calls": self._extract_function_calls_from_source(
-                            implementation, node.type
-                        ),
-                        "imports_used": [],
-                        "exceptions_handled": [],
-                        "complexity": implementation.count("\n") + 1,
-                    }
-            except Exception:
-                # Fallback to basic analysis
-                semantic_metadata = {
-                    "calls": self._extract_function_calls_from_source(implementation, node.type),
-                    "imports_used": [],
-                    "exceptions_handled": [],
-                    "complexity": implementation.count("\n") + 1,  # Simple line count
-                }
+            # Calls, attribute accesses, exceptions and branches in one query pass
+            semantic_metadata = python_chunk_metadata(self._chunk_query, node)
+            if script is None:
+                semantic_metadata["inferred_types"] = {}
+            else:
+                try:
+                    # Get Jedi definition at the entity location
+                    definitions = script.goto(start_line + 1, node.start_point[1])
+                    if definitions:
+                        semantic_metadata["inferred_types"] = self._get_type_hints(
+                            definitions[0]
+                        )
+                except Exception:
+                    pass
 
             # Create collision-resistant ID using MD5 hash suffix
             entity_type = "function" if node.type == "function_definition" else "class"
@@ -1138,80 +1182,6 @@ class PythonParser(CodeParser):
         except Exception:
             return {}
 
-    def _extract_function_calls_from_source(self, source: str, node_type: str = "function") -> list[str]:
-        """Extract function calls from source code using regex."""
-
-        # Split source into lines to filter out function definitions
-        lines = source.split("\n")
-
-        # For classes: filter out method bodies to avoid double-counting
-        if node_type == "class_definition":
-            filtered_lines = []
-            in_method = False
-            method_indent = 0
-
-            for line in lines:
-                stripped = line.strip()
-                current_indent = len(line) - len(line.lstrip())
-
-                # Detect method start
-                if stripped.startswith("def "):
-                    in_method = True
-                    method_indent = current_indent
-                    continue  # Skip method definition line
-
-                # Skip method body lines (higher indent than method definition)
-                if in_method and current_indent > method_indent:
-                    continue
-
-                # End of method body (back to class level or less)
-                if in_method and current_indent <= method_indent and stripped:
-                    in_method = False
-
-                # Keep class-level lines
-                if not in_method:
-                    filtered_lines.append(line)
-        else:
-            # For functions: filter out function definition lines that start with 'def '
-            filtered_lines = []
-            for line in lines:
-                stripped = line.strip()
-                # Skip lines that are function definitions
-                if not stripped.startswith("def "):
-                    filtered_lines.append(line)
-
-        # Rejoin the filtered source
-        filtered_source = "\n".join(filtered_lines)
-
-        # Simple regex to find function calls (name followed by parentheses)
-        call_pattern = r"(\w+)\s*\("
-        calls = re.findall(call_pattern, filtered_source)
-
-        # No filtering for built-ins - let entity validation handle it
-        return list(set(calls))
-
-    def _extract_imports_used_in_source(self, source: str) -> list[str]:
-        """Extract imports referenced in the source code."""
-        # Find module.function or module.class patterns
-        module_pattern = r"(\w+)\.(\w+)"
-        matches = re.findall(module_pattern, source)
-        return list({f"{module}.{attr}" for module, attr in matches})
-
-    def _extract_exceptions_from_source(self, source: str) -> list[str]:
-        """Extract exception types from source code."""
-        # Find except SomeException patterns
-        except_pattern = r"except\s+(\w+)"
-        exceptions = re.findall(except_pattern, source)
-        return list(set(exceptions))
-
-    def _calculate_complexity_from_source(self, source: str) -> int:
-        """Calculate complexity based on control flow statements."""
-        complexity_keywords = ["if", "elif", "for", "while", "try", "except", "with"]
-        complexity = 1  # Base complexity
-        for keyword in complexity_keywords:
-            complexity += source.count(f" {keyword} ") + source.count(f"\n{keyword} ")
-        return complexity
-
     def _find_nodes_by_type(
         self, root: "tree_sitter.Node", node_types: list[str]
     ) -> list["tree_sitter.Node"]:
@@ -1472,17 +1442,41 @@ class PythonParser(CodeParser):
             logger.debug(f"   By type: {type_counts}")
         return relations
 
+    def clear_cache(self) -> None:
+        """Forget module locations, so imports see files added since."""
+        self._import_resolver.clear_cache()
+
+    def resolve_calls(
+        self, result: ParserResult, global_entity_names: Any = None
+    ) -> list["Relation"]:
+        """Rebuild the CALLS relations parse() derives from implementation chunks."""
+        return self._create_calls_relations_from_chunks(
+            result.implementation_chunks or [],
+            result.file_path,
+            {entity.name for entity in result.entities},
+            SymbolIndex.of(global_entity_names),
+        )
+
     def _create_calls_relations_from_chunks(
         self,
         chunks: list["EntityChunk"],
         file_path: Path,
-        entities: list["Entity"] | None = None,
+        local_names: set[str] | None = None,
+        symbols: SymbolIndex | None = None,
     ) -> list["Relation"]:
-        """Create CALLS relations only for project-defined entities."""
-        relations = []
+        """Create CALLS relations only for project-defined entities.
+
+        Args:
+            chunks: Implementation chunks with call metadata
+            file_path: File the chunks were extracted from
+            local_names: Entity names defined in this file
+            symbols: Project-wide entity names
 
-        # Get entity names from current batch for validation
-        entity_names = {entity.name for entity in entities} if entities else set()
+        Returns:
+            CALLS relations whose targets are known entities
+        """
+        relations = []
+        symbols = SymbolIndex.of(symbols)
 
         # 🐛 DEBUG: Track chunks and their call metadata
         # logger.debug(f"🔍 PHANTOM DEBUG: Processing {len(chunks)} chunks for relations")
@@ -1500,7 +1494,7 @@ class PythonParser(CodeParser):
 
                 for called_name in calls:
                     # Only create relations to entities we actually indexed
-                    if called_name in entity_names:
+                    if symbols.resolves(called_name, local_names):
                         relation = Relation(
                             from_entity=chunk.entity_name,
                             to_entity=called_name,
@@ -1649,7 +1643,7 @@ class MarkdownParser(CodeParser, TiktokenMixin):
                 lines = content.split("\n")
 
             # Parse markdown into structured sections
-            sections = self._parse_markdown_sections(content, file_path)
+            sections = self._parse_markdown_sections(content)
             
             # Apply intelligent chunking algorithm
             chunk_groups = self._create_intelligent_chunks(sections)
@@ -1667,7 +1661,7 @@ class MarkdownParser(CodeParser, TiktokenMixin):
 
         return chunks
     
-    def _parse_markdown_sections(self, content: str, file_path: Path) -> list[dict]:
+    def _parse_markdown_sections(self, content: str) -> list[dict]:
         """Parse markdown into hierarchical sections with token counts."""
         sections = []
         lines = content.split('\n')
@@ -2138,6 +2132,15 @@ class MarkdownParser(CodeParser, TiktokenMixin):
         return impl_chunk, metadata_chunk
 
 
+def _tag_relations(relations: list["Relation"], file_path: Path) -> None:
+    """Record the parsed file in each relation's metadata.
+
+    Names alone are ambiguous when several files define the same entity.
+    """
+    for relation in relations:
+        relation.metadata.setdefault("file_path", str(file_path))
+
+
 class ParserRegistry:
     """Registry for managing multiple code parsers."""
 
@@ -2277,78 +2280,116 @@ class ParserRegistry:
             result.errors.append(f"No parser available for {file_path.suffix}")  # type: ignore[union-attr]
             return result
 
+        # Unchanged files (same size and mtime as recorded in the parse cache
+        # manifest) are served from the cache without reading or hashing them
+        stat = None
+        if self._parse_cache is not None:
+            try:
+                stat = file_path.stat()
+                content_hash = self._parse_cache.lookup(file_path, stat)
+                if content_hash is not None:
+                    cached = self._parse_cache.get(content_hash, file_path)
+                    if cached is not None:
+                        return self._resolve_cached(parser, cached, global_entity_names)
+            except Exception as e:
+                logger.debug(f"Parse cache manifest lookup failed for {file_path}: {e}")
+
+        # Read the file once for the cache key and for parsers that accept it
+        source = None
+        if self._parse_cache is not None or parser.accepts_source_file:
+            try:
+                source = SourceFile.read(file_path)
+            except OSError as e:
+                logger.debug(f"Failed to read {file_path}: {e}")
+
         # Check parse cache if available
         content_hash = None
-        if self._parse_cache is not None:
+        if self._parse_cache is not None and source is not None:
             try:
-                content = file_path.read_text(encoding="utf-8", errors="replace")
-                from .parse_cache import ParseResultCache
-                content_hash = ParseResultCache.compute_content_hash(content)
+                # Same digest as ParseResultCache.compute_content_hash for
+                # UTF-8 files, without decoding and re-encoding the text
+                content_hash = source.sha256[:16]
 
-                cached = self._parse_cache.get(content_hash)
+                cached = self._parse_cache.get(content_hash, file_path)
                 if cached is not None:
-                    # Reconstruct ParserResult from cached data
-                    return self._reconstruct_result(cached, file_path)
+                    if stat is not None:
+                        self._parse_cache.record(file_path, stat, content_hash)
+                    return self._resolve_cached(parser, cached, global_entity_names)
             except Exception as e:
                 logger.debug(f"Parse cache lookup failed for {file_path}: {e}")
 
         # Parse the file
-        try:
+        if parser.accepts_source_file:
             result = parser.parse(
                 file_path,
                 batch_callback=batch_callback,  # type: ignore[call-arg]
                 global_entity_names=global_entity_names,
+                source=source,
             )
-        except TypeError:
-            # Fallback for parsers that don't support new parameters
+        else:
             try:
-                result = parser.parse(file_path, batch_callback=batch_callback)  # type: ignore[call-arg]
+                result = parser.parse(
+                    file_path,
+                    batch_callback=batch_callback,  # type: ignore[call-arg]
+                    global_entity_names=global_entity_names,
+                )
             except TypeError:
-                # Final fallback for basic parsers
-                result = parser.parse(file_path)
+                # Fallback for parsers that don't support new parameters
+                try:
+                    result = parser.parse(file_path, batch_callback=batch_callback)  # type: ignore[call-arg]
+                except TypeError:
+                    # Final fallback for basic parsers
+                    result = parser.parse(file_path)
+
+        # Cache the result without the CALLS relations resolved against
+        # global_entity_names; hits resolve them against the current names
+        cacheable = result
+        if self._parse_cache is not None and parser.resolves_project_calls:
+            relations = list(result.relations)
+            calls = []
+            for relation in parser.resolve_calls(result, global_entity_names):
+                if relation in relations:
+                    relations.remove(relation)
+                    calls.append(relation)
+            cacheable = replace(result, relations=relations)
+            # Same order as a cache hit, which appends the resolved calls
+            result.relations = relations + calls
+
+        _tag_relations(result.relations, file_path)
 
         # Save to cache if available
         if self._parse_cache is not None and content_hash is not None:
             try:
-                self._parse_cache.set(content_hash, result)
+                self._parse_cache.set(content_hash, cacheable, stat)
             except Exception as e:
                 logger.debug(f"Failed to cache parse result for {file_path}: {e}")
 
         return result
 
-    def _reconstruct_result(self, cached: dict[str, Any], file_path: Path) -> ParserResult:
-        """Reconstruct ParserResult from cached data."""
-        from .models import Entity, EntityChunk, Relation
+    @staticmethod
+    def _resolve_cached(
+        parser: CodeParser, cached: Any, global_entity_names: Any
+    ) -> ParserResult:
+        """Add the project-dependent CALLS relations to a cached result."""
+        if parser.resolves_project_calls:
+
+            def resolve() -> list["Relation"]:
+                calls = parser.resolve_calls(cached, global_entity_names)
+                _tag_relations(calls, cached.file_path)
+                return calls
 
-        entities = []
-        for entity_data in cached.get("entities", []):
-            # Convert file_path back to Path if present
-            if "file_path" in entity_data and entity_data["file_path"]:
-                entity_data["file_path"] = Path(entity_data["file_path"])
-            entities.append(Entity(**entity_data))
+            cached.add_relations_on_load(resolve)
+        return cached
 
-        relations = []
-        for relation_data in cached.get("relations", []):
-            relations.append(Relation(**relation_data))
-
-        implementation_chunks = None
-        if cached.get("implementation_chunks"):
-            implementation_chunks = []
-            for chunk_data in cached["implementation_chunks"]:
-                if "file_path" in chunk_data and chunk_data["file_path"]:
-                    chunk_data["file_path"] = Path(chunk_data["file_path"])
-                implementation_chunks.append(EntityChunk(**chunk_data))
-
-        return ParserResult(
-            file_path=file_path,
-            entities=entities,
-            relations=relations,
-            implementation_chunks=implementation_chunks,
-            parsing_time=cached.get("parsing_time", 0.0),
-            file_hash=cached.get("file_hash", ""),
-            errors=cached.get("errors"),
-            warnings=cached.get("warnings"),
-        )
+    def clear_caches(self) -> None:
+        """Forget what parsers cached about other files, e.g. before a new batch."""
+        for parser in self._parsers:
+            parser.clear_cache()
+
+    def flush_cache(self) -> None:
+        """Commit buffered parse cache writes, if a cache is attached."""
+        if self._parse_cache is not None:
+            self._parse_cache.flush()
 
     def get_supported_extensions(self) -> list[str]:
         """Get all supported file extensions."""
@@ -0,0 +1,80 @@
+"""Single-read view of a source file shared by every parsing stage."""
+
+import hashlib
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+
+@dataclass
+class SourceFile:
+    """A file read once, with derived views computed on first use.
+
+    Parsers, the parse cache and change detection all need the file's bytes,
+    hash or text. Passing one SourceFile through the stages replaces a read
+    (and often a hash or decode) per stage with a single read per file.
+
+    The decoded text follows ``open(path, encoding="utf-8")`` semantics:
+    strict UTF-8 with universal newlines, so line numbers match tree-sitter's
+    and Jedi's. Decoding is lazy and raises ``UnicodeDecodeError`` on first
+    access for invalid files, like the reads it replaces.
+    """
+
+    path: Path
+    data: bytes
+    # Parsed tree-sitter tree, attached by the parser that produced it
+    tree: Any = field(default=None, repr=False)
+
+    @classmethod
+    def read(cls, path: Path) -> "SourceFile":
+        """Read a file from disk.
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        with open(path, "rb") as f:
+            return cls(Path(path), f.read())
+
+    @cached_property
+    def sha256(self) -> str:
+        """SHA256 hex digest of the raw bytes."""
+        return hashlib.sha256(self.data).hexdigest()
+
+    @cached_property
+    def text(self) -> str:
+        """Decoded text with universal newlines."""
+        text = self.data.decode("utf-8")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+    @cached_property
+    def lines(self) -> list[str]:
+        """Text split on newlines (no line terminators)."""
+        return self.text.split("\n")
+
+    @cached_property
+    def line_offsets(self) -> list[int]:
+        """Character offset in ``text`` where each line starts."""
+        offsets = [0]
+        text = self.text
+        pos = text.find("\n")
+        while pos != -1:
+            offsets.append(pos + 1)
+            pos = text.find("\n", pos + 1)
+        return offsets
+
+    def line_span(self, start_line: int, end_line: int) -> str:
+        """Return lines ``start_line..end_line`` (0-based, inclusive) as one string.
+
+        Equivalent to ``"\\n".join(lines[start_line:end_line + 1])`` without
+        materializing the slice.
+        """
+        offsets = self.line_offsets
+        if start_line >= len(offsets) or end_line < start_line:
+            return ""
+        start = offsets[max(start_line, 0)]
+        if end_line + 1 < len(offsets):
+            return self.text[start : offsets[end_line + 1] - 1]
+        return self.text[start:]
@@ -0,0 +1,63 @@
+"""Read-only index of project entity names for cross-file relation resolution."""
+
+import sys
+from collections.abc import Iterable, Iterator, Set
+
+
+class SymbolIndex:
+    """Immutable set of entity names known across the project.
+
+    Built once per indexing run and shared by every parse, including
+    ParallelFileProcessor workers, so resolving a file's CALLS relations
+    costs one lookup per call site instead of a copy of the project's
+    entity names per file. Names are interned so the index and the parsed
+    entities share string storage.
+    """
+
+    __slots__ = ("_names",)
+
+    def __init__(self, names: Iterable[str] = ()):
+        self._names: Set[str] = frozenset(sys.intern(name) for name in names if name)
+
+    @classmethod
+    def of(cls, names: "SymbolIndex | Set[str] | Iterable[str] | None") -> "SymbolIndex":
+        """Return ``names`` as a SymbolIndex without copying where possible.
+
+        Existing indexes are returned unchanged and sets are wrapped as-is;
+        callers must not mutate a wrapped set while it is in use.
+        """
+        if isinstance(names, SymbolIndex):
+            return names
+        if names is None:
+            return EMPTY_SYMBOL_INDEX
+        if isinstance(names, Set):
+            index = cls.__new__(cls)
+            index._names = names
+            return index
+        return cls(names)
+
+    def resolves(self, name: str, local_names: Set[str] | None = None) -> bool:
+        """Check whether ``name`` is defined in the current file or the project."""
+        return (local_names is not None and name in local_names) or name in self._names
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __bool__(self) -> bool:
+        return bool(self._names)
+
+    def __reduce__(self):
+        # Ship a frozenset to worker processes regardless of the wrapped type
+        return (SymbolIndex, (frozenset(self._names),))
+
+    def __repr__(self) -> str:
+        return f"SymbolIndex({len(self._names)} names)"
+
+
+EMPTY_SYMBOL_INDEX = SymbolIndex()
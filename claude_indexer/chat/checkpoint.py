@@ -0,0 +1,103 @@
+"""Read positions of chat log files, persisted between chat index runs."""
+
+import json
+import os
+import tempfile
+from logging import Logger
+from pathlib import Path
+from typing import Any
+
+from ..indexer_logging import get_logger
+
+
+class ChatCheckpoint:
+    """Tracks how far each chat JSONL file has been parsed and indexed.
+
+    Each entry records the file's inode, size and mtime, the byte offset
+    parsed up to with a fingerprint of the bytes before it, and aggregate
+    session statistics, so later runs skip unchanged files by stat alone
+    and parse only appended lines.
+
+    Entries are staged while parsing and only committed once the resulting
+    conversation was indexed, so a failed run re-reads the same lines.
+
+    Cache Structure:
+        .index_cache/
+            chat_checkpoint.json
+    """
+
+    CHECKPOINT_FILE = "chat_checkpoint.json"
+
+    def __init__(self, cache_dir: Path, logger: Logger | None = None):
+        """Initialize and load the checkpoint.
+
+        Args:
+            cache_dir: Directory for checkpoint storage
+            logger: Optional logger instance
+        """
+        self.cache_dir = Path(cache_dir)
+        self.path = self.cache_dir / self.CHECKPOINT_FILE
+        self.logger = logger or get_logger()
+        self._files: dict[str, dict[str, Any]] = {}
+        self._staged: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """Load existing checkpoint from disk."""
+        try:
+            if self.path.exists():
+                with open(self.path) as f:
+                    self._files = json.load(f).get("files", {})
+        except Exception as e:
+            self.logger.warning(f"Failed to load chat checkpoint: {e}")
+            self._files = {}
+
+    def get(self, file_path: Path) -> dict[str, Any] | None:
+        """Get the committed entry for a chat file."""
+        return self._files.get(str(file_path))
+
+    def is_unchanged(self, file_path: Path, stat: os.stat_result) -> bool:
+        """Check whether a file is exactly as it was when last committed."""
+        entry = self.get(file_path)
+        return (
+            entry is not None
+            and entry.get("inode") == stat.st_ino
+            and entry.get("size") == stat.st_size
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+        )
+
+    def stage(self, file_path: Path, entry: dict[str, Any]) -> None:
+        """Hold a new entry until its conversation is indexed."""
+        self._staged[str(file_path)] = entry
+
+    def commit(self, file_path: Path) -> None:
+        """Make a staged entry the committed one; saved by save()."""
+        entry = self._staged.pop(str(file_path), None)
+        if entry is not None:
+            self._files[str(file_path)] = entry
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist committed entries to disk.
+
+        Uses atomic write with temp file + rename pattern to prevent
+        corruption from interrupted writes.
+        """
+        if not self._dirty:
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"files": self._files}, f)
+                os.replace(temp_path, self.path)
+                self._dirty = False
+            except Exception:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                raise
+        except Exception as e:
+            self.logger.warning(f"Failed to save chat checkpoint: {e}")
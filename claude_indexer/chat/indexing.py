@@ -0,0 +1,136 @@
+"""Batched indexing of chat conversation summaries into the vector store."""
+
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from typing import Any
+
+from ..analysis.entities import ChatChunk
+from ..indexer_logging import get_logger
+from .parser import ChatConversation
+from .summarizer import ChatSummarizer
+
+# Conversations summarized, embedded and upserted together
+CHAT_BATCH_SIZE = 32
+
+ProgressCallback = Callable[[ChatConversation, str], None]
+
+
+def summary_chunk_id(conversation: ChatConversation) -> str:
+    """Chunk ID of a conversation's summary; its point ID derives from it.
+
+    Conversations parsed from a checkpoint offset hold only appended
+    messages, so their summary is stored alongside the earlier ones.
+    """
+    chunk_id = f"chat::{conversation.summary_key}::summary"
+    if conversation.start_offset:
+        chunk_id += f"::{conversation.start_offset}"
+    return chunk_id
+
+
+def index_conversations(
+    conversations: Iterable[ChatConversation],
+    summarizer: ChatSummarizer,
+    embedder: Any,
+    store: Any,
+    collection_name: str,
+    batch_size: int = CHAT_BATCH_SIZE,
+    on_progress: ProgressCallback | None = None,
+) -> dict[str, int]:
+    """Summarize, embed and store conversations a batch at a time.
+
+    Conversations are consumed lazily, so only one batch is held in memory.
+    Sessions whose summary point is already stored are skipped before any
+    summarization. Each batch is summarized concurrently, embedded with one
+    ``embed_batch`` call and written with one ``upsert_points`` call.
+    Summaries that failed are not stored, so they are retried next run.
+
+    Args:
+        conversations: Conversations to index, e.g. from ChatParser.iter_chats
+        summarizer: Summarizer used for new sessions
+        embedder: Embedder providing ``embed_batch``
+        store: Vector store providing ``upsert_points``
+        collection_name: Target collection
+        batch_size: Conversations per batch
+        on_progress: Called with each conversation and its outcome,
+            "indexed", "skipped" or "failed"
+
+    Returns:
+        Counts of indexed, skipped and failed conversations
+    """
+    logger = get_logger()
+    stats = {"indexed": 0, "skipped": 0, "failed": 0}
+
+    def report(conversation: ChatConversation, outcome: str) -> None:
+        stats[outcome] += 1
+        if on_progress:
+            on_progress(conversation, outcome)
+
+    for batch in _batched(conversations, batch_size):
+        point_ids = [store.generate_deterministic_id(summary_chunk_id(c)) for c in batch]
+        existing = (
+            store.find_existing_point_ids(collection_name, point_ids)
+            if hasattr(store, "find_existing_point_ids")
+            else set()
+        )
+        new_conversations = []
+        for conversation, point_id in zip(batch, point_ids, strict=True):
+            if point_id in existing:
+                report(conversation, "skipped")
+            else:
+                new_conversations.append(conversation)
+        if not new_conversations:
+            continue
+
+        summaries = summarizer.batch_summarize(new_conversations)
+        pending = []
+        for conversation, summary in zip(new_conversations, summaries, strict=True):
+            if "error" in summary.debugging_info:
+                logger.debug(
+                    f"Summary failed for {conversation.metadata.session_id}: "
+                    f"{summary.debugging_info['error']}"
+                )
+                report(conversation, "failed")
+            else:
+                pending.append((conversation, " | ".join(summary.to_observations())))
+        if not pending:
+            continue
+
+        embeddings = embedder.embed_batch(
+            [content for _, content in pending], item_type="general"
+        )
+        points = []
+        stored = []
+        for (conversation, content), embedding in zip(pending, embeddings, strict=True):
+            if not embedding.success:
+                report(conversation, "failed")
+                continue
+            chunk = ChatChunk(
+                id=summary_chunk_id(conversation),
+                chat_id=conversation.summary_key,
+                chunk_type="chat_summary",
+                content=content,
+                timestamp=str(conversation.metadata.start_time),
+            )
+            points.append(
+                store.create_chat_chunk_point(chunk, embedding.embedding, collection_name)
+            )
+            stored.append(conversation)
+        if not points:
+            continue
+
+        result = store.upsert_points(collection_name, points)
+        if not result.success:
+            logger.warning(f"Failed to store chat batch: {'; '.join(result.errors)}")
+        for conversation in stored:
+            report(conversation, "indexed" if result.success else "failed")
+
+    return stats
+
+
+def _batched(
+    items: Iterable[ChatConversation], size: int
+) -> Iterator[list[ChatConversation]]:
+    """Yield lists of up to ``size`` items."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
@@ -2,11 +2,18 @@
 
 import hashlib
 import json
+import re
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from .checkpoint import ChatCheckpoint
+
+# Bytes before a checkpoint offset that must be unchanged to resume there
+FINGERPRINT_BYTES = 256
+
 
 @dataclass
 class ChatMessage:
@@ -62,6 +69,9 @@ class ChatConversation:
     messages: list[ChatMessage]
     metadata: ChatMetadata
     file_path: Path
+    # Byte offset the messages were read from; non-zero when only lines
+    # appended since the last indexed run were parsed
+    start_offset: int = 0
 
     @property
     def session_hash(self) -> str:
@@ -110,38 +120,130 @@ class ChatParser:
     def parse_jsonl(self, file_path: Path) -> ChatConversation | None:
         """Parse a single JSONL file into a conversation."""
         try:
-            messages = []
             session_id = file_path.stem  # Use filename as session ID
+            messages, _ = self.read_messages(file_path)
 
-            with open(file_path, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
+            if not messages:
+                return None
+
+            # Extract metadata
+            metadata = self._extract_metadata(messages, file_path, session_id)
+
+            return ChatConversation(
+                messages=messages, metadata=metadata, file_path=file_path
+            )
+
+        except Exception as e:
+            print(f"Error parsing {file_path}: {e}")
+            return None
 
+    def read_messages(
+        self, file_path: Path, start_offset: int = 0
+    ) -> tuple[list[ChatMessage], int]:
+        """Stream messages from a JSONL file, one line at a time.
+
+        A final line without a newline that is not valid JSON is treated as
+        still being written and left for the next read.
+
+        Args:
+            file_path: Chat file to read
+            start_offset: Byte offset of the first line to read
+
+        Returns:
+            Tuple of (messages, byte offset just past the last line consumed)
+        """
+        messages = []
+        offset = start_offset
+
+        with open(file_path, "rb") as f:
+            f.seek(start_offset)
+            for raw_line in f:
+                complete = raw_line.endswith(b"\n")
+                line = raw_line.strip()
+                if line:
                     try:
-                        data = json.loads(line)
-                        message = self._parse_message(data)
+                        message = self._parse_message(json.loads(line))
                         if message:
                             messages.append(message)
-                    except json.JSONDecodeError as e:
+                    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                        if not complete:
+                            break
                         print(f"Skipping malformed JSON line in {file_path}: {e}")
-                        continue
+                offset += len(raw_line)
 
-            if not messages:
+        return messages, offset
+
+    def parse_incremental(
+        self, file_path: Path, checkpoint: ChatCheckpoint
+    ) -> ChatConversation | None:
+        """Parse only what was appended to a chat file since its checkpoint.
+
+        Files whose inode, size and mtime match the checkpoint are skipped
+        without being opened. Files that were replaced, truncated or
+        rewritten in place (the bytes before the offset changed) are parsed
+        from the start. The returned conversation holds only the new
+        messages, with metadata covering the whole session; its checkpoint
+        entry is staged for the caller to commit once it is indexed.
+
+        Returns:
+            The conversation's new messages, or None if there are none
+        """
+        try:
+            stat = file_path.stat()
+            if checkpoint.is_unchanged(file_path, stat):
                 return None
 
-            # Extract metadata
-            metadata = self._extract_metadata(messages, file_path, session_id)
+            entry = checkpoint.get(file_path)
+            resume = (
+                entry is not None
+                and entry.get("inode") == stat.st_ino
+                and entry.get("offset", 0) <= stat.st_size
+                and entry.get("fingerprint")
+                == self._fingerprint(file_path, entry.get("offset", 0))
+            )
+            start_offset = entry["offset"] if resume else 0
+
+            messages, offset = self.read_messages(file_path, start_offset)
+            stats = self._session_stats(messages)
+            if resume:
+                stats = self._merge_session_stats(entry["session"], stats)
+
+            checkpoint.stage(
+                file_path,
+                {
+                    "inode": stat.st_ino,
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "offset": offset,
+                    "fingerprint": self._fingerprint(file_path, offset),
+                    "session": stats,
+                },
+            )
+            if not messages:
+                # Nothing to index; remember how far was read
+                checkpoint.commit(file_path)
+                return None
 
             return ChatConversation(
-                messages=messages, metadata=metadata, file_path=file_path
+                messages=messages,
+                metadata=self._metadata_from_stats(stats, file_path, file_path.stem),
+                file_path=file_path,
+                start_offset=start_offset,
             )
 
         except Exception as e:
             print(f"Error parsing {file_path}: {e}")
             return None
 
+    @staticmethod
+    def _fingerprint(file_path: Path, offset: int) -> str:
+        """Hash of the bytes just before ``offset``, i.e. the last lines read."""
+        start = max(0, offset - FINGERPRINT_BYTES)
+        with open(file_path, "rb") as f:
+            f.seek(start)
+            data = f.read(offset - start)
+        return hashlib.sha256(data).hexdigest()[:16]
+
     def _parse_message(self, data: dict[str, Any]) -> ChatMessage | None:
         """Parse individual message from JSONL data."""
         # Handle different possible JSONL formats
@@ -162,11 +264,12 @@ class ChatParser:
                 elif not isinstance(content, str):
                     content = str(content)
 
+                # The nested message is already in content; don't keep it twice
                 return ChatMessage(
                     role=message_data["role"],
                     content=content,
                     timestamp=self._parse_timestamp(data.get("timestamp")),
-                    metadata=data,
+                    metadata={k: v for k, v in data.items() if k != "message"},
                 )
 
         # Standard format
@@ -216,48 +319,89 @@ class ChatParser:
         self, messages: list[ChatMessage], file_path: Path, session_id: str
     ) -> ChatMetadata:
         """Extract metadata from messages."""
+        return self._metadata_from_stats(
+            self._session_stats(messages), file_path, session_id
+        )
+
+    def _session_stats(self, messages: list[ChatMessage]) -> dict[str, Any]:
+        """Aggregate statistics of messages, JSON-serializable for checkpoints."""
+        timestamps = [msg.timestamp for msg in messages if msg.timestamp]
+        return {
+            "start_time": min(timestamps).isoformat() if timestamps else None,
+            "end_time": max(timestamps).isoformat() if timestamps else None,
+            "message_count": len(messages),
+            "total_words": sum(msg.word_count for msg in messages),
+            "has_code": any(msg.is_code_heavy for msg in messages),
+            "languages": self._count_languages(messages),
+        }
+
+    @staticmethod
+    def _merge_session_stats(
+        previous: dict[str, Any], new: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Combine statistics of a session's earlier and appended messages."""
+        starts = [t for t in (previous["start_time"], new["start_time"]) if t]
+        ends = [t for t in (previous["end_time"], new["end_time"]) if t]
+        languages = dict(previous["languages"])
+        for lang, count in new["languages"].items():
+            languages[lang] = languages.get(lang, 0) + count
+        return {
+            "start_time": min(starts, key=datetime.fromisoformat) if starts else None,
+            "end_time": max(ends, key=datetime.fromisoformat) if ends else None,
+            "message_count": previous["message_count"] + new["message_count"],
+            "total_words": previous["total_words"] + new["total_words"],
+            "has_code": previous["has_code"] or new["has_code"],
+            "languages": languages,
+        }
+
+    def _metadata_from_stats(
+        self, stats: dict[str, Any], file_path: Path, session_id: str
+    ) -> ChatMetadata:
+        """Build metadata from aggregate session statistics."""
         # Get project path from file location
         project_dir_name = file_path.parent.name
         # Decode project path by replacing hyphens with slashes
         project_path = "/" + project_dir_name.replace("-", "/")
 
         # Calculate timestamps
-        timestamps = [msg.timestamp for msg in messages if msg.timestamp]
-        if timestamps:
-            start_time = min(timestamps)
-            end_time = max(timestamps)
+        if stats["start_time"]:
+            start_time = datetime.fromisoformat(stats["start_time"])
+            end_time = datetime.fromisoformat(stats["end_time"])
         else:
             # Fall back to file times
             stat = file_path.stat()
             start_time = datetime.fromtimestamp(stat.st_ctime)
             end_time = datetime.fromtimestamp(stat.st_mtime)
 
-        # Calculate statistics
-        total_words = sum(msg.word_count for msg in messages)
-        has_code = any(msg.is_code_heavy for msg in messages)
-
-        # Detect primary language from code blocks
-        primary_language = self._detect_primary_language(messages)
+        languages = stats["languages"]
+        primary_language = (
+            max(languages, key=lambda x: languages[x]) if languages else None
+        )
 
         return ChatMetadata(
             project_path=project_path,
             session_id=session_id,
             start_time=start_time,
             end_time=end_time,
-            message_count=len(messages),
-            total_words=total_words,
-            has_code=has_code,
+            message_count=stats["message_count"],
+            total_words=stats["total_words"],
+            has_code=stats["has_code"],
             primary_language=primary_language,
         )
 
     def _detect_primary_language(self, messages: list[ChatMessage]) -> str | None:
         """Detect primary programming language from code blocks."""
+        language_counts = self._count_languages(messages)
+        if language_counts:
+            return max(language_counts, key=lambda x: language_counts[x])
+        return None
+
+    def _count_languages(self, messages: list[ChatMessage]) -> dict[str, int]:
+        """Count code blocks per language specifier."""
         language_counts: dict[str, int] = {}
 
         for msg in messages:
             # Look for code blocks with language specifiers
-            import re
-
             code_blocks = re.findall(r"```(\w+)\n", msg.content)
             for lang in code_blocks:
                 if lang.lower() not in ["bash", "shell", "text", "plaintext"]:
@@ -265,9 +409,7 @@ class ChatParser:
                         language_counts.get(lang.lower(), 0) + 1
                     )
 
-        if language_counts:
-            return max(language_counts, key=lambda x: language_counts[x])
-        return None
+        return language_counts
 
     def get_inactive_conversations(
         self, project_path: Path, threshold_hours: float = 1.0
@@ -286,19 +428,32 @@ class ChatParser:
 
         return inactive_files
 
-    def parse_all_chats(
-        self, project_path: Path, limit: int | None = None
-    ) -> list[ChatConversation]:
-        """Parse all chat files for a project."""
+    def iter_chats(
+        self,
+        project_path: Path,
+        limit: int | None = None,
+        checkpoint: ChatCheckpoint | None = None,
+    ) -> Iterator[ChatConversation]:
+        """Parse chat files for a project one at a time, newest first.
+
+        With a checkpoint, unchanged files are skipped and only appended
+        lines are parsed; see parse_incremental().
+        """
         chat_files = self.get_chat_files(project_path)
 
         if limit:
             chat_files = chat_files[:limit]
 
-        conversations = []
         for file_path in chat_files:
-            conversation = self.parse_jsonl(file_path)
+            if checkpoint is not None:
+                conversation = self.parse_incremental(file_path, checkpoint)
+            else:
+                conversation = self.parse_jsonl(file_path)
             if conversation:
-                conversations.append(conversation)
+                yield conversation
 
-        return conversations
+    def parse_all_chats(
+        self, project_path: Path, limit: int | None = None
+    ) -> list[ChatConversation]:
+        """Parse all chat files for a project."""
+        return list(self.iter_chats(project_path, limit=limit))
@@ -1,6 +1,7 @@
 """Chat summarization using OpenAI API for Claude Code conversations."""
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -204,6 +205,7 @@ class ChatSummarizer:
         self.max_retries = 3
         self.base_delay = 1.0
         self.max_tokens = 4000
+        self.max_concurrency = 4
 
     def summarize_conversation(self, conversation: ChatConversation) -> SummaryResult:
         """Summarize a complete conversation."""
@@ -378,27 +380,28 @@ Respond in JSON format:
         return topics or ["general"]
 
     def batch_summarize(
-        self, conversations: list[ChatConversation]
+        self, conversations: list[ChatConversation], max_workers: int | None = None
     ) -> list[SummaryResult]:
-        """Summarize multiple conversations with rate limiting."""
-        results = []
+        """Summarize multiple conversations with bounded concurrency.
 
-        for i, conversation in enumerate(conversations):
-            try:
-                result = self.summarize_conversation(conversation)
-                results.append(result)
+        At most ``max_workers`` requests (default ``max_concurrency``) are in
+        flight; rate-limited calls back off in ``_call_openai_with_retry``.
+        Results are returned in input order.
+        """
+        if not conversations:
+            return []
 
-                # Rate limiting: small delay between calls
-                if i < len(conversations) - 1:
-                    time.sleep(0.5)
+        workers = min(max_workers or self.max_concurrency, len(conversations))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._summarize_safely, conversations))
 
-            except Exception as e:
-                # Continue with other conversations on individual failures
-                results.append(
-                    SummaryResult(
-                        summary=f"Failed to summarize: {str(e)}",
-                        debugging_info={"error": str(e)},
-                    )
-                )
-
-        return results
+    def _summarize_safely(self, conversation: ChatConversation) -> SummaryResult:
+        """Summarize one conversation, turning failures into a result."""
+        try:
+            return self.summarize_conversation(conversation)
+        except Exception as e:
+            # Continue with other conversations on individual failures
+            return SummaryResult(
+                summary=f"Failed to summarize: {str(e)}",
+                debugging_info={"error": str(e)},
+            )
@@ -20,6 +20,7 @@ def cli():
             "hooks",
             "watch",
             "service",
+            "daemon",
             "search",
             "file",
             "add-mcp",
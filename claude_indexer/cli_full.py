@@ -1946,6 +1946,77 @@ else:
             click.echo(f"❌ Error: {e}", err=True)
             sys.exit(1)
 
+    @cli.group()
+    def daemon() -> None:
+        """Resident indexer daemon for fast hook responses."""
+        pass
+
+    @daemon.command("start")
+    @common_options
+    @click.option(
+        "--socket", "socket_path", type=click.Path(), help="Unix socket path"
+    )
+    def start_daemon(verbose, quiet, no_color, config, socket_path):
+        """Run the indexer daemon in the foreground.
+
+        Keeps rule engines, parsers, embedders and Qdrant connections warm so
+        hooks answer in milliseconds instead of paying CLI start-up.
+        """
+        from .hooks.daemon import DaemonClient, get_socket_path, run_daemon
+
+        path = Path(socket_path) if socket_path else get_socket_path()
+        if DaemonClient(path, timeout=1.0).is_running():
+            if not quiet:
+                click.echo(f"ℹ️  Daemon already running at {path}")
+            return
+
+        if not quiet:
+            click.echo(f"🚀 Starting indexer daemon on {path}")
+        sys.exit(run_daemon(path))
+
+    @daemon.command("stop")
+    @common_options
+    @click.option(
+        "--socket", "socket_path", type=click.Path(), help="Unix socket path"
+    )
+    def stop_daemon(verbose, quiet, no_color, config, socket_path):
+        """Stop a running indexer daemon."""
+        from .hooks.daemon import DaemonClient, DaemonUnavailableError
+
+        try:
+            DaemonClient(Path(socket_path) if socket_path else None).request(
+                {"command": "shutdown"}
+            )
+            if not quiet:
+                click.echo("✅ Daemon stopped")
+        except DaemonUnavailableError:
+            if not quiet:
+                click.echo("ℹ️  Daemon is not running")
+
+    @daemon.command("status")
+    @common_options
+    @click.option(
+        "--socket", "socket_path", type=click.Path(), help="Unix socket path"
+    )
+    def daemon_status(verbose, quiet, no_color, config, socket_path):
+        """Show indexer daemon status."""
+        from .hooks.daemon import DaemonClient, DaemonUnavailableError
+
+        client = DaemonClient(Path(socket_path) if socket_path else None)
+        try:
+            info = client.request({"command": "status"})
+        except DaemonUnavailableError:
+            click.echo("Daemon Status: 🔴 Stopped")
+            sys.exit(1)
+
+        click.echo("Daemon Status: 🟢 Running")
+        click.echo(f"Socket: {client.socket_path}")
+        click.echo(f"PID: {info['pid']}")
+        click.echo(f"Uptime: {info['uptime_seconds']:.0f}s")
+        click.echo(f"Requests served: {info['requests_served']}")
+        click.echo(f"Files pending: {info['pending_files']}")
+        click.echo(f"Files indexed: {info['files_indexed']}")
+
     @cli.group()
     def hooks():
         """Git hooks management."""
@@ -3108,6 +3179,8 @@ else:
             store = create_store_from_config(config_obj)
 
             # Import chat modules
+            from .chat.checkpoint import ChatCheckpoint
+            from .chat.indexing import index_conversations
             from .chat.parser import ChatParser
             from .chat.summarizer import ChatSummarizer
 
@@ -3117,107 +3190,55 @@ else:
             # Initialize chat parser and summarizer
             parser = ChatParser()
             summarizer = ChatSummarizer(config_obj)
+            checkpoint = ChatCheckpoint(cache_dir)
 
-            # Parse conversations
-            project_path = Path(project).resolve()
-            conversations = parser.parse_all_chats(project_path, limit=limit)
-
-            if not conversations:
-                if not quiet:
-                    click.echo("📭 No chat conversations found")
-                return
+            # Stream conversations; only one batch is parsed and held at a time,
+            # and only lines appended since the last run are read
+            conversations = parser.iter_chats(
+                project_path, limit=limit, checkpoint=checkpoint
+            )
 
             # Filter inactive conversations if requested
             if inactive_hours > 0:
-                active_conversations = [
+                conversations = (
                     conv
                     for conv in conversations
                     if not conv.metadata.is_inactive(inactive_hours)
-                ]
-                if not quiet and len(active_conversations) != len(conversations):
+                )
+
+            def on_progress(conversation, outcome):
+                if outcome != "failed":
+                    checkpoint.commit(conversation.file_path)
+                if verbose:
+                    symbol = {"indexed": "✅", "skipped": "⏭️ ", "failed": "❌"}[outcome]
                     click.echo(
-                        f"🔍 Filtered to {len(active_conversations)} active conversations (inactive threshold: {inactive_hours}h)"
+                        f"  {symbol} {outcome.capitalize()}: {conversation.metadata.session_id}"
                     )
-                conversations = active_conversations
-
-            if not conversations:
-                if not quiet:
-                    click.echo("📭 No active conversations found")
-                return
-
-            if not quiet:
-                click.echo(f"📚 Processing {len(conversations)} conversations...")
 
-            # Generate summaries
-            summaries = summarizer.batch_summarize(conversations)
-
-            # Store summaries as entities
-            success_count = 0
-            error_count = 0
-
-            for conversation, summary in zip(conversations, summaries, strict=False):
-                try:
-                    # Create chat chunk from summary for v2.4 pure architecture
-                    from .analysis.entities import ChatChunk
-
-                    # Generate embedding
-                    chat_content = " | ".join(summary.to_observations())
-                    embedding_result = embedder.embed_text(chat_content)
-
-                    if embedding_result.success:
-                        # Create chat chunk
-                        chat_chunk = ChatChunk(
-                            id=f"chat::{conversation.summary_key}::summary",
-                            chat_id=conversation.summary_key,
-                            chunk_type="chat_summary",
-                            content=chat_content,
-                            timestamp=str(conversation.metadata.start_time)
-                            if hasattr(conversation.metadata, "start_time")
-                            else None,
-                        )
-
-                        # Create vector point
-                        point = store.create_chat_chunk_point(
-                            chat_chunk, embedding_result.embedding, collection
-                        )
-
-                        # Store in vector database
-                        result = store.batch_upsert(collection, [point])
-
-                        if result.success:
-                            success_count += 1
-                            if verbose:
-                                click.echo(
-                                    f"  ✅ Indexed: {conversation.metadata.session_id}"
-                                )
-                        else:
-                            error_count += 1
-                            if verbose:
-                                click.echo(
-                                    f"  ❌ Failed to store: {conversation.metadata.session_id}"
-                                )
-                    else:
-                        error_count += 1
-                        if verbose:
-                            click.echo(
-                                f"  ❌ Failed to embed: {conversation.metadata.session_id}"
-                            )
-
-                except Exception as e:
-                    error_count += 1
-                    if verbose:
-                        click.echo(
-                            f"  ❌ Error processing {conversation.metadata.session_id}: {e}"
-                        )
+            try:
+                stats = index_conversations(
+                    conversations,
+                    summarizer,
+                    embedder,
+                    store,
+                    collection,
+                    on_progress=on_progress,
+                )
+            finally:
+                checkpoint.save()
 
             # Summary output
             if not quiet:
-                if success_count > 0:
+                if not any(stats.values()):
+                    click.echo("📭 No chat conversations found")
+                if stats["indexed"] > 0:
                     click.echo(
-                        f"✅ Successfully indexed {success_count} chat conversations"
+                        f"✅ Successfully indexed {stats['indexed']} chat conversations"
                     )
-                if error_count > 0:
-                    click.echo(f"❌ Failed to index {error_count} conversations")
+                if stats["skipped"] > 0:
+                    click.echo(f"⏭️  Skipped {stats['skipped']} already indexed conversations")
+                if stats["failed"] > 0:
+                    click.echo(f"❌ Failed to index {stats['failed']} conversations")
 
         except Exception as e:
             click.echo(f"❌ Chat indexing failed: {e}", err=True)
@@ -136,6 +136,7 @@ class HierarchicalConfigLoader:
         "max_concurrent_files": ("performance", "max_concurrent_files"),
         "use_parallel_processing": ("performance", "use_parallel_processing"),
         "max_parallel_workers": ("performance", "max_parallel_workers"),
+        "embedding_concurrency": ("performance", "embedding_concurrency"),
         "cleanup_interval_minutes": ("performance", "cleanup_interval_minutes"),
         "include_markdown": ("indexing", "include_markdown"),
         "include_tests": ("indexing", "include_tests"),
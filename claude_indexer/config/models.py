@@ -113,6 +113,7 @@ class IndexerConfig(BaseModel):
     # Parallel Processing
     use_parallel_processing: bool = Field(default=True)  # Enable multiprocessing
     max_parallel_workers: int = Field(default=0, ge=0, le=16)  # 0=auto (CPU count - 1)
+    embedding_concurrency: int = Field(default=1, ge=1, le=32)  # Embedding requests in flight
 
     # State Management
     state_directory: Path | None = Field(default=None)
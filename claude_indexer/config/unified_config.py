@@ -186,6 +186,9 @@ class PerformanceConfig(BaseModel):
     max_parallel_workers: int = Field(
         default=0, ge=0, le=16, description="Max parallel workers (0 = auto)"
     )
+    embedding_concurrency: int = Field(
+        default=1, ge=1, le=32, description="Embedding API requests in flight"
+    )
     cleanup_interval_minutes: int = Field(
         default=1, ge=0, le=10080, description="Cleanup interval (0 = disabled)"
     )
@@ -348,6 +351,7 @@ class UnifiedConfig(BaseModel):
             max_concurrent_files=self.performance.max_concurrent_files,
             use_parallel_processing=self.performance.use_parallel_processing,
             max_parallel_workers=self.performance.max_parallel_workers,
+            embedding_concurrency=self.performance.embedding_concurrency,
             cleanup_interval_minutes=self.performance.cleanup_interval_minutes,
         )
 
@@ -401,6 +405,7 @@ class UnifiedConfig(BaseModel):
                 max_concurrent_files=config.max_concurrent_files,
                 use_parallel_processing=config.use_parallel_processing,
                 max_parallel_workers=config.max_parallel_workers,
+                embedding_concurrency=config.embedding_concurrency,
                 cleanup_interval_minutes=config.cleanup_interval_minutes,
             ),
             logging=LoggingConfig(
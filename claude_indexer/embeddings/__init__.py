@@ -1,16 +1,24 @@
 """Embeddings package for generating vector representations of text."""
 
-from .base import BatchingEmbedder, CachingEmbedder, Embedder, EmbeddingResult
-from .bm25 import BM25Embedder
+from .base import (
+    BatchingEmbedder,
+    CachingEmbedder,
+    Embedder,
+    EmbeddingResult,
+    SparseEmbedding,
+)
+from .bm25 import BM25Embedder, BM25Statistics
 from .openai import OpenAIEmbedder
 from .registry import EmbedderRegistry
 
 __all__ = [
     "Embedder",
     "EmbeddingResult",
+    "SparseEmbedding",
     "CachingEmbedder",
     "BatchingEmbedder",
     "BM25Embedder",
+    "BM25Statistics",
     "OpenAIEmbedder",
     "EmbedderRegistry",
 ]
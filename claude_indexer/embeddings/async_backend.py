@@ -0,0 +1,429 @@
+"""Asyncio HTTP backend for batch embedding requests.
+
+Keeps several embedding requests in flight, packs texts into requests up to
+the provider's token limit, budgets tokens per minute and adapts its
+concurrency to 429 / ``Retry-After`` feedback from the provider. Both
+OpenAI and Voyage expose the same request/response shape for embeddings,
+so one backend serves both.
+"""
+
+import asyncio
+import contextlib
+import random
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from .base import EmbeddingResult
+
+try:
+    import aiohttp
+
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+
+# HTTP statuses that are worth retrying besides 429
+RETRYABLE_STATUSES = frozenset({408, 500, 502, 503, 504})
+
+
+class EmbeddingRequestError(Exception):
+    """Embedding request failed with an HTTP error."""
+
+    def __init__(self, status: int, message: str, retry_after: float | None = None):
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+        self.retry_after = retry_after
+
+    @property
+    def retryable(self) -> bool:
+        """Whether the request may succeed when sent again."""
+        return self.status == 429 or self.status in RETRYABLE_STATUSES
+
+
+class AdaptiveConcurrencyLimiter:
+    """Additive-increase / multiplicative-decrease limit on in-flight requests.
+
+    Every 429 halves the limit and pauses all new requests until the
+    provider's ``Retry-After`` has passed. After ``limit`` consecutive
+    successes the limit grows by one again, up to ``max_limit``.
+
+    The learned limit and pause outlive a single event loop, so one
+    limiter can serve successive ``asyncio.run`` calls.
+    """
+
+    def __init__(self, max_limit: int, min_limit: int = 1):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = self.max_limit
+        self._in_flight = 0
+        self._successes = 0
+        self._paused_until = 0.0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._condition: asyncio.Condition | None = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        # asyncio primitives belong to one loop; start fresh in a new one
+        loop = asyncio.get_running_loop()
+        if self._condition is None or loop is not self._loop:
+            self._loop = loop
+            self._condition = asyncio.Condition()
+            self._in_flight = 0
+        return self._condition
+
+    async def acquire(self) -> None:
+        """Wait for a free slot and for any rate-limit pause to pass."""
+        condition = self._get_condition()
+        async with condition:
+            while True:
+                pause = self._paused_until - time.monotonic()
+                if pause > 0:
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(condition.wait(), timeout=pause)
+                    continue
+                if self._in_flight < self.limit:
+                    self._in_flight += 1
+                    return
+                await condition.wait()
+
+    async def release(self, rate_limited: bool = False, retry_after: float = 0.0) -> None:
+        """Return a slot, adjusting the limit from the request outcome."""
+        async with self._get_condition():
+            self._in_flight -= 1
+            if rate_limited:
+                self._successes = 0
+                self.limit = max(self.min_limit, self.limit // 2)
+                self._paused_until = max(
+                    self._paused_until, time.monotonic() + retry_after
+                )
+            else:
+                self._successes += 1
+                if self._successes >= self.limit and self.limit < self.max_limit:
+                    self.limit += 1
+                    self._successes = 0
+            self._get_condition().notify_all()
+
+
+class TokenBudget:
+    """Sliding one-minute budget of tokens sent to the provider.
+
+    Spent tokens are remembered across event loops, like the limiter's state.
+    """
+
+    def __init__(self, tokens_per_minute: int, window_seconds: float = 60.0):
+        self.tokens_per_minute = tokens_per_minute
+        self.window_seconds = window_seconds
+        self._spent: deque[tuple[float, int]] = deque()
+        self._total = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock: asyncio.Lock | None = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or loop is not self._loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until ``tokens`` fit into the current window, then spend them."""
+        async with self._get_lock():
+            while True:
+                now = time.monotonic()
+                while self._spent and now - self._spent[0][0] >= self.window_seconds:
+                    self._total -= self._spent.popleft()[1]
+
+                # A single oversized request is let through on an empty window
+                if not self._spent or self._total + tokens <= self.tokens_per_minute:
+                    self._spent.append((now, tokens))
+                    self._total += tokens
+                    return
+
+                await asyncio.sleep(self._spent[0][0] + self.window_seconds - now)
+
+
+class AsyncEmbeddingBackend:
+    """Concurrent, token-packed embedding requests over HTTP.
+
+    Example:
+        >>> backend = AsyncEmbeddingBackend(
+        ...     url="https://api.openai.com/v1/embeddings",
+        ...     api_key=api_key,
+        ...     model="text-embedding-3-small",
+        ...     count_tokens=embedder._estimate_tokens,
+        ...     max_batch_tokens=120_000,
+        ...     max_batch_texts=2048,
+        ... )
+        >>> results = asyncio.run(backend.embed(texts))
+    """
+
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        model: str,
+        count_tokens: Callable[[str], int],
+        max_batch_tokens: int,
+        max_batch_texts: int,
+        tokens_per_minute: int = 1_000_000,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        timeout: float = 30.0,
+        extra_payload: dict[str, Any] | None = None,
+        cost_per_1k_tokens: float = 0.0,
+        on_request: Callable[[float, int], None] | None = None,
+    ):
+        """Initialize the backend.
+
+        Args:
+            url: Embeddings endpoint accepting ``{"model", "input": [...]}``
+            api_key: Bearer token for the provider
+            model: Model name sent with every request
+            count_tokens: Token counter used to pack requests
+            max_batch_tokens: Token limit for a single request
+            max_batch_texts: Text count limit for a single request
+            tokens_per_minute: Provider token budget per minute
+            max_concurrency: Upper bound on requests in flight
+            max_retries: Retries per request on 429, 5xx and timeouts
+            base_delay: First backoff delay when no Retry-After is given
+            max_delay: Backoff ceiling in seconds
+            timeout: Per-request timeout in seconds
+            extra_payload: Provider-specific request fields
+            cost_per_1k_tokens: Price used for result cost estimates
+            on_request: Called with (timestamp, tokens) after each request
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError(
+                "aiohttp package not available. Install with: pip install aiohttp"
+            )
+
+        self.url = url
+        self.api_key = api_key
+        self.model = model
+        self.count_tokens = count_tokens
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_texts = max_batch_texts
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.extra_payload = extra_payload or {}
+        self.cost_per_1k_tokens = cost_per_1k_tokens
+        self.on_request = on_request
+
+        # Shared by every embed() call, so the token budget and the learned
+        # concurrency carry over from one batch to the next
+        self.limiter = AdaptiveConcurrencyLimiter(self.max_concurrency)
+        self.budget = TokenBudget(self.tokens_per_minute)
+
+    @property
+    def last_concurrency_limit(self) -> int:
+        """Concurrency limit learned so far, for reporting."""
+        return self.limiter.limit
+
+    def pack_batches(
+        self, texts: list[str], max_batch_texts: int | None = None
+    ) -> list[tuple[list[int], int]]:
+        """Pack texts into requests bounded by token and text count limits.
+
+        Args:
+            texts: Texts to embed
+            max_batch_texts: Optional tighter text count limit
+
+        Returns:
+            List of (text indices, token count) per request, in input order
+        """
+        text_limit = min(max_batch_texts or self.max_batch_texts, self.max_batch_texts)
+        batches: list[tuple[list[int], int]] = []
+        current: list[int] = []
+        current_tokens = 0
+
+        for index, text in enumerate(texts):
+            tokens = self.count_tokens(text)
+            if current and (
+                current_tokens + tokens > self.max_batch_tokens
+                or len(current) >= text_limit
+            ):
+                batches.append((current, current_tokens))
+                current = []
+                current_tokens = 0
+            current.append(index)
+            current_tokens += tokens
+
+        if current:
+            batches.append((current, current_tokens))
+        return batches
+
+    async def embed(
+        self, texts: list[str], max_batch_texts: int | None = None
+    ) -> list[EmbeddingResult]:
+        """Embed texts with several requests in flight.
+
+        Failed requests yield error results for their texts rather than
+        raising, matching the synchronous embedders.
+
+        Args:
+            texts: Texts to embed
+            max_batch_texts: Optional tighter text count limit per request
+
+        Returns:
+            One EmbeddingResult per input text, in input order
+        """
+        if not texts:
+            return []
+
+        results: list[EmbeddingResult | None] = [None] * len(texts)
+
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
+            await asyncio.gather(
+                *(
+                    self._embed_request(session, texts, indices, tokens, results)
+                    for indices, tokens in self.pack_batches(texts, max_batch_texts)
+                )
+            )
+
+        return [result for result in results if result is not None]
+
+    async def _embed_request(
+        self,
+        session: "aiohttp.ClientSession",
+        texts: list[str],
+        indices: list[int],
+        estimated_tokens: int,
+        results: list[EmbeddingResult | None],
+    ) -> None:
+        """Send one packed request with its own retry and backoff."""
+        batch = [texts[i] for i in indices]
+        start_time = time.time()
+        await self.budget.acquire(estimated_tokens)
+
+        last_error: Exception | None = None
+        for attempt in range(self.max_retries + 1):
+            await self.limiter.acquire()
+            rate_limited = False
+            retry_after = 0.0
+            try:
+                embeddings, total_tokens = await self._post(session, batch)
+            except (EmbeddingRequestError, aiohttp.ClientError, TimeoutError) as e:
+                last_error = e
+                retryable = not isinstance(e, EmbeddingRequestError) or e.retryable
+                rate_limited = isinstance(e, EmbeddingRequestError) and e.status == 429
+                if isinstance(e, EmbeddingRequestError) and e.retry_after is not None:
+                    retry_after = e.retry_after
+                else:
+                    retry_after = self._backoff_delay(attempt)
+                await self.limiter.release(rate_limited=rate_limited, retry_after=retry_after)
+
+                if not retryable or attempt >= self.max_retries:
+                    break
+                # Rate-limited requests wait in the limiter for the shared pause
+                if not rate_limited:
+                    await asyncio.sleep(retry_after)
+                continue
+
+            await self.limiter.release()
+            if self.on_request is not None:
+                self.on_request(time.time(), total_tokens)
+
+            processing_time = (time.time() - start_time) / len(batch)
+            cost_per_text = (
+                total_tokens * self.cost_per_1k_tokens / 1000 / len(batch)
+            )
+            for index, text, embedding in zip(indices, batch, embeddings, strict=True):
+                results[index] = EmbeddingResult(
+                    text=text,
+                    embedding=embedding,
+                    model=self.model,
+                    token_count=total_tokens // len(batch),
+                    processing_time=processing_time,
+                    cost_estimate=cost_per_text,
+                )
+            return
+
+        error_msg = str(last_error) if last_error else "Embedding request failed"
+        for index, text in zip(indices, batch, strict=True):
+            results[index] = EmbeddingResult(
+                text=text,
+                embedding=[],
+                model=self.model,
+                processing_time=0.0,
+                error=error_msg,
+            )
+
+    async def _post(
+        self, session: "aiohttp.ClientSession", batch: list[str]
+    ) -> tuple[list[list[float]], int]:
+        """POST one request and return its embeddings and total tokens."""
+        payload = {"model": self.model, "input": batch, **self.extra_payload}
+        async with session.post(self.url, json=payload) as response:
+            if response.status != 200:
+                raise EmbeddingRequestError(
+                    response.status,
+                    (await response.text())[:200],
+                    retry_after=self._parse_retry_after(response.headers),
+                )
+            body = await response.json()
+
+        data = sorted(body["data"], key=lambda item: item.get("index", 0))
+        if len(data) != len(batch):
+            raise EmbeddingRequestError(
+                200, f"expected {len(batch)} embeddings, got {len(data)}"
+            )
+        total_tokens = int(body.get("usage", {}).get("total_tokens", 0))
+        return [item["embedding"] for item in data], total_tokens
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with jitter, as in RetryableEmbedder."""
+        delay = min(self.base_delay * (2.0**attempt), self.max_delay)
+        return delay + random.uniform(0.1, 0.3) * delay
+
+    @staticmethod
+    def _parse_retry_after(headers: Any) -> float | None:
+        """Seconds to wait from ``Retry-After`` or ``retry-after-ms`` headers."""
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            try:
+                return max(0.0, float(retry_after_ms) / 1000)
+            except ValueError:
+                pass
+        retry_after = headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                return None
+        return None
+
+
+def in_event_loop() -> bool:
+    """Check whether the calling thread is running an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def run_embedding_coroutine(coroutine: Any) -> Any:
+    """Run a backend coroutine from synchronous code.
+
+    Raises:
+        RuntimeError: When called from a thread with a running event loop;
+            async callers should await the backend directly (check with
+            ``in_event_loop`` first)
+    """
+    if not in_event_loop():
+        return asyncio.run(coroutine)
+    coroutine.close()
+    raise RuntimeError("Cannot run embedding requests synchronously inside an event loop")
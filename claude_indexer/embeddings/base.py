@@ -21,12 +21,36 @@ except ImportError:
     Encoding = _EncodingFallback  # type: ignore
 
 
+@dataclass
+class SparseEmbedding:
+    """Sparse vector stored as parallel ``indices``/``values`` lists.
+
+    Only non-zero weights are kept, so the size of the vector is bounded by
+    the number of distinct terms in the text rather than the vocabulary.
+    """
+
+    indices: list[int]
+    values: list[float]
+
+    def __len__(self) -> int:
+        """Number of non-zero entries."""
+        return len(self.indices)
+
+    def to_dense(self, dimension: int) -> list[float]:
+        """Expand to a dense list of the given dimension."""
+        dense = [0.0] * dimension
+        for idx, value in zip(self.indices, self.values, strict=True):
+            if idx < dimension:
+                dense[idx] = value
+        return dense
+
+
 @dataclass
 class EmbeddingResult:
     """Result of an embedding operation."""
 
     text: str
-    embedding: list[float]
+    embedding: "list[float] | SparseEmbedding"
 
     # Metadata
     model: str = ""
@@ -381,21 +405,35 @@ class CachingEmbedder(Embedder):
         results: list[EmbeddingResult | None] = [None] * len(texts)
         uncached_texts = []
         uncached_indices = []
+        memory_misses: list[tuple[int, str, str]] = []
 
-        # Check both cache tiers for each text
+        # Tier 1: Memory cache
         for i, text in enumerate(texts):
             cache_key = self._get_cache_key(text)
-
-            # Tier 1: Memory cache
             if cache_key in self._cache:
                 self._memory_hits += 1
                 results[i] = self._cache[cache_key]
-                continue
+            else:
+                memory_misses.append((i, text, cache_key))
 
-            # Tier 2: Persistent cache
-            persistent_result = self._get_from_persistent(cache_key, text)
-            if persistent_result is not None:
+        # Tier 2: Persistent cache, resolved in a single batch lookup
+        persistent_hits: dict[str, Any] = {}
+        if self._persistent_cache is not None and memory_misses:
+            persistent_hits = self._persistent_cache.get_batch(
+                [cache_key for _, _, cache_key in memory_misses]
+            )
+
+        model = "cached"
+        if any(v is not None for v in persistent_hits.values()):
+            model = self.embedder.get_model_info().get("model", "cached")
+
+        for i, text, cache_key in memory_misses:
+            vector = persistent_hits.get(cache_key)
+            if vector is not None:
                 self._disk_hits += 1
+                persistent_result = EmbeddingResult(
+                    text=text, embedding=vector.tolist(), model=model
+                )
                 # Promote to memory cache
                 self._cache[cache_key] = persistent_result
                 results[i] = persistent_result
@@ -3,17 +3,22 @@
 import hashlib
 import json
 import math
+import os
 import pickle
+import re
 import time
+from collections import Counter
+from itertools import chain
 from pathlib import Path
 from typing import Any, cast
 
 from ..indexer_logging import get_logger
-from .base import EmbeddingResult, Embedder
+from .base import EmbeddingResult, Embedder, SparseEmbedding
 
 try:
     import bm25s
     import numpy as np
+    from scipy import sparse
 
     BM25_AVAILABLE = True
 except ImportError:
@@ -21,11 +26,143 @@ except ImportError:
 
 logger = get_logger()
 
+# Lowercased alphanumeric runs of two or more characters
+_TOKEN_PATTERN = re.compile(r"\b[a-z0-9]{2,}\b")
+
+
+class BM25Statistics:
+    """Persisted BM25 document-frequency table maintained per file.
+
+    Each indexed file contributes a set of documents (one per BM25 chunk).
+    The table keeps, per file, how many documents contained each term, so a
+    re-indexed or deleted file can be subtracted exactly without refitting
+    the whole corpus. Term ids are assigned once and never reused, keeping
+    sparse vector indices stable across runs.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        self.path = Path(path) if path is not None else None
+        self.term_ids: dict[str, int] = {}
+        self.doc_freq: Counter[str] = Counter()
+        self.doc_count = 0
+        self._files: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Path | str) -> "BM25Statistics":
+        """Load statistics from disk, starting empty if missing or unreadable."""
+        stats = cls(path)
+        try:
+            if stats.path is not None and stats.path.exists():
+                with open(stats.path) as f:
+                    data = json.load(f)
+                if data.get("version") == cls.VERSION:
+                    stats.term_ids = data.get("term_ids", {})
+                    stats.doc_freq = Counter(data.get("doc_freq", {}))
+                    stats.doc_count = data.get("doc_count", 0)
+                    stats._files = data.get("files", {})
+        except Exception as e:
+            logger.warning(f"Failed to load BM25 statistics from {path}: {e}")
+        return stats
+
+    def save(self) -> None:
+        """Atomically write the table to disk if it changed."""
+        if self.path is None or not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.path.with_suffix(".tmp")
+            with open(tmp_file, "w") as f:
+                json.dump(
+                    {
+                        "version": self.VERSION,
+                        "doc_count": self.doc_count,
+                        "term_ids": self.term_ids,
+                        "doc_freq": dict(self.doc_freq),
+                        "files": self._files,
+                    },
+                    f,
+                )
+            os.replace(tmp_file, self.path)
+            self._dirty = False
+        except Exception as e:
+            logger.warning(f"Failed to save BM25 statistics: {e}")
+
+    def term_id(self, term: str) -> int:
+        """Get the stable sparse index for a term, assigning one if new."""
+        idx = self.term_ids.get(term)
+        if idx is None:
+            idx = len(self.term_ids)
+            self.term_ids[term] = idx
+            self._dirty = True
+        return idx
+
+    def add_documents(self, file_path: str, documents: list[list[str]]) -> None:
+        """Count tokenized documents as belonging to ``file_path``."""
+        if not documents:
+            return
+
+        entry = self._files.setdefault(file_path, {"docs": 0, "terms": {}})
+        file_terms = entry["terms"]
+        for tokens in documents:
+            for term in set(tokens):
+                self.term_id(term)
+                self.doc_freq[term] += 1
+                file_terms[term] = file_terms.get(term, 0) + 1
+        entry["docs"] += len(documents)
+        self.doc_count += len(documents)
+        self._dirty = True
+
+    def remove_file(self, file_path: str) -> bool:
+        """Subtract every document previously recorded for ``file_path``."""
+        entry = self._files.pop(file_path, None)
+        if entry is None:
+            return False
+
+        for term, count in entry["terms"].items():
+            remaining = self.doc_freq[term] - count
+            if remaining > 0:
+                self.doc_freq[term] = remaining
+            else:
+                del self.doc_freq[term]
+        self.doc_count = max(0, self.doc_count - entry["docs"])
+        self._dirty = True
+        return True
+
+    def replace_file(self, file_path: str, documents: list[list[str]]) -> None:
+        """Replace the documents recorded for ``file_path``."""
+        self.remove_file(file_path)
+        self.add_documents(file_path, documents)
+
+    def rename_file(self, old_path: str, new_path: str) -> None:
+        """Move recorded documents to a new path without changing counts."""
+        entry = self._files.pop(old_path, None)
+        if entry is not None:
+            self._files[new_path] = entry
+            self._dirty = True
+
+    def idf(self, term: str) -> float | None:
+        """Robertson IDF for ``term``, or None if no document contains it."""
+        df = self.doc_freq.get(term, 0)
+        if df <= 0:
+            return None
+        return math.log((self.doc_count - df + 0.5) / (df + 0.5))
+
+    @property
+    def file_count(self) -> int:
+        return len(self._files)
+
+    def __contains__(self, file_path: object) -> bool:
+        return file_path in self._files
+
 
 class BM25Embedder(Embedder):
     """BM25 sparse embeddings for keyword-based semantic search.
     
-    Generates sparse vectors compatible with Qdrant format using the bm25s library.
+    Generates ``SparseEmbedding`` vectors (non-zero indices and values only)
+    that map directly onto Qdrant sparse vectors, using the bm25s library.
     Maintains separate models for different collections and supports incremental updates.
     """
 
@@ -38,6 +175,7 @@ class BM25Embedder(Embedder):
         method: str = "robertson",
         corpus_size_limit: int = 10000,  # Reduced from 100000 to prevent OOM
         cache_dir: str | None = None,
+        statistics: BM25Statistics | None = None,
         **kwargs: Any,  # noqa: ARG002
     ) -> None:
         """Initialize BM25 embedder with configurable parameters.
@@ -50,6 +188,9 @@ class BM25Embedder(Embedder):
             method: BM25 variant ('robertson', 'lucene', 'atire', 'bm25l', 'bm25plus')
             corpus_size_limit: Maximum corpus size for memory management
             cache_dir: Directory for caching trained models
+            statistics: Persisted document-frequency table. When given, IDF
+                weights and term indices come from it instead of a corpus
+                fit, and ``corpus_size_limit`` does not apply.
         """
         if not BM25_AVAILABLE:
             raise ImportError(
@@ -76,6 +217,7 @@ class BM25Embedder(Embedder):
         self.is_fitted = False
         # Cache document frequencies globally to avoid O(n²) recalculation
         self._doc_freq_cache: dict[str, int] = {}
+        self.statistics = statistics
         
         # Performance tracking
         self._fit_time = 0.0
@@ -172,18 +314,13 @@ class BM25Embedder(Embedder):
             return False
 
     def _preprocess_text(self, text: str) -> list[str]:
-        """Preprocess text into tokens."""
-        # Simple tokenization - can be enhanced with proper tokenizers
-        import re
-        
-        # Convert to lowercase and extract alphanumeric tokens
-        text = text.lower()
-        tokens = re.findall(r'\b[a-zA-Z0-9]+\b', text)
-        
-        # Remove very short tokens
-        tokens = [token for token in tokens if len(token) > 1]
-        
-        return tokens
+        """Preprocess text into lowercase alphanumeric tokens of length > 1."""
+        return _TOKEN_PATTERN.findall(text.lower())
+
+    def _tokenize_batch(self, texts: list[str]) -> list[list[str]]:
+        """Tokenize many texts in one pass with the precompiled pattern."""
+        findall = _TOKEN_PATTERN.findall
+        return [findall(text.lower()) for text in texts]
 
     def _fit_corpus(self, corpus: list[str]) -> None:
         """Fit BM25 model on corpus."""
@@ -222,8 +359,7 @@ class BM25Embedder(Embedder):
         batch_size = 1000
         for i in range(0, len(corpus), batch_size):
             batch = corpus[i:i+batch_size]
-            tokenized_batch = [self._preprocess_text(text) for text in batch]
-            tokenized_corpus.extend(tokenized_batch)
+            tokenized_corpus.extend(self._tokenize_batch(batch))
 
             # Update progress
             if progress_bar:
@@ -272,8 +408,8 @@ class BM25Embedder(Embedder):
         
         self.is_fitted = True
         
-        # Pre-calculate document frequencies ONCE during fitting
-        self._calculate_doc_frequencies()
+        # Pre-calculate document frequencies ONCE during fitting, reusing the tokens
+        self._calculate_doc_frequencies(tokenized_corpus)
         
         self._fit_time = time.time() - start_time
         self._total_texts_processed = len(corpus)
@@ -286,87 +422,162 @@ class BM25Embedder(Embedder):
             f"vocabulary size: {len(self.vocabulary)}"
         )
 
-    def _calculate_doc_frequencies(self) -> None:
-        """Pre-calculate document frequencies for all vocabulary terms to avoid O(n²) recalculation."""
+    def _calculate_doc_frequencies(
+        self, tokenized_corpus: list[list[str]] | None = None
+    ) -> None:
+        """Pre-calculate document frequencies for all vocabulary terms to avoid O(n²) recalculation.
+
+        Args:
+            tokenized_corpus: Tokens of ``self.corpus`` if already available,
+                so the corpus is not tokenized a second time
+        """
         if not self.vocabulary or not self.corpus:
             return
 
         calc_start = time.time()
-        self._doc_freq_cache.clear()
+        if tokenized_corpus is None:
+            tokenized_corpus = self._tokenize_batch(self.corpus)
 
-        # More efficient approach: iterate documents once, count all terms
-        from collections import defaultdict
-        doc_freq_counts = defaultdict(int)
-
-        # Process documents in batches to manage memory
-        batch_size = 1000
-        for i in range(0, len(self.corpus), batch_size):
-            batch = self.corpus[i:i+batch_size]
-            for doc in batch:
-                # Get unique tokens for this document
-                doc_tokens = set(self._preprocess_text(doc))
-                # Increment count for each term appearing in doc
-                for token in doc_tokens:
-                    if token in self.vocabulary:
-                        doc_freq_counts[token] += 1
-
-        # Convert to regular dict for cache
-        self._doc_freq_cache = dict(doc_freq_counts)
+        # Iterate documents once, counting each distinct term per document
+        doc_freq_counts = Counter(
+            chain.from_iterable(set(tokens) for tokens in tokenized_corpus)
+        )
 
         # Ensure all vocabulary terms have an entry (even if 0)
-        for term in self.vocabulary:
-            if term not in self._doc_freq_cache:
-                self._doc_freq_cache[term] = 0
+        self._doc_freq_cache = {
+            term: doc_freq_counts.get(term, 0) for term in self.vocabulary
+        }
 
         calc_time = time.time() - calc_start
         logger.debug(f"✅ Optimized doc frequency calculation in {calc_time:.3f}s for {len(self.vocabulary)} terms")
 
-    def _generate_sparse_vector(self, text: str) -> list[float]:
-        """Generate sparse vector for a single text using proper IDF-based term weighting."""
-        if not self.is_fitted or self.model is None:
+    def _term_weights(self, terms: set[str]) -> dict[str, tuple[int, float]]:
+        """Resolve each distinct term to its sparse index and IDF weight.
+
+        Terms with a non-positive weight are left out, as are terms without
+        an index. With persisted statistics, indices are only assigned by
+        ``add_documents``, so embedding queries never grows ``term_ids``.
+        """
+        weights: dict[str, tuple[int, float]] = {}
+
+        if self.statistics is not None:
+            stats = self.statistics
+            for term in terms:
+                term_idx = stats.term_ids.get(term)
+                if term_idx is None:
+                    # Never seen in a document, so no stored vector can match it
+                    continue
+                idf = stats.idf(term)
+                if idf is None:
+                    # Term no longer in corpus, give it a small positive weight
+                    weights[term] = (term_idx, 0.1)
+                elif idf > 0.0:
+                    weights[term] = (term_idx, idf)
+            return weights
+
+        # Create vocabulary mapping if missing
+        if not self.vocabulary and self.model is not None and hasattr(self.model, 'vocab'):
+            self.vocabulary = {term: idx for idx, term in enumerate(self.model.vocab)}
+
+        # Use pre-calculated document frequencies (O(1) lookup vs O(n²) calculation)
+        doc_freq = self._doc_freq_cache
+        N = len(self.corpus)
+        for term in terms:
+            vocab_idx = self.vocabulary.get(term)
+            if vocab_idx is None:
+                continue
+            df = doc_freq.get(term, 0)
+            if df > 0:
+                # Standard IDF formula: log((N - df + 0.5) / (df + 0.5))
+                idf = math.log((N - df + 0.5) / (df + 0.5))
+                if idf > 0.0:
+                    weights[term] = (vocab_idx, idf)
+            else:
+                # Term not in corpus, give it a small positive weight
+                weights[term] = (vocab_idx, 0.1)
+        return weights
+
+    def _encode_tokenized(self, tokenized: list[list[str]]) -> "sparse.csr_matrix":
+        """Encode tokenized texts as one CSR matrix with a row per text.
+
+        Each distinct term in the batch is resolved once, and every row is
+        built from the shared lookup with sorted column indices.
+        """
+        if self.statistics is None and (not self.is_fitted or self.model is None):
             raise RuntimeError("BM25 model not fitted. Call fit_corpus or embed_batch first.")
-        
-        # Tokenize query text
+
+        rows = [set(tokens) for tokens in tokenized]
+        weights = self._term_weights(set().union(*rows)) if rows else {}
+
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        indices: list[int] = []
+        values: list[float] = []
+        for i, row in enumerate(rows):
+            for term in row:
+                entry = weights.get(term)
+                if entry is not None:
+                    indices.append(entry[0])
+                    values.append(entry[1])
+            indptr[i + 1] = len(indices)
+
+        if self.statistics is not None:
+            n_cols = len(self.statistics.term_ids)
+        else:
+            n_cols = len(self.vocabulary)
+        n_cols = max(n_cols, max(indices, default=-1) + 1, 1)
+
+        matrix = sparse.csr_matrix(
+            (
+                np.asarray(values, dtype=np.float64),
+                np.asarray(indices, dtype=np.int64),
+                indptr,
+            ),
+            shape=(len(rows), n_cols),
+        )
+        matrix.sort_indices()
+        return matrix
+
+    def encode_batch(self, texts: list[str]) -> "sparse.csr_matrix":
+        """Encode texts as a CSR matrix of BM25 weights (one row per text)."""
+        return self._encode_tokenized(self._tokenize_batch(texts))
+
+    @staticmethod
+    def _row_to_sparse(matrix: "sparse.csr_matrix", row: int) -> SparseEmbedding:
+        """Extract one CSR row as a SparseEmbedding."""
+        start, end = matrix.indptr[row], matrix.indptr[row + 1]
+        return SparseEmbedding(
+            indices=matrix.indices[start:end].tolist(),
+            values=matrix.data[start:end].tolist(),
+        )
+
+    def _generate_sparse_vector(self, text: str) -> SparseEmbedding:
+        """Generate sparse vector for a single text using proper IDF-based term weighting.
+
+        Only the terms present in ``text`` are emitted, as sorted
+        ``(indices, values)`` pairs keyed by vocabulary index.
+        """
+        if self.statistics is None and (not self.is_fitted or self.model is None):
+            raise RuntimeError("BM25 model not fitted. Call fit_corpus or embed_batch first.")
+
         query_tokens = self._preprocess_text(text)
-        
         if not query_tokens:
-            # Return zero vector for empty queries
-            vocab_size = max(len(self.vocabulary), 100)  # minimum size
-            return [0.0] * vocab_size
-        
+            return SparseEmbedding(indices=[], values=[])
+
         try:
-            # Create vocabulary mapping if missing
-            if not self.vocabulary and hasattr(self.model, 'vocab'):
-                self.vocabulary = {term: idx for idx, term in enumerate(self.model.vocab)}
-            
-            # Determine vector dimension
-            vocab_size = max(len(self.vocabulary), 100)
-            sparse_vector = np.zeros(vocab_size, dtype=np.float32)
-            
-            # Use pre-calculated document frequencies (O(1) lookup vs O(n²) calculation)
-            doc_freq = self._doc_freq_cache
-            
-            # Calculate IDF weights for query terms
-            N = len(self.corpus)
-            for token in query_tokens:
-                if token in self.vocabulary:
-                    vocab_idx = self.vocabulary[token]
-                    if vocab_idx < len(sparse_vector):
-                        df = doc_freq.get(token, 0)
-                        if df > 0:
-                            # Standard IDF formula: log((N - df + 0.5) / (df + 0.5))
-                            idf = math.log((N - df + 0.5) / (df + 0.5))
-                            sparse_vector[vocab_idx] = float(max(0.0, idf))
-                        else:
-                            # Term not in corpus, give it a small positive weight
-                            sparse_vector[vocab_idx] = 0.1
-            
-            return sparse_vector.tolist()
-            
+            return self._row_to_sparse(self._encode_tokenized([query_tokens]), 0)
         except Exception as e:
-            logger.warning(f"BM25 scoring failed: {e}, returning zero vector")
-            vocab_size = max(len(self.vocabulary), 100)
-            return [0.0] * vocab_size
+            logger.warning(f"BM25 scoring failed: {e}, returning empty vector")
+            return SparseEmbedding(indices=[], values=[])
+
+    def record_documents(self, file_path: str, texts: list[str]) -> None:
+        """Count ``texts`` as documents of ``file_path`` in the statistics.
+
+        Callers remove the file's previous documents first (see
+        ``BM25Statistics.remove_file``) when re-indexing it.
+        """
+        if self.statistics is None:
+            return
+        self.statistics.add_documents(file_path, self._tokenize_batch(texts))
 
     def embed_text(self, text: str) -> EmbeddingResult:
         """Generate BM25 sparse embedding for a single text."""
@@ -376,11 +587,10 @@ class BM25Embedder(Embedder):
             # Handle empty or very short text
             tokens = self._preprocess_text(text)
             if not tokens:
-                # Return zero vector for empty text
-                default_dim = max(len(self.vocabulary), 100) if self.vocabulary else 100
+                # Return empty sparse vector for empty text
                 return EmbeddingResult(
                     text=text,
-                    embedding=[0.0] * default_dim,
+                    embedding=SparseEmbedding(indices=[], values=[]),
                     model=f"bm25_{self.method}",
                     token_count=0,
                     processing_time=time.time() - start_time,
@@ -388,7 +598,7 @@ class BM25Embedder(Embedder):
                 )
             
             # If model not fitted, fit on single text corpus
-            if not self.is_fitted:
+            if not self.is_fitted and self.statistics is None:
                 logger.debug("BM25 model not fitted, using single-text corpus")
                 # For single text, add some default corpus to avoid empty vocabulary
                 corpus = [text] if tokens else ["default corpus text for initialization"]
@@ -408,11 +618,10 @@ class BM25Embedder(Embedder):
             
         except Exception as e:
             logger.error(f"BM25 embedding failed: {e}")
-            # Return zero vector on error
-            default_dim = max(len(self.vocabulary), 100) if self.vocabulary else 100
+            # Return empty sparse vector on error
             return EmbeddingResult(
                 text=text,
-                embedding=[0.0] * default_dim,
+                embedding=SparseEmbedding(indices=[], values=[]),
                 model=f"bm25_{self.method}",
                 processing_time=time.time() - start_time,
                 error=str(e),
@@ -432,8 +641,8 @@ class BM25Embedder(Embedder):
         logger.debug(f"🐌 BM25 embed_batch starting with {len(texts)} texts")
         
         try:
-            # Fit model on the entire corpus first
-            if not self.is_fitted:
+            # Fit model on the entire corpus first (not needed with persisted statistics)
+            if not self.is_fitted and self.statistics is None:
                 # Limit corpus size for memory management
                 corpus = texts[:self.corpus_size_limit]
                 fit_start = time.time()
@@ -441,22 +650,23 @@ class BM25Embedder(Embedder):
                 fit_total = time.time() - fit_start
                 logger.debug(f"🐌 BM25 _fit_corpus took {fit_total:.3f}s")
             
-            # Generate embeddings for all texts
-            results = []
+            # Tokenize once and encode the whole batch as a single CSR matrix
             embedding_start = time.time()
-            for text in texts:
-                embedding = self._generate_sparse_vector(text)
-                
-                results.append(
-                    EmbeddingResult(
-                        text=text,
-                        embedding=embedding,
-                        model=f"bm25_{self.method}",
-                        token_count=len(self._preprocess_text(text)),
-                        processing_time=(time.time() - start_time) / len(texts),
-                        cost_estimate=0.0,  # BM25 is free
-                    )
+            tokenized = self._tokenize_batch(texts)
+            matrix = self._encode_tokenized(tokenized)
+
+            per_text_time = (time.time() - start_time) / len(texts)
+            results = [
+                EmbeddingResult(
+                    text=text,
+                    embedding=self._row_to_sparse(matrix, i),
+                    model=f"bm25_{self.method}",
+                    token_count=len(tokens),
+                    processing_time=per_text_time,
+                    cost_estimate=0.0,  # BM25 is free
                 )
+                for i, (text, tokens) in enumerate(zip(texts, tokenized, strict=True))
+            ]
             
             embedding_total = time.time() - embedding_start
             logger.debug(f"🐌 BM25 embedding generation took {embedding_total:.3f}s for {len(texts)} texts")
@@ -469,7 +679,7 @@ class BM25Embedder(Embedder):
             return [
                 EmbeddingResult(
                     text=text,
-                    embedding=[],
+                    embedding=SparseEmbedding(indices=[], values=[]),
                     model=f"bm25_{self.method}",
                     processing_time=0.0,
                     error=error_msg,
@@ -483,7 +693,10 @@ class BM25Embedder(Embedder):
 
     def get_model_info(self) -> dict[str, Any]:
         """Get information about the BM25 model."""
-        vocab_size = len(self.vocabulary) if self.vocabulary else 0
+        if self.statistics is not None:
+            vocab_size = len(self.statistics.term_ids)
+        else:
+            vocab_size = len(self.vocabulary) if self.vocabulary else 0
         
         return {
             "provider": "bm25",
@@ -499,9 +712,11 @@ class BM25Embedder(Embedder):
             "cost_per_1k_tokens": 0.0,
             "supports_batch": True,
             "sparse_vectors": True,
-            "corpus_size": len(self.corpus),
+            "corpus_size": (
+                self.statistics.doc_count if self.statistics is not None else len(self.corpus)
+            ),
             "vocabulary_size": vocab_size,
-            "is_fitted": self.is_fitted,
+            "is_fitted": self.is_fitted or self.statistics is not None,
             "fit_time": self._fit_time,
             "total_texts_processed": self._total_texts_processed,
         }
@@ -519,7 +734,7 @@ class BM25Embedder(Embedder):
         if not self.is_fitted:
             return {"fitted": False}
         
-        token_counts = [len(self._preprocess_text(text)) for text in self.corpus]
+        token_counts = [len(tokens) for tokens in self._tokenize_batch(self.corpus)]
         
         return {
             "fitted": True,
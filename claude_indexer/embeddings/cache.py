@@ -1,29 +1,67 @@
 """Persistent disk-based embedding cache for reduced API calls and faster re-indexing."""
 
+import contextlib
+import fcntl
 import hashlib
 import json
+import mmap
 import os
 import struct
 import time
+from dataclasses import dataclass
 from pathlib import Path
 from threading import Lock
-from typing import Any
+from typing import Any, BinaryIO
+
+import numpy as np
 
 from ..indexer_logging import get_logger
 
+# Index file layout: 8-byte magic header followed by fixed-size records.
+# Records are appended as entries are added or touched; the last record
+# for a key wins when the log is replayed on startup.
+_INDEX_MAGIC = b"PECIDX01"
+_INDEX_RECORD = struct.Struct("<8sIQId")  # key, segment, offset, dimension, last_access
+
+# Roll over to a new segment file once the active one reaches this size
+SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+
+_FLOAT32 = np.dtype("<f4")
+
+
+@dataclass(slots=True)
+class _SegmentEntry:
+    """Location of a cached embedding inside a segment file."""
+
+    segment: int
+    offset: int
+    dimension: int
+    last_access: float
+
+    @property
+    def size_bytes(self) -> int:
+        return self.dimension * _FLOAT32.itemsize
+
 
 class PersistentEmbeddingCache:
     """Disk-based embedding cache with content hash keys.
 
-    Stores embeddings as binary files for efficient storage and retrieval.
+    Embeddings are appended as raw float32 vectors to a small number of
+    segment files and located through a compact binary index. Segments are
+    read through ``mmap`` so lookups never open files per embedding, and
+    ``get_batch`` returns NumPy views straight into the mapped segments.
     Uses SHA256 content hashes to enable cache hits across re-indexing runs.
 
     Cache Structure:
         cache_dir/
-            index.json          - Hash -> metadata mapping
-            embeddings/
-                abc123.bin      - Binary embedding vector
-                def456.bin
+            index.bin           - Append-only hash -> (segment, offset) log
+            segments/
+                000001.seg      - Packed float32 vectors
+                000002.seg
+
+    Eviction drops the least recently used entries and compacts the
+    survivors into fresh segments. Caches written in the legacy
+    one-file-per-embedding layout are imported on first open.
     """
 
     def __init__(
@@ -41,16 +79,31 @@ class PersistentEmbeddingCache:
         """
         self.logger = get_logger()
         self.cache_dir = Path(cache_dir) / ".embedding_cache" / model_name
-        self.embeddings_dir = self.cache_dir / "embeddings"
-        self.index_file = self.cache_dir / "index.json"
+        self.segments_dir = self.cache_dir / "segments"
+        self.index_file = self.cache_dir / "index.bin"
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.model_name = model_name
 
+        # Legacy layout (one .bin file per embedding + index.json)
+        self.legacy_embeddings_dir = self.cache_dir / "embeddings"
+        self.legacy_index_file = self.cache_dir / "index.json"
+
         # Thread safety
         self._lock = Lock()
 
         # In-memory index for fast lookups
-        self._index: dict[str, dict[str, Any]] = {}
+        self._index: dict[bytes, _SegmentEntry] = {}
+        self._live_bytes = 0
+
+        # Keys whose index records have not been appended to index.bin yet
+        self._dirty: set[bytes] = set()
+        self._index_records = 0
+
+        # Segment state
+        self._maps: dict[int, mmap.mmap] = {}
+        self._active_segment = 0
+        self._active_file: BinaryIO | None = None
+        self._active_size = 0
 
         # Statistics
         self._hits = 0
@@ -62,31 +115,60 @@ class PersistentEmbeddingCache:
     def _init_cache(self) -> None:
         """Initialize cache directory structure and load existing index."""
         try:
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
-            self.embeddings_dir.mkdir(exist_ok=True)
+            self.segments_dir.mkdir(parents=True, exist_ok=True)
 
             if self.index_file.exists():
-                with open(self.index_file, "r") as f:
-                    self._index = json.load(f)
-                self.logger.debug(
-                    f"Loaded embedding cache with {len(self._index)} entries"
-                )
+                try:
+                    self._load_index()
+                    self.logger.debug(
+                        f"Loaded embedding cache with {len(self._index)} entries"
+                    )
+                except (OSError, ValueError) as e:
+                    # Start over with a valid empty index; appending behind a
+                    # bad header would lose every later entry too
+                    self.logger.warning(f"Discarding unreadable embedding cache index: {e}")
+                    self._index = {}
+                    self._live_bytes = 0
+                    self._write_index_snapshot()
             else:
-                self._index = {}
                 self.logger.debug("Initialized new embedding cache")
+
+            self._remove_unreferenced_segments()
+            # Keep appending to the newest segment; _roll_segment moves on
+            # if it is full or another process is writing to it
+            existing = self._segment_ids()
+            self._active_segment = max(existing) if existing else 1
+
+            if self.legacy_index_file.exists():
+                self.migrate_legacy_cache()
         except Exception as e:
             self.logger.warning(f"Failed to initialize embedding cache: {e}")
             self._index = {}
+            self._live_bytes = 0
 
     @staticmethod
     def content_hash(content: str) -> str:
         """Generate cache key from content using SHA256.
 
-        Uses first 16 characters of hex digest for reasonable uniqueness
-        while keeping filenames manageable.
+        Uses first 16 characters of hex digest, which packs into the
+        8-byte key slot of the binary index.
         """
         return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
 
+    @staticmethod
+    def _key(content_hash: str) -> bytes:
+        """Pack a content hash into the 8-byte index key."""
+        if len(content_hash) == 16:
+            try:
+                return bytes.fromhex(content_hash)
+            except ValueError:
+                pass
+        return hashlib.sha256(content_hash.encode("utf-8")).digest()[:8]
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
     def get(self, content_hash: str) -> list[float] | None:
         """Get cached embedding by content hash.
 
@@ -97,44 +179,75 @@ class PersistentEmbeddingCache:
             Embedding vector if found, None otherwise
         """
         with self._lock:
-            if content_hash not in self._index:
-                self._misses += 1
-                return None
-
-            entry = self._index[content_hash]
-            embedding_file = self.embeddings_dir / f"{content_hash}.bin"
-
-            if not embedding_file.exists():
-                # Index entry exists but file is missing - cleanup
-                del self._index[content_hash]
-                self._misses += 1
-                return None
-
-            try:
-                embedding = self._read_embedding(embedding_file)
-                # Update access time for LRU eviction
-                entry["last_access"] = time.time()
-                self._hits += 1
-                return embedding
-            except Exception as e:
-                self.logger.warning(f"Failed to read cached embedding: {e}")
-                del self._index[content_hash]
-                self._misses += 1
-                return None
+            view = self._lookup(self._key(content_hash))
+            return None if view is None else view.tolist()
 
-    def get_batch(self, content_hashes: list[str]) -> dict[str, list[float] | None]:
+    def get_batch(self, content_hashes: list[str]) -> dict[str, np.ndarray | None]:
         """Get multiple cached embeddings at once.
 
+        Returned arrays are read-only views into the memory-mapped segments;
+        copy them (or call ``tolist()``) if they must outlive the cache.
+
         Args:
             content_hashes: List of content hashes to look up
 
         Returns:
-            Dict mapping hash -> embedding (or None if not found)
+            Dict mapping hash -> embedding array (or None if not found)
         """
-        results = {}
-        for h in content_hashes:
-            results[h] = self.get(h)
-        return results
+        with self._lock:
+            return {h: self._lookup(self._key(h)) for h in content_hashes}
+
+    def _lookup(self, key: bytes) -> np.ndarray | None:
+        """Resolve a key to a view of its vector. Caller must hold the lock."""
+        entry = self._index.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        try:
+            view = self._view(entry)
+        except Exception as e:
+            self.logger.warning(f"Failed to read cached embedding: {e}")
+            self._drop(key)
+            self._misses += 1
+            return None
+
+        # Update access time for LRU eviction
+        entry.last_access = time.time()
+        self._dirty.add(key)
+        self._hits += 1
+        return view
+
+    def _view(self, entry: _SegmentEntry) -> np.ndarray:
+        """Return a float32 view of an entry inside its mapped segment."""
+        mapped = self._map_segment(entry.segment, entry.offset + entry.size_bytes)
+        return np.frombuffer(
+            mapped, dtype=_FLOAT32, count=entry.dimension, offset=entry.offset
+        )
+
+    def _map_segment(self, segment: int, min_length: int) -> mmap.mmap:
+        """Get a read-only map of a segment covering at least ``min_length`` bytes."""
+        mapped = self._maps.get(segment)
+        if mapped is not None and len(mapped) >= min_length:
+            return mapped
+
+        if segment == self._active_segment and self._active_file is not None:
+            self._active_file.flush()
+
+        path = self._segment_path(segment)
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < min_length:
+                raise ValueError(f"segment {path.name} truncated")
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # Outstanding views keep the old map alive until they are released
+        self._maps[segment] = mapped
+        return mapped
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
 
     def set(self, content_hash: str, embedding: list[float], dimension: int = 0) -> None:
         """Store embedding with automatic eviction if needed.
@@ -142,29 +255,12 @@ class PersistentEmbeddingCache:
         Args:
             content_hash: SHA256 hash of the original content
             embedding: Embedding vector to cache
-            dimension: Embedding dimension (auto-detected if 0)
+            dimension: Expected embedding dimension; vectors of another
+                length are not cached (0 accepts any length)
         """
         with self._lock:
             try:
-                # Check if we need to evict
-                self._maybe_evict()
-
-                # Write embedding to binary file
-                embedding_file = self.embeddings_dir / f"{content_hash}.bin"
-                self._write_embedding(embedding_file, embedding)
-
-                # Update index
-                self._index[content_hash] = {
-                    "dimension": dimension or len(embedding),
-                    "created": time.time(),
-                    "last_access": time.time(),
-                    "size_bytes": embedding_file.stat().st_size,
-                }
-
-                # Periodically save index
-                if len(self._index) % 100 == 0:
-                    self._save_index()
-
+                self._append(self._key(content_hash), embedding, time.time(), dimension)
             except Exception as e:
                 self.logger.warning(f"Failed to cache embedding: {e}")
 
@@ -177,100 +273,367 @@ class PersistentEmbeddingCache:
 
         Args:
             embeddings: Dict mapping content_hash -> embedding vector
-            dimension: Embedding dimension (auto-detected if 0)
+            dimension: Expected embedding dimension; vectors of another
+                length are not cached (0 accepts any length)
         """
-        for content_hash, embedding in embeddings.items():
-            self.set(content_hash, embedding, dimension)
+        with self._lock:
+            now = time.time()
+            try:
+                for content_hash, embedding in embeddings.items():
+                    self._append(self._key(content_hash), embedding, now, dimension)
+            except Exception as e:
+                self.logger.warning(f"Failed to cache embedding batch: {e}")
 
-        # Save index after batch
-        self._save_index()
+            self._save_index()
 
-    def _write_embedding(self, filepath: Path, embedding: list[float]) -> None:
-        """Write embedding vector to binary file.
+    def _append(
+        self, key: bytes, embedding: Any, now: float, dimension: int = 0
+    ) -> None:
+        """Append a vector to the active segment. Caller must hold the lock."""
+        if key in self._index:
+            # Content-addressed: same hash means same vector
+            return
 
-        Uses struct.pack for efficient storage of float32 values.
-        """
-        with open(filepath, "wb") as f:
-            # Write dimension first
-            f.write(struct.pack("I", len(embedding)))
-            # Write float32 values
-            f.write(struct.pack(f"{len(embedding)}f", *embedding))
-
-    def _read_embedding(self, filepath: Path) -> list[float]:
-        """Read embedding vector from binary file."""
-        with open(filepath, "rb") as f:
-            # Read dimension
-            dimension = struct.unpack("I", f.read(4))[0]
-            # Read float32 values
-            embedding = struct.unpack(f"{dimension}f", f.read(dimension * 4))
-            return list(embedding)
-
-    def _maybe_evict(self) -> None:
-        """Evict oldest entries if cache exceeds size limit."""
-        current_size = self._get_cache_size()
-
-        if current_size < self.max_size_bytes:
+        data = np.asarray(embedding, dtype=_FLOAT32).tobytes()
+        if not data:
+            return
+        if dimension and len(data) != dimension * _FLOAT32.itemsize:
+            self.logger.warning(
+                f"Not caching embedding of dimension {len(data) // _FLOAT32.itemsize}, "
+                f"expected {dimension}"
+            )
             return
 
-        # Sort by last access time (oldest first)
-        sorted_entries = sorted(
-            self._index.items(),
-            key=lambda x: x[1].get("last_access", 0)
+        self._maybe_evict(len(data))
+
+        if self._active_file is None or self._active_size + len(data) > SEGMENT_MAX_BYTES:
+            self._roll_segment()
+
+        assert self._active_file is not None
+        offset = self._active_size
+        self._active_file.write(data)
+        self._active_size += len(data)
+
+        entry = _SegmentEntry(
+            segment=self._active_segment,
+            offset=offset,
+            dimension=len(data) // _FLOAT32.itemsize,
+            last_access=now,
         )
+        self._index[key] = entry
+        self._live_bytes += entry.size_bytes
+        self._dirty.add(key)
+
+    def _roll_segment(self) -> None:
+        """Close the active segment and open the next writable one.
+
+        A segment is writable while it is under SEGMENT_MAX_BYTES and no
+        other process holds its write lock, so short-lived processes share
+        the newest segment instead of each starting a file of their own.
+        """
+        if self._active_file is not None:
+            self._active_file.close()
+            self._active_file = None
+            if self._active_size > 0:
+                self._active_segment += 1
+
+        while True:
+            segment_file = self._open_segment_for_append(self._active_segment)
+            if segment_file is not None:
+                break
+            self._active_segment += 1
+
+        self._active_file = segment_file
+        self._active_size = segment_file.tell()
+
+    def _open_segment_for_append(self, segment: int) -> BinaryIO | None:
+        """Open and write-lock a segment, or None if it is full or busy."""
+        # Stays open as the active segment until _roll_segment or close()
+        segment_file = open(self._segment_path(segment), "ab")  # noqa: SIM115
+        try:
+            fcntl.flock(segment_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            segment_file.close()
+            return None
+        if segment_file.tell() >= SEGMENT_MAX_BYTES:
+            segment_file.close()
+            return None
+        return segment_file
+
+    def _drop(self, key: bytes) -> None:
+        """Forget an entry; its bytes are reclaimed on the next compaction."""
+        entry = self._index.pop(key, None)
+        if entry is not None:
+            self._live_bytes -= entry.size_bytes
+        self._dirty.discard(key)
+
+    # ------------------------------------------------------------------
+    # Eviction and compaction
+    # ------------------------------------------------------------------
+
+    def _maybe_evict(self, incoming_bytes: int = 0) -> None:
+        """Evict oldest entries if cache would exceed size limit."""
+        if self._live_bytes + incoming_bytes < self.max_size_bytes or not self._index:
+            return
 
-        # Remove oldest 25% of entries
-        entries_to_remove = len(sorted_entries) // 4
-        entries_to_remove = max(entries_to_remove, 1)
+        # Sort by last access time (oldest first) and drop the oldest 25%
+        by_age = sorted(self._index.items(), key=lambda item: item[1].last_access)
+        entries_to_remove = max(len(by_age) // 4, 1)
 
         removed_size = 0
-        for content_hash, entry in sorted_entries[:entries_to_remove]:
-            embedding_file = self.embeddings_dir / f"{content_hash}.bin"
-            try:
-                if embedding_file.exists():
-                    removed_size += embedding_file.stat().st_size
-                    embedding_file.unlink()
-                del self._index[content_hash]
-            except Exception as e:
-                self.logger.warning(f"Failed to evict cache entry {content_hash}: {e}")
+        for key, entry in by_age[:entries_to_remove]:
+            removed_size += entry.size_bytes
+            self._drop(key)
+
+        self._compact()
 
         self.logger.info(
             f"Evicted {entries_to_remove} cache entries, freed {removed_size / 1024 / 1024:.1f}MB"
         )
 
-    def _get_cache_size(self) -> int:
-        """Calculate total cache size in bytes."""
-        total = 0
-        for entry in self._index.values():
-            total += entry.get("size_bytes", 0)
-        return total
+    def _compact(self) -> None:
+        """Rewrite live entries into fresh segments and drop the old ones."""
+        old_segments = self._segment_ids()
+        if self._active_file is not None:
+            self._active_file.close()
+            self._active_file = None
+        self._active_segment = (max(old_segments) if old_segments else 0) + 1
+        self._active_size = 0
+
+        # Copy survivors in on-disk order so reads stay sequential
+        survivors = sorted(
+            self._index.items(), key=lambda item: (item[1].segment, item[1].offset)
+        )
+        compacted: dict[bytes, _SegmentEntry] = {}
+        for key, entry in survivors:
+            try:
+                data = self._view(entry).tobytes()
+            except Exception as e:
+                self.logger.debug(f"Dropping unreadable cache entry during compaction: {e}")
+                continue
+
+            if self._active_file is None or self._active_size + len(data) > SEGMENT_MAX_BYTES:
+                self._roll_segment()
+            assert self._active_file is not None
+            offset = self._active_size
+            self._active_file.write(data)
+            self._active_size += len(data)
+            compacted[key] = _SegmentEntry(
+                segment=self._active_segment,
+                offset=offset,
+                dimension=entry.dimension,
+                last_access=entry.last_access,
+            )
+
+        if self._active_file is not None:
+            self._active_file.flush()
+
+        self._index = compacted
+        self._live_bytes = sum(e.size_bytes for e in compacted.values())
+        self._write_index_snapshot()
+
+        for segment in old_segments:
+            self._release_segment(segment)
+
+    def _release_segment(self, segment: int) -> None:
+        """Unmap and delete a segment file that no longer holds live entries."""
+        mapped = self._maps.pop(segment, None)
+        if mapped is not None:
+            # Views handed out by get_batch may still reference the map;
+            # it is closed when the last one is garbage collected.
+            with contextlib.suppress(BufferError):
+                mapped.close()
+        try:
+            self._segment_path(segment).unlink(missing_ok=True)
+        except OSError as e:
+            self.logger.warning(f"Failed to remove cache segment {segment}: {e}")
+
+    def _remove_unreferenced_segments(self) -> None:
+        """Delete segment files left behind by an interrupted compaction."""
+        referenced = {entry.segment for entry in self._index.values()}
+        for segment in self._segment_ids():
+            if segment not in referenced:
+                self._release_segment(segment)
+
+    # ------------------------------------------------------------------
+    # Index persistence
+    # ------------------------------------------------------------------
+
+    def _load_index(self) -> None:
+        """Replay the binary index log into memory."""
+        with open(self.index_file, "rb") as f:
+            if f.read(len(_INDEX_MAGIC)) != _INDEX_MAGIC:
+                raise ValueError("unrecognized embedding cache index format")
+            payload = f.read()
+
+        usable = len(payload) - len(payload) % _INDEX_RECORD.size
+        segment_sizes: dict[int, int] = {}
+        index: dict[bytes, _SegmentEntry] = {}
+        for key, segment, offset, dimension, last_access in _INDEX_RECORD.iter_unpack(
+            payload[:usable]
+        ):
+            if segment not in segment_sizes:
+                path = self._segment_path(segment)
+                segment_sizes[segment] = path.stat().st_size if path.exists() else -1
+            if offset + dimension * _FLOAT32.itemsize > segment_sizes[segment]:
+                # Record points past the end of its segment (crash mid-write)
+                index.pop(key, None)
+                continue
+            index[key] = _SegmentEntry(segment, offset, dimension, last_access)
+
+        self._index = index
+        self._index_records = usable // _INDEX_RECORD.size
+        self._live_bytes = sum(e.size_bytes for e in index.values())
 
     def _save_index(self) -> None:
-        """Persist index to disk."""
+        """Persist pending index changes to disk."""
         try:
-            with open(self.index_file, "w") as f:
-                json.dump(self._index, f)
+            if self._active_file is not None:
+                self._active_file.flush()
+
+            if not self._dirty:
+                return
+
+            # Rewrite the log once stale records outnumber live ones
+            if self._index_records + len(self._dirty) > 2 * len(self._index) + 1024:
+                self._write_index_snapshot()
+                return
+
+            new_file = not self.index_file.exists()
+            with open(self.index_file, "ab") as f:
+                if new_file:
+                    f.write(_INDEX_MAGIC)
+                f.write(
+                    b"".join(
+                        self._pack_record(key, self._index[key])
+                        for key in self._dirty
+                        if key in self._index
+                    )
+                )
+            self._index_records += len(self._dirty)
+            self._dirty.clear()
         except Exception as e:
             self.logger.warning(f"Failed to save cache index: {e}")
 
+    def _write_index_snapshot(self) -> None:
+        """Atomically replace the index log with one record per live entry."""
+        tmp_file = self.index_file.with_suffix(".tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(_INDEX_MAGIC)
+            f.write(
+                b"".join(
+                    self._pack_record(key, entry) for key, entry in self._index.items()
+                )
+            )
+        os.replace(tmp_file, self.index_file)
+        self._index_records = len(self._index)
+        self._dirty.clear()
+
+    @staticmethod
+    def _pack_record(key: bytes, entry: _SegmentEntry) -> bytes:
+        return _INDEX_RECORD.pack(
+            key, entry.segment, entry.offset, entry.dimension, entry.last_access
+        )
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.segments_dir / f"{segment:06d}.seg"
+
+    def _segment_ids(self) -> list[int]:
+        ids = []
+        for path in self.segments_dir.glob("*.seg"):
+            try:
+                ids.append(int(path.stem))
+            except ValueError:
+                continue
+        return sorted(ids)
+
+    # ------------------------------------------------------------------
+    # Legacy migration
+    # ------------------------------------------------------------------
+
+    def migrate_legacy_cache(self) -> int:
+        """Import a cache written in the one-file-per-embedding layout.
+
+        Reads ``index.json`` and the ``embeddings/*.bin`` files, appends every
+        readable vector to the segment store and removes the legacy files.
+
+        Returns:
+            Number of embeddings imported
+        """
+        with self._lock:
+            try:
+                with open(self.legacy_index_file) as f:
+                    legacy_index: dict[str, dict[str, Any]] = json.load(f)
+            except Exception as e:
+                self.logger.warning(f"Failed to read legacy embedding cache index: {e}")
+                legacy_index = {}
+
+            imported = 0
+            for content_hash, meta in legacy_index.items():
+                legacy_file = self.legacy_embeddings_dir / f"{content_hash}.bin"
+                try:
+                    with open(legacy_file, "rb") as f:
+                        dimension = struct.unpack("I", f.read(4))[0]
+                        vector = np.frombuffer(
+                            f.read(dimension * 4), dtype=np.float32, count=dimension
+                        )
+                    self._append(
+                        self._key(content_hash),
+                        vector,
+                        float(meta.get("last_access", time.time())),
+                    )
+                    imported += 1
+                except Exception:
+                    continue
+
+            self._save_index()
+
+            for legacy_file in self.legacy_embeddings_dir.glob("*.bin"):
+                legacy_file.unlink(missing_ok=True)
+            with contextlib.suppress(OSError):
+                self.legacy_embeddings_dir.rmdir()
+            self.legacy_index_file.unlink(missing_ok=True)
+
+            self.logger.info(
+                f"Migrated {imported} embeddings from legacy cache layout"
+            )
+            return imported
+
+    # ------------------------------------------------------------------
+    # Maintenance and statistics
+    # ------------------------------------------------------------------
+
     def flush(self) -> None:
         """Force save index to disk."""
         with self._lock:
             self._save_index()
 
+    def close(self) -> None:
+        """Flush pending writes and release segment handles."""
+        with self._lock:
+            self._save_index()
+            if self._active_file is not None:
+                self._active_file.close()
+                self._active_file = None
+            for mapped in self._maps.values():
+                with contextlib.suppress(BufferError):
+                    mapped.close()
+            self._maps.clear()
+
     def clear(self) -> None:
         """Clear all cached embeddings."""
         with self._lock:
-            # Remove all embedding files
-            for content_hash in list(self._index.keys()):
-                embedding_file = self.embeddings_dir / f"{content_hash}.bin"
-                try:
-                    if embedding_file.exists():
-                        embedding_file.unlink()
-                except Exception:
-                    pass
+            if self._active_file is not None:
+                self._active_file.close()
+                self._active_file = None
+            for segment in self._segment_ids():
+                self._release_segment(segment)
 
             self._index = {}
-            self._save_index()
+            self._live_bytes = 0
+            self._active_segment = 1
+            self._active_size = 0
+            self._write_index_snapshot()
             self._hits = 0
             self._misses = 0
             self.logger.info("Cleared embedding cache")
@@ -280,11 +643,18 @@ class PersistentEmbeddingCache:
         with self._lock:
             total_requests = self._hits + self._misses
             hit_ratio = self._hits / total_requests if total_requests > 0 else 0.0
-            cache_size = self._get_cache_size()
+            segments = self._segment_ids()
+            disk_size = sum(
+                self._segment_path(s).stat().st_size
+                for s in segments
+                if self._segment_path(s).exists()
+            )
 
             return {
                 "entries": len(self._index),
-                "size_mb": cache_size / 1024 / 1024,
+                "size_mb": self._live_bytes / 1024 / 1024,
+                "disk_size_mb": disk_size / 1024 / 1024,
+                "segments": len(segments),
                 "max_size_mb": self.max_size_bytes / 1024 / 1024,
                 "hits": self._hits,
                 "misses": self._misses,
@@ -295,7 +665,7 @@ class PersistentEmbeddingCache:
     def contains(self, content_hash: str) -> bool:
         """Check if content hash exists in cache."""
         with self._lock:
-            return content_hash in self._index
+            return self._key(content_hash) in self._index
 
     def __len__(self) -> int:
         """Return number of cached embeddings."""
@@ -305,6 +675,8 @@ class PersistentEmbeddingCache:
         """Ensure index is saved on cleanup."""
         try:
             self._save_index()
+            if self._active_file is not None:
+                self._active_file.close()
         except Exception:
             pass
 
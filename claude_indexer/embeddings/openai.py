@@ -3,6 +3,7 @@
 import time
 from typing import Any, cast
 
+from .async_backend import AsyncEmbeddingBackend, in_event_loop, run_embedding_coroutine
 from .base import EmbeddingResult, RetryableEmbedder, TiktokenMixin
 
 try:
@@ -42,6 +43,8 @@ class OpenAIEmbedder(TiktokenMixin, RetryableEmbedder):
         model: str = "text-embedding-3-small",
         max_retries: int = 3,
         base_delay: float = 1.0,
+        max_concurrency: int = 1,
+        base_url: str = "https://api.openai.com/v1",
         **kwargs: Any,  # noqa: ARG002
     ) -> None:
         if not OPENAI_AVAILABLE:
@@ -69,7 +72,9 @@ class OpenAIEmbedder(TiktokenMixin, RetryableEmbedder):
 
         super().__init__(max_retries=max_retries, base_delay=base_delay)
 
-        self.client = openai.OpenAI(api_key=final_api_key, timeout=30.0)
+        self.client = openai.OpenAI(
+            api_key=final_api_key, base_url=base_url, timeout=30.0
+        )
 
         # Rate limiting
         self._requests_per_minute = 3000  # Conservative limit
@@ -77,6 +82,30 @@ class OpenAIEmbedder(TiktokenMixin, RetryableEmbedder):
         self._request_times: list[float] = []
         self._token_counts: list[tuple[float, int]] = []
 
+        # Concurrent requests through the asyncio backend when enabled
+        self._async_backend: AsyncEmbeddingBackend | None = None
+        if max_concurrency > 1:
+            self._async_backend = AsyncEmbeddingBackend(
+                url=f"{base_url.rstrip('/')}/embeddings",
+                api_key=final_api_key,
+                model=model,
+                count_tokens=self._estimate_tokens,
+                max_batch_tokens=self._get_effective_token_limit(),
+                max_batch_texts=self._get_text_count_limit(),
+                tokens_per_minute=self._tokens_per_minute,
+                max_concurrency=max_concurrency,
+                max_retries=max_retries,
+                base_delay=base_delay,
+                extra_payload={"encoding_format": "float"},
+                cost_per_1k_tokens=self.model_config["cost_per_1k_tokens"],
+                on_request=self._record_request,
+            )
+
+    def _record_request(self, timestamp: float, tokens: int) -> None:
+        """Record a completed request for rate limiting and usage stats."""
+        self._request_times.append(timestamp)
+        self._token_counts.append((timestamp, tokens))
+
     def _check_rate_limits(self, estimated_tokens: int = 1000) -> None:
         """Check and enforce rate limits."""
         current_time = time.time()
@@ -169,6 +198,14 @@ class OpenAIEmbedder(TiktokenMixin, RetryableEmbedder):
         if not texts:
             return []
 
+        # Inside an event loop callers should await aembed_batch; fall back
+        # to synchronous requests rather than blocking the loop
+        if self._async_backend is not None and not in_event_loop():
+            return cast(
+                list[EmbeddingResult],
+                run_embedding_coroutine(self.aembed_batch(texts, item_type)),
+            )
+
         # Model-specific token limits with tiktoken accuracy
         token_limit = self._get_effective_token_limit()
 
@@ -206,6 +243,26 @@ class OpenAIEmbedder(TiktokenMixin, RetryableEmbedder):
 
         return results
 
+    async def aembed_batch(
+        self, texts: list[str], item_type: str = "general"
+    ) -> list[EmbeddingResult]:
+        """Generate embeddings with several requests in flight.
+
+        Requires ``max_concurrency > 1``; texts are truncated and packed to
+        the same token and count limits as ``embed_batch``.
+        """
+        if self._async_backend is None:
+            raise RuntimeError("Async embedding requires max_concurrency > 1")
+
+        truncated_texts = [self.truncate_text(text) for text in texts]
+        results = await self._async_backend.embed(
+            truncated_texts,
+            max_batch_texts=500 if item_type == "relation" else None,
+        )
+        for text, result in zip(texts, results, strict=True):
+            result.text = text
+        return results
+
     def _get_effective_token_limit(self) -> int:
         """Get effective token limit for batching."""
         # Conservative limit for OpenAI embeddings - leave room for overhead
@@ -290,6 +347,9 @@ class OpenAIEmbedder(TiktokenMixin, RetryableEmbedder):
                 "requests_per_minute": self._requests_per_minute,
                 "tokens_per_minute": self._tokens_per_minute,
             },
+            "max_concurrency": (
+                self._async_backend.max_concurrency if self._async_backend else 1
+            ),
         }
 
     def get_max_tokens(self) -> int:
@@ -137,6 +137,7 @@ def create_embedder_from_config(
             provider_config = {
                 "api_key": config.voyage_api_key,
                 "model": config.voyage_model,
+                "max_concurrency": getattr(config, "embedding_concurrency", 1),
             }
         elif provider == "bm25":
             provider_config = {
@@ -149,6 +150,7 @@ def create_embedder_from_config(
             provider_config = {
                 "api_key": config.openai_api_key,
                 "model": "text-embedding-3-small",
+                "max_concurrency": getattr(config, "embedding_concurrency", 1),
             }
     else:
         # Dict config (backward compatibility)
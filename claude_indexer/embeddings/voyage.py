@@ -3,6 +3,7 @@
 import time
 from typing import Any, cast
 
+from .async_backend import AsyncEmbeddingBackend, in_event_loop, run_embedding_coroutine
 from .base import EmbeddingResult, RetryableEmbedder, TiktokenMixin
 
 try:
@@ -46,6 +47,9 @@ class VoyageEmbedder(TiktokenMixin, RetryableEmbedder):
         model: str = "voyage-3-lite",
         max_retries: int = 3,
         base_delay: float = 1.0,
+        max_concurrency: int = 1,
+        base_url: str = "https://api.voyageai.com/v1",
+        **kwargs: Any,  # noqa: ARG002
     ):
         if not VOYAGE_AVAILABLE:
             raise ImportError(
@@ -73,6 +77,34 @@ class VoyageEmbedder(TiktokenMixin, RetryableEmbedder):
         self._request_times: list[float] = []
         self._token_counts: list[tuple[float, int]] = []
 
+        # Concurrent requests through the asyncio backend when enabled
+        self._async_backend: AsyncEmbeddingBackend | None = None
+        if max_concurrency > 1:
+            self._async_backend = AsyncEmbeddingBackend(
+                url=f"{base_url.rstrip('/')}/embeddings",
+                api_key=api_key,
+                model=model,
+                count_tokens=self._estimate_tokens,
+                max_batch_tokens=self._get_effective_token_limit(),
+                # Per-call limits narrow this to the item type's count limit
+                max_batch_texts=self._get_text_count_limit("relation"),
+                tokens_per_minute=self._tokens_per_minute,
+                max_concurrency=max_concurrency,
+                max_retries=max_retries,
+                base_delay=base_delay,
+                extra_payload={
+                    "input_type": "document",
+                    "output_dimension": self.model_config["dimensions"],
+                },
+                cost_per_1k_tokens=self.model_config["cost_per_1k_tokens"],
+                on_request=self._record_request,
+            )
+
+    def _record_request(self, timestamp: float, tokens: int) -> None:
+        """Record a completed request for rate limiting and usage stats."""
+        self._request_times.append(timestamp)
+        self._token_counts.append((timestamp, tokens))
+
     def _init_tiktoken(self) -> None:
         """Initialize tiktoken - Voyage uses similar tokenization to OpenAI's cl100k_base."""
         try:
@@ -183,21 +215,16 @@ class VoyageEmbedder(TiktokenMixin, RetryableEmbedder):
         if not texts:
             return []
 
-        # Voyage token limits per API testing
-        model_limits = {
-            "voyage-3-lite": 30_000,  # Safe limit below 32K context (tested up to 32K)
-            "voyage-3.5-lite": 30_000,  # Same as voyage-3-lite
-            "voyage-3": 120_000,
-            "voyage-code-3": 120_000,
-        }
-        token_limit = model_limits.get(self.model, 120_000)  # Conservative default
+        # Inside an event loop callers should await aembed_batch; fall back
+        # to synchronous requests rather than blocking the loop
+        if self._async_backend is not None and not in_event_loop():
+            return cast(
+                list[EmbeddingResult],
+                run_embedding_coroutine(self.aembed_batch(texts, item_type)),
+            )
 
-        # Optimize batch size based on content type
-        # Relations are very short (~20-50 tokens), so we can batch many more
-        if item_type == "relation":
-            text_count_limit = 500  # Aggressive batching for relations (80% reduction in API calls)
-        else:
-            text_count_limit = 100  # Standard batching for entities/implementations
+        token_limit = self._get_effective_token_limit()
+        text_count_limit = self._get_text_count_limit(item_type)
 
         # Import progress bar if available
         try:
@@ -253,6 +280,43 @@ class VoyageEmbedder(TiktokenMixin, RetryableEmbedder):
 
         return results
 
+    async def aembed_batch(
+        self, texts: list[str], item_type: str = "general"
+    ) -> list[EmbeddingResult]:
+        """Generate embeddings with several requests in flight.
+
+        Requires ``max_concurrency > 1``; texts are truncated and packed to
+        the same token and count limits as ``embed_batch``.
+        """
+        if self._async_backend is None:
+            raise RuntimeError("Async embedding requires max_concurrency > 1")
+
+        truncated_texts = [self.truncate_text(text) for text in texts]
+        results = await self._async_backend.embed(
+            truncated_texts, max_batch_texts=self._get_text_count_limit(item_type)
+        )
+        for text, result in zip(texts, results, strict=True):
+            result.text = text
+        return results
+
+    def _get_effective_token_limit(self) -> int:
+        """Get effective token limit for batching."""
+        # Voyage token limits per API testing
+        model_limits = {
+            "voyage-3-lite": 30_000,  # Safe limit below 32K context (tested up to 32K)
+            "voyage-3.5-lite": 30_000,  # Same as voyage-3-lite
+            "voyage-3": 120_000,
+            "voyage-code-3": 120_000,
+        }
+        return model_limits.get(self.model, 120_000)  # Conservative default
+
+    def _get_text_count_limit(self, item_type: str = "general") -> int:
+        """Get text count limit for batching."""
+        # Relations are very short (~20-50 tokens), so we can batch many more
+        if item_type == "relation":
+            return 500  # Aggressive batching for relations (80% reduction in API calls)
+        return 100  # Standard batching for entities/implementations
+
     def _embed_batch(self, texts: list[str]) -> list[EmbeddingResult]:
         """Embed a single batch of texts."""
         start_time = time.time()
@@ -329,6 +393,9 @@ class VoyageEmbedder(TiktokenMixin, RetryableEmbedder):
                 "requests_per_minute": self._requests_per_minute,
                 "tokens_per_minute": self._tokens_per_minute,
             },
+            "max_concurrency": (
+                self._async_backend.max_concurrency if self._async_backend else 1
+            ),
         }
 
     def get_max_tokens(self) -> int:
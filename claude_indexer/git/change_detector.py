@@ -4,6 +4,7 @@ This module provides GitChangeDetector which uses git to efficiently
 detect file changes, with fallback to hash-based detection for non-git repos.
 """
 
+import hashlib
 import subprocess
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -14,6 +15,9 @@ from ..indexer_logging import get_logger
 if TYPE_CHECKING:
     from ..storage.file_cache import FileHashCache
 
+# Above this many paths, list the whole index instead of passing pathspecs
+PATHSPEC_LIMIT = 200
+
 
 @dataclass
 class ChangeSet:
@@ -165,6 +169,95 @@ class GitChangeDetector:
         except subprocess.CalledProcessError:
             return None
 
+    def get_blob_ids(self, files: list[Path]) -> dict[Path, str]:
+        """Get git blob IDs for working-tree files.
+
+        Tracked files that match the index take their ID from
+        ``git ls-files -s`` without being read. Only files that differ from
+        the index or are untracked are hashed, via ``git hash-object`` so the
+        IDs agree with the index even when clean filters apply.
+
+        Args:
+            files: Paths of files inside the project
+
+        Returns:
+            Dict mapping each file to its blob ID. Empty outside a git
+            repository or when git fails, so callers can fall back to
+            content hashing.
+        """
+        if not files or not self.is_git_repo():
+            return {}
+
+        relative: dict[Path, str] = {}
+        for file_path in files:
+            try:
+                relative[file_path] = file_path.relative_to(self.project_path).as_posix()
+            except ValueError:
+                try:
+                    relative[file_path] = (
+                        file_path.resolve().relative_to(self.project_path).as_posix()
+                    )
+                except ValueError:
+                    continue
+
+        pathspecs = list(relative.values()) if len(relative) <= PATHSPEC_LIMIT else []
+
+        try:
+            index_ids = self._read_index_ids(pathspecs)
+            dirty = self._read_dirty_paths(pathspecs)
+
+            blob_ids: dict[Path, str] = {}
+            to_hash: list[Path] = []
+            for file_path, rel_path in relative.items():
+                oid = index_ids.get(rel_path)
+                if oid is None or rel_path in dirty:
+                    to_hash.append(file_path)
+                else:
+                    blob_ids[file_path] = oid
+
+            if to_hash:
+                output = self._run_git_command(
+                    ["hash-object", "--stdin-paths"],
+                    input_text="".join(f"{path}\n" for path in to_hash),
+                )
+                blob_ids.update(zip(to_hash, output.split(), strict=True))
+        except (subprocess.CalledProcessError, OSError, ValueError) as e:
+            self.logger.debug(f"Falling back to content hashing: {e}")
+            return {}
+
+        return blob_ids
+
+    def _read_index_ids(self, pathspecs: list[str]) -> dict[str, str]:
+        """Blob IDs of regular files in the index, keyed by project-relative path."""
+        output = self._run_git_command(
+            ["--literal-pathspecs", "ls-files", "-s", "-z", "--", *pathspecs]
+        )
+        index_ids = {}
+        for record in output.split("\0"):
+            if not record:
+                continue
+            meta, rel_path = record.split("\t", 1)
+            mode, oid, stage = meta.split(" ")
+            # Skip submodules, symlinks and unmerged entries
+            if stage == "0" and mode in ("100644", "100755"):
+                index_ids[rel_path] = oid
+        return index_ids
+
+    def _read_dirty_paths(self, pathspecs: list[str]) -> set[str]:
+        """Project-relative paths whose working-tree file differs from the index."""
+        output = self._run_git_command(
+            [
+                "--literal-pathspecs",
+                "diff-files",
+                "--name-only",
+                "--relative",
+                "-z",
+                "--",
+                *pathspecs,
+            ]
+        )
+        return {path for path in output.split("\0") if path}
+
     def detect_changes(
         self,
         since_commit: str | None = None,
@@ -354,17 +447,18 @@ class GitChangeDetector:
     def _detect_via_hash(self, previous_state: dict) -> ChangeSet:
         """Detect changes using file hash comparison.
 
-        Falls back to this when not in a git repository.
+        Falls back to this when no base commit is known. Entries recorded
+        with a git blob ID ("oid") are compared against the current blob IDs,
+        which only requires hashing files that differ from the index; other
+        entries are compared by SHA256 content hash ("hash").
 
         Args:
             previous_state: Dict mapping relative paths to file info
-                          (with "hash" key for content hash)
+                          (with "oid" or "hash" key)
 
         Returns:
             ChangeSet based on hash comparison
         """
-        from ..storage.file_cache import FileHashCache
-
         added_files: list[Path] = []
         modified_files: list[Path] = []
         deleted_files: list[str] = []
@@ -372,6 +466,7 @@ class GitChangeDetector:
         # Get all current files
         current_files = self._find_all_files()
         current_paths = set()
+        blob_ids = self.get_blob_ids(current_files)
 
         for file_path in current_files:
             try:
@@ -383,10 +478,13 @@ class GitChangeDetector:
                     added_files.append(file_path)
                 else:
                     # Check if modified
-                    current_hash = FileHashCache.compute_file_hash(file_path)
-                    previous_hash = previous_state.get(rel_path, {}).get("hash", "")
+                    previous = previous_state.get(rel_path, {})
+                    if "oid" in previous and file_path in blob_ids:
+                        changed = blob_ids[file_path] != previous["oid"]
+                    else:
+                        changed = _sha256_file(file_path) != previous.get("hash", "")
 
-                    if current_hash != previous_hash:
+                    if changed:
                         modified_files.append(file_path)
             except ValueError:
                 continue
@@ -457,11 +555,12 @@ class GitChangeDetector:
         parts = file_path.parts
         return any(pattern in parts for pattern in skip_patterns)
 
-    def _run_git_command(self, args: list[str]) -> str:
+    def _run_git_command(self, args: list[str], input_text: str | None = None) -> str:
         """Run a git command and return stdout.
 
         Args:
             args: Git command arguments (without "git")
+            input_text: Optional text written to the command's stdin
 
         Returns:
             Command stdout as string
@@ -472,8 +571,17 @@ class GitChangeDetector:
         result = subprocess.run(
             ["git"] + args,
             cwd=self.project_path,
+            input=input_text,
             capture_output=True,
             text=True,
             check=True,
         )
         return result.stdout
+
+
+def _sha256_file(file_path: Path) -> str:
+    """SHA256 hex digest of a file, matching the indexer's state hashes."""
+    try:
+        return hashlib.sha256(file_path.read_bytes()).hexdigest()
+    except OSError:
+        return ""
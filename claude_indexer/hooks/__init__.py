@@ -21,8 +21,14 @@ Milestone 3.4 adds SessionStart hook:
 - SessionStartResult: Aggregated check results
 - IndexFreshnessResult: Index staleness detection
 - run_session_start: Entry function for CLI
+
+The resident daemon keeps rule engines and indexer components warm:
+- IndexerDaemon: Unix-socket server answering hook requests
+- DaemonClient: Client used by IndexQueue and the CLI
+- run_daemon: Entry function for CLI
 """
 
+from .daemon import DaemonClient, IndexerDaemon, run_daemon
 from .fix_generator import FixSuggestion, FixSuggestionGenerator
 from .index_queue import IndexQueue
 from .post_write import PostWriteExecutor, PostWriteResult, format_findings_for_display
@@ -59,6 +65,10 @@ __all__ = [
     "run_session_start",
     # Indexing queue
     "IndexQueue",
+    # Resident daemon
+    "IndexerDaemon",
+    "DaemonClient",
+    "run_daemon",
     # Self-repair loop (Milestone 3.3)
     "RepairSession",
     "RepairSessionManager",
@@ -0,0 +1,413 @@
+"""
+Resident indexer daemon for Claude Code hooks.
+
+Every hook invocation of ``claude-indexer`` pays interpreter start-up,
+package imports and rule/parser/embedder initialization before doing any
+work. The daemon keeps those warm in one long-lived process and answers
+hook requests over a Unix-domain socket:
+
+- post-write: fast rules on a single file (warm RuleEngine)
+- stop-check: end-of-turn checks, optionally with repair tracking
+- index-files: queue files for background indexing with warm
+  ParserRegistry, embedder and QdrantStore per collection
+
+Protocol: the client sends one JSON object terminated by a newline and
+receives one JSON object back:
+    {"command": "post-write", "file_path": "...", "json": true}
+    -> {"ok": true, "exit_code": 1, "stdout": "...", "stderr": ""}
+
+Hook scripts use the stdlib-only ``hooks/indexer_client.py`` and fall back
+to the regular CLI when the daemon is not running.
+"""
+
+import contextlib
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Any, ClassVar
+
+from ..session.lock import LockManager
+
+logger = logging.getLogger(__name__)
+
+# Environment override for the socket location
+SOCKET_ENV_VAR = "CLAUDE_INDEXER_SOCKET"
+
+# Default socket next to the index queue files
+DEFAULT_SOCKET_PATH = Path.home() / ".claude-code-memory" / "indexer.sock"
+
+# Largest request accepted from a client (post-write may inline file content)
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+
+def get_socket_path() -> Path:
+    """Get the daemon socket path, honouring CLAUDE_INDEXER_SOCKET."""
+    override = os.environ.get(SOCKET_ENV_VAR)
+    return Path(override) if override else DEFAULT_SOCKET_PATH
+
+
+class DaemonUnavailableError(ConnectionError):
+    """Raised when no daemon is listening on the socket."""
+
+
+class DaemonClient:
+    """Minimal client for the indexer daemon socket.
+
+    Example usage:
+        client = DaemonClient()
+        if client.is_running():
+            reply = client.request({"command": "ping"})
+    """
+
+    def __init__(self, socket_path: Path | None = None, timeout: float = 10.0):
+        self.socket_path = Path(socket_path) if socket_path else get_socket_path()
+        self.timeout = timeout
+
+    def request(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Send one request and wait for the reply.
+
+        Args:
+            payload: Request with a "command" key
+
+        Returns:
+            Decoded JSON reply
+
+        Raises:
+            DaemonUnavailableError: If nothing is listening on the socket
+        """
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(self.timeout)
+                sock.connect(str(self.socket_path))
+                sock.sendall(json.dumps(payload).encode() + b"\n")
+                with sock.makefile("rb") as reader:
+                    line = reader.readline()
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise DaemonUnavailableError(
+                f"Indexer daemon not running at {self.socket_path}"
+            ) from e
+
+        if not line:
+            raise DaemonUnavailableError("Indexer daemon closed the connection")
+        return json.loads(line)
+
+    def is_running(self) -> bool:
+        """Check whether a daemon answers on the socket."""
+        try:
+            return self.request({"command": "ping"}).get("ok", False)
+        except (OSError, ValueError):
+            return False
+
+
+class _IndexingSessions:
+    """Indexing queue feeding the warm session of each (project, collection).
+
+    Queued files are coalesced per collection and indexed as a batch, so a
+    burst of writes to the same files costs one ``index_files`` call. The
+    sessions are shared with any watcher running in the same process.
+    """
+
+    # Seconds a file must be quiet before it is indexed
+    DEBOUNCE_DELAY = 1.0
+
+    def __init__(self) -> None:
+        # (project, collection) -> {file_path: last enqueue time}
+        self._pending: dict[tuple[str, str], dict[str, float]] = {}
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self.files_indexed = 0
+        self._worker = threading.Thread(
+            target=self._run, daemon=True, name="IndexerDaemon-Worker"
+        )
+        self._worker.start()
+
+    def enqueue(self, project: str, collection: str, file_paths: list[str]) -> int:
+        """Queue files for indexing and return the number now pending."""
+        now = time.time()
+        key = (str(Path(project).resolve()), collection)
+        with self._condition:
+            files = self._pending.setdefault(key, {})
+            for file_path in file_paths:
+                files[str(Path(file_path).resolve())] = now
+            self._condition.notify()
+            return sum(len(f) for f in self._pending.values())
+
+    def pending_count(self) -> int:
+        """Number of files waiting to be indexed."""
+        with self._condition:
+            return sum(len(f) for f in self._pending.values())
+
+    def stop(self) -> None:
+        """Stop the worker after the current batch."""
+        self._stop_event.set()
+        with self._condition:
+            self._condition.notify()
+        self._worker.join(timeout=5.0)
+
+    def _take_ready(self) -> list[tuple[tuple[str, str], list[str]]]:
+        """Pop files that have been quiet for the debounce delay."""
+        cutoff = time.time() - self.DEBOUNCE_DELAY
+        ready = []
+        for key, files in list(self._pending.items()):
+            quiet = [path for path, stamp in files.items() if stamp <= cutoff]
+            for path in quiet:
+                del files[path]
+            if not files:
+                del self._pending[key]
+            if quiet:
+                ready.append((key, quiet))
+        return ready
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            with self._condition:
+                ready = self._take_ready()
+                if not ready:
+                    self._condition.wait(
+                        timeout=self.DEBOUNCE_DELAY if self._pending else None
+                    )
+                    continue
+
+            for (project, collection), file_paths in ready:
+                try:
+                    self._index(project, collection, file_paths)
+                except Exception as e:
+                    logger.warning(f"Daemon indexing failed for {collection}: {e}")
+
+    def _index(self, project: str, collection: str, file_paths: list[str]) -> None:
+        paths = [Path(p) for p in file_paths if Path(p).exists()]
+        if not paths:
+            return
+
+        from ..main import acquire_indexing_session
+
+        session = acquire_indexing_session(project, collection, quiet=True)
+        if session is None:
+            raise RuntimeError(f"Could not create indexer for {project}")
+        try:
+            result = session.indexer.index_files(paths, collection)
+        finally:
+            session.release()
+        self.files_indexed += len(paths)
+        if not result.success:
+            logger.warning(
+                f"Daemon indexing reported errors for {collection}: {result.errors}"
+            )
+
+
+class IndexerDaemon:
+    """Long-lived process answering hook requests over a Unix socket.
+
+    Rule checks are serialized (the rule engines are shared singletons);
+    indexing runs on a background worker so index requests return at once.
+
+    Example usage:
+        daemon = IndexerDaemon()
+        daemon.serve_forever()  # blocks until a "shutdown" request
+    """
+
+    COMMANDS: ClassVar[tuple[str, ...]] = (
+        "ping",
+        "status",
+        "post-write",
+        "stop-check",
+        "index-files",
+        "shutdown",
+    )
+
+    def __init__(self, socket_path: Path | None = None) -> None:
+        self.socket_path = Path(socket_path) if socket_path else get_socket_path()
+        self.started_at = time.time()
+        self.requests_served = 0
+        self._check_lock = threading.Lock()
+        self._sessions: _IndexingSessions | None = None
+        self._server: socketserver.ThreadingUnixStreamServer | None = None
+        self._lock: LockManager | None = None
+
+    @property
+    def sessions(self) -> _IndexingSessions:
+        """Indexing sessions, started on the first index request."""
+        if self._sessions is None:
+            self._sessions = _IndexingSessions()
+        return self._sessions
+
+    def warm_up(self) -> None:
+        """Load the rule engines before the first request arrives."""
+        from .post_write import PostWriteExecutor
+        from .stop_check import StopCheckExecutor
+
+        PostWriteExecutor.get_instance()
+        StopCheckExecutor.get_instance()
+
+    def acquire_lock(self) -> None:
+        """Take the daemon lock, held until serve_forever returns.
+
+        The lock file sits next to the socket. Whoever holds it owns the
+        socket path, so a daemon that is still warming up or busy is never
+        mistaken for a dead one.
+
+        Raises:
+            RuntimeError: If another daemon holds the lock
+        """
+        if self._lock is not None:
+            return
+        lock = LockManager(self.socket_path.with_suffix(".lock"), session_id="daemon")
+        if not lock.acquire(blocking=False):
+            raise RuntimeError(f"Indexer daemon already running at {self.socket_path}")
+        self._lock = lock
+
+    def bind(self) -> None:
+        """Bind the socket, replacing a stale one left by a dead daemon.
+
+        Raises:
+            RuntimeError: If another daemon is already serving the socket
+        """
+        self.acquire_lock()
+        with contextlib.suppress(FileNotFoundError):
+            self.socket_path.unlink()
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                line = self.rfile.readline(MAX_REQUEST_BYTES)
+                reply = daemon.handle_request(line)
+                self.wfile.write(json.dumps(reply).encode() + b"\n")
+
+        old_umask = os.umask(0o177)  # Socket readable by the owner only
+        try:
+            self._server = socketserver.ThreadingUnixStreamServer(
+                str(self.socket_path), Handler
+            )
+        finally:
+            os.umask(old_umask)
+        self._server.daemon_threads = True
+
+    def serve_forever(self) -> None:
+        """Bind (if needed) and serve requests until shutdown."""
+        if self._server is None:
+            self.bind()
+        assert self._server is not None
+        logger.info(f"Indexer daemon listening on {self.socket_path}")
+        try:
+            self._server.serve_forever(poll_interval=0.5)
+        finally:
+            self._server.server_close()
+            if self._sessions is not None:
+                self._sessions.stop()
+            with contextlib.suppress(FileNotFoundError):
+                self.socket_path.unlink()
+            if self._lock is not None:
+                self._lock.release()
+                self._lock = None
+
+    def shutdown(self) -> None:
+        """Stop serving; safe to call from a request handler thread."""
+        if self._server is not None:
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+    def handle_request(self, raw: bytes) -> dict[str, Any]:
+        """Decode and dispatch one request, never raising."""
+        self.requests_served += 1
+        try:
+            request = json.loads(raw)
+            command = request.get("command")
+            if command not in self.COMMANDS:
+                return {"ok": False, "error": f"Unknown command: {command}"}
+            handler = getattr(self, "_handle_" + command.replace("-", "_"))
+            return {"ok": True, **handler(request)}
+        except Exception as e:
+            logger.warning(f"Daemon request failed: {e}")
+            return {"ok": False, "error": str(e)}
+
+    def _handle_ping(self, request: dict[str, Any]) -> dict[str, Any]:  # noqa: ARG002
+        return {"pid": os.getpid()}
+
+    def _handle_status(self, request: dict[str, Any]) -> dict[str, Any]:  # noqa: ARG002
+        sessions = self._sessions
+        return {
+            "pid": os.getpid(),
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "requests_served": self.requests_served,
+            "pending_files": sessions.pending_count() if sessions else 0,
+            "files_indexed": sessions.files_indexed if sessions else 0,
+        }
+
+    def _handle_post_write(self, request: dict[str, Any]) -> dict[str, Any]:
+        from .post_write import run_post_write_check
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with self._check_lock:
+            exit_code = run_post_write_check(
+                file_path=request["file_path"],
+                content=request.get("content"),
+                output_json=request.get("json", False),
+                stdout=stdout,
+                stderr=stderr,
+            )
+        return {
+            "exit_code": exit_code,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+        }
+
+    def _handle_stop_check(self, request: dict[str, Any]) -> dict[str, Any]:
+        from .stop_check import run_stop_check, run_stop_check_with_repair
+
+        run = run_stop_check_with_repair if request.get("repair") else run_stop_check
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with self._check_lock:
+            exit_code = run(
+                project=request.get("project", "."),
+                output_json=request.get("json", False),
+                timeout_ms=request.get("timeout_ms", 5000),
+                threshold=request.get("threshold", "high"),
+                stdout=stdout,
+                stderr=stderr,
+            )
+        return {
+            "exit_code": exit_code,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+        }
+
+    def _handle_index_files(self, request: dict[str, Any]) -> dict[str, Any]:
+        pending = self.sessions.enqueue(
+            request["project"], request["collection"], request["file_paths"]
+        )
+        return {"exit_code": 0, "queued": len(request["file_paths"]), "pending": pending}
+
+    def _handle_shutdown(self, request: dict[str, Any]) -> dict[str, Any]:  # noqa: ARG002
+        self.shutdown()
+        return {"exit_code": 0}
+
+
+def run_daemon(socket_path: Path | None = None) -> int:
+    """Run the daemon in the foreground until it is shut down.
+
+    Args:
+        socket_path: Socket location (default: CLAUDE_INDEXER_SOCKET or
+            ~/.claude-code-memory/indexer.sock)
+
+    Returns:
+        Exit code: 0 on clean shutdown, 1 if a daemon is already running
+    """
+    daemon = IndexerDaemon(socket_path)
+    try:
+        daemon.acquire_lock()
+    except RuntimeError as e:
+        logger.info(str(e))
+        return 1
+    # Warm up before binding: clients fall back to the CLI until the socket
+    # appears instead of timing out against a daemon that is not accepting
+    daemon.warm_up()
+    daemon.bind()
+    daemon.serve_forever()
+    return 0
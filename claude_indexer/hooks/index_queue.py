@@ -133,7 +133,7 @@ class IndexQueue:
             self._index_files(files_to_process)
 
     def _index_files(self, entries: list[dict[str, Any]]) -> None:
-        """Index a batch of files using claude-indexer.
+        """Index a batch of files via the daemon, or claude-indexer if none runs.
 
         Args:
             entries: List of queue entries to index
@@ -154,6 +154,11 @@ class IndexQueue:
             project_path = collection_entries[0]["project_path"]
             file_paths = [e["file_path"] for e in collection_entries]
 
+            # Hand off to the resident daemon when one is running
+            if self._send_to_daemon(project_path, collection, file_paths):
+                logger.debug(f"Queued {len(file_paths)} files in daemon for {collection}")
+                continue
+
             try:
                 # Use batch indexing via stdin for efficiency
                 file_list = "\n".join(file_paths)
@@ -190,6 +195,29 @@ class IndexQueue:
             except Exception as e:
                 logger.warning(f"Indexing error: {e}")
 
+    def _send_to_daemon(
+        self, project_path: str, collection: str, file_paths: list[str]
+    ) -> bool:
+        """Queue files in the indexer daemon, avoiding a CLI start-up.
+
+        Returns:
+            True if the daemon accepted the files
+        """
+        from .daemon import DaemonClient
+
+        try:
+            reply = DaemonClient(timeout=5.0).request(
+                {
+                    "command": "index-files",
+                    "project": project_path,
+                    "collection": collection,
+                    "file_paths": file_paths,
+                }
+            )
+        except (OSError, ValueError):
+            return False
+        return bool(reply.get("ok"))
+
     def enqueue(
         self,
         file_path: Path,
@@ -16,7 +16,7 @@ import sys
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import Any, ClassVar, TextIO
 
 from ..rules.base import Finding, RuleContext, Severity
 from ..rules.engine import RuleEngine, RuleEngineResult, create_rule_engine
@@ -259,15 +259,19 @@ def run_post_write_check(
     file_path: str,
     content: str | None = None,
     output_json: bool = False,
+    stdout: TextIO | None = None,
+    stderr: TextIO | None = None,
 ) -> int:
     """Run post-write checks and output results.
 
-    This is the main entry point for the CLI command.
+    This is the main entry point for the CLI command and the indexer daemon.
 
     Args:
         file_path: Path to file to check
         content: Optional content (avoids file read)
         output_json: Whether to output JSON format
+        stdout: Stream for results (default: sys.stdout)
+        stderr: Stream for errors (default: sys.stderr)
 
     Returns:
         Exit code: 0 = no findings, 1 = warnings found
@@ -276,11 +280,11 @@ def run_post_write_check(
     result = executor.check_file(Path(file_path), content=content)
 
     if output_json:
-        print(result.to_json())
+        print(result.to_json(), file=stdout)
     elif result.findings:
-        print(format_findings_for_display(result))
+        print(format_findings_for_display(result), file=stdout)
     elif result.error:
-        print(f"Error: {result.error}", file=sys.stderr)
+        print(f"Error: {result.error}", file=stderr or sys.stderr)
 
     # Exit 1 if warnings found, 0 otherwise
     return 1 if result.should_warn else 0
@@ -18,7 +18,7 @@ import sys
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import Any, ClassVar, TextIO
 
 from ..rules.base import DiffHunk, Finding, RuleContext, Severity, Trigger
 from ..rules.engine import RuleEngine, RuleEngineResult, create_rule_engine
@@ -690,6 +690,8 @@ def run_stop_check(
     output_json: bool = False,
     timeout_ms: int = 5000,
     threshold: str = "high",
+    stdout: TextIO | None = None,
+    stderr: TextIO | None = None,
 ) -> int:
     """Run stop checks and output results.
 
@@ -700,6 +702,8 @@ def run_stop_check(
         output_json: Whether to output JSON format
         timeout_ms: Timeout in milliseconds
         threshold: Severity threshold ('critical', 'high', 'medium', 'low')
+        stdout: Stream for results (default: sys.stdout)
+        stderr: Stream for errors (default: sys.stderr)
 
     Returns:
         Exit code: 0 = no blocking issues, 1 = warnings, 2 = blocked
@@ -721,14 +725,14 @@ def run_stop_check(
     )
 
     if output_json:
-        print(result.to_json())
+        print(result.to_json(), file=stdout)
     elif result.findings:
         if result.should_block:
-            print(format_findings_for_claude(result))
+            print(format_findings_for_claude(result), file=stdout)
         else:
-            print(format_findings_for_display(result))
+            print(format_findings_for_display(result), file=stdout)
     elif result.error:
-        print(f"Error: {result.error}", file=sys.stderr)
+        print(f"Error: {result.error}", file=stderr or sys.stderr)
 
     # Exit code: 2 = blocked, 1 = warnings, 0 = clean
     if result.should_block:
@@ -743,6 +747,8 @@ def run_stop_check_with_repair(
     output_json: bool = False,
     timeout_ms: int = 5000,
     threshold: str = "high",
+    stdout: TextIO | None = None,
+    stderr: TextIO | None = None,
 ) -> int:
     """Run stop checks with repair loop tracking.
 
@@ -754,6 +760,8 @@ def run_stop_check_with_repair(
         output_json: Whether to output JSON format
         timeout_ms: Timeout in milliseconds
         threshold: Severity threshold ('critical', 'high', 'medium', 'low')
+        stdout: Stream for results (default: sys.stdout)
+        stderr: Stream for errors (default: sys.stderr)
 
     Returns:
         Exit code:
@@ -788,9 +796,9 @@ def run_stop_check_with_repair(
     # If no blocking issues, return clean
     if not base_result.should_block:
         if output_json:
-            print(base_result.to_json())
+            print(base_result.to_json(), file=stdout)
         elif base_result.findings:
-            print(format_findings_for_display(base_result))
+            print(format_findings_for_display(base_result), file=stdout)
 
         return 1 if base_result.findings else 0
 
@@ -844,9 +852,9 @@ def run_stop_check_with_repair(
 
     # Output result
     if output_json:
-        print(repair_result.to_json())
+        print(repair_result.to_json(), file=stdout)
     else:
-        print(repair_result.format_for_claude())
+        print(repair_result.format_for_claude(), file=stdout)
 
     # Determine exit code
     if repair_result.should_escalate:
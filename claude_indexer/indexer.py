@@ -12,13 +12,14 @@ from typing import Any
 
 from .analysis.entities import Entity, EntityChunk, Relation
 from .analysis.parser import ParserRegistry
+from .analysis.symbol_index import SymbolIndex
 from .categorization import FileCategorizationSystem, ProcessingTier
 from .config import IndexerConfig
 from .embeddings.base import Embedder
 from .git import ChangeSet, GitChangeDetector
 from .indexer_logging import get_logger
 from .storage.base import VectorStore
-from .parallel_processor import ParallelFileProcessor
+from .parallel_processor import ParallelFileProcessor, result_from_worker
 from .progress_bar import BatchProgressBar
 
 logger = get_logger()
@@ -212,27 +213,18 @@ class CoreIndexer:
         # Initialize parser registry with optional parse cache
         self.parser_registry = ParserRegistry(project_path, parse_cache=self._parse_cache)
 
-        # Initialize session cost tracking
-        self._session_cost_data: dict[str, int | float] = {
-            "tokens": 0,
-            "cost": 0.0,
-            "requests": 0,
-        }
-
-        # Initialize embedding metrics tracking
-        self._embedding_metrics: dict[str, int | float] = {
-            "metadata_embeddings": 0,
-            "implementation_embeddings": 0,
-            "relation_embeddings": 0,
-            "total_embeddings": 0,
-            "embeddings_reused": 0,
-            "relation_batch_size": 500,  # Track optimized batch size
-            "avg_embeddings_per_entity": 0.0,
-        }
+        # Initialize session cost and embedding metrics tracking
+        self.reset_session_metrics()
 
         # Pipeline support (lazy-initialized)
         self._pipeline: Any = None
 
+        # Persisted BM25 document frequencies per collection (lazy-loaded)
+        self._bm25_statistics: dict[str, Any] = {}
+
+        # Persisted entity-name / relation-edge index per collection (lazy-loaded)
+        self._relation_indexes: dict[str, Any] = {}
+
     def _get_pipeline(self) -> Any:
         """Get or create the IndexingPipeline for bulk operations.
 
@@ -258,6 +250,9 @@ class CoreIndexer:
                 vector_store=self.vector_store,
                 project_path=self.project_path,
                 logger=self.logger,
+                bm25_statistics_loader=self._get_bm25_statistics,
+                relation_index_loader=self._get_relation_index,
+                parallel_processor=self.parallel_processor,
             )
         return self._pipeline
 
@@ -414,7 +409,7 @@ class CoreIndexer:
             # Non-critical - don't break indexing, just log
             self.logger.debug(f"Signature table update failed: {e}")
 
-    def _parse_light_tier(self, file_path: Path, global_entity_names: set[str]) -> Any:
+    def _parse_light_tier(self, file_path: Path, global_entity_names: SymbolIndex | set[str]) -> Any:
         """
         Light parsing for generated files and type definitions.
         Extracts only metadata and type definitions without relations or deep analysis.
@@ -526,12 +521,7 @@ class CoreIndexer:
             return GitMetaContext.empty()
 
         # Global entity caching (extracted from duplication)
-        if not hasattr(self, "_cached_global_entities"):
-            self._cached_global_entities = self._get_all_entity_names(collection_name)
-            if self._cached_global_entities:
-                self.logger.debug(
-                    f"🌐 Cached {len(self._cached_global_entities)} global entities for cross-file relation filtering"
-                )
+        self._get_symbol_index(collection_name)
 
         # Content hash analysis (extracted from index_single_file) with safety checks
         unchanged_entities = 0
@@ -540,51 +530,48 @@ class CoreIndexer:
             and hasattr(self.vector_store, "collection_exists")
             and self.vector_store.collection_exists(collection_name)
         ):
+            # FIX: Use file content hash instead of entity metadata hash
+            # This prevents infinite loops when file content changes but entity metadata stays same
+            file_hashes: dict[str, str] = {}
+            entity_hashes = []
             for entity in entities:
-                try:
-                    # FIX: Use file content hash instead of entity metadata hash
-                    # This prevents infinite loops when file content changes but entity metadata stays same
-                    content_hash = (
-                        self._get_file_hash(entity.file_path)
-                        if entity.file_path
-                        else ""
-                    )
-
-                    # Robustness: Validate hash and vector store capability before checking
-                    if not content_hash:
-                        self.logger.debug(
-                            f"🔄 Git+Meta: Empty content hash for {entity.name}, treating as changed"
-                        )
-                        continue
-
-                    if not hasattr(self.vector_store, "check_content_exists"):
-                        self.logger.debug(
-                            "🔄 Git+Meta: Vector store doesn't support content checking, treating as changed"
-                        )
-                        continue
+                file_path = str(entity.file_path) if entity.file_path else ""
+                if file_path and file_path not in file_hashes:
+                    file_hashes[file_path] = self._get_file_hash(entity.file_path)
+                entity_hashes.append(file_hashes.get(file_path, ""))
 
-                    # Check if content exists with fallback handling
-                    exists = self.vector_store.check_content_exists(  # type: ignore[attr-defined]
-                        collection_name, content_hash
+            try:
+                # One batched lookup for every distinct hash
+                if hasattr(self.vector_store, "find_existing_content_hashes"):
+                    existing_hashes = self.vector_store.find_existing_content_hashes(  # type: ignore[attr-defined]
+                        collection_name, entity_hashes
                     )
-                    if exists:
-                        unchanged_entities += 1
-                        self.logger.debug(
-                            f"🔄 Git+Meta: Content unchanged for {entity.name}"
+                elif hasattr(self.vector_store, "check_content_exists"):
+                    existing_hashes = {
+                        h
+                        for h in set(entity_hashes)
+                        if h
+                        and self.vector_store.check_content_exists(  # type: ignore[attr-defined]
+                            collection_name, h
                         )
-                    else:
-                        self.logger.debug(
-                            f"🔄 Git+Meta: Content changed for {entity.name}"
-                        )
-
-                except Exception as e:
-                    self.logger.debug(
-                        f"🔄 Git+Meta: Content check failed for {entity.name}: {e}"
-                    )
-                    # Robustness: Fallback to processing as "changed" (safe default)
+                    }
+                else:
                     self.logger.debug(
-                        f"🔄 Git+Meta: Falling back to processing {entity.name} as changed"
+                        "🔄 Git+Meta: Vector store doesn't support content checking, treating as changed"
                     )
+                    existing_hashes = set()
+
+                unchanged_entities = sum(
+                    1 for h in entity_hashes if h and h in existing_hashes
+                )
+                self.logger.debug(
+                    f"🔄 Git+Meta: {unchanged_entities}/{len(entities)} entities have unchanged content"
+                )
+            except Exception as e:
+                # Robustness: Fallback to processing as "changed" (safe default)
+                self.logger.debug(
+                    f"🔄 Git+Meta: Content check failed, treating entities as changed: {e}"
+                )
 
         # Changed entity IDs computation (unified from both patterns)
         changed_entity_ids = (
@@ -667,6 +654,24 @@ class CoreIndexer:
 
         return new_state_file
 
+    def _get_bm25_statistics(self, collection_name: str) -> Any:
+        """Get the persisted BM25 statistics for a collection."""
+        if collection_name not in self._bm25_statistics:
+            from .embeddings.bm25 import BM25Statistics
+
+            stats_file = self._get_state_directory() / f"{collection_name}.bm25.json"
+            self._bm25_statistics[collection_name] = BM25Statistics.load(stats_file)
+        return self._bm25_statistics[collection_name]
+
+    def _get_relation_index(self, collection_name: str) -> Any:
+        """Get the persisted entity-name / relation index for a collection."""
+        if collection_name not in self._relation_indexes:
+            from .storage.relation_index import RelationIndex
+
+            index_file = self._get_state_directory() / f"{collection_name}.relations.json"
+            self._relation_indexes[collection_name] = RelationIndex.load(index_file)
+        return self._relation_indexes[collection_name]
+
     @property
     def state_file(self) -> Path:
         """Default state file for backward compatibility with tests."""
@@ -978,6 +983,11 @@ class CoreIndexer:
                     logger.info(f"   Mode: {'INCREMENTAL' if incremental else 'FULL'}")
                     logger.info(f"   Files processed: {len(successfully_processed)}")
                     logger.info("   Starting orphan cleanup...")
+                    # A full index has recorded every file in the relation index
+                    relation_index = self._get_relation_index(collection_name)
+                    if not incremental:
+                        relation_index.mark_complete()
+
                     # Orphan cleanup with null safety
                     orphaned_deleted = 0
                     if self.vector_store and hasattr(
@@ -985,9 +995,12 @@ class CoreIndexer:
                     ):
                         orphaned_deleted = (
                             self.vector_store._cleanup_orphaned_relations(
-                                collection_name, verbose
+                                collection_name,
+                                verbose,
+                                relation_index=relation_index,
                             )
                         )
+                        relation_index.save()
                     else:
                         logger.info(
                             "✅ No orphaned relations found (vector store not available)"
@@ -1045,11 +1058,13 @@ class CoreIndexer:
                 )
 
             # Parse file using cached global entities (will be set by Git+Meta setup if needed)
+            self.parser_registry.clear_caches()
             parse_result = self.parser_registry.parse_file(
                 file_path,
                 batch_callback,
-                global_entity_names=getattr(self, "_cached_global_entities", None),
+                global_entity_names=getattr(self, "_cached_symbol_index", None),
             )
+            self.parser_registry.flush_cache()
 
             if not parse_result.success:
                 result.success = False
@@ -1436,6 +1451,14 @@ class CoreIndexer:
             else:
                 self.logger.warning(f"⚠️ Some renames failed: {result.errors}")
 
+            bm25_statistics = self._get_bm25_statistics(collection_name)
+            relation_index = self._get_relation_index(collection_name)
+            for old_abs, new_abs in path_updates:
+                bm25_statistics.rename_file(old_abs, new_abs)
+                relation_index.rename_file(old_abs, new_abs)
+            bm25_statistics.save()
+            relation_index.save()
+
             # Update file hash cache for renamed files
             for old_rel, new_rel in renamed_files:
                 new_path = self.project_path / new_rel
@@ -1544,6 +1567,20 @@ class CoreIndexer:
             if state_file.exists():
                 state_file.unlink()
 
+            # BM25 statistics describe the cleared documents, reset them too
+            self._bm25_statistics.pop(collection_name, None)
+            bm25_stats_file = self._get_state_directory() / f"{collection_name}.bm25.json"
+            if bm25_stats_file.exists():
+                bm25_stats_file.unlink()
+
+            # Relation index describes the cleared points as well
+            self._relation_indexes.pop(collection_name, None)
+            relation_index_file = (
+                self._get_state_directory() / f"{collection_name}.relations.json"
+            )
+            if relation_index_file.exists():
+                relation_index_file.unlink()
+
             return bool(result.success)
 
         except Exception as e:
@@ -1693,14 +1730,24 @@ class CoreIndexer:
     def _find_changed_files(
         self, include_tests: bool = False, collection_name: str | None = None
     ) -> tuple[list[Path], list[str]]:
-        """Find files that have changed since last indexing."""
+        """Find files that have changed since last indexing.
+
+        In a git repository every file is compared by blob ID, which git
+        supplies without reading files that match the index, so branch
+        switches are resolved without hashing the tree. Elsewhere only files
+        modified since the last run are hashed.
+        """
         previous_state = self._load_state(collection_name or "default")
-        last_run_time = self._get_last_run_time(previous_state)
+        all_files = self._find_all_files(include_tests)
 
-        # OPTIMIZATION: Only scan modified files instead of ALL files
-        candidate_files = self._find_files_since(
-            last_run_time, include_tests, collection_name or "default"
-        )
+        if self._get_git_detector().is_git_repo():
+            candidate_files = all_files
+        else:
+            # OPTIMIZATION: Only scan modified files instead of ALL files
+            last_run_time = self._get_last_run_time(previous_state)
+            candidate_files = self._find_files_since(
+                last_run_time, include_tests, collection_name or "default"
+            )
         current_state = self._get_current_state(candidate_files)  # Hash only suspects
 
         changed_files: list[Path] = []
@@ -1709,17 +1756,12 @@ class CoreIndexer:
         # Find new and modified files
         for file_path in candidate_files:
             file_key = str(file_path.relative_to(self.project_path))
-            current_hash = current_state.get(file_key, {}).get("hash", "")
-            previous_hash = previous_state.get(file_key, {}).get("hash", "")
-
-            if current_hash != previous_hash:
+            if self._file_changed(file_path, file_key, current_state, previous_state):
                 changed_files.append(file_path)
 
-        # Find deleted files (still need full scan for deletions)
-        all_files = self._find_all_files(include_tests)
-        all_current_state = self._get_current_state(all_files)
-        current_keys = set(all_current_state.keys())
-        previous_keys = set(previous_state.keys())
+        # Find deleted files (a full listing, but nothing needs hashing)
+        current_keys = {str(f.relative_to(self.project_path)) for f in all_files}
+        previous_keys = {k for k in previous_state if not k.startswith("_")}
         deleted_keys = previous_keys - current_keys
         deleted_files.extend(deleted_keys)
 
@@ -1740,14 +1782,10 @@ class CoreIndexer:
         # Categorize changed files
         for file_path in current_files:
             file_key = str(file_path.relative_to(self.project_path))
-            current_hash = current_state.get(file_key, {}).get("hash", "")
-            previous_hash = previous_state.get(file_key, {}).get("hash", "")
-
-            if current_hash != previous_hash:
-                if previous_hash == "":  # Not in previous state = new file
-                    new_files.append(file_path)
-                else:  # In previous state but different hash = modified file
-                    modified_files.append(file_path)
+            if file_key not in previous_state:
+                new_files.append(file_path)
+            elif self._file_changed(file_path, file_key, current_state, previous_state):
+                modified_files.append(file_path)
 
         # Find deleted files
         current_keys = set(current_state.keys())
@@ -1875,45 +1913,10 @@ class CoreIndexer:
     # So only parallelize for 100+ files where we expect sequential time > 2s
     MIN_PARALLEL_BATCH = 100
 
-    def _dict_to_entity(self, data: dict) -> Entity:
-        """Convert dictionary from parallel worker back to Entity dataclass."""
-        from .analysis.entities import EntityType
-
-        return Entity(
-            name=data['name'],
-            entity_type=EntityType(data['entity_type']),
-            observations=data.get('observations', []),
-            file_path=Path(data['file_path']) if data.get('file_path') else None,
-            line_number=data.get('line_number'),
-            end_line_number=data.get('end_line_number'),
-            docstring=data.get('docstring'),
-            signature=data.get('signature'),
-            complexity_score=data.get('complexity_score'),
-            metadata=data.get('metadata', {}),
-        )
-
-    def _dict_to_relation(self, data: dict) -> Relation:
-        """Convert dictionary from parallel worker back to Relation dataclass."""
-        from .analysis.entities import RelationType
-
-        return Relation(
-            from_entity=data['from_entity'],
-            to_entity=data['to_entity'],
-            relation_type=RelationType(data['relation_type']),
-            context=data.get('context'),
-            confidence=data.get('confidence', 1.0),
-            metadata=data.get('metadata', {}),
-        )
-
-    def _dict_to_chunk(self, data: dict) -> EntityChunk:
-        """Convert dictionary from parallel worker back to EntityChunk dataclass."""
-        return EntityChunk(
-            id=data['id'],
-            entity_name=data['entity_name'],
-            chunk_type=data['chunk_type'],
-            content=data['content'],
-            metadata=data.get('metadata', {}),
-        )
+    def shutdown_workers(self) -> None:
+        """Stop the parallel parsing workers; they restart on the next parallel batch."""
+        if self.parallel_processor is not None:
+            self.parallel_processor.shutdown()
 
     def _process_files_parallel(
         self, files: list[Path], collection_name: str, _verbose: bool = False
@@ -1937,7 +1940,12 @@ class CoreIndexer:
 
         # Run parallel processing
         results = self.parallel_processor.process_files_parallel(
-            files, collection_name, processing_config
+            files,
+            collection_name,
+            processing_config,
+            symbol_index=self._get_symbol_index(collection_name),
+            project_root=self.project_path,
+            parse_times=self._load_parse_times(collection_name, files),
         )
 
         # Get tier stats for logging
@@ -1958,10 +1966,11 @@ class CoreIndexer:
             file_path_str = result.get('file_path', '')
 
             if result['status'] == 'success':
-                # Convert dicts back to dataclass objects
-                entities = [self._dict_to_entity(e) for e in result.get('entities', [])]
-                relations = [self._dict_to_relation(r) for r in result.get('relations', [])]
-                chunks = [self._dict_to_chunk(c) for c in result.get('chunks', [])]
+                # Decode the worker's encoded rows back to dataclass objects
+                parsed = result_from_worker(result)
+                entities = parsed.entities
+                relations = parsed.relations
+                chunks = parsed.implementation_chunks
 
                 all_entities.extend(entities)
                 all_relations.extend(relations)
@@ -1994,6 +2003,33 @@ class CoreIndexer:
 
         return all_entities, all_relations, all_chunks, errors, successful_files
 
+    def _load_parse_times(
+        self, collection_name: str, files: list[Path]
+    ) -> dict[Path, float]:
+        """Parse times (ms) recorded in the state file, for scheduling workers."""
+        state = self._load_state(collection_name)
+        parse_times = {}
+        for file_path in files:
+            try:
+                entry = state.get(str(file_path.relative_to(self.project_path)))
+            except ValueError:
+                continue
+            if isinstance(entry, dict) and "parse_ms" in entry:
+                parse_times[file_path] = entry["parse_ms"]
+        return parse_times
+
+    def _record_parse_times(self, state: dict[str, Any]) -> None:
+        """Store the parallel workers' measured parse times in state entries."""
+        if self.parallel_processor is None or not self.parallel_processor.parse_times:
+            return
+        parse_times = self.parallel_processor.parse_times
+        for relative_path, entry in state.items():
+            if relative_path.startswith("_") or not isinstance(entry, dict):
+                continue
+            parse_ms = parse_times.get(str(self.project_path / relative_path))
+            if parse_ms is not None:
+                entry["parse_ms"] = round(parse_ms, 1)
+
     def _filter_orphan_relations_in_memory(
         self, relations: list["Relation"], global_entity_names: set
     ) -> list["Relation"]:
@@ -2074,13 +2110,64 @@ class CoreIndexer:
         )
         return valid_relations
 
+    def reset_session_metrics(self) -> None:
+        """Reset the cost and embedding metrics reported for a run.
+
+        Indexers reused across runs (warm watcher sessions) call this before
+        each batch so the summary covers only that batch.
+        """
+        self._session_cost_data: dict[str, int | float] = {
+            "tokens": 0,
+            "cost": 0.0,
+            "requests": 0,
+        }
+        self._embedding_metrics: dict[str, int | float] = {
+            "metadata_embeddings": 0,
+            "implementation_embeddings": 0,
+            "relation_embeddings": 0,
+            "total_embeddings": 0,
+            "embeddings_reused": 0,
+            "relation_batch_size": 500,  # Track optimized batch size
+            "avg_embeddings_per_entity": 0.0,
+        }
+
+    def _extend_symbol_index(self, entities: list[Entity]) -> None:
+        """Add newly stored entity names to the cached symbol index.
+
+        The index is built once per indexer; long-lived indexers would
+        otherwise never resolve calls to entities added after it was built.
+        """
+        if getattr(self, "_cached_symbol_index", None) is None:
+            return
+        new_names = {
+            e.name for e in entities if e.name not in self._cached_symbol_index
+        }
+        if new_names:
+            self._cached_global_entities.update(new_names)
+            self._cached_symbol_index = SymbolIndex(self._cached_global_entities)
+
+    def _get_symbol_index(self, collection_name: str) -> SymbolIndex:
+        """Get the project-wide symbol index, building it once per run.
+
+        Every parse resolves CALLS relations against this shared, read-only
+        index instead of a per-file copy of the global entity names.
+        """
+        if getattr(self, "_cached_symbol_index", None) is None:
+            self._cached_global_entities = self._get_all_entity_names(collection_name)
+            self._cached_symbol_index = SymbolIndex(self._cached_global_entities)
+            if self._cached_global_entities:
+                self.logger.debug(
+                    f"🌐 Cached {len(self._cached_global_entities)} global entities for cross-file relation filtering"
+                )
+        return self._cached_symbol_index
+
     def _get_all_entity_names(self, collection_name: str) -> set:
         """Get all entity names from vector store for global entity awareness."""
         try:
             from qdrant_client.models import FieldCondition, Filter, MatchValue
 
-            # Use storage layer's _scroll_collection method which handles collection existence
-            points = self.vector_store._scroll_collection(
+            # Stream names only; the storage layer handles collection existence
+            points = self.vector_store._iter_scroll_collection(
                 collection_name=collection_name,
                 scroll_filter=Filter(
                     must_not=[
@@ -2088,8 +2175,7 @@ class CoreIndexer:
                     ]
                 ),
                 limit=1000,
-                with_vectors=False,
-                handle_pagination=True,
+                with_payload=["entity_name", "name"],
             )
 
             entity_names = set()
@@ -2147,22 +2233,27 @@ class CoreIndexer:
         errors: list[str] = []
         successfully_processed_files = []
 
+        # Determine file status using existing changed files logic
+        current_state = self._get_current_state(files)
+        previous_state = self._load_state(collection_name)
+
+        # Module lookups cached by the parsers may predate files added since
+        self.parser_registry.clear_caches()
+
         for file_path in files:
             try:
                 relative_path = file_path.relative_to(self.project_path)
 
-                # Determine file status using existing changed files logic
-                current_state = self._get_current_state([file_path])
-                previous_state = self._load_state(collection_name)
-
                 file_key = str(relative_path)
                 if file_key not in previous_state:
                     file_status = "ADDED"
                 else:
-                    current_hash = current_state.get(file_key, {}).get("hash", "")
-                    previous_hash = previous_state.get(file_key, {}).get("hash", "")
                     file_status = (
-                        "MODIFIED" if current_hash != previous_hash else "UNCHANGED"
+                        "MODIFIED"
+                        if self._file_changed(
+                            file_path, file_key, current_state, previous_state
+                        )
+                        else "UNCHANGED"
                     )
 
                 # Only log file processing for non-standard tiers
@@ -2188,9 +2279,9 @@ class CoreIndexer:
                     collection_name, []
                 )  # Empty entities just to trigger caching
 
-                # Use cached global entities with fallback to empty set
-                global_entity_names: set[str] = getattr(
-                    self, "_cached_global_entities", set()
+                # Use the cached global symbol index with fallback to an empty one
+                global_entity_names = getattr(
+                    self, "_cached_symbol_index", SymbolIndex()
                 )
 
                 # Parse file with tier-appropriate processing
@@ -2270,6 +2361,9 @@ class CoreIndexer:
                 errors.append(error_msg)
                 self.logger.debug(f"  Processing error: {e}")
 
+        # Commit the batch's parse cache writes in one transaction
+        self.parser_registry.flush_cache()
+
         return (
             all_entities,
             all_relations,
@@ -2327,8 +2421,14 @@ class CoreIndexer:
             # Create unified processor (NEW)
             from .processing import UnifiedContentProcessor
 
+            bm25_statistics = self._get_bm25_statistics(collection_name)
+            relation_index = self._get_relation_index(collection_name)
             processor = UnifiedContentProcessor(
-                self.vector_store, self.embedder, logger
+                self.vector_store,
+                self.embedder,
+                logger,
+                bm25_statistics,
+                relation_index,
             )
             
             result = processor.process_all_content(
@@ -2338,6 +2438,8 @@ class CoreIndexer:
                 implementation_chunks,
                 changed_entity_ids,
             )
+            bm25_statistics.save()
+            relation_index.save()
 
             if not result.success:
                 if logger:
@@ -2352,6 +2454,9 @@ class CoreIndexer:
             self._session_cost_data["cost"] += result.total_cost
             self._session_cost_data["requests"] += result.total_requests
 
+            # Later batches of a reused indexer can resolve calls to these
+            self._extend_symbol_index(entities)
+
             # RACE CONDITION DEBUG: Track storage completion
             if logger:
                 logger.info(
@@ -2390,19 +2495,27 @@ class CoreIndexer:
         return text
 
     def _get_current_state(self, files: list[Path]) -> dict[str, dict[str, Any]]:
-        """Get current state of files."""
+        """Get current state of files.
+
+        Files in a git repository are identified by blob ID ("oid"), read
+        from the index when they match it. Other files fall back to a SHA256
+        content hash ("hash").
+        """
         state = {}
+        blob_ids = self._get_git_detector().get_blob_ids(files)
 
         for file_path in files:
             try:
                 relative_path = str(file_path.relative_to(self.project_path))
-                file_hash = self._get_file_hash(file_path)
+                stat = file_path.stat()
 
-                state[relative_path] = {
-                    "hash": file_hash,
-                    "size": file_path.stat().st_size,
-                    "mtime": file_path.stat().st_mtime,
-                }
+                entry: dict[str, Any] = {"size": stat.st_size, "mtime": stat.st_mtime}
+                oid = blob_ids.get(file_path)
+                if oid is not None:
+                    entry["oid"] = oid
+                else:
+                    entry["hash"] = self._get_file_hash(file_path)
+                state[relative_path] = entry
             except (OSError, ValueError) as e:
                 self.logger.warning(f"Failed to get state for file {file_path}: {e}")
                 continue
@@ -2414,6 +2527,35 @@ class CoreIndexer:
 
         return state
 
+    def _get_git_detector(self) -> GitChangeDetector:
+        """Get the change detector used for blob IDs, created on first use."""
+        detector = getattr(self, "_git_detector", None)
+        if detector is None:
+            detector = self._git_detector = GitChangeDetector(self.project_path)
+        return detector
+
+    def _file_changed(
+        self,
+        file_path: Path,
+        file_key: str,
+        current_state: dict[str, dict[str, Any]],
+        previous_state: dict[str, dict[str, Any]],
+    ) -> bool:
+        """Check whether a file's content differs from its previous state.
+
+        Blob IDs are compared when both states have one. Entries written
+        before blob IDs were recorded are compared by content hash, so
+        upgrading does not re-index unchanged files.
+        """
+        previous = previous_state.get(file_key)
+        if not previous:
+            return True
+        current = current_state.get(file_key, {})
+        if "oid" in current and "oid" in previous:
+            return current["oid"] != previous["oid"]
+        current_hash = current.get("hash") or self._get_file_hash(file_path)
+        return current_hash != previous.get("hash", "")
+
     def _get_file_hash(self, file_path: Path) -> str:
         """Get SHA256 hash of file contents."""
         try:
@@ -2586,6 +2728,9 @@ class CoreIndexer:
                     else:  # rebuilt
                         file_count_desc = f"{len(new_files)} files tracked, {files_removed} deleted files removed"
 
+            # Keep measured parse times so the next run schedules costly files first
+            self._record_parse_times(final_state)
+
             # Save state atomically using consolidated utility
             state_file = self._get_state_file(collection_name)
             self._atomic_json_write(state_file, final_state, "state file")
@@ -2709,6 +2854,8 @@ class CoreIndexer:
             return
 
         total_entities_deleted = 0
+        bm25_statistics = self._get_bm25_statistics(collection_name)
+        relation_index = self._get_relation_index(collection_name)
 
         try:
             for deleted_file in deleted_files:
@@ -2719,6 +2866,11 @@ class CoreIndexer:
                 # Don't use .resolve() as it adds /private on macOS, but entities are stored without it
                 full_path = str(self.project_path / deleted_file)
 
+                # Subtract the file's documents from BM25 statistics
+                bm25_statistics.remove_file(full_path)
+                # Its entity names vanish; relations referencing them become stale
+                relation_index.remove_file(full_path)
+
                 if verbose:
                     logger.debug(f"   📁 Resolved to: {full_path}")
 
@@ -2785,7 +2937,9 @@ class CoreIndexer:
                     )
 
             # NEW: Clean up orphaned relations after entity deletion
-            if total_entities_deleted > 0:
+            if total_entities_deleted > 0 or (
+                relation_index.complete and relation_index.has_pending
+            ):
                 if verbose:
                     logger.info(
                         f"🔍 Starting orphan cleanup after deleting {total_entities_deleted} entities from {len(deleted_files)} files:"
@@ -2799,7 +2953,7 @@ class CoreIndexer:
                     self.vector_store, "_cleanup_orphaned_relations"
                 ):
                     orphaned_deleted = self.vector_store._cleanup_orphaned_relations(
-                        collection_name, verbose
+                        collection_name, verbose, relation_index=relation_index
                     )
                 else:
                     logger.info(
@@ -2816,6 +2970,9 @@ class CoreIndexer:
 
         except Exception as e:
             logger.error(f"Error handling deleted files: {e}")
+        finally:
+            bm25_statistics.save()
+            relation_index.save()
 
     def _is_test_file(self, _file_path: Path) -> bool:
         """Check if a file is a test file - DISABLED."""
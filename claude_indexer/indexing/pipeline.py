@@ -6,7 +6,11 @@ with progress tracking and resume capability.
 """
 
 import gc
+import queue
+import threading
 import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from logging import Logger
 from pathlib import Path
 from typing import Any
@@ -17,7 +21,8 @@ from ..categorization import FileCategorizationSystem, ProcessingTier
 from ..config import IndexerConfig
 from ..embeddings.base import Embedder
 from ..indexer_logging import get_logger
-from ..parallel_processor import ParallelFileProcessor
+from ..parallel_processor import ParallelFileProcessor, result_from_worker
+from ..processing.results import PreparedContent
 from ..processing.unified_processor import UnifiedContentProcessor
 from ..storage.base import VectorStore
 from ..storage.file_cache import FileHashCache
@@ -37,6 +42,24 @@ from .types import (
 MIN_PARALLEL_BATCH = 100
 
 
+@dataclass
+class _StagedBatch:
+    """A batch travelling through the parse -> embed -> store stages."""
+
+    batch: list[Path]
+    result: BatchResult
+    start_time: float
+    entities: list[Entity] = field(default_factory=list)
+    relations: list[Relation] = field(default_factory=list)
+    implementation_chunks: list[EntityChunk] = field(default_factory=list)
+    prepared: PreparedContent | None = None
+
+    @property
+    def has_content(self) -> bool:
+        """Whether parsing produced anything to embed and store."""
+        return bool(self.entities or self.relations or self.implementation_chunks)
+
+
 class IndexingPipeline:
     """High-performance bulk indexing orchestrator.
 
@@ -45,6 +68,7 @@ class IndexingPipeline:
 
     Features:
         - Parallel file processing (ProcessPoolExecutor)
+        - Overlapped parse, embed and store stages with bounded queues
         - Intelligent batch sizing with memory awareness
         - Progress tracking with ETA
         - Resume capability for interrupted indexing
@@ -70,6 +94,9 @@ class IndexingPipeline:
         vector_store: VectorStore,
         project_path: Path,
         logger: Logger | None = None,
+        bm25_statistics_loader: Callable[[str], Any] | None = None,
+        relation_index_loader: Callable[[str], Any] | None = None,
+        parallel_processor: ParallelFileProcessor | None = None,
     ):
         """Initialize indexing pipeline.
 
@@ -80,6 +107,12 @@ class IndexingPipeline:
             vector_store: Vector storage backend (Qdrant)
             project_path: Root path of the project to index
             logger: Optional logger instance
+            bm25_statistics_loader: Optional callable returning the persisted
+                BM25 statistics for a collection name
+            relation_index_loader: Optional callable returning the persisted
+                relation index for a collection name
+            parallel_processor: Optional processor whose warm worker pool is
+                shared with the caller instead of starting a new one
         """
         self.config = config
         self.indexer_config = indexer_config
@@ -87,6 +120,8 @@ class IndexingPipeline:
         self.vector_store = vector_store
         self.project_path = project_path.resolve()
         self.logger = logger or get_logger()
+        self.bm25_statistics_loader = bm25_statistics_loader
+        self.relation_index_loader = relation_index_loader
 
         # Initialize sub-components
         self.progress = PipelineProgress(logger=self.logger)
@@ -102,8 +137,11 @@ class IndexingPipeline:
             logger=self.logger,
         )
 
+        # Serializes progress updates made from the stage threads
+        self._progress_lock = threading.Lock()
+
         # Lazy-initialized components
-        self._parallel_processor: ParallelFileProcessor | None = None
+        self._parallel_processor: ParallelFileProcessor | None = parallel_processor
         self._content_processor: UnifiedContentProcessor | None = None
         self._file_cache: FileHashCache | None = None
         self._parser_registry: ParserRegistry | None = None
@@ -125,11 +163,29 @@ class IndexingPipeline:
             )
         return self._parallel_processor
 
-    def _get_content_processor(self) -> UnifiedContentProcessor:
-        """Get or create content processor."""
-        if self._content_processor is None:
+    def _get_content_processor(self, collection_name: str) -> UnifiedContentProcessor:
+        """Get or create content processor bound to the collection's persisted state."""
+        bm25_statistics = (
+            self.bm25_statistics_loader(collection_name)
+            if self.bm25_statistics_loader is not None
+            else None
+        )
+        relation_index = (
+            self.relation_index_loader(collection_name)
+            if self.relation_index_loader is not None
+            else None
+        )
+        if (
+            self._content_processor is None
+            or self._content_processor.bm25_statistics is not bm25_statistics
+            or self._content_processor.relation_index is not relation_index
+        ):
             self._content_processor = UnifiedContentProcessor(
-                self.vector_store, self.embedder, self.logger
+                self.vector_store,
+                self.embedder,
+                self.logger,
+                bm25_statistics,
+                relation_index,
             )
         return self._content_processor
 
@@ -256,53 +312,13 @@ class IndexingPipeline:
             )
 
             # Phase 4: Process batches
-            all_entities: list[Entity] = []
-            all_relations: list[Relation] = []
-            all_chunks: list[EntityChunk] = []
-            total_files_processed = 0
-            total_files_failed = 0
+            batch_results = self._run_batches(batches, collection_name)
 
-            for batch_index, batch in enumerate(batches):
-                batch_result = self._process_batch(
-                    batch=batch,
-                    collection_name=collection_name,
-                    batch_index=batch_index,
-                )
-
-                # Update totals
-                total_files_processed += batch_result.files_processed
-                total_files_failed += batch_result.files_failed
-                all_entities.extend([])  # Entities stored in batch
+            total_files_processed = sum(r.files_processed for r in batch_results)
+            total_files_failed = sum(r.files_failed for r in batch_results)
+            for batch_result in batch_results:
                 errors.extend(batch_result.errors)
 
-                # Update checkpoint
-                processed_paths = [Path(p) for p in batch_result.processed_files]
-                failed_paths = [Path(p) for p in batch_result.failed_files]
-                self.checkpoint.update_batch(
-                    processed_files=processed_paths,
-                    failed_files=failed_paths,
-                    batch_index=batch_index,
-                    entities=batch_result.entities_created,
-                    relations=batch_result.relations_created,
-                    chunks=batch_result.implementation_chunks,
-                )
-
-                # Save checkpoint periodically
-                if (batch_index + 1) % max(1, self.config.checkpoint_interval // self.batch_optimizer.current_size) == 0:
-                    self.checkpoint.save()
-
-                # Record batch metrics for optimizer
-                metrics = BatchMetrics(
-                    batch_size=len(batch),
-                    processing_time_ms=batch_result.total_time_ms,
-                    memory_delta_mb=0.0,  # Calculated in batch_optimizer
-                    error_count=batch_result.files_failed,
-                )
-                self.batch_optimizer.record_batch(metrics)
-
-                # Garbage collection between batches
-                gc.collect()
-
             # Update file cache with processed files
             if incremental:
                 file_cache = self._get_file_cache(collection_name)
@@ -492,6 +508,132 @@ class IndexingPipeline:
 
         return batches
 
+    def _run_batches(
+        self, batches: list[list[Path]], collection_name: str
+    ) -> list[BatchResult]:
+        """Process all batches, overlapping stages when configured.
+
+        Args:
+            batches: File batches in processing order
+            collection_name: Target collection
+
+        Returns:
+            BatchResult for every processed batch, in batch order
+        """
+        if self.config.pipeline_depth <= 0 or len(batches) < 2:
+            results = []
+            for batch_index, batch in enumerate(batches):
+                batch_result = self._process_batch(
+                    batch=batch,
+                    collection_name=collection_name,
+                    batch_index=batch_index,
+                )
+                self._record_batch(batch, batch_result)
+                results.append(batch_result)
+            return results
+
+        return self._run_staged(batches, collection_name)
+
+    def _run_staged(
+        self, batches: list[list[Path]], collection_name: str
+    ) -> list[BatchResult]:
+        """Run parse -> embed -> store as concurrent stages.
+
+        Parsing happens on the calling thread while one thread embeds and
+        another stores, so batch N+1 is parsed while batch N is embedded and
+        batch N-1 is upserted. Bounded queues of ``pipeline_depth`` batches
+        sit between the stages. When the BatchOptimizer reports memory
+        pressure, parsing waits until the downstream stages have drained.
+
+        Args:
+            batches: File batches in processing order
+            collection_name: Target collection
+
+        Returns:
+            BatchResult for every processed batch, in batch order
+
+        Raises:
+            Exception: The first error raised by the embed or store stage
+        """
+        content_processor = self._get_content_processor(collection_name)
+        embed_queue: queue.Queue[_StagedBatch | None] = queue.Queue(
+            maxsize=self.config.pipeline_depth
+        )
+        store_queue: queue.Queue[_StagedBatch | None] = queue.Queue(
+            maxsize=self.config.pipeline_depth
+        )
+        results: list[BatchResult] = []
+        stage_errors: list[Exception] = []
+        failed = threading.Event()
+
+        def embed_stage() -> None:
+            while True:
+                staged = embed_queue.get()
+                try:
+                    if staged is None:
+                        store_queue.put(None)
+                        return
+                    # After a failure, keep draining so the parser never blocks
+                    if not failed.is_set():
+                        self._embed_batch(staged, collection_name, content_processor)
+                        store_queue.put(staged)
+                except Exception as e:
+                    stage_errors.append(e)
+                    failed.set()
+                finally:
+                    embed_queue.task_done()
+
+        def store_stage() -> None:
+            while True:
+                staged = store_queue.get()
+                try:
+                    if staged is None:
+                        return
+                    if not failed.is_set():
+                        batch_result = self._store_batch(staged, content_processor)
+                        self._record_batch(staged.batch, batch_result)
+                        results.append(batch_result)
+                except Exception as e:
+                    stage_errors.append(e)
+                    failed.set()
+                finally:
+                    store_queue.task_done()
+
+        workers = [
+            threading.Thread(target=embed_stage, name="pipeline-embed", daemon=True),
+            threading.Thread(target=store_stage, name="pipeline-store", daemon=True),
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            for batch_index, batch in enumerate(batches):
+                if failed.is_set():
+                    break
+
+                # Backpressure: let in-flight batches drain under memory pressure
+                current_mb, under_pressure = self.batch_optimizer.check_memory()
+                if under_pressure and batch_index > 0:
+                    self.logger.debug(
+                        f"Memory pressure ({current_mb:.0f}MB), draining pipeline "
+                        f"before batch {batch_index + 1}"
+                    )
+                    embed_queue.join()
+                    store_queue.join()
+                    gc.collect()
+
+                staged = self._parse_batch(batch, collection_name, batch_index)
+                embed_queue.put(staged)
+        finally:
+            embed_queue.put(None)
+            for worker in workers:
+                worker.join()
+
+        if stage_errors:
+            raise stage_errors[0]
+
+        return results
+
     def _process_batch(
         self,
         batch: list[Path],
@@ -508,8 +650,35 @@ class IndexingPipeline:
         Returns:
             BatchResult with metrics
         """
-        start_time = time.time()
-        result = BatchResult(batch_index=batch_index)
+        staged = self._parse_batch(batch, collection_name, batch_index)
+        content_processor = (
+            self._get_content_processor(collection_name) if staged.has_content else None
+        )
+        self._embed_batch(staged, collection_name, content_processor)
+        return self._store_batch(staged, content_processor)
+
+    def _parse_batch(
+        self,
+        batch: list[Path],
+        collection_name: str,
+        batch_index: int,
+    ) -> _StagedBatch:
+        """Parse a batch of files into entities, relations and chunks.
+
+        Args:
+            batch: Files in this batch
+            collection_name: Target collection
+            batch_index: Index of this batch
+
+        Returns:
+            Staged batch ready for embedding
+        """
+        staged = _StagedBatch(
+            batch=batch,
+            result=BatchResult(batch_index=batch_index),
+            start_time=time.time(),
+        )
+        result = staged.result
 
         # Get tier stats for progress
         categorizer = self._get_categorizer()
@@ -523,35 +692,49 @@ class IndexingPipeline:
             else:
                 tier_stats["standard"] += 1
 
-        self.progress.update_batch(
-            batch_index=batch_index,
-            files_in_batch=len(batch),
-            tier_stats=tier_stats,
-        )
+        with self._progress_lock:
+            self.progress.update_batch(
+                batch_index=batch_index,
+                files_in_batch=len(batch),
+                tier_stats=tier_stats,
+            )
 
         # Parse files
         parse_start = time.time()
-        entities: list[Entity] = []
-        relations: list[Relation] = []
-        implementation_chunks: list[EntityChunk] = []
-        processed_files: list[str] = []
-        failed_files: list[str] = []
+        entities = staged.entities
+        relations = staged.relations
+        implementation_chunks = staged.implementation_chunks
+        processed_files = result.processed_files
+        failed_files = result.failed_files
 
         # Use parallel processing for large batches
         parallel_processor = self._get_parallel_processor()
         if parallel_processor and len(batch) >= MIN_PARALLEL_BATCH:
             try:
+                file_cache = self._get_file_cache(collection_name)
                 parse_result = parallel_processor.process_files_parallel(
-                    batch, collection_name, self.indexer_config
+                    batch,
+                    collection_name,
+                    {"max_file_size": self.indexer_config.max_file_size},
+                    project_root=self.project_path,
+                    parse_times=file_cache.get_parse_times(batch),
+                )
+                file_cache.record_parse_times(
+                    {
+                        Path(r["file_path"]): r["parse_ms"]
+                        for r in parse_result
+                        if r["status"] == "success" and "parse_ms" in r
+                    }
                 )
                 for file_result in parse_result:
-                    if file_result.get("success", False):
-                        entities.extend(self._dict_to_entities(file_result.get("entities", [])))
-                        relations.extend(self._dict_to_relations(file_result.get("relations", [])))
-                        implementation_chunks.extend(
-                            self._dict_to_chunks(file_result.get("implementation_chunks", []))
-                        )
-                        processed_files.append(file_result.get("file_path", ""))
+                    if file_result["status"] == "success":
+                        parsed = result_from_worker(file_result)
+                        entities.extend(parsed.entities)
+                        relations.extend(parsed.relations)
+                        implementation_chunks.extend(parsed.implementation_chunks)
+                        processed_files.append(file_result["file_path"])
+                    elif file_result["status"] in ("skipped", "no_parser"):
+                        continue
                     else:
                         failed_files.append(file_result.get("file_path", ""))
                         result.errors.append(
@@ -575,153 +758,149 @@ class IndexingPipeline:
                     relations.extend(file_relations)
                     implementation_chunks.extend(file_chunks)
                     processed_files.append(str(file_path))
-                    self.progress.update_file(file_path, status="complete")
+                    with self._progress_lock:
+                        self.progress.update_file(file_path, status="complete")
                 except Exception as e:
                     failed_files.append(str(file_path))
                     result.errors.append(f"Failed to parse {file_path}: {e}")
                     self.logger.warning(f"Parse error for {file_path}: {e}")
+            parser_registry.flush_cache()
 
         result.parse_time_ms = (time.time() - parse_start) * 1000
+        return staged
 
-        # Store vectors
-        store_start = time.time()
-        if entities or relations or implementation_chunks:
-            content_processor = self._get_content_processor()
+    def _embed_batch(
+        self,
+        staged: _StagedBatch,
+        collection_name: str,
+        content_processor: UnifiedContentProcessor | None,
+    ) -> None:
+        """Embed a parsed batch into points, without storing them.
 
-            # Build changed entity IDs set
-            changed_entity_ids = {
-                f"{e.file_path}::{e.name}" for e in entities if e.file_path
-            }
+        Args:
+            staged: Parsed batch; its ``prepared`` field is filled in
+            collection_name: Target collection
+            content_processor: Processor bound to the target collection
+        """
+        if not staged.has_content or content_processor is None:
+            return
 
-            processing_result = content_processor.process_all_content(
-                collection_name=collection_name,
-                entities=entities,
-                relations=relations,
-                implementation_chunks=implementation_chunks,
-                changed_entity_ids=changed_entity_ids,
+        embed_start = time.time()
+
+        # Build changed entity IDs set
+        changed_entity_ids = {
+            f"{e.file_path}::{e.name}" for e in staged.entities if e.file_path
+        }
+
+        staged.prepared = content_processor.prepare_content(
+            collection_name=collection_name,
+            entities=staged.entities,
+            relations=staged.relations,
+            implementation_chunks=staged.implementation_chunks,
+            changed_entity_ids=changed_entity_ids,
+        )
+        if content_processor.bm25_statistics is not None:
+            content_processor.bm25_statistics.save()
+
+        staged.result.embed_time_ms = (time.time() - embed_start) * 1000
+
+    def _store_batch(
+        self,
+        staged: _StagedBatch,
+        content_processor: UnifiedContentProcessor | None,
+    ) -> BatchResult:
+        """Store an embedded batch and finalize its result.
+
+        Args:
+            staged: Embedded batch
+            content_processor: Processor bound to the target collection
+
+        Returns:
+            BatchResult with metrics
+        """
+        result = staged.result
+        entities = staged.entities
+        relations = staged.relations
+        implementation_chunks = staged.implementation_chunks
+
+        # Store vectors
+        store_start = time.time()
+        if staged.prepared is not None and content_processor is not None:
+            processing_result = content_processor.store_prepared_content(
+                staged.prepared
             )
+            if content_processor.relation_index is not None:
+                content_processor.relation_index.save()
 
             if not processing_result.success:
                 result.errors.append(
-                    f"Storage failed: {processing_result.error_message}"
+                    f"Storage failed: {processing_result.error}"
                 )
 
         result.store_time_ms = (time.time() - store_start) * 1000
 
         # Update result metrics
-        result.files_processed = len(processed_files)
-        result.files_failed = len(failed_files)
+        result.files_processed = len(result.processed_files)
+        result.files_failed = len(result.failed_files)
         result.entities_created = len(entities)
         result.relations_created = len(relations)
         result.implementation_chunks = len(implementation_chunks)
-        result.processed_files = processed_files
-        result.failed_files = failed_files
 
         # Update progress
-        self.progress.complete_batch(
-            batch_index=batch_index,
-            entities=len(entities),
-            relations=len(relations),
-            chunks=len(implementation_chunks),
-            parse_time_ms=result.parse_time_ms,
-            embed_time_ms=result.embed_time_ms,
-            store_time_ms=result.store_time_ms,
-            files_processed=len(processed_files),
-        )
+        with self._progress_lock:
+            self.progress.complete_batch(
+                batch_index=result.batch_index,
+                entities=len(entities),
+                relations=len(relations),
+                chunks=len(implementation_chunks),
+                parse_time_ms=result.parse_time_ms,
+                embed_time_ms=result.embed_time_ms,
+                store_time_ms=result.store_time_ms,
+                files_processed=result.files_processed,
+            )
 
-        total_time = (time.time() - start_time) * 1000
+        total_time = (time.time() - staged.start_time) * 1000
         self.logger.debug(
-            f"Batch {batch_index + 1}: {len(processed_files)} files, "
+            f"Batch {result.batch_index + 1}: {result.files_processed} files, "
             f"{len(entities)} entities, {len(relations)} relations, "
             f"{total_time:.0f}ms"
         )
 
         return result
 
-    def _dict_to_entities(self, dicts: list[dict]) -> list[Entity]:
-        """Convert dictionary representations to Entity objects.
+    def _record_batch(self, batch: list[Path], batch_result: BatchResult) -> None:
+        """Checkpoint a finished batch and feed its metrics to the optimizer.
 
         Args:
-            dicts: List of entity dictionaries from parallel processing
-
-        Returns:
-            List of Entity objects
+            batch: Files in the batch
+            batch_result: Result of the finished batch
         """
-        from ..analysis.entities import Entity, EntityType
-
-        entities = []
-        for d in dicts:
-            try:
-                entity_type = EntityType(d.get("entity_type", "function"))
-                entity = Entity(
-                    name=d.get("name", ""),
-                    entity_type=entity_type,
-                    file_path=d.get("file_path"),
-                    start_line=d.get("start_line", 0),
-                    end_line=d.get("end_line", 0),
-                    docstring=d.get("docstring"),
-                    signature=d.get("signature"),
-                    code=d.get("code"),
-                    parent_name=d.get("parent_name"),
-                    metadata=d.get("metadata", {}),
-                )
-                entities.append(entity)
-            except Exception:
-                continue
-        return entities
-
-    def _dict_to_relations(self, dicts: list[dict]) -> list[Relation]:
-        """Convert dictionary representations to Relation objects.
-
-        Args:
-            dicts: List of relation dictionaries from parallel processing
-
-        Returns:
-            List of Relation objects
-        """
-        from ..analysis.entities import Relation, RelationType
-
-        relations = []
-        for d in dicts:
-            try:
-                relation_type = RelationType(d.get("relation_type", "calls"))
-                relation = Relation(
-                    source=d.get("source", ""),
-                    target=d.get("target", ""),
-                    relation_type=relation_type,
-                    file_path=d.get("file_path"),
-                    line_number=d.get("line_number"),
-                    metadata=d.get("metadata", {}),
-                )
-                relations.append(relation)
-            except Exception:
-                continue
-        return relations
-
-    def _dict_to_chunks(self, dicts: list[dict]) -> list[EntityChunk]:
-        """Convert dictionary representations to EntityChunk objects.
+        batch_index = batch_result.batch_index
+
+        # Update checkpoint
+        processed_paths = [Path(p) for p in batch_result.processed_files]
+        failed_paths = [Path(p) for p in batch_result.failed_files]
+        self.checkpoint.update_batch(
+            processed_files=processed_paths,
+            failed_files=failed_paths,
+            batch_index=batch_index,
+            entities=batch_result.entities_created,
+            relations=batch_result.relations_created,
+            chunks=batch_result.implementation_chunks,
+        )
 
-        Args:
-            dicts: List of chunk dictionaries from parallel processing
+        # Save checkpoint periodically
+        if (batch_index + 1) % max(1, self.config.checkpoint_interval // self.batch_optimizer.current_size) == 0:
+            self.checkpoint.save()
 
-        Returns:
-            List of EntityChunk objects
-        """
-        from ..analysis.entities import EntityChunk
+        # Record batch metrics for optimizer
+        metrics = BatchMetrics(
+            batch_size=len(batch),
+            processing_time_ms=batch_result.total_time_ms,
+            memory_delta_mb=0.0,  # Calculated in batch_optimizer
+            error_count=batch_result.files_failed,
+        )
+        self.batch_optimizer.record_batch(metrics)
 
-        chunks = []
-        for d in dicts:
-            try:
-                chunk = EntityChunk(
-                    entity_name=d.get("entity_name", ""),
-                    chunk_type=d.get("chunk_type", "implementation"),
-                    content=d.get("content", ""),
-                    file_path=d.get("file_path"),
-                    start_line=d.get("start_line", 0),
-                    end_line=d.get("end_line", 0),
-                    metadata=d.get("metadata", {}),
-                )
-                chunks.append(chunk)
-            except Exception:
-                continue
-        return chunks
+        # Garbage collection between batches
+        gc.collect()
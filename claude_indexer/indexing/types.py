@@ -36,6 +36,8 @@ class PipelineConfig:
         checkpoint_interval: Files between checkpoint saves
         enable_resume: Whether to create checkpoints for resume capability
         max_parallel_workers: Maximum worker processes (0 = auto)
+        pipeline_depth: Batches queued between the parse, embed and store
+            stages (0 = run the stages sequentially)
     """
 
     initial_batch_size: int = 25
@@ -46,6 +48,7 @@ class PipelineConfig:
     checkpoint_interval: int = 50
     enable_resume: bool = True
     max_parallel_workers: int = 0
+    pipeline_depth: int = 2
 
 
 @dataclass
@@ -29,6 +29,7 @@ class HooksInstaller:
         "ui-pre-tool-guard.sh",
         "session_start.py",
         "prompt_handler.py",
+        "indexer_client.py",
     ]
 
     def __init__(self, project_path: Path, collection_name: str):
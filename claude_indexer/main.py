@@ -1,6 +1,8 @@
 """Main entry point for the Claude Code indexer."""
 
 import sys
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +20,7 @@ def _create_indexer_components(
     verbose: bool = False,
     config_file: str | None = None,
     enable_debug_logging: bool = False,
+    shared_clients: bool = False,
 ) -> tuple[Any, Any, Any, Any, Any, Any] | tuple[None, None, None, None, None, None]:
     """Create common indexer components (project, logger, config, embedder, vector_store, indexer).
 
@@ -28,6 +31,8 @@ def _create_indexer_components(
         verbose: Enable verbose output
         config_file: Optional configuration file path
         enable_debug_logging: Enable additional debug logging for config
+        shared_clients: Reuse embedders and vector stores created with the
+            same settings by earlier calls in this process
 
     Returns:
         tuple: (project, logger, config, embedder, vector_store, indexer) or (None, None, None, None, None, None) on error
@@ -74,24 +79,31 @@ def _create_indexer_components(
         # Create cache directory for persistent embedding cache
         cache_dir = project / ".index_cache"
 
-        embedder = create_embedder_from_config(
-            {
-                "provider": provider,
-                "api_key": api_key,
-                "model": model,
-                "enable_caching": True,
-                "cache_dir": cache_dir,
-            }
-        )
-
-        vector_store = create_store_from_config(
-            {
-                "backend": "qdrant",
-                "url": config.qdrant_url,
-                "api_key": config.qdrant_api_key,
-                "enable_caching": True,
-            }
-        )
+        embedder_config = {
+            "provider": provider,
+            "api_key": api_key,
+            "model": model,
+            "enable_caching": True,
+            "cache_dir": cache_dir,
+        }
+        store_config = {
+            "backend": "qdrant",
+            "url": config.qdrant_url,
+            "api_key": config.qdrant_api_key,
+            "enable_caching": True,
+        }
+        if shared_clients:
+            embedder = _get_shared_client(
+                ("embedder", provider, model, api_key, str(cache_dir)),
+                lambda: create_embedder_from_config(embedder_config),
+            )
+            vector_store = _get_shared_client(
+                ("store", config.qdrant_url, config.qdrant_api_key),
+                lambda: create_store_from_config(store_config),
+            )
+        else:
+            embedder = create_embedder_from_config(embedder_config)
+            vector_store = create_store_from_config(store_config)
 
         # Optional debug logging for provider info
         if enable_debug_logging and not quiet and verbose:
@@ -109,6 +121,124 @@ def _create_indexer_components(
         return None, None, None, None, None, None
 
 
+# Embedders and vector stores shared by every session with the same settings,
+# so watched projects reuse one HTTP client and Qdrant connection pool
+_shared_clients: dict[tuple[Any, ...], Any] = {}
+
+# Warm indexer components per (project, collection, config file)
+_sessions: dict[tuple[str, str, str | None], "IndexingSession"] = {}
+_sessions_lock = threading.Lock()
+
+
+def _get_shared_client(key: tuple[Any, ...], factory: Any) -> Any:
+    """Return the client cached under ``key``, creating it on first use."""
+    with _sessions_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = _shared_clients[key] = factory()
+        return client
+
+
+@dataclass
+class IndexingSession:
+    """Indexer components kept warm across batches for one collection.
+
+    Long-running callers (the file watcher, the multi-project service and
+    the hook daemon) index many small batches. Reusing a session means each
+    batch pays only for parse, embed and upsert, instead of reloading config
+    and rebuilding the embedder, vector store, parser registry and caches.
+    Batches for one session are serialized by its lock.
+    """
+
+    project: Path
+    logger: Any
+    config: Any
+    embedder: Any
+    vector_store: Any
+    indexer: CoreIndexer
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def components(self) -> tuple[Any, Any, Any, Any, Any, Any]:
+        """Components in the order returned by _create_indexer_components."""
+        return (
+            self.project,
+            self.logger,
+            self.config,
+            self.embedder,
+            self.vector_store,
+            self.indexer,
+        )
+
+    def acquire(self) -> "IndexingSession":
+        """Take the session for one batch and reset its per-run metrics."""
+        self.lock.acquire()
+        self.indexer.reset_session_metrics()
+        return self
+
+    def release(self) -> None:
+        """Finish a batch, committing buffered parse cache writes."""
+        try:
+            self.indexer.parser_registry.flush_cache()
+        finally:
+            self.lock.release()
+
+
+def acquire_indexing_session(
+    project_path: str,
+    collection_name: str,
+    quiet: bool = False,
+    verbose: bool = False,
+    config_file: str | None = None,
+) -> IndexingSession | None:
+    """Get the warm session for a collection, locked for one batch.
+
+    The session is created on first use. Callers must call ``release()``
+    when the batch is done.
+
+    Args:
+        project_path: Path to the project root
+        collection_name: Name of the vector collection
+        quiet: Suppress non-error output when creating the session
+        verbose: Enable verbose output when creating the session
+        config_file: Optional configuration file path
+
+    Returns:
+        The acquired session, or None if its components could not be created
+    """
+    key = (str(Path(project_path).resolve()), collection_name, config_file)
+    with _sessions_lock:
+        session = _sessions.get(key)
+    if session is None:
+        components = _create_indexer_components(
+            project_path,
+            collection_name,
+            quiet,
+            verbose,
+            config_file,
+            enable_debug_logging=verbose,
+            shared_clients=True,
+        )
+        if components[-1] is None:
+            return None
+        with _sessions_lock:
+            # Another thread may have created it meanwhile; keep the first
+            session = _sessions.setdefault(key, IndexingSession(*components))
+    return session.acquire()
+
+
+def close_indexing_sessions() -> None:
+    """Drop all warm sessions and shared clients, flushing their caches."""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+        _shared_clients.clear()
+    for session in sessions:
+        with session.lock:
+            session.indexer.parser_registry.flush_cache()
+            session.indexer.shutdown_workers()
+
+
 def run_indexing_with_shared_deletion(
     project_path: str,
     collection_name: str,
@@ -116,15 +246,31 @@ def run_indexing_with_shared_deletion(
     quiet: bool = False,
     verbose: bool = False,
     config_file: str | None = None,
+    reuse_session: bool = False,
 ) -> bool:
-    """Run deletion handling with shared deletion logic for a single file."""
+    """Run deletion handling with shared deletion logic for a single file.
+
+    With ``reuse_session`` the collection's warm IndexingSession is used
+    instead of creating new indexer components.
+    """
+    session = None
     try:
-        # Create common indexer components
-        project, logger, config, embedder, vector_store, indexer = (
-            _create_indexer_components(
+        # Create common indexer components, or reuse the warm session
+        if reuse_session:
+            session = acquire_indexing_session(
                 project_path, collection_name, quiet, verbose, config_file
             )
-        )
+            if session is None:
+                return False
+            project, logger, config, embedder, vector_store, indexer = (
+                session.components
+            )
+        else:
+            project, logger, config, embedder, vector_store, indexer = (
+                _create_indexer_components(
+                    project_path, collection_name, quiet, verbose, config_file
+                )
+            )
         if indexer is None:
             return False
 
@@ -282,6 +428,9 @@ def run_indexing_with_shared_deletion(
         if not quiet:
             logger.error(f"❌ Error in shared deletion: {e}")
         return False
+    finally:
+        if session is not None:
+            session.release()
 
 
 def run_indexing_with_specific_files(
@@ -292,6 +441,7 @@ def run_indexing_with_specific_files(
     verbose: bool = False,
     config_file: str | None = None,
     skip_change_detection: bool = False,
+    reuse_session: bool = False,
 ) -> bool:
     """Run indexing with specific file paths, bypassing file discovery.
 
@@ -305,22 +455,35 @@ def run_indexing_with_specific_files(
         quiet: Suppress non-error output
         verbose: Enable verbose output
         config_file: Optional configuration file path
+        reuse_session: Use the collection's warm IndexingSession instead of
+            creating new indexer components (for long-running callers)
 
     Returns:
         bool: True if successful, False otherwise
     """
+    session = None
     try:
-        # Create common indexer components
-        project, logger, config, embedder, vector_store, indexer = (
-            _create_indexer_components(
-                project_path,
-                collection_name,
-                quiet,
-                verbose,
-                config_file,
-                enable_debug_logging=verbose,
+        # Create common indexer components, or reuse the warm session
+        if reuse_session:
+            session = acquire_indexing_session(
+                project_path, collection_name, quiet, verbose, config_file
+            )
+            if session is None:
+                return False
+            project, logger, config, embedder, vector_store, indexer = (
+                session.components
+            )
+        else:
+            project, logger, config, embedder, vector_store, indexer = (
+                _create_indexer_components(
+                    project_path,
+                    collection_name,
+                    quiet,
+                    verbose,
+                    config_file,
+                    enable_debug_logging=verbose,
+                )
             )
-        )
         if indexer is None:
             return False
 
@@ -449,9 +612,11 @@ def run_indexing_with_specific_files(
                     logger.info(
                         f"🔍 Cleaning up orphaned relations after processing {len(successfully_processed)} files"
                     )
+                relation_index = indexer._get_relation_index(collection_name)
                 orphaned_deleted = vector_store._cleanup_orphaned_relations(
-                    collection_name, verbose
+                    collection_name, verbose, relation_index=relation_index
                 )
+                relation_index.save()
                 if verbose and orphaned_deleted > 0:
                     logger.info(
                         f"✅ Cleanup complete: {orphaned_deleted} orphaned relations removed"
@@ -705,6 +870,9 @@ def run_indexing_with_specific_files(
         if not quiet:
             logger.error(f"❌ Error: {e}")
         return False
+    finally:
+        if session is not None:
+            session.release()
 
 
 def run_indexing(
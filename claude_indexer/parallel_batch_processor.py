@@ -9,7 +9,7 @@ from typing import List, Tuple, Dict, Any, Optional
 import logging
 
 from .analysis.entities import Entity, EntityChunk as ChunkMetadata, Relation
-from .parallel_processor import ParallelFileProcessor
+from .parallel_processor import ParallelFileProcessor, result_from_worker
 
 
 def process_file_batch_with_parallel(
@@ -75,7 +75,8 @@ def process_file_batch_with_parallel(
         results = self.parallel_processor.process_files_parallel(
             files,
             collection_name,
-            processing_config
+            processing_config,
+            project_root=self.project_path,
         )
 
         # Get tier statistics
@@ -91,40 +92,11 @@ def process_file_batch_with_parallel(
             file_path = Path(result['file_path'])
 
             if result['status'] == 'success':
-                # Reconstruct entities from dictionaries
-                for entity_dict in result['entities']:
-                    entity = Entity(
-                        name=entity_dict['name'],
-                        type=entity_dict['type'],
-                        file_path=entity_dict['file_path'],
-                        content=entity_dict['content'],
-                        collection_name=entity_dict['collection_name'],
-                        metadata=entity_dict.get('metadata', {})
-                    )
-                    all_entities.append(entity)
-
-                # Reconstruct relations
-                for relation_dict in result['relations']:
-                    relation = Relation(
-                        source=relation_dict['source'],
-                        target=relation_dict['target'],
-                        type=relation_dict['type'],
-                        metadata=relation_dict.get('metadata', {})
-                    )
-                    all_relations.append(relation)
-
-                # Reconstruct chunks
-                for chunk_dict in result['chunks']:
-                    chunk = ChunkMetadata(
-                        file_path=chunk_dict['file_path'],
-                        entity_names=chunk_dict['entity_names'],
-                        chunk_type=chunk_dict['chunk_type'],
-                        content=chunk_dict['content'],
-                        start_line=chunk_dict['start_line'],
-                        end_line=chunk_dict['end_line'],
-                        metadata=chunk_dict.get('metadata', {})
-                    )
-                    all_implementation_chunks.append(chunk)
+                # Decode the worker's encoded rows
+                parsed = result_from_worker(result)
+                all_entities.extend(parsed.entities)
+                all_relations.extend(parsed.relations)
+                all_implementation_chunks.extend(parsed.implementation_chunks)
 
                 successfully_processed_files.append(file_path)
 
@@ -5,35 +5,151 @@ This module implements multiprocessing-based parallel parsing to speed up
 indexing of large projects while managing memory efficiently.
 """
 
+import contextlib
 import multiprocessing as mp
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Any
+import time
 import traceback
 import logging
+import marshal
 import os
+import pickle
 import psutil
 import gc
+import shutil
+import tempfile
 
-from .analysis.parser import ParserRegistry
+from .analysis.parse_cache import CachedParserResult, encode_result
+from .analysis.parser import ParserRegistry, ParserResult
+from .analysis.symbol_index import EMPTY_SYMBOL_INDEX, SymbolIndex
 from .categorization import FileCategorizationSystem, ProcessingTier
 from .analysis.entities import Entity, EntityChunk, EntityType, Relation, RelationType
 
+# Files per task sent to a worker; small enough to keep workers balanced
+MAX_CHUNK_SIZE = 32
+# Seconds a task may run before its worker is killed; longer for costly
+# files, up to MAX_TIMEOUT_FACTOR times the base timeout
+PARSE_TIMEOUT_SECONDS = 30.0
+RUNAWAY_COST_FACTOR = 20
+MAX_TIMEOUT_FACTOR = 4
+# Rough parse cost priors, replaced by measured times once a file was parsed
+FILE_OVERHEAD_MS = 2.0
+LIGHT_TIER_MS_PER_KB = 0.1
+DEFAULT_MS_PER_KB = 1.0
+PARSE_MS_PER_KB = {
+    '.py': 2.0,
+    '.js': 1.5, '.jsx': 1.5, '.ts': 1.5, '.tsx': 1.5,
+    '.html': 1.0, '.css': 0.5,
+    '.md': 0.5, '.txt': 0.2,
+    '.json': 0.3, '.yaml': 0.3, '.yml': 0.3, '.toml': 0.3, '.ini': 0.2,
+}
+# Parser registries kept per worker before the oldest are dropped
+MAX_WORKER_REGISTRIES = 8
+
+# Per-process state, built once by init_worker and reused across batches
+_worker_symbol_index: SymbolIndex = EMPTY_SYMBOL_INDEX
+_worker_symbol_version = 0
+_worker_registries: dict[Path, ParserRegistry] = {}
+_worker_categorizer: FileCategorizationSystem | None = None
+
+
 # Configure logging for child processes
-def init_worker():
-    """Initialize worker process with proper logging."""
+def init_worker(project_root: Path | None = None):
+    """Initialize worker process with proper logging and warm parsers.
+
+    Args:
+        project_root: Project whose ParserRegistry is built up front, so the
+            first batch does not pay for loading grammars and project config
+    """
+    global _worker_categorizer
     # Disable most logging in workers to avoid output confusion
     logging.basicConfig(level=logging.ERROR)
+    _worker_categorizer = FileCategorizationSystem()
+    if project_root is not None:
+        _get_worker_registry(project_root)
     # Force garbage collection on worker start
     gc.collect()
 
-def parse_file_worker(args: Tuple[Path, str, Dict[str, Any]]) -> Dict[str, Any]:
+
+def _get_worker_registry(project_root: Path) -> ParserRegistry:
+    """Return this worker's ParserRegistry for a project, creating it once."""
+    registry = _worker_registries.get(project_root)
+    if registry is None:
+        if len(_worker_registries) >= MAX_WORKER_REGISTRIES:
+            _worker_registries.pop(next(iter(_worker_registries)))
+        registry = _worker_registries[project_root] = ParserRegistry(project_root)
+    return registry
+
+
+def _load_symbol_index(symbol_ref: tuple[str, int] | None) -> SymbolIndex:
+    """Load a published symbol index unless this worker already has that version."""
+    global _worker_symbol_index, _worker_symbol_version
+    if symbol_ref is None:
+        return EMPTY_SYMBOL_INDEX
+    path, version = symbol_ref
+    if version != _worker_symbol_version:
+        with open(path, 'rb') as f:
+            _worker_symbol_index = SymbolIndex.of(pickle.load(f))
+        _worker_symbol_version = version
+        # A new index means a new run; drop lookups cached by the last one
+        for registry in _worker_registries.values():
+            registry.clear_caches()
+    return _worker_symbol_index
+
+
+def parse_chunk_worker(args: tuple[list[Path], str, dict[str, Any], Path | None,
+                                   tuple[str, int] | None]) -> list[dict[str, Any]]:
+    """
+    Worker function for parsing a chunk of files in one task.
+
+    Args:
+        args: Tuple of (file_paths, collection_name, processing_config,
+            project_root, symbol_ref) where symbol_ref is the published
+            symbol index (path, version) or None
+
+    Returns:
+        One result dictionary per file, as returned by parse_file_worker,
+        with the file's parse time in 'parse_ms'
+    """
+    file_paths, collection_name, processing_config, project_root, symbol_ref = args
+    try:
+        symbol_index = _load_symbol_index(symbol_ref)
+    except Exception as e:
+        return [
+            {'status': 'error', 'file_path': str(file_path),
+             'error': f'Failed to load symbol index: {e}'}
+            for file_path in file_paths
+        ]
+    results = []
+    for file_path in file_paths:
+        start = time.perf_counter()
+        result = parse_file_worker(
+            (file_path, collection_name, processing_config),
+            project_root=project_root,
+            symbol_index=symbol_index,
+        )
+        result['parse_ms'] = (time.perf_counter() - start) * 1000
+        results.append(result)
+    return results
+
+
+def parse_file_worker(args: tuple[Path, str, dict[str, Any]],
+                      project_root: Path | None = None,
+                      symbol_index: SymbolIndex | None = None) -> dict[str, Any]:
     """
     Worker function for parsing a single file.
     Runs in a separate process for true parallelism.
 
     Args:
         args: Tuple of (file_path, collection_name, processing_config)
+        project_root: Project root for parser initialization; the file's
+            parent directory when not given
+        symbol_index: Global symbol index for CALLS resolution
 
     Returns:
         Dictionary containing parsing results or error information
@@ -41,11 +157,9 @@ def parse_file_worker(args: Tuple[Path, str, Dict[str, Any]]) -> Dict[str, Any]:
     file_path, collection_name, processing_config = args
 
     try:
-        # Initialize components in worker process
-        # Use file's parent directory as project root for parser initialization
-        project_root = file_path.parent
-        parser_registry = ParserRegistry(project_root)
-        categorizer = FileCategorizationSystem()
+        # Reuse this worker's registry and categorizer across files
+        parser_registry = _get_worker_registry(project_root or file_path.parent)
+        categorizer = _worker_categorizer or FileCategorizationSystem()
 
         # Get processing tier and config
         tier = categorizer.categorize_file(file_path)
@@ -73,13 +187,17 @@ def parse_file_worker(args: Tuple[Path, str, Dict[str, Any]]) -> Dict[str, Any]:
                 parser_registry,
                 collection_name
             )
+            parse_result = ParserResult(
+                file_path, entities=entities, relations=relations,
+                implementation_chunks=chunks,
+            )
         else:
             # Standard or deep parsing
             # ParserRegistry.parse_file signature: (file_path, batch_callback=None, global_entity_names=None)
             parse_result = parser_registry.parse_file(
                 file_path=file_path,
                 batch_callback=None,
-                global_entity_names=set()
+                global_entity_names=symbol_index
             )
 
             if not parse_result:
@@ -93,20 +211,25 @@ def parse_file_worker(args: Tuple[Path, str, Dict[str, Any]]) -> Dict[str, Any]:
             relations = parse_result.relations
             chunks = parse_result.implementation_chunks
 
-        # Convert to serializable format
-        return {
+        result = {
             'status': 'success',
             'file_path': str(file_path),
             'tier': tier.value,
-            'entities': [entity_to_dict(e) for e in entities],
-            'relations': [relation_to_dict(r) for r in relations],
-            'chunks': [chunk_to_dict(c) for c in chunks],
             'stats': {
                 'entity_count': len(entities),
                 'relation_count': len(relations),
                 'chunk_count': len(chunks)
             }
         }
+        try:
+            # One bytes object per file: pickling it is a copy, not a walk
+            result['payload'] = encode_result(parse_result)
+        except ValueError:
+            # Metadata marshal cannot encode; ship plain dicts instead
+            result['entities'] = [entity_to_dict(e) for e in entities]
+            result['relations'] = [relation_to_dict(r) for r in relations]
+            result['chunks'] = [chunk_to_dict(c) for c in chunks]
+        return result
 
     except Exception as e:
         return {
@@ -118,7 +241,7 @@ def parse_file_worker(args: Tuple[Path, str, Dict[str, Any]]) -> Dict[str, Any]:
 
 
 def parse_light_tier(file_path: Path, parser_registry: ParserRegistry,
-                    collection_name: str) -> Tuple[List[Entity], List[Relation], List[EntityChunk]]:
+                    collection_name: str) -> tuple[list[Entity], list[Relation], list[EntityChunk]]:
     """
     Simplified parsing for light tier files (generated code, type definitions).
 
@@ -208,7 +331,7 @@ def parse_light_tier(file_path: Path, parser_registry: ParserRegistry,
     return entities, [], chunks  # No relations for light tier
 
 
-def entity_to_dict(entity: Entity) -> Dict[str, Any]:
+def entity_to_dict(entity: Entity) -> dict[str, Any]:
     """Convert Entity to serializable dictionary for cross-process transfer."""
     return {
         'name': entity.name,
@@ -224,7 +347,7 @@ def entity_to_dict(entity: Entity) -> Dict[str, Any]:
     }
 
 
-def relation_to_dict(relation: Relation) -> Dict[str, Any]:
+def relation_to_dict(relation: Relation) -> dict[str, Any]:
     """Convert Relation to serializable dictionary for cross-process transfer."""
     return {
         'from_entity': relation.from_entity,
@@ -236,7 +359,7 @@ def relation_to_dict(relation: Relation) -> Dict[str, Any]:
     }
 
 
-def chunk_to_dict(chunk: EntityChunk) -> Dict[str, Any]:
+def chunk_to_dict(chunk: EntityChunk) -> dict[str, Any]:
     """Convert EntityChunk to serializable dictionary for cross-process transfer."""
     return {
         'id': chunk.id,
@@ -247,14 +370,76 @@ def chunk_to_dict(chunk: EntityChunk) -> Dict[str, Any]:
     }
 
 
+def entity_from_dict(data: dict[str, Any]) -> Entity:
+    """Convert a dictionary from entity_to_dict back to an Entity."""
+    return Entity(
+        name=data['name'],
+        entity_type=EntityType(data['entity_type']),
+        observations=data.get('observations', []),
+        file_path=Path(data['file_path']) if data.get('file_path') else None,
+        line_number=data.get('line_number'),
+        end_line_number=data.get('end_line_number'),
+        docstring=data.get('docstring'),
+        signature=data.get('signature'),
+        complexity_score=data.get('complexity_score'),
+        metadata=data.get('metadata', {}),
+    )
+
+
+def relation_from_dict(data: dict[str, Any]) -> Relation:
+    """Convert a dictionary from relation_to_dict back to a Relation."""
+    return Relation(
+        from_entity=data['from_entity'],
+        to_entity=data['to_entity'],
+        relation_type=RelationType(data['relation_type']),
+        context=data.get('context'),
+        confidence=data.get('confidence', 1.0),
+        metadata=data.get('metadata', {}),
+    )
+
+
+def chunk_from_dict(data: dict[str, Any]) -> EntityChunk:
+    """Convert a dictionary from chunk_to_dict back to an EntityChunk."""
+    return EntityChunk(
+        id=data['id'],
+        entity_name=data['entity_name'],
+        chunk_type=data['chunk_type'],
+        content=data['content'],
+        metadata=data.get('metadata', {}),
+    )
+
+
+def result_from_worker(result: dict[str, Any]) -> ParserResult:
+    """Rebuild the ParserResult carried by a successful worker result.
+
+    Encoded payloads are decoded into a CachedParserResult, whose entities,
+    relations and chunks are only built when first accessed.
+    """
+    file_path = Path(result['file_path'])
+    payload = result.get('payload')
+    if payload is not None:
+        return CachedParserResult(file_path, marshal.loads(payload))
+    return ParserResult(
+        file_path,
+        entities=[entity_from_dict(e) for e in result.get('entities', [])],
+        relations=[relation_from_dict(r) for r in result.get('relations', [])],
+        implementation_chunks=[chunk_from_dict(c) for c in result.get('chunks', [])],
+    )
+
+
 class ParallelFileProcessor:
     """
     Manages parallel file processing for efficient indexing.
+
+    Worker processes are started once and kept for the processor's lifetime,
+    so each builds its parsers once per project and reuses them across
+    batches and incremental runs. Call shutdown() to release them.
     """
 
-    def __init__(self, max_workers: Optional[int] = None,
+    def __init__(self, max_workers: int | None = None,
                  memory_limit_mb: int = 2000,
-                 logger: Optional[logging.Logger] = None):
+                 logger: logging.Logger | None = None,
+                 parse_timeout: float = PARSE_TIMEOUT_SECONDS):
         """
         Initialize the parallel processor.
 
@@ -262,8 +447,12 @@ class ParallelFileProcessor:
             max_workers: Maximum number of worker processes (default: CPU count - 1)
             memory_limit_mb: Memory limit before reducing workers
             logger: Logger instance
+            parse_timeout: Seconds before a task's worker is killed, raised
+                (up to MAX_TIMEOUT_FACTOR times) for tasks estimated to take
+                longer
         """
         self.logger = logger or logging.getLogger(__name__)
+        self.parse_timeout = parse_timeout
 
         # Determine optimal worker count
         cpu_count = mp.cpu_count()
@@ -279,22 +468,48 @@ class ParallelFileProcessor:
         # Track current worker count (can be adjusted dynamically)
         self.current_workers = self.max_workers
 
+        # Persistent pool, created on first use
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_workers = 0
+
+        # Last measured parse time (ms) per file path, for cost estimates
+        self.parse_times: dict[str, float] = {}
+
+        # Symbol index published to workers through a file, once per version
+        self._symbol_dir: str | None = None
+        self._published_index: SymbolIndex | None = None
+        self._symbol_ref: tuple[str, int] | None = None
+
         self.logger.info(f"💪 Parallel processor initialized with {self.current_workers} workers")
 
     def process_files_parallel(self,
-                              file_paths: List[Path],
+                              file_paths: list[Path],
                               collection_name: str,
-                              processing_config: Dict[str, Any]) -> List[Dict[str, Any]]:
+                              processing_config: dict[str, Any],
+                              symbol_index: SymbolIndex | None = None,
+                              project_root: Path | None = None,
+                              parse_times: Mapping[Path, float] | None = None) -> list[dict[str, Any]]:
         """
         Process multiple files in parallel.
 
+        Files are sent to workers longest-estimated-first, one task per idle
+        worker, so a large file is never left to start last. Tasks running
+        far past their estimate are stopped by killing the worker, and tasks
+        lost to a crashed worker are retried.
+
         Args:
             file_paths: List of file paths to process
             collection_name: Name of the collection
             processing_config: Configuration for processing
+            symbol_index: Global symbol index for CALLS resolution; each
+                worker loads a given index once rather than with every file
+            project_root: Project root for parser initialization; workers
+                keep one registry per project
+            parse_times: Previously measured parse times in ms, used to
+                estimate each file's cost
 
         Returns:
-            List of parsing results
+            List of parsing results; those from workers carry 'parse_ms'
         """
         if not file_paths:
             return []
@@ -308,64 +523,264 @@ class ParallelFileProcessor:
             self.logger.warning(f"High memory usage ({memory_usage:.0f}MB), reducing to {self.current_workers} workers")
             gc.collect()
 
-        # Categorize files first for better work distribution
-        file_tiers = []
-        for file_path in file_paths:
-            tier = self.categorizer.categorize_file(file_path)
-            file_tiers.append((file_path, tier))
-
-        # Sort by tier - process light files first for quick wins
-        file_tiers.sort(key=lambda x: (
-            0 if x[1] == ProcessingTier.LIGHT else
-            1 if x[1] == ProcessingTier.STANDARD else 2
-        ))
-
-        # Prepare worker arguments
-        worker_args = [
-            (file_path, collection_name, processing_config)
-            for file_path, _ in file_tiers
-        ]
+        symbol_ref = self._publish_symbol_index(symbol_index)
+        if parse_times:
+            self.parse_times.update((str(path), ms) for path, ms in parse_times.items())
 
+        # Longest jobs first, tiny files grouped so each task is worth sending
+        pending = deque(self._plan_chunks(file_paths))
+        # future -> (files, deadline, timeout in seconds)
+        running: dict[Future, tuple[list[Path], float, float]] = {}
+        # Files already retried alone after a worker crash
+        crashed: set[str] = set()
         results = []
-        processed = 0
-
-        # Process files in parallel
-        with ProcessPoolExecutor(
-            max_workers=self.current_workers,
-            initializer=init_worker
-        ) as executor:
-            # Submit all tasks
-            future_to_file = {
-                executor.submit(parse_file_worker, args): args[0]
-                for args in worker_args
-            }
 
-            # Collect results as they complete
-            for future in as_completed(future_to_file):
-                file_path = future_to_file[future]
-                try:
-                    result = future.result(timeout=30)  # 30 second timeout per file
-                    results.append(result)
-                    processed += 1
-
-                    # Log progress
-                    if processed % 10 == 0:
-                        self.logger.debug(f"Processed {processed}/{len(file_paths)} files in parallel")
+        while pending or running:
+            executor = self._get_executor(project_root)
+            # Keep one task per worker so a task starts when it is submitted
+            # and an idle worker always takes the most expensive one left
+            while pending and len(running) < self.current_workers:
+                chunk, cost_ms = pending.popleft()
+                future = executor.submit(
+                    parse_chunk_worker,
+                    (chunk, collection_name, processing_config, project_root, symbol_ref),
+                )
+                timeout = self._task_timeout(cost_ms)
+                running[future] = (chunk, time.monotonic() + timeout, timeout)
+
+            next_deadline = min(deadline for _, deadline, _ in running.values())
+            done, _ = wait(
+                running,
+                timeout=max(0.0, next_deadline - time.monotonic()),
+                return_when=FIRST_COMPLETED,
+            )
 
+            lost: list[list[Path]] = []
+            for future in done:
+                chunk, _, _ = running.pop(future)
+                try:
+                    results.extend(self._record_times(future.result()))
+                except BrokenProcessPool:
+                    lost.append(chunk)
                 except Exception as e:
-                    self.logger.error(f"Error processing {file_path}: {e}")
-                    results.append({
-                        'status': 'timeout',
-                        'file_path': str(file_path),
-                        'error': str(e)
-                    })
+                    self.logger.error(f"Error processing chunk of {len(chunk)} files: {e}")
+                    results.extend(
+                        {'status': 'error', 'file_path': str(file_path), 'error': str(e)}
+                        for file_path in chunk
+                    )
+            if lost:
+                # A worker died and took the pool with it, along with every
+                # task still running on it
+                lost.extend(chunk for chunk, _, _ in running.values())
+                running.clear()
+                self._shutdown_executor()
+                results.extend(self._retry_crashed(lost, crashed, pending))
+                continue
+
+            now = time.monotonic()
+            expired = [f for f, (_, deadline, _) in running.items() if deadline <= now]
+            if expired:
+                results.extend(self._cancel_runaways(expired, running, pending))
+
+            self.logger.debug(f"Processed {len(results)}/{len(file_paths)} files in parallel")
 
         # Force garbage collection after batch
         gc.collect()
 
         return results
 
-    def get_tier_stats(self, results: List[Dict[str, Any]]) -> Dict[str, int]:
+    def estimate_cost(self, file_path: Path) -> float:
+        """Estimate how long a file takes to parse, in milliseconds.
+
+        Uses the file's last measured parse time when known, otherwise its
+        size weighted by language and processing tier.
+        """
+        known = self.parse_times.get(str(file_path))
+        if known is not None:
+            return known
+        try:
+            size_kb = file_path.stat().st_size / 1024
+        except OSError:
+            return FILE_OVERHEAD_MS
+        if self.categorizer.categorize_file(file_path) == ProcessingTier.LIGHT:
+            rate = LIGHT_TIER_MS_PER_KB
+        else:
+            rate = PARSE_MS_PER_KB.get(file_path.suffix.lower(), DEFAULT_MS_PER_KB)
+        return FILE_OVERHEAD_MS + size_kb * rate
+
+    def _plan_chunks(self, file_paths: list[Path]) -> list[tuple[list[Path], float]]:
+        """Group files into tasks, most expensive first.
+
+        Files costing at least an even share of the batch (a quarter of one
+        worker's load) run alone; cheaper files are packed together until a
+        task reaches that share or MAX_CHUNK_SIZE files.
+
+        Returns:
+            List of (files, estimated cost in ms) in descending cost order
+        """
+        costs = sorted(
+            ((self.estimate_cost(path), path) for path in file_paths),
+            key=lambda item: item[0],
+            reverse=True,
+        )
+        target_ms = sum(cost for cost, _ in costs) / (self.current_workers * 4)
+
+        chunks: list[tuple[list[Path], float]] = []
+        chunk: list[Path] = []
+        chunk_ms = 0.0
+        for cost, path in costs:
+            chunk.append(path)
+            chunk_ms += cost
+            if chunk_ms >= target_ms or len(chunk) >= MAX_CHUNK_SIZE:
+                chunks.append((chunk, chunk_ms))
+                chunk, chunk_ms = [], 0.0
+        if chunk:
+            chunks.append((chunk, chunk_ms))
+        return chunks
+
+    def _record_times(self, results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Remember measured parse times for scheduling later batches."""
+        for result in results:
+            if 'parse_ms' in result:
+                self.parse_times[result['file_path']] = result['parse_ms']
+        return results
+
+    def _task_timeout(self, cost_ms: float) -> float:
+        """Seconds a task estimated at ``cost_ms`` may run before it is killed."""
+        return min(
+            max(self.parse_timeout, RUNAWAY_COST_FACTOR * cost_ms / 1000),
+            MAX_TIMEOUT_FACTOR * self.parse_timeout,
+        )
+
+    def _cancel_runaways(self, expired: list[Future],
+                         running: dict[Future, tuple[list[Path], float, float]],
+                         pending: deque) -> list[dict[str, Any]]:
+        """Kill the pool to stop tasks past their deadline.
+
+        A future cannot be cancelled once its worker has started, so the
+        workers are killed and the pool restarted. Other tasks that were
+        running are queued again. A timed-out task of several files is
+        split so each file is retried alone; a single file that times out
+        is reported as an error and remembered as expensive.
+
+        Returns:
+            Error results for the files that timed out
+        """
+        self._kill_workers()
+        results = []
+        retry: list[tuple[list[Path], float]] = []
+        for future, (chunk, _, timeout) in list(running.items()):
+            if future in expired:
+                if len(chunk) > 1:
+                    retry.extend(([path], self.estimate_cost(path)) for path in chunk)
+                    continue
+                self.logger.warning(f"Parse of {chunk[0]} timed out; worker killed")
+                self.parse_times[str(chunk[0])] = timeout * 1000
+                results.append({
+                    'status': 'error',
+                    'file_path': str(chunk[0]),
+                    'error': f'Parse timed out after {timeout:.0f}s',
+                })
+            else:
+                retry.append((chunk, sum(map(self.estimate_cost, chunk))))
+        running.clear()
+        self._queue_first(pending, retry)
+        return results
+
+    def _retry_crashed(self, chunks: list[list[Path]], crashed: set[str],
+                       pending: deque) -> list[dict[str, Any]]:
+        """Queue tasks lost to a crashed worker again.
+
+        Which task crashed the worker is unknown, so tasks of several files
+        are split and retried file by file. A file is retried alone once;
+        if its worker dies again it is reported as an error.
+
+        Returns:
+            Error results for the files that are not retried
+        """
+        results = []
+        retry: list[tuple[list[Path], float]] = []
+        for chunk in chunks:
+            if len(chunk) > 1:
+                retry.extend(([path], self.estimate_cost(path)) for path in chunk)
+            elif str(chunk[0]) in crashed:
+                self.logger.error(f"Parse of {chunk[0]} terminated its worker again")
+                results.append({
+                    'status': 'error',
+                    'file_path': str(chunk[0]),
+                    'error': 'Worker pool terminated abruptly',
+                })
+            else:
+                crashed.add(str(chunk[0]))
+                retry.append((chunk, self.estimate_cost(chunk[0])))
+        self._queue_first(pending, retry)
+        return results
+
+    @staticmethod
+    def _queue_first(pending: deque, retry: list[tuple[list[Path], float]]) -> None:
+        """Put tasks back at the front of the queue, most expensive first."""
+        retry.sort(key=lambda item: item[1])
+        pending.extendleft(retry)  # extendleft reverses: most expensive first
+
+    def _kill_workers(self) -> None:
+        """Kill the worker processes immediately and drop the pool."""
+        if self._executor is not None:
+            for process in list((self._executor._processes or {}).values()):
+                with contextlib.suppress(Exception):
+                    process.kill()
+            self._shutdown_executor()
+
+    def _get_executor(self, project_root: Path | None) -> ProcessPoolExecutor:
+        """Return the persistent pool, restarting it if the worker count changed."""
+        if self._executor is not None and self._executor_workers != self.current_workers:
+            self._shutdown_executor()
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.current_workers,
+                initializer=init_worker,
+                initargs=(project_root,),
+            )
+            self._executor_workers = self.current_workers
+        return self._executor
+
+    def _publish_symbol_index(self, symbol_index: SymbolIndex | None) -> tuple[str, int] | None:
+        """Write a new symbol index for workers to load; unchanged indexes are reused."""
+        if not symbol_index:
+            return None
+        if symbol_index is self._published_index:
+            return self._symbol_ref
+
+        if self._symbol_dir is None:
+            self._symbol_dir = tempfile.mkdtemp(prefix='claude-indexer-symbols-')
+        version = (self._symbol_ref[1] if self._symbol_ref else 0) + 1
+        path = os.path.join(self._symbol_dir, f'symbols-{version}.pickle')
+        with open(path, 'wb') as f:
+            pickle.dump(SymbolIndex.of(symbol_index), f, protocol=pickle.HIGHEST_PROTOCOL)
+        if self._symbol_ref is not None:
+            # Workers only load the version referenced by the current batch
+            with contextlib.suppress(OSError):
+                os.remove(self._symbol_ref[0])
+
+        self._published_index = symbol_index
+        self._symbol_ref = (path, version)
+        return self._symbol_ref
+
+    def _shutdown_executor(self) -> None:
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def shutdown(self) -> None:
+        """Stop the worker processes and remove published symbol indexes."""
+        self._shutdown_executor()
+        if self._symbol_dir is not None:
+            shutil.rmtree(self._symbol_dir, ignore_errors=True)
+            self._symbol_dir = None
+        self._published_index = None
+        self._symbol_ref = None
+
+    def get_tier_stats(self, results: list[dict[str, Any]]) -> dict[str, int]:
         """
         Get statistics about processed file tiers.
 
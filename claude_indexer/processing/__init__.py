@@ -8,13 +8,14 @@ and implementation chunks with deduplication and error handling.
 from .content_processor import ContentProcessor
 from .context import ProcessingContext
 from .processors import EntityProcessor, ImplementationProcessor, RelationProcessor
-from .results import ProcessingResult
+from .results import PreparedContent, ProcessingResult
 from .unified_processor import UnifiedContentProcessor
 
 __all__ = [
     "ContentProcessor",
     "ProcessingContext",
     "ProcessingResult",
+    "PreparedContent",
     "EntityProcessor",
     "RelationProcessor",
     "ImplementationProcessor",
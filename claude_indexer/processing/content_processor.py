@@ -15,10 +15,12 @@ if TYPE_CHECKING:
 class ContentProcessor(ContentHashMixin, ABC):
     """Base class for content processing with deduplication."""
 
-    def __init__(self, vector_store, embedder, logger=None):
+    def __init__(self, vector_store, embedder, logger=None, bm25_statistics=None):
         self.vector_store = vector_store
         self.embedder = embedder
         self.logger = logger
+        # Persisted BM25 document frequencies shared across processors
+        self.bm25_statistics = bm25_statistics
         # Lazy-loaded BM25 embedder for sparse vectors
         self._bm25_embedder = None
 
@@ -26,7 +28,9 @@ class ContentProcessor(ContentHashMixin, ABC):
         """Lazy initialize BM25 embedder for sparse vectors."""
         if self._bm25_embedder is None:
             try:
-                self._bm25_embedder = create_bm25_embedder()
+                self._bm25_embedder = create_bm25_embedder(
+                    statistics=self.bm25_statistics
+                )
                 if self.logger:
                     self.logger.debug("🔤 Initialized BM25 embedder for sparse vectors")
             except Exception as e:
@@ -45,16 +49,31 @@ class ContentProcessor(ContentHashMixin, ABC):
     def check_deduplication(
         self, items: list, collection_name: str
     ) -> tuple[list, list]:
-        """Universal deduplication logic using content hashes."""
+        """Universal deduplication logic using content hashes.
+
+        Every item is hashed once and all hashes are checked together, so a
+        batch costs a handful of lookups instead of one round trip per item.
+        """
+        if not items:
+            return [], []
+
+        hashes = [self._get_content_hash(item) for item in items]
+        if hasattr(self.vector_store, "find_existing_content_hashes"):
+            existing = self.vector_store.find_existing_content_hashes(
+                collection_name, hashes
+            )
+        else:
+            existing = {
+                h
+                for h in set(hashes)
+                if h and self.vector_store.check_content_exists(collection_name, h)
+            }
+
         to_embed = []
         to_skip = []
-
-        for item in items:
-            content_hash = self._get_content_hash(item)
-            if self.vector_store.check_content_exists(collection_name, content_hash):
+        for item, content_hash in zip(items, hashes, strict=True):
+            if content_hash and content_hash in existing:
                 to_skip.append(item)
-                # if self.logger:
-                # self.logger.debug(f"⚡ Skipping unchanged item: {getattr(item, 'entity_name', item)}")
             else:
                 to_embed.append(item)
 
@@ -62,6 +81,8 @@ class ContentProcessor(ContentHashMixin, ABC):
 
     def _get_content_hash(self, item) -> str:
         """Get content hash from item."""
+        if hasattr(item, "content_hash"):
+            return item.content_hash
         if hasattr(item, "to_vector_payload"):
             return item.to_vector_payload().get("content_hash", "")
         return ""
@@ -94,6 +115,36 @@ class ContentProcessor(ContentHashMixin, ABC):
             entity_path in context.files_being_processed
         )
 
+    def _get_bm25_text(self, item) -> str:
+        """Get BM25-optimized content from metadata, falling back to regular content."""
+        if hasattr(item, 'metadata') and item.metadata and 'content_bm25' in item.metadata:
+            return item.metadata['content_bm25']
+        return getattr(item, "content", str(item))
+
+    def record_bm25_documents(self, chunks: list) -> None:
+        """Count metadata chunks as BM25 documents of their files.
+
+        Called with every metadata chunk of the files being indexed, before
+        deduplication, so unchanged chunks still contribute to the
+        document frequencies.
+        """
+        if self.bm25_statistics is None or not chunks:
+            return
+        bm25_embedder = self._get_bm25_embedder()
+        if not bm25_embedder or not hasattr(bm25_embedder, "record_documents"):
+            return
+
+        texts_by_file: dict[str, list[str]] = {}
+        for chunk in chunks:
+            file_path = chunk.metadata.get("file_path") if chunk.metadata else None
+            if file_path:
+                texts_by_file.setdefault(str(file_path), []).append(
+                    self._get_bm25_text(chunk)
+                )
+
+        for file_path, texts in texts_by_file.items():
+            bm25_embedder.record_documents(file_path, texts)
+
     def process_embeddings(self, items: list, item_name: str) -> tuple[list, dict]:  # noqa: ARG002
         """Generate embeddings with error handling and cost tracking.
 
@@ -151,13 +202,7 @@ class ContentProcessor(ContentHashMixin, ABC):
             if bm25_embedder:
                 try:
                     # Extract BM25-optimized content for sparse embeddings
-                    bm25_texts = []
-                    for item in items:
-                        # Try to get BM25 content from metadata, fallback to regular content
-                        if hasattr(item, 'metadata') and item.metadata and 'content_bm25' in item.metadata:
-                            bm25_texts.append(item.metadata['content_bm25'])
-                        else:
-                            bm25_texts.append(getattr(item, "content", str(item)))
+                    bm25_texts = [self._get_bm25_text(item) for item in items]
                     
                     # Generate BM25 embeddings using optimized content
                     bm25_results = bm25_embedder.embed_batch(bm25_texts, item_type=item_name)
@@ -50,6 +50,9 @@ class EntityProcessor(ContentProcessor):
             )
             chunks_to_process.append(metadata_chunk)
 
+        # Count every metadata chunk toward BM25 document frequencies
+        self.record_bm25_documents(chunks_to_process)
+
         # Phase 2: Enhanced Git+Meta deletion - handle both existing and deleted entities
         entities_deleted = 0
 
@@ -452,6 +455,11 @@ class ImplementationProcessor(ContentProcessor):
                 f"💻 Processing implementation chunks with Git+Meta deduplication: {len(implementation_chunks)} items"
             )
 
+        # Metadata-typed chunks (e.g. markdown sections) are BM25 documents too
+        self.record_bm25_documents(
+            [c for c in implementation_chunks if getattr(c, "chunk_type", None) == "metadata"]
+        )
+
         # Check which implementation chunks need embedding
         # Skip chunks that already have unified embeddings with their metadata
         chunks_to_check_dedup = []
@@ -1,6 +1,10 @@
 """Processing result data structures."""
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .context import ProcessingContext
 
 
 @dataclass
@@ -67,3 +71,13 @@ class ProcessingResult:
             points_created=combined_points,
             error=self.error or other.error,
         )
+
+
+@dataclass
+class PreparedContent:
+    """Embedded points of one batch, ready to be stored."""
+
+    context: "ProcessingContext"
+    result: ProcessingResult
+    entities: list
+    relations: list
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Any
 
 from .context import ProcessingContext
 from .processors import EntityProcessor, ImplementationProcessor, RelationProcessor
-from .results import ProcessingResult
+from .results import PreparedContent, ProcessingResult
 
 if TYPE_CHECKING:
     from ..analysis.entities import Entity, EntityChunk, Relation
@@ -13,15 +13,31 @@ if TYPE_CHECKING:
 class UnifiedContentProcessor:
     """Orchestrates unified content processing pipeline."""
 
-    def __init__(self, vector_store: Any, embedder: Any, logger: Any = None) -> None:
+    def __init__(
+        self,
+        vector_store: Any,
+        embedder: Any,
+        logger: Any = None,
+        bm25_statistics: Any = None,
+        relation_index: Any = None,
+    ) -> None:
         self.vector_store = vector_store
         self.embedder = embedder
         self.logger = logger
+        self.bm25_statistics = bm25_statistics
+        # Per-file entity names and relation edges for incremental orphan cleanup
+        self.relation_index = relation_index
 
         # Initialize specialized processors
-        self.entity_processor = EntityProcessor(vector_store, embedder, logger)
-        self.relation_processor = RelationProcessor(vector_store, embedder, logger)
-        self.impl_processor = ImplementationProcessor(vector_store, embedder, logger)
+        self.entity_processor = EntityProcessor(
+            vector_store, embedder, logger, bm25_statistics
+        )
+        self.relation_processor = RelationProcessor(
+            vector_store, embedder, logger, bm25_statistics
+        )
+        self.impl_processor = ImplementationProcessor(
+            vector_store, embedder, logger, bm25_statistics
+        )
 
     def process_all_content(
         self,
@@ -32,6 +48,29 @@ class UnifiedContentProcessor:
         changed_entity_ids: set[str],
     ) -> ProcessingResult:
         """Single entry point replacing _store_vectors() logic."""
+        prepared = self.prepare_content(
+            collection_name,
+            entities,
+            relations,
+            implementation_chunks,
+            changed_entity_ids,
+        )
+        return self.store_prepared_content(prepared)
+
+    def prepare_content(
+        self,
+        collection_name: str,
+        entities: list["Entity"],
+        relations: list["Relation"],
+        implementation_chunks: list["EntityChunk"],
+        changed_entity_ids: set[str],
+    ) -> PreparedContent:
+        """Embed entities, relations and chunks into points without storing them.
+
+        This is the embedding half of ``process_all_content``. Its result is
+        handed to ``store_prepared_content``, possibly from another thread
+        while the next batch is being prepared.
+        """
 
         # DEBUG: Print parameters to compare CLI vs Watcher calls
         if self.logger:
@@ -66,6 +105,11 @@ class UnifiedContentProcessor:
         # Remove None values
         files_being_processed.discard(None)
 
+        # Files are re-counted from scratch as their chunks are processed
+        if self.bm25_statistics is not None:
+            for file_path in files_being_processed:
+                self.bm25_statistics.remove_file(str(file_path))
+
         # Create implementation chunk lookup for has_implementation flags
         implementation_entity_names = set()
         if implementation_chunks:
@@ -105,7 +149,7 @@ class UnifiedContentProcessor:
             if entities:
                 entity_result = self.entity_processor.process_batch(entities, context)
                 if not entity_result.success:
-                    return entity_result
+                    return PreparedContent(context, entity_result, entities, relations)
                 combined_result = combined_result.combine_with(entity_result)
                 all_points.extend(entity_result.points_created or [])
 
@@ -115,7 +159,7 @@ class UnifiedContentProcessor:
                     relations, context
                 )
                 if not relation_result.success:
-                    return relation_result
+                    return PreparedContent(context, relation_result, entities, relations)
                 combined_result = combined_result.combine_with(relation_result)
                 all_points.extend(relation_result.points_created or [])
 
@@ -125,10 +169,37 @@ class UnifiedContentProcessor:
                     implementation_chunks, context
                 )
                 if not impl_result.success:
-                    return impl_result
+                    return PreparedContent(context, impl_result, entities, relations)
                 combined_result = combined_result.combine_with(impl_result)
                 all_points.extend(impl_result.points_created or [])
 
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error in unified content processing: {e}")
+            return PreparedContent(
+                context,
+                ProcessingResult.failure_result(f"Processing failed: {e}"),
+                entities,
+                relations,
+            )
+
+        combined_result.points_created = all_points
+        return PreparedContent(context, combined_result, entities, relations)
+
+    def store_prepared_content(self, prepared: PreparedContent) -> ProcessingResult:
+        """Delete replaced entities, upsert prepared points and clean up orphans.
+
+        This is the storage half of ``process_all_content``; it only talks to
+        the vector store and the relation index, never to the embedder.
+        """
+        if not prepared.result.success:
+            return prepared.result
+
+        context = prepared.context
+        collection_name = context.collection_name
+        all_points = prepared.result.points_created or []
+
+        try:
             # Phase 4: Execute deletion + upsert in single transaction
             if context.entities_to_delete or all_points:
                 # Execute deletion before upsert if entities need to be replaced
@@ -147,7 +218,17 @@ class UnifiedContentProcessor:
                             "Failed to store points in batch operation"
                         )
 
-                # Phase 5: Enhanced orphan cleanup after successful storage
+            # Record what the processed files now define and reference
+            if self.relation_index is not None:
+                self.relation_index.record_entities(prepared.entities, prepared.relations)
+
+            # Phase 5: Orphan cleanup after successful storage. With a complete
+            # relation index it also runs when nothing was upserted, since
+            # relations dropped from a file are stale too.
+            indexed_cleanup = (
+                self.relation_index is not None and self.relation_index.complete
+            )
+            if indexed_cleanup or context.entities_to_delete or all_points:
                 try:
                     self._cleanup_orphaned_relations(collection_name)
                 except Exception as cleanup_error:
@@ -156,9 +237,7 @@ class UnifiedContentProcessor:
                             f"⚠️ Orphan cleanup failed but storage succeeded: {cleanup_error}"
                         )
 
-            # Update combined result with final metrics
-            combined_result.points_created = all_points
-            return combined_result
+            return prepared.result
 
         except Exception as e:
             if self.logger:
@@ -212,6 +291,21 @@ class UnifiedContentProcessor:
         """Clean up orphaned relations after successful storage with timer control."""
         backend = getattr(self.vector_store, "backend", self.vector_store)
 
+        # A complete relation index replaces both scans below
+        if (
+            self.relation_index is not None
+            and self.relation_index.complete
+            and hasattr(backend, "_cleanup_orphaned_relations")
+        ):
+            stale_count = backend._cleanup_orphaned_relations(
+                collection_name, force=True, relation_index=self.relation_index
+            )
+            if self.logger and stale_count > 0:
+                self.logger.info(
+                    f"🧹 Cleaned {stale_count} stale relations of the processed files"
+                )
+            return
+
         if self.logger:
             self.logger.debug(
                 "🔍 DEBUG: Starting comprehensive orphan cleanup after successful storage"
@@ -8,6 +8,7 @@ from typing import Any
 
 from .indexer_logging import get_logger
 from .watcher.handler import IndexingEventHandler
+from .watcher.scheduler import ProjectScheduler
 
 logger = get_logger()
 
@@ -31,7 +32,12 @@ class IndexingService:
         self.config_file = config_file or str(
             Path.home() / ".claude-indexer" / "config.json"
         )
-        self.observers: dict[str, Observer] = {}
+        # One observer thread watches every project; their batches share one
+        # bounded worker pool instead of indexing on per-project threads.
+        self.observer: Observer | None = None
+        self.watches: dict[str, Any] = {}
+        self.handlers: dict[str, IndexingEventHandler] = {}
+        self.scheduler: ProjectScheduler | None = None
         self.running = False
 
         # Setup signal handlers for graceful shutdown
@@ -144,7 +150,7 @@ class IndexingService:
                 logger.info(f"✅ Removed project: {project_path}")
 
                 # Stop watching if service is running
-                if self.running and project_path in self.observers:
+                if self.running and project_path in self.watches:
                     self._stop_project_watcher(project_path)
 
                 return True
@@ -175,6 +181,11 @@ class IndexingService:
 
             logger.info(f"🚀 Starting indexing service for {len(projects)} projects...")
 
+            self.observer = Observer()
+            self.observer.start()
+            self.scheduler = self._create_scheduler(global_settings)
+            self.scheduler.start()
+
             # Start watchers for each project
             for project in projects:
                 if project.get("enabled", True):
@@ -186,7 +197,7 @@ class IndexingService:
 
             self.running = True
             logger.info(
-                f"✅ Service started with {len(self.observers)} active watchers"
+                f"✅ Service started with {len(self.watches)} active watchers"
             )
 
             # Keep service running
@@ -212,15 +223,29 @@ class IndexingService:
         try:
             logger.info("🛑 Stopping indexing service...")
 
-            # Stop all observers
-            for project_path, observer in self.observers.items():
-                observer.stop()
-                observer.join(timeout=5)
+            # Stop watching first so no new batches are queued
+            if self.observer is not None:
+                self.observer.stop()
+                self.observer.join(timeout=5)
+                self.observer = None
+            for project_path, handler in self.handlers.items():
+                handler.coalescer.stop()
                 logger.info(f"   Stopped watcher for {project_path}")
 
-            self.observers.clear()
+            self.watches.clear()
+            self.handlers.clear()
+
+            # Let in-flight batches finish before the sessions are closed
+            if self.scheduler is not None:
+                self.scheduler.stop()
+                self.scheduler = None
             self.running = False
 
+            # Release the warm indexing sessions the watchers shared
+            from .main import close_indexing_sessions
+
+            close_indexing_sessions()
+
             logger.info("✅ Service stopped")
             return True
 
@@ -239,24 +264,42 @@ class IndexingService:
         """Get service status."""
         config = self.load_config()
 
+        queues = self.scheduler.get_status() if self.scheduler else {}
+        observer_alive = self.observer is not None and self.observer.is_alive()
+
         watchers_status = {}
-        for project_path, observer in self.observers.items():
+        for project_path, handler in self.handlers.items():
+            queue = queues.get(str(handler.project_path), {})
             watchers_status[project_path] = {
-                "running": observer.is_alive(),
-                "watch_count": len(observer.watches)
-                if hasattr(observer, "watches")
-                else 0,
+                "running": observer_alive,
+                "watch_count": 1,
+                "queue_depth": queue.get("queue_depth", 0),
+                "lag_seconds": queue.get("lag_seconds", 0.0),
+                "indexing": queue.get("in_flight", False),
             }
 
         return {
             "running": self.running,
             "config_file": self.config_file,
             "total_projects": len(config.get("projects", [])),
-            "active_watchers": len(self.observers),
+            "active_watchers": len(self.watches),
             "watchers": watchers_status,
+            "scheduler": self.scheduler.get_stats() if self.scheduler else {},
             "settings": config.get("settings", {}),
         }
 
+    def _create_scheduler(self, global_settings: dict[str, Any]) -> ProjectScheduler:
+        """Create the worker pool shared by all watched projects."""
+        from .indexing.batch_optimizer import BatchOptimizer
+
+        return ProjectScheduler(
+            max_workers=global_settings.get("index_workers", 2),
+            max_lag_seconds=global_settings.get("max_lag_seconds", 30.0),
+            batch_optimizer=BatchOptimizer(
+                memory_threshold_mb=global_settings.get("memory_threshold_mb", 2000)
+            ),
+        )
+
     def _start_project_watcher(
         self, project_config: dict[str, Any], global_settings: dict[str, Any]
     ) -> bool:
@@ -298,14 +341,19 @@ class IndexingService:
                 debounce_seconds=debounce_seconds,
                 settings=settings,
                 verbose=config.indexer_verbose,  # Use config setting
+                scheduler=self.scheduler,
+            )
+            self.scheduler.register(
+                str(event_handler.project_path),
+                collection_name,
+                event_handler._process_file_batch,
             )
 
-            # Create and start observer
-            observer = Observer()
-            observer.schedule(event_handler, project_path, recursive=True)
-            observer.start()
-
-            self.observers[project_path] = observer
+            # Add the project to the shared observer
+            self.watches[project_path] = self.observer.schedule(
+                event_handler, project_path, recursive=True
+            )
+            self.handlers[project_path] = event_handler
             logger.info(f"👁️  Watching: {project_path} -> {collection_name}")
 
             return True
@@ -316,14 +364,14 @@ class IndexingService:
 
     def _stop_project_watcher(self, project_path: str) -> bool:
         """Stop watcher for a single project."""
-        if project_path not in self.observers:
+        if project_path not in self.watches:
             return True
 
         try:
-            observer = self.observers[project_path]
-            observer.stop()
-            observer.join(timeout=5)
-            del self.observers[project_path]
+            self.observer.unschedule(self.watches.pop(project_path))
+            handler = self.handlers.pop(project_path)
+            handler.coalescer.stop()
+            self.scheduler.unregister(str(handler.project_path))
 
             logger.info(f"⏹️  Stopped watching: {project_path}")
             return True
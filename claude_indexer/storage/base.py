@@ -3,7 +3,10 @@
 import hashlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ..embeddings.base import SparseEmbedding
 
 
 @dataclass
@@ -74,7 +77,7 @@ class HybridVectorPoint:
 
     id: str | int
     dense_vector: list[float]
-    sparse_vector: list[float]
+    sparse_vector: "list[float] | SparseEmbedding"
     payload: dict[str, Any]
 
     def __post_init__(self) -> None:
@@ -427,11 +430,45 @@ class CachingVectorStore(VectorStore):
                 f"Backend {type(self.backend)} does not support check_content_exists"
             )
 
+    def find_existing_content_hashes(
+        self, collection_name: str, content_hashes: list[str]
+    ) -> set[str]:
+        """Delegate batched content hash checking to backend."""
+        if hasattr(self.backend, "find_existing_content_hashes"):
+            return set(
+                self.backend.find_existing_content_hashes(
+                    collection_name, content_hashes
+                )
+            )
+        else:
+            raise AttributeError(
+                f"Backend {type(self.backend)} does not support find_existing_content_hashes"
+            )
+
+    def find_existing_point_ids(
+        self, collection_name: str, point_ids: list[int]
+    ) -> set[int]:
+        """Delegate batched point existence checking to backend."""
+        if hasattr(self.backend, "find_existing_point_ids"):
+            return set(self.backend.find_existing_point_ids(collection_name, point_ids))
+        else:
+            raise AttributeError(
+                f"Backend {type(self.backend)} does not support find_existing_point_ids"
+            )
+
     def _cleanup_orphaned_relations(
-        self, collection_name: str, verbose: bool = False, force: bool = False
+        self,
+        collection_name: str,
+        verbose: bool = False,
+        force: bool = False,
+        relation_index: Any = None,
     ) -> Any:
         """Delegate orphaned relation cleanup to backend"""
         if hasattr(self.backend, "_cleanup_orphaned_relations"):
+            if relation_index is not None:
+                return self.backend._cleanup_orphaned_relations(
+                    collection_name, verbose, force, relation_index=relation_index
+                )
             return self.backend._cleanup_orphaned_relations(
                 collection_name, verbose, force
             )
@@ -471,6 +508,24 @@ class CachingVectorStore(VectorStore):
                 f"Backend {type(self.backend)} does not support _scroll_collection"
             )
 
+    def _iter_scroll_collection(
+        self,
+        collection_name: str,
+        scroll_filter: Any = None,
+        limit: int = 1000,
+        with_payload: bool | list[str] = True,
+        with_vectors: bool = False,
+    ) -> Any:
+        """Delegate streaming scroll to backend."""
+        if hasattr(self.backend, "_iter_scroll_collection"):
+            return self.backend._iter_scroll_collection(
+                collection_name, scroll_filter, limit, with_payload, with_vectors
+            )
+        else:
+            raise AttributeError(
+                f"Backend {type(self.backend)} does not support _iter_scroll_collection"
+            )
+
     @property
     def client(self) -> Any:
         """Delegate client access to backend for Git+Meta orphan cleanup compatibility."""
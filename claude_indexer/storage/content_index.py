@@ -0,0 +1,137 @@
+"""Bloom-filter index of stored content hashes for batched deduplication."""
+
+import math
+import threading
+from collections.abc import Iterable
+
+# Target false-positive rate; positives are always confirmed against Qdrant
+DEFAULT_FALSE_POSITIVE_RATE = 0.01
+
+# Smallest filter allocated for a collection (~12 KB of bits)
+MIN_CAPACITY = 10_000
+
+
+class BloomFilter:
+    """Fixed-size bloom filter keyed by hex SHA-256 digests.
+
+    The keys are already uniformly distributed, so bit positions are
+    derived from two 64-bit slices of the digest (double hashing) instead
+    of hashing again.
+    """
+
+    def __init__(
+        self, capacity: int, false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE
+    ) -> None:
+        self.capacity = max(1, capacity)
+        bits = -self.capacity * math.log(false_positive_rate) / (math.log(2) ** 2)
+        self.num_bits = max(8, int(bits))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, digest: str) -> Iterable[int]:
+        h1 = int(digest[:16], 16)
+        h2 = int(digest[16:32], 16) | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, digest: str) -> None:
+        """Add a hex digest to the filter."""
+        for pos in self._positions(digest):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, digest: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(digest)
+        )
+
+
+class ContentHashIndex:
+    """Local record of which content hashes a collection holds.
+
+    The filter only answers "definitely not stored" once it has been seeded
+    from a full scan of the collection; until then every hash is a
+    candidate for the batched Qdrant lookup. Hashes of points written
+    through this process are added as they are upserted. Deletions are
+    not tracked, so stale positives simply fall through to the lookup.
+    Content written by another process after seeding is re-embedded at
+    worst, which is safe because point IDs are deterministic.
+    """
+
+    def __init__(self, collection_size: int, seed_ratio: float = 10.0) -> None:
+        # Points in the collection when the index was created
+        self.collection_size = collection_size
+        # Seed once lookups reach 1/seed_ratio of the collection size, so the
+        # scan never costs more than a constant factor of lookups already made
+        self.seed_ratio = seed_ratio
+        self.seeded = False
+        self.lookups = 0
+        self._filter: BloomFilter | None = None
+        # Hashes upserted while a seeding scan is running
+        self._pending: list[str] | None = None
+        self._lock = threading.Lock()
+
+    def begin_seed(self, upcoming: int) -> bool:
+        """Claim the seeding scan if cumulative lookups now justify one.
+
+        Args:
+            upcoming: Number of hashes about to be looked up
+
+        Returns:
+            True if the caller should scan the collection and call ``seed``
+        """
+        with self._lock:
+            if self.seeded or self._pending is not None:
+                return False
+            if (self.lookups + upcoming) * self.seed_ratio < self.collection_size:
+                return False
+            self._pending = []
+            return True
+
+    def seed(self, hashes: Iterable[str]) -> None:
+        """Build the filter from every hash stored in the collection."""
+        bloom = BloomFilter(max(2 * self.collection_size, MIN_CAPACITY))
+        for content_hash in hashes:
+            if content_hash:
+                bloom.add(content_hash)
+        with self._lock:
+            # Upserts that raced the scan may not have been visible to it
+            for content_hash in self._pending or []:
+                bloom.add(content_hash)
+            self._filter = bloom
+            self._pending = None
+            self.seeded = True
+
+    def abort_seed(self) -> None:
+        """Give up on a seeding scan that failed part way."""
+        with self._lock:
+            self._pending = None
+
+    def add(self, hashes: Iterable[str]) -> None:
+        """Record hashes of points that were just stored."""
+        with self._lock:
+            if self._pending is not None:
+                self._pending.extend(h for h in hashes if h)
+                return
+            if self._filter is None:
+                return
+            for content_hash in hashes:
+                if content_hash:
+                    self._filter.add(content_hash)
+            if self._filter.count > self._filter.capacity:
+                # Over capacity the false-positive rate climbs; reseed later
+                self.collection_size = self._filter.count
+                self._filter = None
+                self.seeded = False
+                self.lookups = 0
+
+    def candidates(self, hashes: Iterable[str]) -> list[str]:
+        """Return the hashes that might already be stored."""
+        hashes = list(hashes)
+        with self._lock:
+            self.lookups += len(hashes)
+            if not self.seeded or self._filter is None:
+                return hashes
+            bloom = self._filter
+            return [h for h in hashes if h in bloom]
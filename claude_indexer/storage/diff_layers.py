@@ -170,8 +170,8 @@ class EnhancedOrphanCleanup:
 
         qdrant_store = self._get_qdrant_store()
 
-        # Use existing _scroll_collection method
-        metadata_points = qdrant_store._scroll_collection(
+        # Stream metadata chunks, fetching only the name and grouped headers
+        metadata_points = qdrant_store._iter_scroll_collection(
             collection_name=collection_name,
             scroll_filter=models.Filter(
                 must=[
@@ -181,8 +181,7 @@ class EnhancedOrphanCleanup:
                 ]
             ),
             limit=1000,
-            with_vectors=False,
-            handle_pagination=True,
+            with_payload=["entity_name", "metadata.headers"],
         )
 
         # Build set of existing entity names
@@ -209,15 +208,10 @@ class EnhancedOrphanCleanup:
         """Clean up relations orphaned by content hash changes
 
         Note: For 66x performance improvement, use:
-        - self._get_qdrant_store()._get_all_relations() instead of manual scroll
+        - self._get_qdrant_store()._iter_relations() instead of manual scroll
         - self._batch_get_existing_entities() instead of individual lookups
         """
-        from qdrant_client.models import (
-            FieldCondition,
-            Filter,
-            MatchValue,
-            PointIdsList,
-        )
+        from qdrant_client.models import FieldCondition, MatchValue, PointIdsList
 
         # Scenario 1: Entity content changed, hash changed, old relations point to old entity
         # Scenario 2: Entity deleted but relations still reference it
@@ -226,30 +220,24 @@ class EnhancedOrphanCleanup:
         orphaned_count = 0
 
         try:
-            # Get all relations using optimized approach with file filtering
             qdrant_store = self._get_qdrant_store()
 
+            # Get all existing entities in batch (221x faster than individual queries)
+            existing_entities = self._batch_get_existing_entities(collection_name)
+
+            # Stream relations (optionally for one file) with only the endpoint names
+            conditions = []
             if file_path:
-                # File-specific relations - use optimized pagination
-                relation_filter = [
+                conditions.append(
                     FieldCondition(
-                        key="chunk_type", match=MatchValue(value="relation")
-                    ),
-                    FieldCondition(key="metadata.file_path", match=MatchValue(value=file_path)),
-                ]
-                all_relations = qdrant_store._scroll_collection(
-                    collection_name=collection_name,
-                    scroll_filter=Filter(must=relation_filter),
-                    limit=1000,
-                    with_vectors=False,
-                    handle_pagination=True,
+                        key="metadata.file_path", match=MatchValue(value=file_path)
+                    )
                 )
-            else:
-                # All relations - use existing optimized method
-                all_relations = qdrant_store._get_all_relations(collection_name)
-
-            # Get all existing entities in batch (221x faster than individual queries)
-            existing_entities = self._batch_get_existing_entities(collection_name)
+            all_relations = qdrant_store._iter_relations(
+                collection_name,
+                conditions=conditions,
+                with_payload=["entity_name", "relation_target"],
+            )
 
             orphaned_points = []
 
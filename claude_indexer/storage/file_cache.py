@@ -44,7 +44,8 @@ class FileHashCache:
         # Thread safety
         self._lock = Lock()
 
-        # In-memory cache: {relative_path: {"hash": str, "mtime": float, "size": int}}
+        # In-memory cache: {relative_path: {"hash": str, "mtime": float, "size": int,
+        # "parse_ms": float}}
         self._cache: dict[str, dict[str, Any]] = {}
 
         # Track changes this session
@@ -209,12 +210,16 @@ class FileHashCache:
                 stat = file_path.stat()
                 rel_path = self.get_relative_path(file_path)
 
-                self._cache[rel_path] = {
+                entry = {
                     "hash": self.compute_file_hash(file_path),
                     "mtime": stat.st_mtime,
                     "size": stat.st_size,
                     "indexed_at": time.time(),
                 }
+                parse_ms = self._cache.get(rel_path, {}).get("parse_ms")
+                if parse_ms is not None:
+                    entry["parse_ms"] = parse_ms
+                self._cache[rel_path] = entry
             except Exception as e:
                 self.logger.debug(f"Failed to update cache for {file_path}: {e}")
 
@@ -230,6 +235,34 @@ class FileHashCache:
         # Save cache after batch update
         self._save_cache()
 
+    def get_parse_times(self, files: list[Path]) -> dict[Path, float]:
+        """Get last measured parse times for scheduling parallel parsing.
+
+        Args:
+            files: Files about to be parsed
+
+        Returns:
+            Parse time in milliseconds for each file that has one recorded
+        """
+        with self._lock:
+            times = {}
+            for file_path in files:
+                cached = self._cache.get(self.get_relative_path(file_path))
+                if cached and "parse_ms" in cached:
+                    times[file_path] = cached["parse_ms"]
+            return times
+
+    def record_parse_times(self, times: dict[Path, float]) -> None:
+        """Record measured parse times; saved with the next cache update.
+
+        Args:
+            times: Parse time in milliseconds per file
+        """
+        with self._lock:
+            for file_path, parse_ms in times.items():
+                rel_path = self.get_relative_path(file_path)
+                self._cache.setdefault(rel_path, {})["parse_ms"] = round(parse_ms, 2)
+
     def remove(self, file_path: Path) -> None:
         """Remove file from cache (e.g., when deleted).
 
@@ -1,16 +1,25 @@
 """Qdrant vector store implementation."""
 
+import contextlib
 import hashlib
+import threading
 import time
 import warnings
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
 from ..indexer_logging import get_logger
 from .base import ManagedVectorStore, StorageResult, VectorPoint, HybridVectorPoint
+from .content_index import ContentHashIndex
+from .relation_index import ModuleNameResolver, RelationIndex
+from .relation_index import is_file_reference as is_external_file_reference
 
 if TYPE_CHECKING:
     from ..analysis.entities import EntityChunk, Relation, RelationChunk
     from ..chat.parser import ChatChunk
+    from ..embeddings.base import SparseEmbedding
     from .query_cache import QueryResultCache
 
 logger = get_logger()
@@ -98,6 +107,7 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
         enable_query_cache: bool = False,
         query_cache: "QueryResultCache | None" = None,
         query_cache_ttl: float = 60.0,
+        upsert_concurrency: int = 4,
         **kwargs,  # noqa: ARG002
     ):
         if not QDRANT_AVAILABLE:
@@ -118,28 +128,45 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
         self.api_key = api_key
         self.timeout = timeout
 
+        # Number of upsert batches in flight at once
+        self.upsert_concurrency = max(1, upsert_concurrency)
+
         # Cache for collection sparse vector support
         self._sparse_vector_cache = {}
 
+        # Per-collection bloom filters of stored content hashes
+        self._content_indexes: dict[str, ContentHashIndex] = {}
+        self._content_index_lock = threading.Lock()
+
         # Query result cache for search operations
         self._query_cache: "QueryResultCache | None" = query_cache
         if enable_query_cache and query_cache is None:
             from .query_cache import QueryResultCache
             self._query_cache = QueryResultCache(ttl_seconds=query_cache_ttl)
 
+        # Suppress the insecure connection warning for development. Installed
+        # once here: catch_warnings() swaps process-wide filters and is not
+        # safe around the upserts that run on worker threads.
+        warnings.filterwarnings(
+            "ignore", message="Api key is used with an insecure connection"
+        )
+
         # Initialize client
         try:
-            # Suppress insecure connection warning for development
-            with warnings.catch_warnings():
-                warnings.filterwarnings(
-                    "ignore", message="Api key is used with an insecure connection"
-                )
+            if url == ":memory:":
+                self.client = QdrantClient(location=url)
+            else:
                 self.client = QdrantClient(url=url, api_key=api_key, timeout=timeout)
             # Test connection
             self.client.get_collections()
         except Exception as e:
             raise ConnectionError(f"Failed to connect to Qdrant at {url}: {e}") from None
 
+        # The embedded (local) client is not thread-safe; serialize its writes
+        self._write_guard: Any = (
+            threading.Lock() if url == ":memory:" else contextlib.nullcontext()
+        )
+
     def create_collection(
         self, collection_name: str, vector_size: int, distance_metric: str = "cosine"
     ) -> StorageResult:
@@ -278,6 +305,7 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
 
             # Invalidate query cache for this collection
             self.invalidate_query_cache(collection_name)
+            self._content_indexes.pop(collection_name, None)
 
             return StorageResult(
                 success=True,
@@ -445,20 +473,8 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
         if has_sparse_vectors:
             # Collection supports sparse vectors - create named vector format
             for point in hybrid_points:
-                # Handle BM25 sparse vector - could be SparseVector object or list
-                if hasattr(point.sparse_vector, 'indices'):
-                    # Already a SparseVector object from BM25
-                    sparse_vector = point.sparse_vector
-                else:
-                    # Convert list to SparseVector (optimized single-pass)
-                    indices = []
-                    values = []
-                    for i, val in enumerate(point.sparse_vector):
-                        if val > 0:
-                            indices.append(i)
-                            values.append(val)
-                    sparse_vector = SparseVector(indices=indices, values=values)
-                
+                sparse_vector = self._to_sparse_vector(point.sparse_vector)
+
                 # Pre-create named vectors dictionary (avoid per-point dict creation)
                 qdrant_points.append(PointStruct(
                     id=point.id, 
@@ -504,6 +520,7 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
             start_time=start_time,
             max_batch_size=1000,  # Configurable batch size
             max_retries=3,
+            max_in_flight=self.upsert_concurrency,
         )
 
     def _deduplicate_points(
@@ -544,8 +561,15 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
         start_time: float,
         max_batch_size: int = 1000,
         max_retries: int = 3,
+        max_in_flight: int = 1,
     ) -> StorageResult:
-        """Reliable batch upsert with splitting, timeout handling, and retry logic."""
+        """Reliable batch upsert with splitting, timeout handling, and retry logic.
+
+        When there is more than one batch, up to ``max_in_flight`` of them are
+        sent concurrently with ``wait=False``, each keeping its own retry and
+        backoff. A single acknowledged write afterwards acts as the
+        consistency barrier before the stored count is verified.
+        """
 
         # Split into batches
         batches = self._split_into_batches(qdrant_points, max_batch_size)
@@ -611,23 +635,40 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
                     f"✅ After deduplication: {len(qdrant_points)} unique points in {len(batches)} batches"
                 )
 
-        # Process each batch with retry logic
+        # Process batches concurrently, each with its own retry logic.
+        # A lone batch is simply acknowledged and needs no separate barrier.
+        in_flight = max(1, min(max_in_flight, len(batches)))
+        pipelined = len(batches) > 1
+
+        def upsert_batch(numbered_batch: tuple[int, list[PointStruct]]) -> StorageResult:
+            i, batch = numbered_batch
+            return self._upsert_batch_with_retry(
+                collection_name,
+                batch,
+                batch_num=i + 1,
+                max_retries=max_retries,
+                wait=not pipelined,
+            )
+
+        if in_flight > 1:
+            logger.debug(f"🚀 Upserting {len(batches)} batches, {in_flight} in flight")
+            with ThreadPoolExecutor(
+                max_workers=in_flight, thread_name_prefix="qdrant-upsert"
+            ) as pool:
+                batch_results = list(pool.map(upsert_batch, enumerate(batches)))
+        else:
+            batch_results = [upsert_batch(item) for item in enumerate(batches)]
+
         total_processed = 0
         total_failed = 0
         all_errors = []
+        barrier_point = None
 
-        for i, batch in enumerate(batches):
-            if len(batches) > 1:
-                logger.debug(
-                    f"📦 Processing batch {i + 1}/{len(batches)} ({len(batch)} points)"
-                )
-
-            batch_result = self._upsert_batch_with_retry(
-                collection_name, batch, batch_num=i + 1, max_retries=max_retries
-            )
-
+        for i, (batch, batch_result) in enumerate(zip(batches, batch_results, strict=True)):
             if batch_result.success:
                 total_processed += batch_result.items_processed
+                barrier_point = batch[-1]
+                self._record_content_hashes(collection_name, batch)
                 if len(batches) > 1:
                     logger.debug(
                         f"✅ Batch {i + 1} succeeded: {batch_result.items_processed} points"
@@ -643,6 +684,20 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
                 all_errors.extend(batch_result.errors)
                 logger.error(f"❌ Batch {i + 1} failed: {batch_result.errors}")
 
+        # Consistency barrier: updates apply in order, so once one acknowledged
+        # write completes, every earlier unacknowledged batch has been applied
+        if pipelined and barrier_point is not None:
+            barrier_result = self._upsert_batch_with_retry(
+                collection_name,
+                [barrier_point],
+                batch_num=len(batches) + 1,
+                max_retries=max_retries,
+                wait=True,
+            )
+            if not barrier_result.success:
+                total_failed += 1
+                all_errors.extend(barrier_result.errors)
+
         # Verify storage count
         verification_result = self._verify_storage_count(
             collection_name, total_processed, len(qdrant_points)
@@ -681,19 +736,23 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
         batch: list[PointStruct],
         batch_num: int,
         max_retries: int,
+        wait: bool = True,
     ) -> StorageResult:
-        """Upsert a single batch with retry logic."""
+        """Upsert a single batch with retry logic.
+
+        With ``wait=False`` the write is acknowledged once Qdrant has accepted
+        it, before it is applied; see ``_reliable_batch_upsert`` for the barrier.
+        """
         from qdrant_client.http.exceptions import ResponseHandlingException
 
         start_time = time.time()
 
         for attempt in range(max_retries):
             try:
-                with warnings.catch_warnings():
-                    warnings.filterwarnings(
-                        "ignore", message="Api key is used with an insecure connection"
+                with self._write_guard:
+                    self.client.upsert(
+                        collection_name=collection_name, points=batch, wait=wait
                     )
-                    self.client.upsert(collection_name=collection_name, points=batch, wait=True)
 
                 # Success!
                 return StorageResult(
@@ -964,7 +1023,7 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
         collection_name: str,
         query_vector: list[float] = None,
         dense_vector: list[float] = None,
-        sparse_vector: list[float] = None,
+        sparse_vector: "list[float] | SparseEmbedding" = None,
         search_mode: str = "semantic",
         limit: int = 10,
         score_threshold: float = 0.0,
@@ -977,7 +1036,8 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
             collection_name: Name of the collection to search
             query_vector: Vector for backward compatibility (alias for dense_vector)
             dense_vector: Dense vector for semantic search
-            sparse_vector: Sparse vector for keyword search
+            sparse_vector: Sparse vector for keyword search, as a
+                ``SparseEmbedding`` or a legacy dense list
             search_mode: "semantic", "keyword", or "hybrid"
             limit: Maximum number of results
             score_threshold: Minimum score threshold
@@ -1036,10 +1096,7 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
                 
             elif search_mode == "keyword":
                 # Sparse vector search only
-                sparse_query = SparseVector(
-                    indices=[i for i, val in enumerate(sparse_vector) if val > 0],
-                    values=[val for val in sparse_vector if val > 0]
-                )
+                sparse_query = self._to_sparse_vector(sparse_vector)
                 
                 search_results = self.client.search(
                     collection_name=collection_name,
@@ -1190,7 +1247,7 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
         self,
         collection_name: str,
         dense_vector: list[float],
-        sparse_vector: list[float],
+        sparse_vector: "list[float] | SparseEmbedding",
         limit: int,
         score_threshold: float,
         query_filter: Filter = None,
@@ -1206,7 +1263,8 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
         Args:
             collection_name: Name of the collection
             dense_vector: Dense vector for semantic search
-            sparse_vector: Sparse vector for keyword search
+            sparse_vector: Sparse vector for keyword search, as a
+                ``SparseEmbedding`` or a legacy dense list
             limit: Number of results to return
             score_threshold: Minimum score threshold
             query_filter: Optional filter conditions
@@ -1227,10 +1285,7 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
             search_limit = max(limit * 3, 50)  # Get 3x more results for better fusion
 
             # Build sparse query once (used by sparse search function)
-            sparse_query = SparseVector(
-                indices=[i for i, val in enumerate(sparse_vector) if val > 0],
-                values=[val for val in sparse_vector if val > 0]
-            )
+            sparse_query = self._to_sparse_vector(sparse_vector)
 
             # Define search functions for parallel execution
             def dense_search():
@@ -1359,6 +1414,25 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
         
         return filtered_results[:limit]
 
+    @staticmethod
+    def _to_sparse_vector(vector: "list[float] | SparseEmbedding | SparseVector") -> SparseVector:
+        """Convert a sparse embedding to a Qdrant ``SparseVector``.
+
+        ``SparseEmbedding`` and ``SparseVector`` inputs already carry their
+        indices and values and are copied across without densifying. Legacy
+        dense lists are scanned once for positive weights.
+        """
+        if hasattr(vector, "indices"):
+            return SparseVector(indices=list(vector.indices), values=list(vector.values))
+
+        indices = []
+        values = []
+        for i, val in enumerate(vector):
+            if val > 0:
+                indices.append(i)
+                values.append(val)
+        return SparseVector(indices=indices, values=values)
+
     def _collection_has_sparse_vectors(self, collection_name: str) -> bool:
         """Check if a collection supports sparse vectors with retry for timing issues.
 
@@ -1529,101 +1603,128 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
             logger.error(f"Unexpected error listing collections: {e}")
             return []
 
-    def _scroll_collection(
+    def _iter_scroll_collection(
         self,
         collection_name: str,
         scroll_filter: Any | None = None,
         limit: int = 1000,
+        with_payload: bool | list[str] = True,
         with_vectors: bool = False,
-        handle_pagination: bool = True,
-    ) -> list[Any]:
+    ) -> Iterator[Any]:
         """
-        Unified scroll method for retrieving points from a collection.
+        Stream points from a collection one page at a time.
+
+        Only the current page is held in memory, so callers that reduce points
+        as they go (names, ids) run in constant memory regardless of collection
+        size. Pass a list of payload keys (nested keys use dots, e.g.
+        ``"metadata.file_path"``) to project the payload server-side.
 
         Args:
             collection_name: Name of the collection to scroll
-            scroll_filter: Optional filter to apply during scrolling
-            limit: Maximum number of points per page (default: 1000)
+            scroll_filter: Optional filter applied server-side
+            limit: Number of points per page (default: 1000)
+            with_payload: True for the full payload, or a list of keys to return
             with_vectors: Whether to include vectors in results (default: False)
-            handle_pagination: If True, retrieves all pages; if False, only first page
-
-        Returns:
-            List of points matching the criteria
-        """
-        try:
-            all_points = []
-            offset = None
-            seen_offsets = set()  # Track seen offsets to prevent infinite loops
-            max_iterations = 1000  # Safety limit to prevent runaway loops
-            iteration = 0
 
-            # logger.debug(
-            #     f"Starting scroll operation for collection {collection_name}, limit={limit}, handle_pagination={handle_pagination}"
-            # )
+        Yields:
+            Points matching the criteria
 
-            while True:
-                iteration += 1
+        Raises:
+            Exception: Client errors other than a missing collection propagate,
+                so a partial scan is never mistaken for a complete one
+        """
+        offset = None
+        seen_offsets = set()  # Track seen offsets to prevent infinite loops
+        max_iterations = 1000  # Safety limit to prevent runaway loops
+        iteration = 0
 
-                # Safety check: prevent infinite loops with iteration limit
-                if iteration > max_iterations:
-                    logger.warning(
-                        f"Scroll operation hit max iterations ({max_iterations}) for collection {collection_name}"
-                    )
-                    break
+        while True:
+            iteration += 1
 
-                # logger.debug(f"Scroll iteration {iteration}, offset={offset}")
+            # Safety check: prevent infinite loops with iteration limit
+            if iteration > max_iterations:
+                logger.warning(
+                    f"Scroll operation hit max iterations ({max_iterations}) for collection {collection_name}"
+                )
+                return
 
-                scroll_result = self.client.scroll(
+            try:
+                points, next_offset = self.client.scroll(
                     collection_name=collection_name,
                     scroll_filter=scroll_filter,
                     limit=limit,
                     offset=offset,
-                    with_payload=True,
+                    with_payload=with_payload,
                     with_vectors=with_vectors,
                 )
+            except Exception as e:
+                # Check if collection doesn't exist
+                if "doesn't exist" in str(e) or "Not found" in str(e):
+                    logger.warning(
+                        f"Collection '{collection_name}' doesn't exist - returning empty result"
+                    )
+                    return
+                raise
+
+            logger.debug(
+                f"Retrieved {len(points)} points, next_offset={next_offset}, page={iteration}"
+            )
+            yield from points
 
-                points, next_offset = scroll_result
-                all_points.extend(points)
+            if next_offset is None:
+                return
 
-                logger.debug(
-                    f"Retrieved {len(points)} points, next_offset={next_offset}, total_points={len(all_points)}"
+            # CRITICAL FIX: Infinite loop protection - check if we've seen this offset before
+            offset_key = str(next_offset)  # Convert to string for set membership
+            if offset_key in seen_offsets:
+                logger.warning(
+                    f"Detected offset loop in collection {collection_name} at iteration {iteration}. "
+                    f"Offset {next_offset} already seen. Breaking pagination to prevent infinite loop."
                 )
+                return
 
-                # Handle pagination if requested and more results exist
-                if handle_pagination and next_offset is not None:
-                    # CRITICAL FIX: Infinite loop protection - check if we've seen this offset before
-                    offset_key = str(
-                        next_offset
-                    )  # Convert to string for set membership
-                    if offset_key in seen_offsets:
-                        logger.warning(
-                            f"Detected offset loop in collection {collection_name} at iteration {iteration}. "
-                            f"Offset {next_offset} already seen. Breaking pagination to prevent infinite loop."
-                        )
-                        break
+            seen_offsets.add(offset_key)
+            offset = next_offset
 
-                    seen_offsets.add(offset_key)
-                    offset = next_offset
-                    logger.debug(f"Advancing to next page with offset {next_offset}")
-                else:
-                    # logger.debug(
-                    #     f"Pagination complete: handle_pagination={handle_pagination}, next_offset={next_offset}"
-                    # )
-                    break
+    def _scroll_collection(
+        self,
+        collection_name: str,
+        scroll_filter: Any | None = None,
+        limit: int = 1000,
+        with_vectors: bool = False,
+        handle_pagination: bool = True,
+        with_payload: bool | list[str] = True,
+    ) -> list[Any]:
+        """
+        Unified scroll method for retrieving points from a collection.
+
+        Materializes the result; prefer ``_iter_scroll_collection`` for scans
+        over the whole collection.
+
+        Args:
+            collection_name: Name of the collection to scroll
+            scroll_filter: Optional filter to apply during scrolling
+            limit: Maximum number of points per page (default: 1000)
+            with_vectors: Whether to include vectors in results (default: False)
+            handle_pagination: If True, retrieves all pages; if False, only first page
+            with_payload: True for the full payload, or a list of keys to return
 
-            # logger.debug(
-            #     f"Scroll operation completed for collection {collection_name}: "
-            #     f"{len(all_points)} total points retrieved in {iteration} iterations"
-            # )
-            return all_points
+        Returns:
+            List of points matching the criteria
+        """
+        try:
+            points = self._iter_scroll_collection(
+                collection_name,
+                scroll_filter=scroll_filter,
+                limit=limit,
+                with_payload=with_payload,
+                with_vectors=with_vectors,
+            )
+            if not handle_pagination:
+                return list(islice(points, limit))
+            return list(points)
 
         except Exception as e:
-            # Check if collection doesn't exist
-            if "doesn't exist" in str(e) or "Not found" in str(e):
-                logger.warning(
-                    f"Collection '{collection_name}' doesn't exist - returning empty result"
-                )
-                return []
             # Log error and return empty list
             logger.error(f"Error in _scroll_collection for {collection_name}: {e}")
             return []
@@ -1638,6 +1739,7 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
             preserve_manual: If True, only delete auto-generated memories (entities with file_path or relations with entity_name/relation_target/relation_type)
         """
         start_time = time.time()
+        self._content_indexes.pop(collection_name, None)
 
         try:
             # Check if collection exists
@@ -1657,13 +1759,16 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
                 # Count points before deletion for reporting
                 count_before = self.client.count(collection_name=collection_name).count
 
-                # Get all points to identify auto-generated content
-                # Use helper to get all points with pagination
-                all_points = self._scroll_collection(
+                # Stream only the fields needed to identify auto-generated content
+                all_points = self._iter_scroll_collection(
                     collection_name=collection_name,
                     limit=10000,  # Large page size for efficiency
-                    with_vectors=False,
-                    handle_pagination=True,
+                    with_payload=[
+                        "metadata.file_path",
+                        "entity_name",
+                        "relation_target",
+                        "relation_type",
+                    ],
                 )
 
                 # Find points that are auto-generated (code-indexed entities or relations)
@@ -1776,7 +1881,7 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
         self, 
         chunk: "EntityChunk", 
         dense_embedding: list[float], 
-        sparse_embedding: list[float], 
+        sparse_embedding: "list[float] | SparseEmbedding",
         collection_name: str
     ) -> HybridVectorPoint:
         """Create a hybrid vector point from an EntityChunk with both dense and sparse embeddings.
@@ -1784,7 +1889,7 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
         Args:
             chunk: EntityChunk to create point from
             dense_embedding: Dense vector embedding (e.g., from OpenAI/Voyage)
-            sparse_embedding: Sparse vector embedding (e.g., from BM25)
+            sparse_embedding: Sparse vector embedding (e.g., ``SparseEmbedding`` from BM25)
             collection_name: Name of the collection
             
         Returns:
@@ -1810,7 +1915,7 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
         self, 
         relation: "Relation", 
         dense_embedding: list[float], 
-        sparse_embedding: list[float], 
+        sparse_embedding: "list[float] | SparseEmbedding",
         collection_name: str
     ) -> HybridVectorPoint:
         """Create a hybrid vector point from a Relation with both dense and sparse embeddings.
@@ -1818,7 +1923,7 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
         Args:
             relation: Relation to create point from
             dense_embedding: Dense vector embedding (e.g., from OpenAI/Voyage)
-            sparse_embedding: Sparse vector embedding (e.g., from BM25)
+            sparse_embedding: Sparse vector embedding (e.g., ``SparseEmbedding`` from BM25)
             collection_name: Name of the collection
             
         Returns:
@@ -1954,8 +2059,8 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
             # Use helper to get all entities with pagination
             from qdrant_client import models
 
-            # Get all entities (type != "relation")
-            points = self._scroll_collection(
+            # Stream all entities (type != "relation"), fetching only their names
+            points = self._iter_scroll_collection(
                 collection_name=collection_name,
                 scroll_filter=models.Filter(
                     must_not=[
@@ -1965,8 +2070,7 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
                     ]
                 ),
                 limit=1000,
-                with_vectors=False,
-                handle_pagination=True,
+                with_payload=["entity_name", "name"],
             )
 
             for point in points:
@@ -1986,36 +2090,44 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
         Returns:
             List of relation points from the collection.
         """
-        relations = []
-
         try:
-            # Check if collection exists
-            if not self.collection_exists(collection_name):
-                return relations
+            return list(self._iter_relations(collection_name))
+        except Exception:
+            # Log error but continue - empty list means no relations found
+            return []
 
-            # Use helper to get all relations with pagination
-            from qdrant_client import models
+    def _iter_relations(
+        self,
+        collection_name: str,
+        conditions: list[Any] | None = None,
+        with_payload: bool | list[str] = True,
+    ) -> Iterator[Any]:
+        """Stream relation points (chunk_type = "relation") from the collection.
 
-            # Get all relations (chunk_type = "relation")
-            relations = self._scroll_collection(
-                collection_name=collection_name,
-                scroll_filter=models.Filter(
-                    must=[
-                        models.FieldCondition(
-                            key="chunk_type", match=models.MatchValue(value="relation")
-                        )
-                    ]
-                ),
-                limit=1000,
-                with_vectors=False,
-                handle_pagination=True,
-            )
+        Args:
+            collection_name: Name of the collection
+            conditions: Extra field conditions that must also match
+            with_payload: True for the full payload, or a list of keys to return
+        """
+        if not self.collection_exists(collection_name):
+            return
 
-        except Exception:
-            # Log error but continue - empty list means no relations found
-            pass
+        from qdrant_client import models
 
-        return relations
+        must = [
+            models.FieldCondition(
+                key="chunk_type", match=models.MatchValue(value="relation")
+            )
+        ]
+        if conditions:
+            must.extend(conditions)
+
+        yield from self._iter_scroll_collection(
+            collection_name=collection_name,
+            scroll_filter=models.Filter(must=must),
+            limit=1000,
+            with_payload=with_payload,
+        )
 
     def find_entities_for_file(
         self, collection_name: str, file_path: str
@@ -2263,21 +2375,33 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
             logger.debug(f"Failed to update cleanup timestamp: {e}")
 
     def _cleanup_orphaned_relations(
-        self, collection_name: str, verbose: bool = False, force: bool = False
+        self,
+        collection_name: str,
+        verbose: bool = False,
+        force: bool = False,
+        relation_index: RelationIndex | None = None,
     ) -> int:
         """Clean up relations that reference non-existent entities.
 
         Uses a single atomic query to get a consistent snapshot of the database,
-        avoiding race conditions between entity and relation queries.
+        avoiding race conditions between entity and relation queries. With a
+        complete ``relation_index`` only the relations invalidated since the
+        last cleanup are checked, and no scan is needed.
 
         Args:
             collection_name: Name of the collection to clean
             verbose: Whether to log detailed information about orphaned relations
             force: Whether to bypass timer and force cleanup
+            relation_index: Optional per-file index of entity names and edges
 
         Returns:
             Number of orphaned relations deleted
         """
+        if relation_index is not None and relation_index.complete:
+            return self._cleanup_indexed_orphans(
+                collection_name, relation_index, verbose
+            )
+
         # Check timer first - skip cleanup if interval hasn't elapsed
         if not self._should_run_cleanup(collection_name, force):
             if verbose:
@@ -2297,15 +2421,24 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
                     logger.debug("   Collection doesn't exist - nothing to clean")
                 return 0
 
-            # Get ALL data in a single atomic query to ensure consistency
-            all_points = self._scroll_collection(
+            # Stream ALL points in a single scan, fetching only the fields used below
+            all_points = self._iter_scroll_collection(
                 collection_name=collection_name,
                 limit=10000,  # Large batch size for efficiency
-                with_vectors=False,
-                handle_pagination=True,
+                with_payload=[
+                    "type",
+                    "chunk_type",
+                    "entity_name",
+                    "name",
+                    "headers",
+                    "metadata.headers",
+                    "relation_target",
+                    "relation_type",
+                    "import_type",
+                ],
             )
 
-            # Process in-memory to ensure consistency
+            # Reduce the stream to entity names and (small) relation payloads
             entity_names = set()
             relations = []
             entity_count = 0
@@ -2363,113 +2496,18 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
 
             # Check each relation for orphaned references with consistent snapshot
             orphaned_relations = []
-            phantom_relations = []  # NEW: Track phantom call relations
+            call_relations = []  # Calls with both ends present, checked for phantoms
             valid_relations = 0
             file_ref_relations = 0
 
-            # Build multiple indices for O(1) lookups
-            # Index 1: Direct entity names
-            entity_set = set(entity_names)
-
-            # Index 2: File paths by basename (for module resolution)
-            basename_to_paths = {}
-
-            # Index 3: Directory paths (for package imports)
-            directory_components = set()
-
-            # Index 4: Full path components for complex module paths
-            module_path_index = {}
-
-            # Build indices from entity names
-            for name in entity_names:
-                if name.endswith(".py"):
-                    # Extract basename without extension
-                    import os
-
-                    basename = os.path.basename(name)[:-3]  # Remove .py
-                    if basename not in basename_to_paths:
-                        basename_to_paths[basename] = []
-                    basename_to_paths[basename].append(name)
-
-                    # Extract all directory components
-                    path_parts = name.replace("\\", "/").split("/")
-                    directory_components.update(
-                        path_parts[:-1]
-                    )  # All parts except filename
-
-                    # Build module path index
-                    if len(path_parts) >= 2:
-                        module_parts = [p for p in path_parts[:-1] if p]
-                        if module_parts:
-                            for i in range(len(module_parts)):
-                                module_key = ".".join(module_parts[i:]) + "." + basename
-                                if module_key not in module_path_index:
-                                    module_path_index[module_key] = []
-                                module_path_index[module_key].append(name)
+            # Entity names plus module-path indices for O(1) lookups
+            resolver = ModuleNameResolver(entity_names)
 
             if verbose:
                 logger.debug(
-                    f"   📊 Built indices: {len(basename_to_paths)} basenames, {len(directory_components)} directories"
+                    f"   📊 Built indices: {len(resolver.basename_to_paths)} basenames, {len(resolver.directory_components)} directories"
                 )
 
-            # Cache for module resolution results
-            resolution_cache = {}
-            resolve_call_count = 0
-
-            def resolve_module_name(module_name: str) -> bool:
-                """Optimized O(1) module resolution using pre-built indices."""
-                nonlocal resolve_call_count
-                resolve_call_count += 1
-
-                # Check cache first
-                if module_name in resolution_cache:
-                    return resolution_cache[module_name]
-
-                result = False
-
-                # Direct entity name match
-                if module_name in entity_set:
-                    result = True
-
-                # Handle relative imports (.chat.parser, ..config, etc.)
-                elif module_name.startswith("."):
-                    clean_name = module_name.lstrip(".")
-
-                    # Check direct basename match
-                    if clean_name in basename_to_paths:
-                        result = True
-                    elif "." in clean_name:
-                        # Handle dot notation (chat.parser -> chat/parser.py)
-                        last_part = clean_name.split(".")[-1]
-                        if last_part in basename_to_paths:
-                            # Check if any matching file has the expected path structure
-                            path_pattern = clean_name.replace(".", "/")
-                            for path in basename_to_paths[last_part]:
-                                if path_pattern in path:
-                                    result = True
-                                    break
-
-                # Handle absolute module paths (claude_indexer.analysis.entities)
-                elif "." in module_name:
-                    # Check module path index
-                    if module_name in module_path_index:
-                        result = True
-                    else:
-                        # Fallback: check if last part exists as a file
-                        last_part = module_name.split(".")[-1]
-                        if last_part in basename_to_paths:
-                            result = True
-
-                # Handle package-level imports (claude_indexer -> any /path/claude_indexer/* files)
-                else:
-                    # Single package name without dots
-                    if module_name in directory_components:
-                        result = True
-
-                # Cache the result
-                resolution_cache[module_name] = result
-                return result
-
             # ENHANCED DEBUG: Always log sample relations for debugging
             if len(relations) > 0:
                 logger.debug("Sample relations being checked:")
@@ -2499,46 +2537,11 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
 
                 # Check if either end of the relation references a non-existent entity
                 # Use module resolution for better accuracy
-                from_missing = (
-                    from_entity not in entity_names
-                    and not resolve_module_name(from_entity)
-                )
-                to_missing = to_entity not in entity_names and not resolve_module_name(
-                    to_entity
-                )
+                from_missing = from_entity not in resolver
+                to_missing = to_entity not in resolver
 
                 # Determine if this is a file operation relation (target is external file)
-                # Check for common file extensions to identify external file references
-                is_file_reference = False
-                if to_entity and "." in to_entity:
-                    extension = to_entity.split(".")[-1].lower()
-                    file_extensions = {
-                        "json",
-                        "csv",
-                        "txt",
-                        "xml",
-                        "yaml",
-                        "yml",
-                        "xlsx",
-                        "xls",
-                        "ini",
-                        "toml",
-                        "html",
-                        "css",
-                        "log",
-                        "md",
-                        "pdf",
-                        "doc",
-                        "docx",
-                        "png",
-                        "jpg",
-                        "jpeg",
-                        "gif",
-                        "svg",
-                        "bin",
-                        "dat",
-                    }
-                    is_file_reference = extension in file_extensions
+                is_file_reference = is_external_file_reference(to_entity)
 
                 # Only mark as orphaned if:
                 # 1. Source entity is missing (always invalid)
@@ -2561,16 +2564,7 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
                     relation_type = relation.payload.get("relation_type", "")
                     if relation_type == "calls" and not from_missing and not to_missing:
                         # Both entities exist but we need to verify the call still exists in implementation
-                        is_phantom = self._is_phantom_call_relation(
-                            all_points, from_entity, to_entity, collection_name
-                        )
-                        if is_phantom:
-                            phantom_relations.append(relation)
-                            logger.debug(
-                                f"PHANTOM (stale call): {from_entity} -> {to_entity}"
-                            )
-                        else:
-                            valid_relations += 1
+                        call_relations.append(relation)
                     else:
                         valid_relations += 1
                         if is_file_reference:
@@ -2591,10 +2585,15 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
                     eta = (len(relations) - idx) / rate if rate > 0 else 0
                     logger.debug(
                         f"   ⏳ Progress: {idx}/{len(relations)} relations ({idx / len(relations) * 100:.1f}%) - "
-                        f"{rate:.0f} relations/sec - ETA: {eta:.0f}s - resolve_calls: {resolve_call_count}"
+                        f"{rate:.0f} relations/sec - ETA: {eta:.0f}s - resolve_calls: {resolver.calls}"
                     )
                     last_log_time = current_time
 
+            phantom_relations = self._find_phantom_call_relations(
+                collection_name, call_relations
+            )
+            valid_relations += len(call_relations) - len(phantom_relations)
+
             # Final timing stats
             total_time = time.time() - start_time
 
@@ -2606,10 +2605,10 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
                 logger.debug(f"      Orphans found: {len(orphaned_relations)}")
                 logger.debug(f"      Total time: {total_time:.2f}s")
                 logger.debug(f"      Relations/sec: {len(relations) / total_time:.0f}")
-                logger.debug(f"      resolve_module_name calls: {resolve_call_count}")
+                logger.debug(f"      resolve_module_name calls: {resolver.calls}")
                 logger.debug(
-                    f"      Cache hit rate: {(len(resolution_cache) - resolve_call_count) / resolve_call_count * 100:.1f}%"
-                    if resolve_call_count > 0
+                    f"      Cache hit rate: {(resolver.cache_size - resolver.calls) / resolver.calls * 100:.1f}%"
+                    if resolver.calls > 0
                     else "N/A"
                 )
 
@@ -2650,13 +2649,296 @@ class QdrantStore(ManagedVectorStore, ContentHashMixin):
             logger.debug(f"❌ Error during orphaned relation cleanup: {e}")
             return 0
 
+    def _cleanup_indexed_orphans(
+        self, collection_name: str, relation_index: RelationIndex, verbose: bool = False
+    ) -> int:
+        """Delete the relations a relation index reports as stale.
+
+        The work is proportional to the files changed since the last cleanup.
+        Pending changes are kept if the deletion fails, so the next run
+        retries them.
+        """
+        if not relation_index.has_pending:
+            return 0
+
+        stale_edges = relation_index.find_stale_edges()
+        if stale_edges:
+            delete_result = self.delete_relation_edges(collection_name, stale_edges)
+            if not delete_result.success:
+                logger.debug(
+                    f"❌ Failed to delete stale relations: {delete_result.errors}"
+                )
+                return 0
+            if verbose:
+                for from_entity, to_entity, relation_type in stale_edges[:20]:
+                    logger.debug(
+                        f"   🔍 STALE: {from_entity} --{relation_type}--> {to_entity}"
+                    )
+            logger.info(f"🗑️  Deleted {len(stale_edges)} stale relations (indexed)")
+
+        relation_index.mark_clean(stale_edges)
+        return len(stale_edges)
+
+    def delete_relation_edges(
+        self,
+        collection_name: str,
+        edges: list[tuple[str, str, str]],
+        batch_size: int = 100,
+    ) -> StorageResult:
+        """Delete relation chunks by ``(from_entity, to_entity, relation_type)``.
+
+        Relation point ids are not reproducible from the edge, so points are
+        matched by payload, a batch of edges per delete request.
+        """
+        start_time = time.time()
+
+        try:
+            from qdrant_client import models
+
+            for i in range(0, len(edges), batch_size):
+                batch = edges[i : i + batch_size]
+                self.client.delete(
+                    collection_name=collection_name,
+                    points_selector=models.FilterSelector(
+                        filter=models.Filter(
+                            must=[
+                                models.FieldCondition(
+                                    key="chunk_type",
+                                    match=models.MatchValue(value="relation"),
+                                )
+                            ],
+                            should=[
+                                models.Filter(
+                                    must=[
+                                        models.FieldCondition(
+                                            key="entity_name",
+                                            match=models.MatchValue(value=from_entity),
+                                        ),
+                                        models.FieldCondition(
+                                            key="relation_target",
+                                            match=models.MatchValue(value=to_entity),
+                                        ),
+                                        models.FieldCondition(
+                                            key="relation_type",
+                                            match=models.MatchValue(value=relation_type),
+                                        ),
+                                    ]
+                                )
+                                for from_entity, to_entity, relation_type in batch
+                            ],
+                        )
+                    ),
+                    wait=True,
+                )
+
+            return StorageResult(
+                success=True,
+                operation="delete_relation_edges",
+                items_processed=len(edges),
+                processing_time=time.time() - start_time,
+            )
+
+        except Exception as e:
+            return StorageResult(
+                success=False,
+                operation="delete_relation_edges",
+                items_failed=len(edges),
+                processing_time=time.time() - start_time,
+                errors=[f"Failed to delete relations: {e}"],
+            )
+
+    def find_existing_content_hashes(
+        self, collection_name: str, content_hashes: list[str], batch_size: int = 1000
+    ) -> set[str]:
+        """Return the content hashes that are already stored in a collection.
+
+        Hashes the local bloom filter rules out are treated as novel without
+        a round trip; the rest are confirmed with one ``MatchAny`` scroll per
+        ``batch_size`` hashes, projected to the ``content_hash`` field.
+
+        Args:
+            collection_name: Name of the collection
+            content_hashes: SHA-256 content hashes to check
+            batch_size: Number of hashes per Qdrant lookup
+
+        Returns:
+            The subset of ``content_hashes`` already present. On errors the
+            affected hashes are reported as missing, so content is
+            re-embedded rather than skipped.
+        """
+        unique = list(dict.fromkeys(h for h in content_hashes if h))
+        if not unique:
+            return set()
+
+        if not self.collection_exists(collection_name):
+            logger.debug(
+                f"Collection {collection_name} doesn't exist, no stored content hashes"
+            )
+            return set()
+
+        from qdrant_client import models
+
+        index = self._get_content_index(collection_name)
+        if index.begin_seed(len(unique)):
+            try:
+                index.seed(
+                    point.payload.get("content_hash")
+                    for point in self._iter_scroll_collection(
+                        collection_name=collection_name,
+                        limit=10000,
+                        with_payload=["content_hash"],
+                    )
+                )
+                logger.debug(f"🌸 Seeded content hash filter for {collection_name}")
+            except Exception as e:
+                index.abort_seed()
+                logger.debug(f"Failed to seed content hash filter: {e}")
+
+        candidates = index.candidates(unique)
+        existing: set[str] = set()
+        for i in range(0, len(candidates), batch_size):
+            batch = candidates[i : i + batch_size]
+            try:
+                for point in self._iter_scroll_collection(
+                    collection_name=collection_name,
+                    scroll_filter=models.Filter(
+                        must=[
+                            models.FieldCondition(
+                                key="content_hash", match=models.MatchAny(any=batch)
+                            )
+                        ]
+                    ),
+                    limit=batch_size,
+                    with_payload=["content_hash"],
+                ):
+                    existing.add(point.payload.get("content_hash"))
+            except Exception as e:
+                # On connection errors, fall back to processing (safer than skipping)
+                logger.debug(f"Error checking content hash existence: {e}")
+
+        logger.debug(
+            f"🔎 Content hashes: {len(unique)} checked, {len(candidates)} looked up, "
+            f"{len(existing)} already stored"
+        )
+        return existing
+
+    def find_existing_point_ids(
+        self, collection_name: str, point_ids: list[int], batch_size: int = 1000
+    ) -> set[int]:
+        """Return the point IDs that are already stored in a collection.
+
+        Looks the IDs up directly, ``batch_size`` at a time, without payloads
+        or vectors.
+
+        Args:
+            collection_name: Name of the collection
+            point_ids: Point IDs to check
+            batch_size: Number of IDs per Qdrant lookup
+
+        Returns:
+            The subset of ``point_ids`` already present. On errors the
+            affected IDs are reported as missing, so they are written again.
+        """
+        unique = list(dict.fromkeys(point_ids))
+        if not unique or not self.collection_exists(collection_name):
+            return set()
+
+        existing: set[int] = set()
+        for i in range(0, len(unique), batch_size):
+            try:
+                records = self.client.retrieve(
+                    collection_name=collection_name,
+                    ids=unique[i : i + batch_size],
+                    with_payload=False,
+                    with_vectors=False,
+                )
+                existing.update(record.id for record in records)
+            except Exception as e:
+                logger.debug(f"Error checking point existence: {e}")
+        return existing
+
+    def _get_content_index(self, collection_name: str) -> ContentHashIndex:
+        """Get or create the content hash index for a collection."""
+        with self._content_index_lock:
+            index = self._content_indexes.get(collection_name)
+            if index is None:
+                index = ContentHashIndex(self.count(collection_name))
+                self._content_indexes[collection_name] = index
+            return index
+
+    def _record_content_hashes(
+        self, collection_name: str, points: list[PointStruct]
+    ) -> None:
+        """Add the content hashes of stored points to the collection's index."""
+        index = self._content_indexes.get(collection_name)
+        if index is not None:
+            index.add((point.payload or {}).get("content_hash") for point in points)
+
+    def _find_phantom_call_relations(
+        self, collection_name: str, call_relations: list, batch_size: int = 256
+    ) -> list:
+        """Return the call relations whose call no longer appears in the source.
+
+        Implementation chunks are streamed only for the relations' source
+        entities, a batch of names at a time, so the scan never holds the
+        content of the whole collection.
+        """
+        if not call_relations:
+            return []
+
+        from qdrant_client import models
+
+        relations_by_source: dict[str, list] = {}
+        for relation in call_relations:
+            relations_by_source.setdefault(
+                relation.payload.get("entity_name", ""), []
+            ).append(relation)
+
+        sources = list(relations_by_source)
+        phantom_relations = []
+        for i in range(0, len(sources), batch_size):
+            batch = sources[i : i + batch_size]
+            implementations: dict[str, list] = {}
+            for point in self._iter_scroll_collection(
+                collection_name=collection_name,
+                scroll_filter=models.Filter(
+                    must=[
+                        models.FieldCondition(
+                            key="chunk_type",
+                            match=models.MatchValue(value="implementation"),
+                        ),
+                        models.FieldCondition(
+                            key="entity_name", match=models.MatchAny(any=batch)
+                        ),
+                    ]
+                ),
+                limit=1000,
+                with_payload=["entity_name", "chunk_type", "content"],
+            ):
+                name = point.payload.get("entity_name")
+                implementations.setdefault(name, []).append(point)
+
+            for from_entity in batch:
+                source_points = implementations.get(from_entity, [])
+                for relation in relations_by_source[from_entity]:
+                    to_entity = relation.payload.get("relation_target", "")
+                    if self._is_phantom_call_relation(
+                        source_points, from_entity, to_entity, collection_name
+                    ):
+                        phantom_relations.append(relation)
+                        logger.debug(
+                            f"PHANTOM (stale call): {from_entity} -> {to_entity}"
+                        )
+
+        return phantom_relations
+
     def _is_phantom_call_relation(
         self, all_points: list, from_entity: str, to_entity: str, collection_name: str  # noqa: ARG002
     ) -> bool:
         """Check if a call relation is phantom (entities exist but call doesn't).
 
         Args:
-            all_points: All points from the collection for efficient lookup
+            all_points: Candidate points, e.g. the source entity's implementation chunks
             from_entity: Source entity name
             to_entity: Target entity name
             collection_name: Collection name for debugging
@@ -0,0 +1,396 @@
+"""Persistent entity-name and relation-edge index for incremental orphan cleanup."""
+
+import json
+import os
+from collections import Counter
+from collections.abc import Collection, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ..indexer_logging import get_logger
+
+if TYPE_CHECKING:
+    from ..analysis.entities import Entity, Relation
+
+logger = get_logger()
+
+# (from_entity, to_entity, relation_type) as stored in relation payloads
+Edge = tuple[str, str, str]
+
+# Relation targets with these extensions are external files, not entities
+FILE_REFERENCE_EXTENSIONS = frozenset(
+    {
+        "json",
+        "csv",
+        "txt",
+        "xml",
+        "yaml",
+        "yml",
+        "xlsx",
+        "xls",
+        "ini",
+        "toml",
+        "html",
+        "css",
+        "log",
+        "md",
+        "pdf",
+        "doc",
+        "docx",
+        "png",
+        "jpg",
+        "jpeg",
+        "gif",
+        "svg",
+        "bin",
+        "dat",
+    }
+)
+
+
+def is_file_reference(name: str) -> bool:
+    """Check whether a relation target names an external file."""
+    if not name or "." not in name:
+        return False
+    return name.rsplit(".", 1)[-1].lower() in FILE_REFERENCE_EXTENSIONS
+
+
+class ModuleNameResolver:
+    """Decide whether a relation endpoint refers to a known entity or module.
+
+    Besides exact entity names, import targets are matched against indexed
+    Python files: relative imports (``.chat.parser``), dotted module paths
+    (``claude_indexer.analysis.entities``) and bare package names.
+    """
+
+    def __init__(self, entity_names: Collection[str]) -> None:
+        self.entity_names = entity_names
+        self.calls = 0
+        self._cache: dict[str, bool] = {}
+
+        # File paths by basename (for module resolution)
+        self.basename_to_paths: dict[str, list[str]] = {}
+        # Directory components (for package imports)
+        self.directory_components: set[str] = set()
+        # Dotted module paths for complex module references
+        self.module_path_index: dict[str, list[str]] = {}
+
+        for name in entity_names:
+            if not name.endswith(".py"):
+                continue
+            basename = os.path.basename(name)[:-3]
+            self.basename_to_paths.setdefault(basename, []).append(name)
+
+            path_parts = name.replace("\\", "/").split("/")
+            self.directory_components.update(path_parts[:-1])
+
+            module_parts = [p for p in path_parts[:-1] if p]
+            for i in range(len(module_parts)):
+                module_key = ".".join(module_parts[i:]) + "." + basename
+                self.module_path_index.setdefault(module_key, []).append(name)
+
+    @property
+    def cache_size(self) -> int:
+        """Number of distinct names resolved so far."""
+        return len(self._cache)
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str):
+            return False
+        return name in self.entity_names or self.resolve_module_name(name)
+
+    def resolve_module_name(self, module_name: str) -> bool:
+        """Resolve a module reference against indexed files (cached)."""
+        self.calls += 1
+        cached = self._cache.get(module_name)
+        if cached is not None:
+            return cached
+
+        result = False
+
+        # Direct entity name match
+        if module_name in self.entity_names:
+            result = True
+
+        # Handle relative imports (.chat.parser, ..config, etc.)
+        elif module_name.startswith("."):
+            clean_name = module_name.lstrip(".")
+
+            if clean_name in self.basename_to_paths:
+                result = True
+            elif "." in clean_name:
+                # Handle dot notation (chat.parser -> chat/parser.py)
+                last_part = clean_name.split(".")[-1]
+                path_pattern = clean_name.replace(".", "/")
+                result = any(
+                    path_pattern in path
+                    for path in self.basename_to_paths.get(last_part, [])
+                )
+
+        # Handle absolute module paths (claude_indexer.analysis.entities)
+        elif "." in module_name:
+            result = (
+                module_name in self.module_path_index
+                or module_name.split(".")[-1] in self.basename_to_paths
+            )
+
+        # Handle package-level imports (claude_indexer -> any /path/claude_indexer/* files)
+        else:
+            result = module_name in self.directory_components
+
+        self._cache[module_name] = result
+        return result
+
+
+def is_orphaned_edge(edge: Edge, resolver: ModuleNameResolver) -> bool:
+    """Apply the orphan rules to one relation edge.
+
+    A relation is orphaned if its source is missing, or if its target is
+    missing and is not an external file reference.
+    """
+    from_entity, to_entity, _ = edge
+    if from_entity not in resolver:
+        return True
+    return to_entity not in resolver and not is_file_reference(to_entity)
+
+
+class RelationIndex:
+    """Persisted entity names and relation edges, keyed by indexed file.
+
+    Each file records the entity names it defines and the relation edges it
+    produced. Reference counts over all files give the live entity set, and
+    every change remembers what it invalidated: names that no longer exist,
+    edges no file produces anymore, and newly recorded edges. Orphan
+    detection then only examines those, instead of scanning the collection.
+
+    ``complete`` is set once every file of the collection has been recorded
+    (after a full index); until then callers fall back to a full scan.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        self.path = Path(path) if path is not None else None
+        self.complete = False
+        self.entity_refs: Counter[str] = Counter()
+        self.edge_refs: Counter[Edge] = Counter()
+        self._files: dict[str, dict[str, list]] = {}
+        self._vanished_names: set[str] = set()
+        self._dropped_edges: set[Edge] = set()
+        self._new_edges: set[Edge] = set()
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Path | str) -> "RelationIndex":
+        """Load the index from disk, starting empty if missing or unreadable."""
+        index = cls(path)
+        try:
+            if index.path is not None and index.path.exists():
+                with open(index.path) as f:
+                    data = json.load(f)
+                if data.get("version") == cls.VERSION:
+                    index.complete = data.get("complete", False)
+                    for file_path, entry in data.get("files", {}).items():
+                        index._add_entry(
+                            file_path,
+                            entry["entities"],
+                            [tuple(edge) for edge in entry["relations"]],
+                        )
+                    pending = data.get("pending", {})
+                    index._vanished_names = set(pending.get("vanished_names", []))
+                    index._dropped_edges = {
+                        tuple(e) for e in pending.get("dropped_edges", [])
+                    }
+                    index._new_edges = {tuple(e) for e in pending.get("new_edges", [])}
+        except Exception as e:
+            logger.warning(f"Failed to load relation index from {path}: {e}")
+            index = cls(path)
+        index._dirty = False
+        return index
+
+    def save(self) -> None:
+        """Atomically write the index to disk if it changed."""
+        if self.path is None or not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.path.with_suffix(".tmp")
+            with open(tmp_file, "w") as f:
+                json.dump(
+                    {
+                        "version": self.VERSION,
+                        "complete": self.complete,
+                        "files": self._files,
+                        "pending": {
+                            "vanished_names": sorted(self._vanished_names),
+                            "dropped_edges": sorted(self._dropped_edges),
+                            "new_edges": sorted(self._new_edges),
+                        },
+                    },
+                    f,
+                )
+            os.replace(tmp_file, self.path)
+            self._dirty = False
+        except Exception as e:
+            logger.warning(f"Failed to save relation index: {e}")
+
+    def __contains__(self, file_path: object) -> bool:
+        return file_path in self._files
+
+    @property
+    def file_count(self) -> int:
+        """Number of files with recorded entries."""
+        return len(self._files)
+
+    @property
+    def has_pending(self) -> bool:
+        """Whether changes since the last cleanup still need checking."""
+        return bool(self._vanished_names or self._dropped_edges or self._new_edges)
+
+    def mark_complete(self) -> None:
+        """Record that every file of the collection is now in the index."""
+        if not self.complete:
+            self.complete = True
+            self._dirty = True
+
+    def record_file(
+        self, file_path: str, entity_names: Iterable[str], relations: Iterable[Edge]
+    ) -> None:
+        """Replace the entity names and relation edges recorded for a file."""
+        self.remove_file(file_path)
+        edges = list(dict.fromkeys(tuple(edge) for edge in relations))
+        self._add_entry(file_path, list(dict.fromkeys(entity_names)), edges)
+        # Edges the file still produces are not dropped, only re-checked
+        self._dropped_edges.difference_update(edges)
+        self._new_edges.update(edges)
+        self._dirty = True
+
+    def record_entities(
+        self, entities: list["Entity"], relations: list["Relation"]
+    ) -> None:
+        """Record parsed entities and relations, grouped by defining file.
+
+        Relations are attributed to the file they were parsed from
+        (``metadata["file_path"]``), falling back to the file defining their
+        source entity; relations from files not among ``entities`` are not
+        tracked.
+        """
+        names_by_file: dict[str, list[str]] = {}
+        file_by_name: dict[str, str] = {}
+        for entity in entities:
+            if not entity.file_path:
+                continue
+            file_path = str(entity.file_path)
+            names = names_by_file.setdefault(file_path, [])
+            names.append(entity.name)
+            file_by_name.setdefault(entity.name, file_path)
+            # Grouped markdown entities ("Title (+3 more)") also define their headers
+            if " (+" in entity.name and entity.name.endswith(" more)"):
+                names.extend((entity.metadata or {}).get("headers", []))
+
+        edges_by_file: dict[str, list[Edge]] = {path: [] for path in names_by_file}
+        for relation in relations:
+            file_path = (relation.metadata or {}).get("file_path")
+            if file_path not in edges_by_file:
+                file_path = file_by_name.get(relation.from_entity)
+            if file_path is not None:
+                edges_by_file[file_path].append(
+                    (
+                        relation.from_entity,
+                        relation.to_entity,
+                        relation.relation_type.value,
+                    )
+                )
+
+        for file_path, names in names_by_file.items():
+            self.record_file(file_path, names, edges_by_file[file_path])
+
+    def remove_file(self, file_path: str) -> bool:
+        """Forget everything recorded for a file."""
+        entry = self._files.pop(file_path, None)
+        if entry is None:
+            return False
+
+        for name in entry["entities"]:
+            self.entity_refs[name] -= 1
+            if self.entity_refs[name] <= 0:
+                del self.entity_refs[name]
+                self._vanished_names.add(name)
+        for edge in entry["relations"]:
+            edge = tuple(edge)
+            self.edge_refs[edge] -= 1
+            if self.edge_refs[edge] <= 0:
+                del self.edge_refs[edge]
+                self._dropped_edges.add(edge)
+                self._new_edges.discard(edge)
+        self._dirty = True
+        return True
+
+    def rename_file(self, old_path: str, new_path: str) -> bool:
+        """Move a file's entry; its File entity is renamed along with it."""
+        entry = self._files.get(old_path)
+        if entry is None:
+            return False
+
+        entities = [new_path if name == old_path else name for name in entry["entities"]]
+        relations = [tuple(edge) for edge in entry["relations"]]
+        self.remove_file(old_path)
+        self._add_entry(new_path, entities, relations)
+        # Edges stored in the collection are unchanged by a rename
+        for edge in relations:
+            self._dropped_edges.discard(edge)
+        self._new_edges.update(relations)
+        self._dirty = True
+        return True
+
+    def find_stale_edges(self) -> list[Edge]:
+        """Return the edges invalidated by changes since the last cleanup.
+
+        These are edges no file produces anymore, plus edges touching
+        vanished names or newly recorded edges that fail the orphan rules.
+        """
+        stale = {edge for edge in self._dropped_edges if edge not in self.edge_refs}
+
+        vanished = {name for name in self._vanished_names if name not in self.entity_refs}
+        candidates = set(self._new_edges)
+        if vanished:
+            candidates.update(
+                edge
+                for edge in self.edge_refs
+                if edge[0] in vanished or edge[1] in vanished
+            )
+
+        if candidates:
+            resolver = ModuleNameResolver(self.entity_refs.keys())
+            stale.update(
+                edge for edge in candidates if is_orphaned_edge(edge, resolver)
+            )
+
+        return sorted(stale)
+
+    def mark_clean(self, stale_edges: Iterable[Edge]) -> None:
+        """Drop deleted edges from the index and clear the pending changes."""
+        stale = {tuple(edge) for edge in stale_edges}
+        live_stale = stale & self.edge_refs.keys()
+        if live_stale:
+            for entry in self._files.values():
+                entry["relations"] = [
+                    edge for edge in entry["relations"] if tuple(edge) not in live_stale
+                ]
+            for edge in live_stale:
+                del self.edge_refs[edge]
+
+        self._vanished_names.clear()
+        self._dropped_edges.clear()
+        self._new_edges.clear()
+        self._dirty = True
+
+    def _add_entry(
+        self, file_path: str, entity_names: list[str], relations: list[Edge]
+    ) -> None:
+        self._files[file_path] = {
+            "entities": entity_names,
+            "relations": [list(edge) for edge in relations],
+        }
+        self.entity_refs.update(entity_names)
+        self.edge_refs.update(relations)
@@ -146,8 +146,36 @@ class AsyncDebouncer:
         }
 
 
+# Event kinds tracked by FileChangeCoalescer
+MODIFIED = "modified"
+CREATED = "created"
+DELETED = "deleted"
+
+
+def _merge_event(previous: str | None, event_type: str) -> str | None:
+    """Fold a new event into a path's pending kind; None drops the path."""
+    if previous == DELETED and event_type in (CREATED, MODIFIED):
+        # Rename-away then write, or a temp file moved over the target
+        return MODIFIED
+    if previous == CREATED and event_type == DELETED:
+        # Created and removed within the window: an editor temp file
+        return None
+    if previous == CREATED and event_type == MODIFIED:
+        return CREATED
+    return event_type
+
+
 class FileChangeCoalescer:
-    """Simple file change coalescer with background timer for automatic processing."""
+    """Coalesces raw file events into one pending change per path.
+
+    A path is handed to the callback once no event has touched it for
+    ``delay`` seconds. Editor save sequences collapse while they wait: a
+    delete followed by a create of the same path becomes a modify, and a
+    file created and deleted within the window is dropped. A deletion is
+    therefore only reported when no later event revived the path, so
+    nothing has to sleep and re-check. A one-shot timer is armed only while
+    changes are pending, and callbacks never overlap.
+    """
 
     def __init__(
         self, delay: float = 2.0, callback: Callable[[list[str]], None] | None = None
@@ -155,51 +183,46 @@ class FileChangeCoalescer:
 
         self.delay = delay
         self.callback = callback
-        self._pending: dict[str, float] = {}
+        # path -> (kind, last event time); kept in last-event order
+        self._pending: dict[str, tuple[str, float]] = {}
         self._lock = threading.Lock()
-        self._timer_thread: threading.Thread | None = None
-        self._stop_event = threading.Event()
-        self._start_timer()
-
-    def _start_timer(self) -> None:
-        """Start background timer thread to automatically process files."""
-
-        if self._timer_thread is None or not self._timer_thread.is_alive():
-            import threading
-            self._timer_thread = threading.Thread(target=self._timer_loop, daemon=True)
-            self._timer_thread.start()
-
-    def _timer_loop(self) -> None:
-        """Background timer that periodically checks for ready files."""
-        import time
+        self._timer: threading.Timer | None = None
+        self._stopped = False
+        self.merged_events = 0
+        self.dropped_files = 0
+
+    def _arm_timer(self, now: float) -> None:
+        """Schedule the next flush for the oldest pending path; caller holds the lock."""
+        if self._timer is not None or self._stopped or not self._pending:
+            return
+        _, oldest = next(iter(self._pending.values()))
+        self._timer = threading.Timer(max(0.0, oldest + self.delay - now), self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
 
-        while not self._stop_event.is_set():
-            try:
-                time.sleep(self.delay)
-                self._check_and_process_ready_files()
-            except Exception as e:
-                print(f"❌ Timer error: {e}")
+    def _on_timer(self) -> None:
+        """Flush ready paths, then re-arm for whatever is still pending."""
+        try:
+            self._check_and_process_ready_files()
+        finally:
+            with self._lock:
+                self._timer = None
+                self._arm_timer(time.monotonic())
 
     def _check_and_process_ready_files(self) -> None:
         """Check pending files and process ready ones via callback."""
-        import time
-
-        current_time = time.time()
+        current_time = time.monotonic()
 
         ready_files = []
         with self._lock:
-            files_to_remove = []
-
-            # Find files ready for processing
-            for file_path, timestamp in self._pending.items():
-                if current_time - timestamp >= self.delay:
-                    ready_files.append(file_path)
-                    files_to_remove.append(file_path)
+            for file_path, (_, timestamp) in self._pending.items():
+                if current_time - timestamp < self.delay:
+                    break  # later entries changed more recently
+                ready_files.append(file_path)
 
             # Remove from pending before calling callback
-            for file_path in files_to_remove:
-                if file_path in self._pending:
-                    del self._pending[file_path]
+            for file_path in ready_files:
+                del self._pending[file_path]
 
         # Call callback with ready files
         if ready_files and self.callback:
@@ -208,14 +231,20 @@ class FileChangeCoalescer:
             except Exception as e:
                 print(f"❌ Error in coalescer callback: {e}")
 
-    def add_change(self, file_path: str) -> None:
-        """Add a file change."""
-        import time
-
-        current_time = time.time()
+    def add_change(self, file_path: str, event_type: str = MODIFIED) -> None:
+        """Add a file event, merging it with the path's pending change."""
+        current_time = time.monotonic()
 
         with self._lock:
-            self._pending[file_path] = current_time
+            previous = self._pending.pop(file_path, None)
+            kind = _merge_event(previous[0] if previous else None, event_type)
+            if previous is not None:
+                self.merged_events += 1
+            if kind is None:
+                self.dropped_files += 1
+            else:
+                self._pending[file_path] = (kind, current_time)
+            self._arm_timer(current_time)
 
     def has_pending_files(self) -> bool:
         """Check if there are pending files."""
@@ -231,30 +260,39 @@ class FileChangeCoalescer:
 
     def should_process(self, file_path: str) -> bool:
         """Check if a file should be processed now."""
-        import time
-
-        current_time = time.time()
+        current_time = time.monotonic()
 
         with self._lock:
-            last_change = self._pending.get(file_path, 0)
-            return current_time - last_change >= self.delay
+            entry = self._pending.get(file_path)
+            return entry is None or current_time - entry[1] >= self.delay
 
     def cleanup_old_entries(self, max_age: float = 300.0) -> None:
         """Remove old entries to prevent memory leaks."""
-        import time
-
-        current_time = time.time()
-        cutoff_time = current_time - max_age
+        cutoff_time = time.monotonic() - max_age
 
         with self._lock:
             self._pending = {
-                path: timestamp
-                for path, timestamp in self._pending.items()
-                if timestamp >= cutoff_time
+                path: entry
+                for path, entry in self._pending.items()
+                if entry[1] >= cutoff_time
+            }
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get coalescer statistics."""
+        with self._lock:
+            return {
+                "pending_files": len(self._pending),
+                "delay": self.delay,
+                "merged_events": self.merged_events,
+                "dropped_files": self.dropped_files,
             }
 
     def stop(self) -> None:
-        """Stop the timer thread."""
-        self._stop_event.set()
-        if self._timer_thread and self._timer_thread.is_alive():
-            self._timer_thread.join(timeout=2.0)
+        """Cancel the pending flush timer."""
+        with self._lock:
+            self._stopped = True
+            timer = self._timer
+        if timer is not None:
+            timer.cancel()
+            if timer is not threading.current_thread():
+                timer.join(timeout=2.0)
@@ -1,13 +1,15 @@
 """File system event handler for automatic indexing."""
 
 import asyncio
-import time
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ..indexer_logging import get_logger
 from .debounce import FileChangeCoalescer
 
+if TYPE_CHECKING:
+    from .scheduler import ProjectScheduler
+
 try:
     from watchdog.events import FileSystemEventHandler
 
@@ -30,6 +32,7 @@ class IndexingEventHandler(FileSystemEventHandler):
         debounce_seconds: float = 2.0,
         settings: dict[str, Any] | None = None,
         verbose: bool = False,
+        scheduler: "ProjectScheduler | None" = None,
     ):
         if not WATCHDOG_AVAILABLE:
             raise ImportError(
@@ -43,6 +46,8 @@ class IndexingEventHandler(FileSystemEventHandler):
         self.debounce_seconds = debounce_seconds
         self.settings = settings or {}
         self.verbose = verbose
+        # When set, batches go to the service's shared worker pool
+        self.scheduler = scheduler
 
         # File filtering - use patterns from settings or fallback to defaults
         self.watch_patterns = self.settings.get("watch_patterns", ["*.py", "*.md"])
@@ -99,7 +104,7 @@ class IndexingEventHandler(FileSystemEventHandler):
             self._handle_file_event(event.src_path, "deleted")
             self._handle_file_event(event.dest_path, "created")
 
-    def _handle_file_event(self, file_path: str, event_type: str) -> None:  # noqa: ARG002
+    def _handle_file_event(self, file_path: str, event_type: str) -> None:
         """Process a file system event by adding it to the coalescer."""
         self.events_received += 1
 
@@ -116,8 +121,9 @@ class IndexingEventHandler(FileSystemEventHandler):
                 self.events_ignored += 1
                 return
 
-            # Add the change to the coalescer. The callback will handle processing.
-            self.coalescer.add_change(file_path)
+            # Add the change to the coalescer, which folds editor save
+            # sequences into one change. The callback will handle processing.
+            self.coalescer.add_change(file_path, event_type)
 
         except Exception as e:
             logger = get_logger()
@@ -130,7 +136,10 @@ class IndexingEventHandler(FileSystemEventHandler):
         """Callback for the coalescer to process a batch of files."""
         if ready_files:
             ready_paths = [Path(fp) for fp in ready_files]
-            self._process_file_batch(ready_paths)
+            if self.scheduler is not None:
+                self.scheduler.submit(str(self.project_path), ready_paths)
+            else:
+                self._process_file_batch(ready_paths)
             self.events_processed += len(ready_files)
 
     def _should_process_file(self, path: Path) -> bool:
@@ -162,6 +171,7 @@ class IndexingEventHandler(FileSystemEventHandler):
                 quiet=False,  # Always show summary output, even in non-verbose mode
                 verbose=self.verbose,
                 skip_change_detection=True,  # Bypass expensive hash checking for watcher
+                reuse_session=True,  # Keep embedder, store and caches warm
             )
 
             if success:
@@ -171,36 +181,24 @@ class IndexingEventHandler(FileSystemEventHandler):
             logger.error(f"❌ Error processing file change {path}: {e}")
 
     def _process_file_batch(self, paths: list[Path]):
-        """Process a batch of file changes with phantom deletion detection."""
+        """Process a batch of file changes with phantom deletion detection.
+
+        Paths arrive from the coalescer only after ``debounce_seconds`` without
+        events, so an atomic save's delete has already been folded into its
+        re-create. Whatever is missing now is a real deletion, and a reported
+        deletion whose file exists is treated as a modification.
+        """
         try:
             if not paths:
                 return
 
-            # Separate existing files from potential deletions
             existing_files = []
-            potential_deletions = []
-
+            real_deletions = []
             for path in paths:
                 if path.exists():
                     existing_files.append(path)
                 else:
-                    # It might be a temporary deletion (atomic save), so check again
-                    potential_deletions.append(path)
-
-            # Re-check potential deletions after a short delay to handle atomic saves
-            if potential_deletions:
-                time.sleep(self.debounce_seconds)  # Use configured debounce delay
-
-                real_deletions = []
-                for path in potential_deletions:
-                    if path.exists():
-                        # File reappeared, so it was a modification
-                        existing_files.append(path)
-                    else:
-                        # File is still gone, so it's a real deletion
-                        real_deletions.append(path)
-            else:
-                real_deletions = []
+                    real_deletions.append(path)
 
             logger = get_logger()
 
@@ -227,6 +225,7 @@ class IndexingEventHandler(FileSystemEventHandler):
                     quiet=False,  # Always show summary output, even in non-verbose mode
                     verbose=self.verbose,
                     skip_change_detection=True,  # Bypass expensive hash checking for watcher
+                    reuse_session=True,  # Keep embedder, store and caches warm
                 )
 
                 if success:
@@ -306,6 +305,7 @@ class IndexingEventHandler(FileSystemEventHandler):
                 deleted_file_path=str(path),
                 quiet=False,  # Always show summary output, even in non-verbose mode
                 verbose=self.verbose,
+                reuse_session=True,
             )
 
             if success:
@@ -0,0 +1,231 @@
+"""Shared worker pool that indexes watched projects with fair scheduling."""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ..indexer_logging import get_logger
+from ..indexing.batch_optimizer import BatchOptimizer
+from ..indexing.types import BatchMetrics
+
+BatchCallback = Callable[[list[Path]], None]
+
+
+@dataclass
+class _ProjectQueue:
+    """Pending files of one project, with enqueue times for lag reporting."""
+
+    collection_name: str
+    process_batch: BatchCallback
+    pending: dict[Path, float] = field(default_factory=dict)
+    last_activity: float = 0.0
+    in_flight: int = 0
+    batches_processed: int = 0
+    files_processed: int = 0
+
+    def oldest(self) -> float | None:
+        """Enqueue time of the longest-waiting file (dicts keep insertion order)."""
+        return next(iter(self.pending.values()), None)
+
+
+class ProjectScheduler:
+    """One bounded pool of indexing workers shared by every watched project.
+
+    Each project gets its own queue. Idle workers take the next batch from
+    the project that changed most recently, so the one being edited stays
+    responsive, unless another project has waited longer than
+    ``max_lag_seconds``, in which case the longest-waiting project goes
+    first. A project never has more than one batch in flight, so its batches
+    are indexed in order. Batch sizes come from a single BatchOptimizer, and
+    while memory is over its threshold only one batch runs at a time.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_lag_seconds: float = 30.0,
+        batch_optimizer: BatchOptimizer | None = None,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.max_lag_seconds = max_lag_seconds
+        self.batch_optimizer = batch_optimizer or BatchOptimizer()
+        self.logger = get_logger()
+
+        self._queues: dict[str, _ProjectQueue] = {}
+        self._condition = threading.Condition()
+        self._workers: list[threading.Thread] = []
+        self._running = False
+        self._active_batches = 0
+
+    def register(
+        self, project_path: str, collection_name: str, process_batch: BatchCallback
+    ) -> None:
+        """Add a project whose batches are indexed by ``process_batch``."""
+        with self._condition:
+            self._queues[project_path] = _ProjectQueue(collection_name, process_batch)
+
+    def unregister(self, project_path: str) -> None:
+        """Remove a project and drop its pending files."""
+        with self._condition:
+            self._queues.pop(project_path, None)
+
+    def submit(self, project_path: str, paths: list[Path]) -> None:
+        """Queue changed files of a registered project.
+
+        Files already queued keep their original enqueue time, so repeated
+        saves do not hide how long the project has been waiting.
+        """
+        now = time.monotonic()
+        with self._condition:
+            queue = self._queues.get(project_path)
+            if queue is None:
+                self.logger.warning(f"⚠️  Dropping batch for unwatched project {project_path}")
+                return
+            for path in paths:
+                queue.pending.setdefault(path, now)
+            queue.last_activity = now
+            self._condition.notify()
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._workers = [
+            threading.Thread(
+                target=self._worker_loop, name=f"index-worker-{i}", daemon=True
+            )
+            for i in range(self.max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def stop(self, timeout: float = 30.0) -> None:
+        """Stop the workers after their current batches; queued files are dropped."""
+        with self._condition:
+            self._running = False
+            dropped = sum(len(q.pending) for q in self._queues.values())
+            self._condition.notify_all()
+        for worker in self._workers:
+            worker.join(timeout=timeout)
+        self._workers = []
+        if dropped:
+            self.logger.info(f"   Dropped {dropped} queued files on shutdown")
+
+    def get_status(self) -> dict[str, dict[str, Any]]:
+        """Queue depth and lag of each project.
+
+        Returns:
+            Dict keyed by project path; ``lag_seconds`` is how long the oldest
+            queued file has been waiting
+        """
+        now = time.monotonic()
+        with self._condition:
+            status = {}
+            for project_path, queue in self._queues.items():
+                oldest = queue.oldest()
+                status[project_path] = {
+                    "collection": queue.collection_name,
+                    "queue_depth": len(queue.pending),
+                    "lag_seconds": round(now - oldest, 3) if oldest is not None else 0.0,
+                    "in_flight": queue.in_flight > 0,
+                    "batches_processed": queue.batches_processed,
+                    "files_processed": queue.files_processed,
+                }
+            return status
+
+    def get_stats(self) -> dict[str, Any]:
+        """Pool-wide statistics."""
+        with self._condition:
+            return {
+                "workers": self.max_workers,
+                "active_batches": self._active_batches,
+                "queued_files": sum(len(q.pending) for q in self._queues.values()),
+                "batch_size": self.batch_optimizer.current_size,
+            }
+
+    def _next_project(self, now: float) -> str | None:
+        """Pick the project whose batch runs next; caller holds the lock."""
+        ready = [
+            (project_path, queue)
+            for project_path, queue in self._queues.items()
+            if queue.pending and not queue.in_flight
+        ]
+        if not ready:
+            return None
+
+        # Starvation guard: a project past the lag budget goes first
+        overdue = [
+            (now - queue.oldest(), project_path)
+            for project_path, queue in ready
+            if now - queue.oldest() >= self.max_lag_seconds
+        ]
+        if overdue:
+            return max(overdue)[1]
+
+        return max(ready, key=lambda item: item[1].last_activity)[0]
+
+    def _memory_allows_batch(self) -> bool:
+        """Whether another batch may start; caller holds the lock."""
+        if self._active_batches == 0:
+            return True
+        _, should_reduce = self.batch_optimizer.check_memory()
+        return not should_reduce
+
+    def _take_batch(self) -> tuple[str, _ProjectQueue, list[Path]] | None:
+        """Block until a batch is available, or return None on shutdown."""
+        with self._condition:
+            while self._running:
+                project_path = None
+                if self._memory_allows_batch():
+                    project_path = self._next_project(time.monotonic())
+                if project_path is not None:
+                    queue = self._queues[project_path]
+                    batch_size = self.batch_optimizer.get_batch_size()
+                    paths = list(queue.pending)[:batch_size]
+                    for path in paths:
+                        del queue.pending[path]
+                    queue.in_flight += 1
+                    self._active_batches += 1
+                    return project_path, queue, paths
+                # Re-check periodically so memory pressure and lag can clear
+                self._condition.wait(timeout=1.0)
+            return None
+
+    def _worker_loop(self) -> None:
+        """Index batches until the scheduler stops."""
+        while True:
+            batch = self._take_batch()
+            if batch is None:
+                return
+            project_path, queue, paths = batch
+
+            start_mb, _ = self.batch_optimizer.check_memory()
+            start = time.perf_counter()
+            errors = 0
+            try:
+                queue.process_batch(paths)
+            except Exception as e:
+                errors = len(paths)
+                self.logger.error(f"❌ Batch for {project_path} failed: {e}")
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            end_mb, _ = self.batch_optimizer.check_memory()
+
+            with self._condition:
+                queue.in_flight -= 1
+                queue.batches_processed += 1
+                queue.files_processed += len(paths)
+                self._active_batches -= 1
+                self.batch_optimizer.record_batch(
+                    BatchMetrics(
+                        batch_size=len(paths),
+                        processing_time_ms=elapsed_ms,
+                        memory_delta_mb=end_mb - start_mb,
+                        error_count=errors,
+                    )
+                )
+                self._condition.notify_all()
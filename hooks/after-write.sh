@@ -90,6 +90,22 @@ if ! command -v claude-indexer &> /dev/null; then
     exit 0
 fi
 
+# Resident daemon client (answers in ~tens of ms when the daemon is running).
+# Exit code 75 means no daemon; fall back to the CLI and start one for next time.
+HOOK_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+DAEMON_CLIENT="$HOOK_DIR/indexer_client.py"
+DAEMON_UNAVAILABLE=75
+
+daemon_enabled() {
+    [ "${CLAUDE_INDEXER_DAEMON:-1}" != "0" ] && [ -f "$DAEMON_CLIENT" ] && command -v python3 &> /dev/null
+}
+
+start_daemon() {
+    if [ "${CLAUDE_INDEXER_DAEMON:-1}" != "0" ]; then
+        (nohup claude-indexer daemon start --quiet > /dev/null 2>&1 &) 2>/dev/null
+    fi
+}
+
 # ============================================================
 # Phase 1: Fast Quality Rules (<200ms)
 # ============================================================
@@ -100,8 +116,17 @@ RULE_EXIT_CODE=0
 
 # Only run if file exists and is a code file
 if [ -f "$FILE_PATH" ]; then
-    # Run fast rules with JSON output
-    RULE_OUTPUT=$(claude-indexer post-write "$FILE_PATH" --json 2>/dev/null) || RULE_EXIT_CODE=$?
+    # Run fast rules with JSON output, preferring the warm daemon
+    RULE_EXIT_CODE=$DAEMON_UNAVAILABLE
+    if daemon_enabled; then
+        RULE_EXIT_CODE=0
+        RULE_OUTPUT=$(python3 "$DAEMON_CLIENT" post-write "$FILE_PATH" --json 2>/dev/null) || RULE_EXIT_CODE=$?
+    fi
+    if [ "$RULE_EXIT_CODE" -eq "$DAEMON_UNAVAILABLE" ]; then
+        RULE_EXIT_CODE=0
+        RULE_OUTPUT=$(claude-indexer post-write "$FILE_PATH" --json 2>/dev/null) || RULE_EXIT_CODE=$?
+        start_daemon
+    fi
 fi
 
 # ============================================================
@@ -110,9 +135,12 @@ fi
 
 # Queue file for background indexing if we have collection info
 if [ -n "$COLLECTION" ]; then
-    # Use single-file indexing (fast ~100ms) via background process
-    # Nohup ensures it continues after this hook exits
-    (nohup claude-indexer file -p "$PROJECT_DIR" -c "$COLLECTION" "$FILE_PATH" --quiet 2>/dev/null &) 2>/dev/null
+    # The daemon queues the file and indexes it with warm components
+    if ! daemon_enabled || ! python3 "$DAEMON_CLIENT" index-files -p "$PROJECT_DIR" -c "$COLLECTION" "$FILE_PATH" > /dev/null 2>&1; then
+        # Use single-file indexing (fast ~100ms) via background process
+        # Nohup ensures it continues after this hook exits
+        (nohup claude-indexer file -p "$PROJECT_DIR" -c "$COLLECTION" "$FILE_PATH" --quiet 2>/dev/null &) 2>/dev/null
+    fi
 fi
 
 # ============================================================
@@ -69,8 +69,21 @@ fi
 RESULT_OUTPUT=""
 RESULT_EXIT_CODE=0
 
-# Run comprehensive quality checks with JSON output and repair tracking
-RESULT_OUTPUT=$(claude-indexer stop-check -p "$PROJECT_DIR" --json --repair 2>/dev/null) || RESULT_EXIT_CODE=$?
+# Run comprehensive quality checks with JSON output and repair tracking,
+# preferring the resident daemon (exit code 75 = not running, use the CLI)
+HOOK_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+DAEMON_CLIENT="$HOOK_DIR/indexer_client.py"
+DAEMON_UNAVAILABLE=75
+
+RESULT_EXIT_CODE=$DAEMON_UNAVAILABLE
+if [ "${CLAUDE_INDEXER_DAEMON:-1}" != "0" ] && [ -f "$DAEMON_CLIENT" ] && command -v python3 &> /dev/null; then
+    RESULT_EXIT_CODE=0
+    RESULT_OUTPUT=$(python3 "$DAEMON_CLIENT" stop-check -p "$PROJECT_DIR" --json --repair 2>/dev/null) || RESULT_EXIT_CODE=$?
+fi
+if [ "$RESULT_EXIT_CODE" -eq "$DAEMON_UNAVAILABLE" ]; then
+    RESULT_EXIT_CODE=0
+    RESULT_OUTPUT=$(claude-indexer stop-check -p "$PROJECT_DIR" --json --repair 2>/dev/null) || RESULT_EXIT_CODE=$?
+fi
 
 # ============================================================
 # Handle Results Based on Exit Code
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Indexer Daemon Client - Fast path for hook scripts.
+
+Forwards a hook command to the resident indexer daemon
+(`claude-indexer daemon start`) over its Unix socket, prints the daemon's
+output and exits with its exit code. Only the standard library is imported,
+so a round trip costs a few tens of milliseconds instead of a full CLI start.
+
+Usage:
+    indexer_client.py post-write FILE [--json]
+    indexer_client.py stop-check [-p PROJECT] [--json] [--repair] [--threshold LEVEL]
+    indexer_client.py index-files -p PROJECT -c COLLECTION FILE [FILE ...]
+
+Exit code 75 (EX_TEMPFAIL) means the daemon is not available; callers should
+fall back to the claude-indexer CLI.
+
+Performance target: <50ms round trip for post-write
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+
+DAEMON_UNAVAILABLE = 75
+
+DEFAULT_SOCKET_PATH = os.path.join(
+    os.path.expanduser("~"), ".claude-code-memory", "indexer.sock"
+)
+
+
+def send_request(payload: dict, timeout: float) -> dict | None:
+    """Send one request to the daemon; None if it is not reachable."""
+    socket_path = os.environ.get("CLAUDE_INDEXER_SOCKET", DEFAULT_SOCKET_PATH)
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(socket_path)
+            sock.sendall(json.dumps(payload).encode() + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+        reply = json.loads(line) if line else None
+    except (OSError, ValueError):
+        return None
+    if not reply or not reply.get("ok"):
+        return None
+    return reply
+
+
+def build_request(args: argparse.Namespace) -> dict:
+    """Translate command-line arguments into a daemon request."""
+    if args.command == "post-write":
+        return {
+            "command": "post-write",
+            "file_path": os.path.abspath(args.file_path),
+            "json": args.json,
+        }
+    if args.command == "stop-check":
+        return {
+            "command": "stop-check",
+            "project": os.path.abspath(args.project),
+            "json": args.json,
+            "repair": args.repair,
+            "threshold": args.threshold,
+            "timeout_ms": args.timeout,
+        }
+    return {
+        "command": "index-files",
+        "project": os.path.abspath(args.project),
+        "collection": args.collection,
+        "file_paths": [os.path.abspath(p) for p in args.file_paths],
+    }
+
+
+def parse_args(argv: list) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    post_write = sub.add_parser("post-write")
+    post_write.add_argument("file_path")
+    post_write.add_argument("--json", action="store_true")
+
+    stop_check = sub.add_parser("stop-check")
+    stop_check.add_argument("-p", "--project", default=".")
+    stop_check.add_argument("--json", action="store_true")
+    stop_check.add_argument("--repair", action="store_true")
+    stop_check.add_argument(
+        "--threshold", choices=["critical", "high", "medium", "low"], default="high"
+    )
+    stop_check.add_argument("--timeout", type=int, default=5000)
+
+    index_files = sub.add_parser("index-files")
+    index_files.add_argument("-p", "--project", required=True)
+    index_files.add_argument("-c", "--collection", required=True)
+    index_files.add_argument("file_paths", nargs="+")
+
+    return parser.parse_args(argv)
+
+
+def main(argv: list) -> int:
+    args = parse_args(argv)
+    # Stop checks may legitimately take a few seconds
+    timeout = 30.0 if args.command == "stop-check" else 5.0
+
+    reply = send_request(build_request(args), timeout)
+    if reply is None:
+        return DAEMON_UNAVAILABLE
+
+    if reply.get("stdout"):
+        sys.stdout.write(reply["stdout"])
+    if reply.get("stderr"):
+        sys.stderr.write(reply["stderr"])
+    return int(reply.get("exit_code", 0))
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
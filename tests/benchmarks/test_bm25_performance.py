@@ -0,0 +1,127 @@
+"""
+Performance benchmark for BM25 sparse vector generation.
+
+Compares the sparse ``(indices, values)`` encoding against the previous
+vocabulary-sized dense lists on a synthetic 10k-chunk corpus, reporting
+time and retained memory per 10k chunks.
+
+Run with: pytest tests/benchmarks/test_bm25_performance.py -s
+"""
+
+import math
+import random
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+try:
+    import numpy as np
+
+    from claude_indexer.embeddings.base import SparseEmbedding
+    from claude_indexer.embeddings.bm25 import BM25_AVAILABLE, BM25Embedder
+except ImportError:
+    BM25_AVAILABLE = False
+
+
+pytestmark = [
+    pytest.mark.skipif(not BM25_AVAILABLE, reason="bm25s not available"),
+    pytest.mark.benchmark,
+    pytest.mark.slow,
+]
+
+
+CORPUS_SIZE = 10_000
+VOCAB_SIZE = 50_000
+TOKENS_PER_CHUNK = 40
+MEMORY_SAMPLE = 200  # Dense vectors for all 10k chunks would need gigabytes
+
+
+def _legacy_dense_vector(embedder: "BM25Embedder", text: str) -> list[float]:
+    """Reproduce the pre-sparse encoding: one float per vocabulary term."""
+    vector = np.zeros(max(len(embedder.vocabulary), 100), dtype=np.float32)
+    n_docs = len(embedder.corpus)
+    for token in embedder._preprocess_text(text):
+        idx = embedder.vocabulary.get(token)
+        if idx is None:
+            continue
+        df = embedder._doc_freq_cache.get(token, 0)
+        if df > 0:
+            vector[idx] = max(0.0, math.log((n_docs - df + 0.5) / (df + 0.5)))
+        else:
+            vector[idx] = 0.1
+    return vector.tolist()
+
+
+def _retained_bytes(produce, texts: list[str]) -> int:
+    """Peak traced memory while holding the vectors for ``texts``."""
+    tracemalloc.start()
+    try:
+        vectors = [produce(text) for text in texts]
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del vectors
+    return peak
+
+
+@pytest.fixture(scope="module")
+def fitted_embedder(tmp_path_factory) -> tuple["BM25Embedder", list[str]]:
+    """BM25 embedder fitted on a synthetic corpus with a large vocabulary."""
+    rng = random.Random(42)
+    vocabulary = [f"ident{i}" for i in range(VOCAB_SIZE)]
+    corpus = [
+        " ".join(rng.choices(vocabulary, k=TOKENS_PER_CHUNK))
+        for _ in range(CORPUS_SIZE)
+    ]
+
+    cache_dir: Path = tmp_path_factory.mktemp("bm25_cache")
+    embedder = BM25Embedder(cache_dir=str(cache_dir), corpus_size_limit=CORPUS_SIZE)
+    embedder.fit_corpus(corpus)
+    return embedder, corpus
+
+
+class TestBM25SparseVectors:
+    """Sparse vs dense BM25 encoding per 10k chunks."""
+
+    def test_sparse_matches_dense_weights(self, fitted_embedder):
+        """Sparse encoding carries exactly the non-zero dense weights."""
+        embedder, corpus = fitted_embedder
+
+        for text in corpus[:50]:
+            sparse = embedder._generate_sparse_vector(text)
+            dense = _legacy_dense_vector(embedder, text)
+
+            assert isinstance(sparse, SparseEmbedding)
+            assert sparse.indices == sorted(sparse.indices)
+            np.testing.assert_allclose(
+                sparse.to_dense(len(dense)), dense, rtol=1e-5, atol=1e-6
+            )
+
+    def test_sparse_time_and_memory_per_10k_chunks(self, fitted_embedder):
+        """Sparse vectors are far smaller and faster than dense lists."""
+        embedder, corpus = fitted_embedder
+
+        start = time.perf_counter()
+        embedder.embed_batch(corpus)
+        sparse_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for text in corpus:
+            _legacy_dense_vector(embedder, text)
+        dense_time = time.perf_counter() - start
+
+        sample = corpus[:MEMORY_SAMPLE]
+        scale = CORPUS_SIZE / MEMORY_SAMPLE
+        sparse_bytes = _retained_bytes(embedder._generate_sparse_vector, sample) * scale
+        dense_bytes = (
+            _retained_bytes(lambda t: _legacy_dense_vector(embedder, t), sample) * scale
+        )
+
+        print(f"\nBM25 per {CORPUS_SIZE} chunks (vocabulary {len(embedder.vocabulary)}):")
+        print(f"  dense : {dense_time:.2f}s, {dense_bytes / 1024 / 1024:.1f}MB")
+        print(f"  sparse: {sparse_time:.2f}s, {sparse_bytes / 1024 / 1024:.1f}MB")
+
+        assert sparse_bytes * 10 < dense_bytes
+        assert sparse_time < dense_time
@@ -0,0 +1,70 @@
+"""
+Per-file timing benchmark for Python parsing with and without Jedi.
+
+Parses this repository's own sources twice: once with Jedi analysis for
+every file (the deep-tier path) and once with tree-sitter import resolution
+(the fast path used for light and standard tiers). Reports milliseconds per
+file for each and the slowest files on the Jedi path.
+
+Run with: pytest tests/benchmarks/test_python_parse_performance.py -s
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from claude_indexer.analysis.parser import TREE_SITTER_AVAILABLE, PythonParser
+
+pytestmark = [
+    pytest.mark.skipif(not TREE_SITTER_AVAILABLE, reason="tree-sitter not available"),
+    pytest.mark.benchmark,
+    pytest.mark.slow,
+]
+
+PACKAGE_ROOT = Path(__file__).parents[2] / "claude_indexer"
+MAX_FILES = 60
+
+
+@pytest.fixture(scope="module")
+def python_files() -> list[Path]:
+    """A deterministic sample of real project files."""
+    return sorted(PACKAGE_ROOT.rglob("*.py"))[:MAX_FILES]
+
+
+def _time_per_file(parser: PythonParser, files: list[Path]) -> dict[Path, float]:
+    timings = {}
+    for file_path in files:
+        start = time.perf_counter()
+        result = parser.parse(file_path)
+        timings[file_path] = time.perf_counter() - start
+        assert result.success, result.errors
+    return timings
+
+
+class TestJediFreeParsing:
+    """Milliseconds per file for the Jedi and tree-sitter import paths."""
+
+    def test_per_file_timing(self, python_files):
+        """The fast path is never slower overall; per-file timings are reported."""
+        project = PACKAGE_ROOT.parent
+        # Warm both parsers so one-time setup is not attributed to a file
+        for parser in (PythonParser(project, use_jedi=True), PythonParser(project, use_jedi=False)):
+            parser.parse(python_files[0])
+
+        jedi_times = _time_per_file(PythonParser(project, use_jedi=True), python_files)
+        fast_times = _time_per_file(PythonParser(project, use_jedi=False), python_files)
+
+        jedi_ms = sum(jedi_times.values()) * 1000 / len(python_files)
+        fast_ms = sum(fast_times.values()) * 1000 / len(python_files)
+        print(f"\nPython parse time over {len(python_files)} files:")
+        print(f"  jedi:        {jedi_ms:8.1f} ms/file")
+        print(f"  tree-sitter: {fast_ms:8.1f} ms/file  ({jedi_ms / fast_ms:.1f}x faster)")
+        print("  slowest files with jedi:")
+        for file_path in sorted(jedi_times, key=jedi_times.get, reverse=True)[:5]:
+            print(
+                f"    {file_path.relative_to(project)}: "
+                f"{jedi_times[file_path] * 1000:.1f} ms -> {fast_times[file_path] * 1000:.1f} ms"
+            )
+
+        assert fast_ms < jedi_ms
@@ -0,0 +1,88 @@
+"""
+Performance benchmark for pipelined Qdrant batch upserts.
+
+Upserts a synthetic batch of points at several concurrency levels and
+reports points/sec for each. Runs against the embedded in-memory client by
+default; set ``QDRANT_BENCHMARK_URL`` (e.g. ``http://localhost:6333``) to
+benchmark a local Qdrant container instead, where the in-flight batches
+actually overlap.
+
+Run with: pytest tests/benchmarks/test_qdrant_upsert_performance.py -s
+"""
+
+import os
+import random
+import time
+import uuid
+
+import pytest
+
+try:
+    from claude_indexer.storage.base import VectorPoint
+    from claude_indexer.storage.qdrant import QDRANT_AVAILABLE, QdrantStore
+except ImportError:
+    QDRANT_AVAILABLE = False
+
+
+pytestmark = [
+    pytest.mark.skipif(not QDRANT_AVAILABLE, reason="qdrant-client not available"),
+    pytest.mark.benchmark,
+    pytest.mark.slow,
+]
+
+
+POINT_COUNT = 20_000
+VECTOR_SIZE = 384
+CONCURRENCY_LEVELS = [1, 2, 4, 8]
+
+
+@pytest.fixture(scope="module")
+def store() -> "QdrantStore":
+    """Store backed by a local container if configured, else in-memory."""
+    url = os.environ.get("QDRANT_BENCHMARK_URL", ":memory:")
+    api_key = os.environ.get("QDRANT_API_KEY")
+    try:
+        return QdrantStore(url=url, api_key=api_key)
+    except ConnectionError as e:
+        pytest.skip(f"Qdrant not reachable: {e}")
+
+
+@pytest.fixture(scope="module")
+def points() -> list["VectorPoint"]:
+    """Synthetic points with random dense vectors and small payloads."""
+    rng = random.Random(42)
+    return [
+        VectorPoint(
+            id=str(uuid.UUID(int=rng.getrandbits(128))),
+            vector=[rng.random() for _ in range(VECTOR_SIZE)],
+            payload={"entity_name": f"entity_{i}", "file_path": f"src/file_{i % 500}.py"},
+        )
+        for i in range(POINT_COUNT)
+    ]
+
+
+class TestPipelinedUpsert:
+    """Points/sec for bounded-concurrency batch upserts."""
+
+    def test_points_per_second_by_concurrency(self, store, points):
+        """Every concurrency level stores all points; throughput is reported."""
+        results: dict[int, float] = {}
+
+        for concurrency in CONCURRENCY_LEVELS:
+            collection = f"bench_upsert_{concurrency}_{uuid.uuid4().hex[:8]}"
+            store.upsert_concurrency = concurrency
+
+            try:
+                start = time.perf_counter()
+                result = store.upsert_points(collection, points)
+                elapsed = time.perf_counter() - start
+
+                assert result.success, result.errors
+                assert store.count(collection) == POINT_COUNT
+                results[concurrency] = POINT_COUNT / elapsed
+            finally:
+                store.delete_collection(collection)
+
+        print(f"\nQdrant upsert, {POINT_COUNT} points x {VECTOR_SIZE}d ({store.url}):")
+        for concurrency, rate in results.items():
+            print(f"  {concurrency} in flight: {rate:,.0f} points/sec")
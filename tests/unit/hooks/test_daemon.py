@@ -0,0 +1,180 @@
+"""Tests for the resident indexer daemon and its socket protocol."""
+
+import importlib.util
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from claude_indexer.hooks.daemon import (
+    DaemonClient,
+    DaemonUnavailableError,
+    IndexerDaemon,
+    _IndexingSessions,
+    run_daemon,
+)
+
+HOOKS_DIR = Path(__file__).parents[3] / "hooks"
+
+
+@pytest.fixture
+def socket_path():
+    """Short socket path (AF_UNIX paths are limited to ~100 bytes)."""
+    directory = tempfile.mkdtemp(prefix="cim-")
+    yield Path(directory) / "indexer.sock"
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def running_daemon(socket_path):
+    """Serve a daemon on a background thread for the duration of a test."""
+    daemon = IndexerDaemon(socket_path)
+    daemon.bind()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    yield daemon
+    daemon.shutdown()
+    thread.join(timeout=5)
+
+
+class TestIndexerDaemon:
+    """Tests for IndexerDaemon request handling."""
+
+    @pytest.mark.usefixtures("running_daemon")
+    def test_ping_and_status(self, socket_path):
+        """A client can reach the daemon and read its status."""
+        client = DaemonClient(socket_path)
+
+        assert client.is_running()
+        status = client.request({"command": "status"})
+        assert status["ok"]
+        assert status["requests_served"] >= 2
+        assert status["pending_files"] == 0
+
+    @pytest.mark.usefixtures("running_daemon")
+    def test_post_write_returns_output_and_exit_code(self, socket_path):
+        """post-write output is captured and returned instead of printed."""
+
+        def fake_check(file_path, content, output_json, stdout, stderr):
+            print(f'{{"file": "{file_path}"}}', file=stdout)
+            return 1
+
+        with patch(
+            "claude_indexer.hooks.post_write.run_post_write_check",
+            side_effect=fake_check,
+        ):
+            reply = DaemonClient(socket_path).request(
+                {"command": "post-write", "file_path": "/tmp/a.py", "json": True}
+            )
+
+        assert reply["exit_code"] == 1
+        assert reply["stdout"] == '{"file": "/tmp/a.py"}\n'
+
+    @pytest.mark.usefixtures("running_daemon")
+    def test_unknown_command_is_rejected(self, socket_path):
+        """Unknown commands get an error reply, not a dropped connection."""
+        reply = DaemonClient(socket_path).request({"command": "format-disk"})
+
+        assert reply["ok"] is False
+        assert "Unknown command" in reply["error"]
+
+    @pytest.mark.usefixtures("running_daemon")
+    def test_bind_refuses_second_daemon(self, socket_path):
+        """Only one daemon may serve a socket."""
+        with pytest.raises(RuntimeError, match="already running"):
+            IndexerDaemon(socket_path).bind()
+
+    def test_second_daemon_leaves_warming_daemon_socket(self, socket_path):
+        """A daemon still warming up keeps its socket path from a second start."""
+        socket_path.touch()
+        first = IndexerDaemon(socket_path)
+        first.acquire_lock()
+
+        with patch.object(IndexerDaemon, "warm_up") as warm_up:
+            assert run_daemon(socket_path) == 1
+        warm_up.assert_not_called()
+        assert socket_path.exists()
+
+        first.bind()
+        first._server.server_close()
+
+    def test_bind_replaces_stale_socket(self, socket_path):
+        """A socket file left by a dead daemon is removed on start."""
+        socket_path.touch()
+        daemon = IndexerDaemon(socket_path)
+
+        daemon.bind()
+        daemon._server.server_close()
+
+    def test_client_reports_missing_daemon(self, socket_path):
+        """Clients raise a distinct error when nothing is listening."""
+        client = DaemonClient(socket_path)
+
+        assert not client.is_running()
+        with pytest.raises(DaemonUnavailableError):
+            client.request({"command": "ping"})
+
+
+class TestIndexingSessions:
+    """Tests for the daemon's background indexing queue."""
+
+    def test_coalesces_files_into_one_batch(self, tmp_path):
+        """Repeated writes to the same files are indexed once, together."""
+        a, b = tmp_path / "a.py", tmp_path / "b.py"
+        batches = []
+        with patch.object(_IndexingSessions, "DEBOUNCE_DELAY", 0.05), patch.object(
+            _IndexingSessions,
+            "_index",
+            side_effect=lambda _project, collection, files: batches.append(
+                (collection, sorted(files))
+            ),
+        ):
+            sessions = _IndexingSessions()
+            for _ in range(3):
+                sessions.enqueue(str(tmp_path), "proj", [str(a), str(b)])
+
+            deadline = time.time() + 2
+            while not batches and time.time() < deadline:
+                time.sleep(0.01)
+            sessions.stop()
+
+        assert batches == [("proj", sorted([str(a.resolve()), str(b.resolve())]))]
+
+
+class TestIndexerClientScript:
+    """Tests for the stdlib-only hooks/indexer_client.py."""
+
+    @pytest.fixture
+    def client_module(self):
+        spec = importlib.util.spec_from_file_location(
+            "indexer_client", HOOKS_DIR / "indexer_client.py"
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def test_unavailable_daemon_exit_code(self, client_module, socket_path, monkeypatch):
+        """Without a daemon the client exits 75 so hooks fall back to the CLI."""
+        monkeypatch.setenv("CLAUDE_INDEXER_SOCKET", str(socket_path))
+
+        assert client_module.main(["post-write", "a.py"]) == 75
+
+    @pytest.mark.usefixtures("running_daemon")
+    def test_forwards_daemon_reply(
+        self, client_module, socket_path, monkeypatch, capsys
+    ):
+        """The daemon's stdout and exit code are passed through."""
+        monkeypatch.setenv("CLAUDE_INDEXER_SOCKET", str(socket_path))
+
+        with patch(
+            "claude_indexer.hooks.stop_check.run_stop_check",
+            side_effect=lambda **kwargs: print("clean", file=kwargs["stdout"]) or 0,
+        ):
+            exit_code = client_module.main(["stop-check", "-p", ".", "--json"])
+
+        assert exit_code == 0
+        assert capsys.readouterr().out == "clean\n"
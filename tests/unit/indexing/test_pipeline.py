@@ -0,0 +1,141 @@
+"""Unit tests for IndexingPipeline batch staging."""
+
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from claude_indexer.indexing.pipeline import IndexingPipeline
+from claude_indexer.indexing.types import PipelineConfig
+from claude_indexer.processing.results import PreparedContent, ProcessingResult
+
+
+def _entity(file_path: Path) -> MagicMock:
+    entity = MagicMock()
+    entity.file_path = str(file_path)
+    entity.name = file_path.stem
+    return entity
+
+
+class TestStagedBatches:
+    """Tests for the overlapped parse -> embed -> store stages."""
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        """Three single-file batches worth of Python files."""
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"module_{i}.py"
+            path.write_text(f"def func_{i}():\n    pass\n")
+            paths.append(path)
+        return paths
+
+    @pytest.fixture
+    def content_processor(self):
+        """Content processor that prepares and stores without a backend."""
+        processor = MagicMock()
+        processor.bm25_statistics = None
+        processor.relation_index = None
+        processor.prepare_content.side_effect = lambda **kwargs: PreparedContent(
+            MagicMock(),
+            ProcessingResult.success_result(),
+            kwargs["entities"],
+            kwargs["relations"],
+        )
+        processor.store_prepared_content.side_effect = lambda prepared: prepared.result
+        return processor
+
+    def _pipeline(self, tmp_path, content_processor, pipeline_depth):
+        indexer_config = MagicMock()
+        indexer_config.use_parallel_processing = False
+        pipeline = IndexingPipeline(
+            config=PipelineConfig(
+                initial_batch_size=1,
+                enable_resume=False,
+                pipeline_depth=pipeline_depth,
+            ),
+            indexer_config=indexer_config,
+            embedder=MagicMock(),
+            vector_store=MagicMock(),
+            project_path=tmp_path,
+        )
+        registry = MagicMock()
+        registry.parse_file.side_effect = lambda path: ([_entity(path)], [], [])
+        pipeline._get_parser_registry = MagicMock(return_value=registry)
+        pipeline._get_content_processor = MagicMock(return_value=content_processor)
+        pipeline.batch_optimizer.check_memory = MagicMock(return_value=(100.0, False))
+        return pipeline, registry
+
+    @pytest.mark.parametrize("pipeline_depth", [0, 2])
+    def test_results_in_batch_order(
+        self, tmp_path, files, content_processor, pipeline_depth
+    ):
+        """Staged and sequential runs return the same ordered results."""
+        pipeline, _ = self._pipeline(tmp_path, content_processor, pipeline_depth)
+
+        results = pipeline._run_batches([[f] for f in files], "test_collection")
+
+        assert [r.batch_index for r in results] == [0, 1, 2]
+        assert [r.processed_files for r in results] == [[str(f)] for f in files]
+        assert all(r.entities_created == 1 for r in results)
+        assert content_processor.store_prepared_content.call_count == 3
+
+    def test_parsing_overlaps_storage(self, tmp_path, files, content_processor):
+        """Later batches are parsed while the first batch is still storing."""
+        pipeline, registry = self._pipeline(tmp_path, content_processor, 2)
+        last_parsed = threading.Event()
+        overlapped = []
+
+        def parse_file(path):
+            if path == files[-1]:
+                last_parsed.set()
+            return [_entity(path)], [], []
+
+        def store(prepared):
+            if not overlapped:
+                overlapped.append(last_parsed.wait(timeout=5))
+            return prepared.result
+
+        registry.parse_file.side_effect = parse_file
+        content_processor.store_prepared_content.side_effect = store
+
+        pipeline._run_batches([[f] for f in files], "test_collection")
+
+        assert overlapped == [True]
+
+    def test_stage_error_propagates(self, tmp_path, files, content_processor):
+        """An embedding failure stops the pipeline and is re-raised."""
+        pipeline, _ = self._pipeline(tmp_path, content_processor, 2)
+        content_processor.prepare_content.side_effect = RuntimeError("embedding down")
+
+        with pytest.raises(RuntimeError, match="embedding down"):
+            pipeline._run_batches([[f] for f in files], "test_collection")
+
+        content_processor.store_prepared_content.assert_not_called()
+
+    def test_memory_pressure_drains_pipeline(
+        self, tmp_path, files, content_processor
+    ):
+        """Under memory pressure each batch is stored before the next is parsed."""
+        pipeline, registry = self._pipeline(tmp_path, content_processor, 2)
+        pipeline.batch_optimizer.check_memory = MagicMock(return_value=(5000.0, True))
+        events = []
+
+        def parse_file(path):
+            events.append(("parse", path))
+            return [_entity(path)], [], []
+
+        def store(prepared):
+            events.append(("store", prepared.entities[0].file_path))
+            return prepared.result
+
+        registry.parse_file.side_effect = parse_file
+        content_processor.store_prepared_content.side_effect = store
+
+        pipeline._run_batches([[f] for f in files], "test_collection")
+
+        expected = []
+        for f in files:
+            expected.extend([("parse", f), ("store", str(f))])
+        assert events == expected
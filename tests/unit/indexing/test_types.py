@@ -29,6 +29,7 @@ class TestPipelineConfig:
         assert config.checkpoint_interval == 50
         assert config.enable_resume is True
         assert config.max_parallel_workers == 0
+        assert config.pipeline_depth == 2
 
     def test_custom_values(self):
         """Test custom configuration values."""
@@ -0,0 +1,170 @@
+"""Tests for the content hash bloom filter and batched deduplication."""
+
+import hashlib
+from unittest.mock import MagicMock
+
+import pytest
+
+from claude_indexer.storage.content_index import BloomFilter, ContentHashIndex
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class TestBloomFilter:
+    """Tests for BloomFilter membership."""
+
+    def test_no_false_negatives(self):
+        """Every added digest is reported as present."""
+        bloom = BloomFilter(capacity=1000)
+        digests = [_hash(f"chunk {i}") for i in range(1000)]
+        for digest in digests:
+            bloom.add(digest)
+
+        assert all(digest in bloom for digest in digests)
+
+    def test_false_positive_rate_near_target(self):
+        """Unseen digests are rarely reported as present at capacity."""
+        bloom = BloomFilter(capacity=5000, false_positive_rate=0.01)
+        for i in range(5000):
+            bloom.add(_hash(f"stored {i}"))
+
+        false_positives = sum(_hash(f"novel {i}") in bloom for i in range(10000))
+
+        assert false_positives / 10000 < 0.03
+
+
+class TestContentHashIndex:
+    """Tests for ContentHashIndex seeding and candidate filtering."""
+
+    def test_unseeded_index_treats_every_hash_as_candidate(self):
+        """Before seeding nothing can be ruled out locally."""
+        index = ContentHashIndex(collection_size=1000)
+        hashes = [_hash("a"), _hash("b")]
+
+        assert index.candidates(hashes) == hashes
+
+    def test_seeding_waits_for_enough_lookups(self):
+        """A scan is only claimed once lookups amortize its cost."""
+        index = ContentHashIndex(collection_size=1000, seed_ratio=10.0)
+
+        assert not index.begin_seed(50)
+        index.candidates([_hash(str(i)) for i in range(50)])
+        assert index.begin_seed(50)
+        # Only one caller gets to run the scan
+        assert not index.begin_seed(50)
+
+    def test_seeded_index_rules_out_novel_hashes(self):
+        """Stored hashes stay candidates; novel ones are dropped."""
+        index = ContentHashIndex(collection_size=0)
+        stored = [_hash(f"stored {i}") for i in range(100)]
+        assert index.begin_seed(1)
+        index.seed(stored)
+
+        novel = [_hash(f"novel {i}") for i in range(100)]
+        candidates = index.candidates(stored + novel)
+
+        assert set(stored) <= set(candidates)
+        assert len(candidates) < len(stored) + 10
+
+    def test_hashes_upserted_during_seed_are_kept(self):
+        """Writes that race the scan are merged into the filter."""
+        index = ContentHashIndex(collection_size=0)
+        assert index.begin_seed(1)
+        index.add([_hash("raced")])
+        index.seed([_hash("scanned")])
+
+        assert index.candidates([_hash("raced"), _hash("scanned")]) == [
+            _hash("raced"),
+            _hash("scanned"),
+        ]
+
+    def test_overfull_filter_is_reseeded(self):
+        """Past capacity the index falls back to lookups until reseeded."""
+        index = ContentHashIndex(collection_size=0)
+        assert index.begin_seed(1)
+        index.seed([])
+        index.add(_hash(f"new {i}") for i in range(index._filter.capacity + 1))
+
+        assert not index.seeded
+        novel = [_hash("novel")]
+        assert index.candidates(novel) == novel
+
+
+class TestBatchedDeduplication:
+    """Tests for content-addressed deduplication across the store and processors."""
+
+    @pytest.fixture
+    def store(self):
+        """In-memory Qdrant store with a few stored content hashes."""
+        pytest.importorskip("qdrant_client")
+        from claude_indexer.storage.base import VectorPoint
+        from claude_indexer.storage.qdrant import QdrantStore
+
+        store = QdrantStore(url=":memory:")
+        points = [
+            VectorPoint(
+                id=i,
+                vector=[0.1 * (i + 1)] * 4,
+                payload={"content": f"stored {i}", "content_hash": _hash(f"stored {i}")},
+            )
+            for i in range(5)
+        ]
+        assert store.upsert_points("dedup", points).success
+        return store
+
+    def test_find_existing_content_hashes(self, store):
+        """Only stored hashes are returned, in one pass over the batch."""
+        hashes = [_hash("stored 1"), _hash("novel"), _hash("stored 3"), ""]
+
+        existing = store.find_existing_content_hashes("dedup", hashes, batch_size=2)
+
+        assert existing == {_hash("stored 1"), _hash("stored 3")}
+
+    def test_seeded_store_skips_lookups_for_novel_content(self, store):
+        """Once seeded, hashes the filter rules out never reach Qdrant."""
+        store.find_existing_content_hashes("dedup", [_hash("stored 0")])
+        assert store._content_indexes["dedup"].seeded
+
+        store._iter_scroll_collection = MagicMock(return_value=iter([]))
+        existing = store.find_existing_content_hashes(
+            "dedup", [_hash(f"novel {i}") for i in range(20)]
+        )
+
+        assert existing == set()
+        assert store._iter_scroll_collection.call_count <= 1
+
+    def test_missing_collection_has_no_hashes(self, store):
+        """Unknown collections report nothing stored."""
+        assert store.find_existing_content_hashes("missing", [_hash("x")]) == set()
+
+    def test_check_deduplication_uses_one_batched_lookup(self):
+        """Processors hash each chunk once and check all of them together."""
+        from claude_indexer.analysis.entities import EntityChunk
+        from claude_indexer.processing.processors import EntityProcessor
+
+        chunks = [
+            EntityChunk(
+                id=f"f.py::e{i}::metadata",
+                entity_name=f"e{i}",
+                chunk_type="metadata",
+                content=f"content {i}",
+            )
+            for i in range(4)
+        ]
+        vector_store = MagicMock()
+        vector_store.find_existing_content_hashes.return_value = {
+            _hash("content 1"),
+            _hash("content 3"),
+        }
+        processor = EntityProcessor(vector_store, MagicMock())
+
+        to_embed, to_skip = processor.check_deduplication(chunks, "dedup")
+
+        assert to_embed == [chunks[0], chunks[2]]
+        assert to_skip == [chunks[1], chunks[3]]
+        vector_store.find_existing_content_hashes.assert_called_once_with(
+            "dedup", [chunk.content_hash for chunk in chunks]
+        )
+        vector_store.check_content_exists.assert_not_called()
@@ -0,0 +1,195 @@
+"""Tests for the persistent entity-name / relation index."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from claude_indexer.analysis.entities import Entity, EntityType, Relation, RelationType
+from claude_indexer.storage.base import StorageResult
+from claude_indexer.storage.relation_index import ModuleNameResolver, RelationIndex
+
+
+def _complete_index(**files) -> RelationIndex:
+    """Build a complete index from ``file=(entities, edges)`` and clear pending changes."""
+    index = RelationIndex()
+    for file_path, (entities, edges) in files.items():
+        index.record_file(file_path, entities, edges)
+    index.mark_complete()
+    index.mark_clean(index.find_stale_edges())
+    return index
+
+
+class TestRelationIndex:
+    """Tests for RelationIndex bookkeeping and stale edge detection."""
+
+    def test_removed_file_invalidates_edges_to_its_entities(self):
+        """Edges into a deleted file's entities become stale, others survive."""
+        index = _complete_index(
+            a=(["helper"], []),
+            b=(["main"], [("main", "helper", "calls"), ("main", "b", "contains")]),
+        )
+        index.record_file("b", ["main", "b"], [("main", "helper", "calls")])
+        index.mark_clean(index.find_stale_edges())
+
+        assert index.remove_file("a")
+        assert index.has_pending
+        assert index.find_stale_edges() == [("main", "helper", "calls")]
+
+    def test_dropped_edges_are_stale(self):
+        """Edges a re-indexed file no longer produces are reported once."""
+        index = _complete_index(
+            a=(["caller", "callee"], [("caller", "callee", "calls")])
+        )
+
+        index.record_file("a", ["caller", "callee"], [])
+
+        assert index.find_stale_edges() == [("caller", "callee", "calls")]
+        index.mark_clean([("caller", "callee", "calls")])
+        assert not index.has_pending
+        assert index.find_stale_edges() == []
+
+    def test_edges_shared_by_files_survive_one_removal(self):
+        """An edge still produced by another file is not stale."""
+        edge = ("shared", "shared", "calls")
+        index = _complete_index(a=(["shared"], [edge]), b=(["shared"], [edge]))
+
+        index.remove_file("a")
+
+        assert index.find_stale_edges() == []
+
+    def test_new_edges_follow_module_resolution_rules(self):
+        """New edges resolve modules and ignore external file targets."""
+        index = _complete_index(
+            **{"/src/pkg/util.py": (["/src/pkg/util.py", "load"], [])}
+        )
+
+        index.record_file(
+            "/src/pkg/app.py",
+            ["/src/pkg/app.py", "run"],
+            [
+                ("/src/pkg/app.py", "pkg.util", "imports"),
+                ("run", "config.json", "reads"),
+                ("run", "missing", "calls"),
+            ],
+        )
+
+        assert index.find_stale_edges() == [("run", "missing", "calls")]
+
+    def test_record_entities_groups_by_file(self):
+        """Entities and relations are attributed to their defining file."""
+        index = RelationIndex()
+        entities = [
+            Entity(name="f", entity_type=EntityType.FUNCTION, file_path=Path("a.py")),
+            Entity(name="g", entity_type=EntityType.FUNCTION, file_path=Path("b.py")),
+        ]
+        relations = [
+            Relation(from_entity="f", to_entity="g", relation_type=RelationType.CALLS)
+        ]
+
+        index.record_entities(entities, relations)
+
+        assert "a.py" in index and "b.py" in index
+        assert index.edge_refs[("f", "g", "calls")] == 1
+        index.remove_file("a.py")
+        assert index.find_stale_edges() == [("f", "g", "calls")]
+
+    def test_record_entities_uses_relation_source_file(self):
+        """Edges of a name defined in two files stay with the file producing them."""
+        index = RelationIndex()
+
+        def parsed(file_path, helper):
+            entities = [
+                Entity(name=n, entity_type=EntityType.FUNCTION, file_path=Path(file_path))
+                for n in ("main", helper)
+            ]
+            relation = Relation(
+                from_entity="main",
+                to_entity=helper,
+                relation_type=RelationType.CALLS,
+                metadata={"file_path": file_path},
+            )
+            return entities, [relation]
+
+        a_entities, a_relations = parsed("a.py", "helper_a")
+        b_entities, b_relations = parsed("b.py", "helper_b")
+        index.record_entities(a_entities + b_entities, a_relations + b_relations)
+        index.mark_clean(index.find_stale_edges())
+
+        index.record_entities(a_entities, a_relations)
+
+        assert index.edge_refs[("main", "helper_b", "calls")] == 1
+        assert ("main", "helper_b", "calls") not in index.find_stale_edges()
+
+    def test_persistence_roundtrip(self, tmp_path):
+        """Entries, completeness and pending changes survive a reload."""
+        path = tmp_path / "collection.relations.json"
+        index = RelationIndex(path)
+        index.record_file("a", ["x", "y"], [("x", "y", "calls")])
+        index.mark_complete()
+        index.record_file("a", ["x"], [("x", "y", "calls")])
+        index.save()
+
+        loaded = RelationIndex.load(path)
+
+        assert loaded.complete
+        assert loaded.entity_refs == index.entity_refs
+        assert loaded.find_stale_edges() == [("x", "y", "calls")]
+
+    def test_rename_keeps_edges_but_renames_file_entity(self):
+        """Renaming moves the entry; edges from the old file name go stale."""
+        index = _complete_index(
+            **{"old.py": (["old.py", "f"], [("old.py", "f", "contains")])}
+        )
+
+        assert index.rename_file("old.py", "new.py")
+
+        assert "new.py" in index and "old.py" not in index
+        assert "new.py" in index.entity_refs
+        assert index.find_stale_edges() == [("old.py", "f", "contains")]
+
+
+class TestModuleNameResolver:
+    """Tests for module reference resolution."""
+
+    def test_resolves_relative_absolute_and_package_imports(self):
+        resolver = ModuleNameResolver({"/src/claude_indexer/chat/parser.py", "Thing"})
+
+        assert "Thing" in resolver
+        assert ".chat.parser" in resolver
+        assert "claude_indexer.chat.parser" in resolver
+        assert "claude_indexer" in resolver
+        assert "unknown_pkg" not in resolver
+
+
+class TestIndexedOrphanCleanup:
+    """QdrantStore uses a complete relation index instead of scanning."""
+
+    @patch("claude_indexer.storage.qdrant.QdrantClient")
+    def test_cleanup_deletes_only_stale_edges(self, mock_client_class):
+        with patch("claude_indexer.storage.qdrant.QDRANT_AVAILABLE", True):
+            from claude_indexer.storage.qdrant import QdrantStore
+
+            mock_client_class.return_value = MagicMock()
+            store = QdrantStore()
+
+            index = _complete_index(a=(["f", "g"], [("f", "g", "calls")]))
+            index.record_file("a", ["f"], [("f", "g", "calls")])
+
+            with (
+                patch.object(store, "_iter_scroll_collection") as mock_scroll,
+                patch.object(store, "delete_relation_edges") as mock_delete,
+            ):
+                mock_delete.return_value = StorageResult(
+                    success=True, operation="delete_relation_edges"
+                )
+
+                deleted = store._cleanup_orphaned_relations(
+                    "test_collection", relation_index=index
+                )
+
+                assert deleted == 1
+                mock_delete.assert_called_once_with(
+                    "test_collection", [("f", "g", "calls")]
+                )
+                mock_scroll.assert_not_called()
+                assert not index.has_pending
+                assert ("f", "g", "calls") not in index.edge_refs
@@ -0,0 +1,237 @@
+"""Unit tests for the asyncio embedding backend against a fake HTTP server."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import test_utils, web  # noqa: E402
+
+from claude_indexer.embeddings.async_backend import (  # noqa: E402
+    AdaptiveConcurrencyLimiter,
+    AsyncEmbeddingBackend,
+    TokenBudget,
+)
+
+
+class FakeEmbeddingServer:
+    """OpenAI/Voyage-compatible embeddings endpoint with scripted failures."""
+
+    def __init__(self, rate_limit_first: int = 0, retry_after: str = "0", delay: float = 0.0):
+        self.rate_limit_first = rate_limit_first
+        self.retry_after = retry_after
+        self.delay = delay
+        self.requests: list[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        self.requests.append(payload)
+        if self.rate_limit_first > 0:
+            self.rate_limit_first -= 1
+            return web.json_response(
+                {"error": "rate limited"},
+                status=429,
+                headers={"Retry-After": self.retry_after},
+            )
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        texts = payload["input"]
+        # Return out of order; clients must sort by index
+        data = [
+            {"index": i, "embedding": [float(len(text)), float(i)]}
+            for i, text in reversed(list(enumerate(texts)))
+        ]
+        return web.json_response(
+            {"data": data, "usage": {"total_tokens": sum(len(t.split()) for t in texts)}}
+        )
+
+
+@pytest.fixture
+async def fake_server():
+    """Start a fake embeddings server and yield (server, url)."""
+    servers = []
+
+    async def start(**kwargs):
+        fake = FakeEmbeddingServer(**kwargs)
+        app = web.Application()
+        app.router.add_post("/v1/embeddings", fake.handle)
+        server = test_utils.TestServer(app)
+        await server.start_server()
+        servers.append(server)
+        return fake, str(server.make_url("/v1/embeddings"))
+
+    yield start
+
+    for server in servers:
+        await server.close()
+
+
+def _backend(url: str, **kwargs) -> AsyncEmbeddingBackend:
+    defaults = {
+        "api_key": "test-key",
+        "model": "fake-model",
+        "count_tokens": lambda text: len(text.split()),
+        "max_batch_tokens": 10,
+        "max_batch_texts": 4,
+        "base_delay": 0.01,
+    }
+    defaults.update(kwargs)
+    return AsyncEmbeddingBackend(url=url, **defaults)
+
+
+class TestAsyncEmbeddingBackend:
+    """Tests for AsyncEmbeddingBackend."""
+
+    def test_pack_batches_respects_token_and_count_limits(self):
+        """Requests never exceed the token or text count limit."""
+        backend = _backend("http://unused")
+        texts = ["a b c", "d e f", "g h", "i", "j k l m n o", "p", "q", "r", "s"]
+
+        batches = backend.pack_batches(texts)
+
+        assert [indices for indices, _ in batches] == [[0, 1, 2, 3], [4, 5, 6, 7], [8]]
+        assert all(tokens <= 10 for _, tokens in batches)
+        assert backend.pack_batches(texts, max_batch_texts=2)[0] == ([0, 1], 6)
+
+    async def test_embed_preserves_input_order(self, fake_server):
+        """Results come back in input order across concurrent requests."""
+        fake, url = await fake_server(delay=0.02)
+        backend = _backend(url, max_concurrency=4)
+        texts = [f"text {'word ' * (i % 3)}".strip() for i in range(20)]
+
+        results = await backend.embed(texts)
+
+        assert [r.text for r in results] == texts
+        assert all(r.success for r in results)
+        assert [r.embedding[0] for r in results] == [float(len(t)) for t in texts]
+        assert sum(len(p["input"]) for p in fake.requests) == len(texts)
+
+    async def test_keeps_several_requests_in_flight(self, fake_server):
+        """Up to max_concurrency requests overlap."""
+        fake, url = await fake_server(delay=0.05)
+        backend = _backend(url, max_concurrency=3, max_batch_texts=1)
+
+        await backend.embed([f"text {i}" for i in range(9)])
+
+        assert fake.max_in_flight == 3
+
+    async def test_rate_limit_honours_retry_after_and_backs_off(self, fake_server):
+        """429 responses pause requests and halve the concurrency limit."""
+        fake, url = await fake_server(rate_limit_first=1, retry_after="0.2")
+        backend = _backend(url, max_concurrency=4, max_batch_texts=1)
+
+        start = time.monotonic()
+        results = await backend.embed(["one", "two"])
+        elapsed = time.monotonic() - start
+
+        assert all(r.success for r in results)
+        assert elapsed >= 0.2
+        assert backend.last_concurrency_limit < 4
+
+    async def test_exhausted_retries_return_error_results(self, fake_server):
+        """Texts of a request that keeps failing get error results."""
+        fake, url = await fake_server(rate_limit_first=10, retry_after="0")
+        backend = _backend(url, max_retries=2)
+
+        results = await backend.embed(["one", "two"])
+
+        assert [r.text for r in results] == ["one", "two"]
+        assert all(not r.success and "429" in r.error for r in results)
+        assert len(fake.requests) == 3
+
+    async def test_usage_callback_records_requests(self, fake_server):
+        """Every successful request reports its token usage."""
+        _, url = await fake_server()
+        recorded = []
+        backend = _backend(url, on_request=lambda _ts, tokens: recorded.append(tokens))
+
+        await backend.embed(["a b", "c d e"])
+
+        assert sum(recorded) == 5
+
+
+    def test_state_carries_across_event_loops(self):
+        """Learned concurrency and spent tokens outlive a single embed() call."""
+        backend = _backend("http://unused", max_concurrency=4, max_batch_texts=1)
+
+        async def run(texts, **server_kwargs):
+            fake = FakeEmbeddingServer(**server_kwargs)
+            app = web.Application()
+            app.router.add_post("/v1/embeddings", fake.handle)
+            server = test_utils.TestServer(app)
+            await server.start_server()
+            try:
+                backend.url = str(server.make_url("/v1/embeddings"))
+                return await backend.embed(texts)
+            finally:
+                await server.close()
+
+        # Each synchronous embed_batch runs in a new event loop
+        asyncio.run(run(["one", "two"], rate_limit_first=1))
+        limit = backend.last_concurrency_limit
+        results = asyncio.run(run(["three four"]))
+
+        assert limit < 4
+        assert results[0].success
+        assert backend.last_concurrency_limit == limit
+        assert backend.budget._total == 4
+
+
+class TestSynchronousEmbedBatch:
+    """Tests for embed_batch delegating to the async backend."""
+
+    def test_backend_errors_are_not_retried_synchronously(self):
+        """A RuntimeError from the backend propagates instead of re-running the batch."""
+        voyage = pytest.importorskip("claude_indexer.embeddings.voyage")
+        if not voyage.VOYAGE_AVAILABLE:
+            pytest.skip("voyageai not installed")
+
+        with patch.object(voyage.voyageai, "Client") as client:
+            embedder = voyage.VoyageEmbedder(api_key="key", max_concurrency=2)
+            with patch.object(
+                embedder, "aembed_batch", AsyncMock(side_effect=RuntimeError("boom"))
+            ), pytest.raises(RuntimeError, match="boom"):
+                embedder.embed_batch(["one"])
+
+        client.return_value.embed.assert_not_called()
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for AIMD concurrency adaptation."""
+
+    async def test_halves_on_rate_limit_and_recovers(self):
+        """The limit halves on 429 and grows back after successes."""
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8)
+
+        await limiter.acquire()
+        await limiter.release(rate_limited=True)
+        assert limiter.limit == 4
+
+        for _ in range(4):
+            await limiter.acquire()
+            await limiter.release()
+        assert limiter.limit == 5
+
+
+class TestTokenBudget:
+    """Tests for the per-minute token budget."""
+
+    async def test_waits_for_window_when_budget_spent(self):
+        """Requests beyond the budget wait for the window to slide."""
+        budget = TokenBudget(tokens_per_minute=10, window_seconds=0.1)
+
+        await budget.acquire(8)
+        start = time.monotonic()
+        await budget.acquire(5)
+
+        assert time.monotonic() - start >= 0.09
@@ -0,0 +1,152 @@
+"""Tests for batched chat history indexing."""
+
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from claude_indexer.chat.indexing import index_conversations, summary_chunk_id
+from claude_indexer.chat.parser import ChatConversation, ChatMetadata, ChatParser
+from claude_indexer.chat.summarizer import ChatSummarizer, SummaryResult
+from claude_indexer.embeddings.base import EmbeddingResult
+from claude_indexer.storage.base import StorageResult, VectorPoint
+
+
+def _conversation(session_id: str) -> ChatConversation:
+    now = datetime(2026, 1, 1)
+    metadata = ChatMetadata(
+        project_path="/p",
+        session_id=session_id,
+        start_time=now,
+        end_time=now,
+        message_count=1,
+        total_words=1,
+        has_code=False,
+    )
+    return ChatConversation(messages=[], metadata=metadata, file_path=Path(f"{session_id}.jsonl"))
+
+
+def _store(stored_ids=()):
+    store = MagicMock()
+    store.generate_deterministic_id.side_effect = lambda chunk_id: hash(chunk_id)
+    store.find_existing_point_ids.side_effect = lambda _coll, ids: set(ids) & set(stored_ids)
+    store.create_chat_chunk_point.side_effect = lambda chunk, vector, _coll: VectorPoint(
+        id=hash(chunk.id), vector=vector, payload={"content": chunk.content}
+    )
+    store.upsert_points.return_value = StorageResult(success=True, operation="upsert")
+    return store
+
+
+def _embedder():
+    embedder = MagicMock()
+    embedder.embed_batch.side_effect = lambda texts, **_: [
+        EmbeddingResult(text=text, embedding=[0.1, 0.2]) for text in texts
+    ]
+    return embedder
+
+
+def _summarizer(fail=()):
+    summarizer = MagicMock()
+    summarizer.batch_summarize.side_effect = lambda convs: [
+        SummaryResult(summary="s", debugging_info={"error": "x"})
+        if c.metadata.session_id in fail
+        else SummaryResult(summary=f"about {c.metadata.session_id}")
+        for c in convs
+    ]
+    return summarizer
+
+
+class TestIndexConversations:
+    """Tests for index_conversations batching and deduplication."""
+
+    def test_one_embed_and_upsert_call_per_batch(self):
+        """Each batch is embedded and stored with a single call."""
+        store, embedder = _store(), _embedder()
+        conversations = [_conversation(f"s{i}") for i in range(5)]
+
+        stats = index_conversations(
+            iter(conversations), _summarizer(), embedder, store, "coll", batch_size=2
+        )
+
+        assert stats == {"indexed": 5, "skipped": 0, "failed": 0}
+        assert embedder.embed_batch.call_count == 3
+        assert [len(c.args[1]) for c in store.upsert_points.call_args_list] == [2, 2, 1]
+
+    def test_stored_sessions_are_not_summarized(self):
+        """Sessions whose summary point exists are skipped up front."""
+        conversations = [_conversation("old"), _conversation("new")]
+        store = _store(stored_ids={hash(summary_chunk_id(conversations[0]))})
+        summarizer = _summarizer()
+
+        stats = index_conversations(conversations, summarizer, _embedder(), store, "coll")
+
+        assert stats == {"indexed": 1, "skipped": 1, "failed": 0}
+        assert summarizer.batch_summarize.call_args.args[0] == [conversations[1]]
+
+    def test_failed_summaries_are_not_stored(self):
+        """A summary error is reported and left for the next run."""
+        outcomes = []
+        store = _store()
+
+        stats = index_conversations(
+            [_conversation("bad"), _conversation("good")],
+            _summarizer(fail={"bad"}),
+            _embedder(),
+            store,
+            "coll",
+            on_progress=lambda c, outcome: outcomes.append((c.metadata.session_id, outcome)),
+        )
+
+        assert stats == {"indexed": 1, "skipped": 0, "failed": 1}
+        assert sorted(outcomes) == [("bad", "failed"), ("good", "indexed")]
+        assert len(store.upsert_points.call_args.args[1]) == 1
+
+    def test_appended_messages_get_their_own_summary(self):
+        """A resumed conversation does not overwrite the session's summary."""
+        full = _conversation("s")
+        delta = _conversation("s")
+        delta.start_offset = 1234
+
+        assert summary_chunk_id(delta) == summary_chunk_id(full) + "::1234"
+
+
+class TestStreaming:
+    """Tests for lazy parsing and concurrent summarization."""
+
+    def test_iter_chats_parses_lazily(self, tmp_path: Path):
+        """Files are parsed only as conversations are consumed."""
+        parser = ChatParser(claude_projects_dir=tmp_path)
+        chat_dir = parser.get_project_chat_directory(Path("/p"))
+        chat_dir.mkdir(parents=True)
+        for i in range(3):
+            (chat_dir / f"{i}.jsonl").write_text("{}\n")
+        parser.parse_jsonl = MagicMock(side_effect=lambda path: _conversation(path.stem))
+
+        chats = parser.iter_chats(Path("/p"))
+        next(chats)
+
+        assert parser.parse_jsonl.call_count == 1
+
+    def test_batch_summarize_is_concurrent_and_ordered(self):
+        """Up to max_concurrency summaries run at once; order is kept."""
+        summarizer = ChatSummarizer.__new__(ChatSummarizer)
+        summarizer.max_concurrency = 3
+        running, peak, lock = [0], [0], threading.Lock()
+
+        def summarize(conversation):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+            return SummaryResult(summary=conversation.metadata.session_id)
+
+        summarizer.summarize_conversation = summarize
+        conversations = [_conversation(f"s{i}") for i in range(6)]
+
+        results = summarizer.batch_summarize(conversations)
+
+        assert [r.summary for r in results] == [f"s{i}" for i in range(6)]
+        assert peak[0] == 3
@@ -0,0 +1,128 @@
+"""Tests for incremental, offset-tracked chat log parsing."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from claude_indexer.chat.checkpoint import ChatCheckpoint
+from claude_indexer.chat.parser import ChatParser
+
+
+def _line(role: str, text: str, timestamp: str) -> str:
+    record = {"message": {"role": role, "content": text}, "timestamp": timestamp}
+    return json.dumps(record) + "\n"
+
+
+@pytest.fixture
+def chat_file(tmp_path: Path) -> Path:
+    path = tmp_path / "-p" / "session.jsonl"
+    path.parent.mkdir()
+    path.write_text(
+        _line("user", "hello there", "2026-01-01T10:00:00Z")
+        + _line("assistant", "```python\nx = 1\n```", "2026-01-01T10:01:00Z")
+    )
+    return path
+
+
+@pytest.fixture
+def checkpoint(tmp_path: Path) -> ChatCheckpoint:
+    return ChatCheckpoint(tmp_path / "cache")
+
+
+class TestIncrementalParsing:
+    """Tests for ChatParser.parse_incremental."""
+
+    def test_only_appended_lines_are_parsed(self, chat_file, checkpoint):
+        """After a commit, the next parse starts where the last one ended."""
+        parser = ChatParser()
+        first = parser.parse_incremental(chat_file, checkpoint)
+        checkpoint.commit(chat_file)
+        size = chat_file.stat().st_size
+        with open(chat_file, "a") as f:
+            f.write(_line("user", "one more thing", "2026-01-02T09:00:00Z"))
+
+        second = parser.parse_incremental(chat_file, checkpoint)
+
+        assert [m.content for m in second.messages] == ["one more thing"]
+        assert second.start_offset == size
+        assert second.metadata.message_count == 3
+        assert second.metadata.primary_language == "python"
+        assert second.metadata.end_time.day == 2
+        assert second.summary_key == first.summary_key
+
+    def test_unchanged_file_is_skipped_by_stat(self, chat_file, checkpoint):
+        """Files matching their checkpoint are not opened."""
+        parser = ChatParser()
+        parser.parse_incremental(chat_file, checkpoint)
+        checkpoint.commit(chat_file)
+
+        with patch.object(parser, "read_messages") as read:
+            assert parser.parse_incremental(chat_file, checkpoint) is None
+        read.assert_not_called()
+
+    def test_uncommitted_lines_are_read_again(self, chat_file, checkpoint):
+        """A conversation that was never indexed is parsed again next run."""
+        parser = ChatParser()
+        parser.parse_incremental(chat_file, checkpoint)
+
+        again = parser.parse_incremental(chat_file, checkpoint)
+
+        assert again.start_offset == 0
+        assert len(again.messages) == 2
+
+    def test_partial_last_line_waits(self, chat_file):
+        """A line still being written is left for the next read."""
+        parser = ChatParser()
+        size = chat_file.stat().st_size
+        with open(chat_file, "a") as f:
+            f.write('{"message": {"role": "user", "con')
+
+        messages, offset = parser.read_messages(chat_file)
+
+        assert len(messages) == 2
+        assert offset == size
+
+    def test_truncated_file_is_parsed_from_start(self, chat_file, checkpoint):
+        """A file shorter than its checkpoint offset was rewritten."""
+        parser = ChatParser()
+        parser.parse_incremental(chat_file, checkpoint)
+        checkpoint.commit(chat_file)
+        chat_file.write_text(_line("user", "fresh", "2026-02-01T10:00:00Z"))
+
+        conversation = parser.parse_incremental(chat_file, checkpoint)
+
+        assert conversation.start_offset == 0
+        assert conversation.metadata.message_count == 1
+
+    def test_rewritten_file_is_parsed_from_start(self, chat_file, checkpoint):
+        """A file rewritten in place past the old offset is not resumed mid-stream."""
+        parser = ChatParser()
+        parser.parse_incremental(chat_file, checkpoint)
+        checkpoint.commit(chat_file)
+        inode = chat_file.stat().st_ino
+        with open(chat_file, "r+") as f:
+            f.write(
+                _line("user", "HELLO THERE", "2026-01-01T10:00:00Z")
+                + _line("assistant", "```python\nx = 2\n```", "2026-01-01T10:01:00Z")
+                + _line("user", "and more", "2026-01-01T10:02:00Z")
+            )
+
+        conversation = parser.parse_incremental(chat_file, checkpoint)
+
+        assert chat_file.stat().st_ino == inode
+        assert conversation.start_offset == 0
+        assert conversation.metadata.message_count == 3
+
+    def test_checkpoint_persists(self, chat_file, checkpoint, tmp_path):
+        """Committed entries survive a reload; staged ones do not."""
+        parser = ChatParser()
+        parser.parse_incremental(chat_file, checkpoint)
+        checkpoint.commit(chat_file)
+        checkpoint.save()
+
+        reloaded = ChatCheckpoint(tmp_path / "cache")
+
+        assert reloaded.get(chat_file)["offset"] == chat_file.stat().st_size
+        assert reloaded.is_unchanged(chat_file, chat_file.stat())
@@ -0,0 +1,123 @@
+"""Tests for query-based implementation chunk metadata."""
+
+from pathlib import Path
+
+import pytest
+
+from claude_indexer.analysis.parser import PythonParser
+
+tree_sitter = pytest.importorskip("tree_sitter")
+tspython = pytest.importorskip("tree_sitter_python")
+
+from claude_indexer.analysis.chunk_queries import (  # noqa: E402
+    JAVASCRIPT_CHUNK_QUERY,
+    PYTHON_CHUNK_QUERY,
+    ChunkQuery,
+    javascript_chunk_metadata,
+    python_chunk_metadata,
+)
+
+PYTHON_SOURCE = b'''
+def load(path):
+    """Calls like open(path) in docstrings are not calls."""
+    # Neither is retry(path) in a comment
+    message = "fallback(path) in a string"
+    try:
+        with open(path) as f:
+            data = json.loads(f.read())
+    except (OSError, json.JSONDecodeError) as e:
+        raise ConfigError(message) from e
+    except KeyError:
+        raise
+    if data and data.get("items"):
+        return [item for item in data["items"] if item]
+    return None
+
+
+@dataclass
+class Settings(BaseSettings):
+    timeout = field(default=30)
+
+    @validator("timeout")
+    def check(cls, value):
+        return clamp(value)
+'''
+
+
+@pytest.fixture(scope="module")
+def python_nodes():
+    language = tree_sitter.Language(tspython.language())
+    tree = tree_sitter.Parser(language).parse(PYTHON_SOURCE)
+    nodes = {}
+    for child in tree.root_node.children:
+        if child.type == "decorated_definition":
+            child = child.child_by_field_name("definition")
+        nodes[child.type] = child
+    return ChunkQuery(language, PYTHON_CHUNK_QUERY), nodes
+
+
+class TestPythonChunkMetadata:
+    """Tests for python_chunk_metadata."""
+
+    def test_function_metadata(self, python_nodes):
+        """Calls, attributes, exceptions and branches come from the syntax tree."""
+        query, nodes = python_nodes
+
+        metadata = python_chunk_metadata(query, nodes["function_definition"])
+
+        assert metadata["calls"] == ["open", "loads", "read", "ConfigError", "get"]
+        assert metadata["imports_used"] == ["json.loads", "f.read", "json.JSONDecodeError", "data.get"]
+        assert metadata["exceptions_handled"] == ["OSError", "json.JSONDecodeError", "KeyError"]
+        assert metadata["exceptions_raised"] == ["ConfigError"]
+        # try, with, 2 excepts, if, comprehension for and if
+        assert metadata["complexity"] == 8
+
+    def test_class_excludes_method_calls(self, python_nodes):
+        """Method bodies belong to the methods' own chunks."""
+        query, nodes = python_nodes
+
+        metadata = python_chunk_metadata(query, nodes["class_definition"])
+
+        assert metadata["calls"] == ["field", "validator"]
+        assert "Settings" not in metadata["calls"]
+
+    def test_parser_chunks_use_query_metadata(self, tmp_path: Path):
+        """PythonParser attaches the query metadata to implementation chunks."""
+        file_path = tmp_path / "module.py"
+        file_path.write_bytes(PYTHON_SOURCE)
+
+        result = PythonParser(tmp_path, use_jedi=False).parse(file_path)
+
+        chunks = {c.entity_name: c for c in result.implementation_chunks}
+        semantic = chunks["load"].metadata["semantic_metadata"]
+        assert semantic["calls"] == ["open", "loads", "read", "ConfigError", "get"]
+        assert semantic["inferred_types"] == {}
+
+
+class TestJavaScriptChunkMetadata:
+    """Tests for javascript_chunk_metadata."""
+
+    @pytest.mark.parametrize(
+        "module, grammar",
+        [
+            ("tree_sitter_javascript", "language"),
+            ("tree_sitter_typescript", "language_typescript"),
+        ],
+    )
+    def test_function_metadata(self, module, grammar):
+        """Calls and branches are found in JS and TS without matching comments."""
+        language_module = pytest.importorskip(module)
+        language = tree_sitter.Language(getattr(language_module, grammar)())
+        tree = tree_sitter.Parser(language).parse(
+            b"function f(a) {\n"
+            b"  // format(a) is a comment\n"
+            b"  if (a && ready()) { log.info('x(y)'); }\n"
+            b"  return a ?? new Widget();\n"
+            b"}\n"
+        )
+
+        metadata = javascript_chunk_metadata(
+            ChunkQuery(language, JAVASCRIPT_CHUNK_QUERY), tree.root_node.children[0]
+        )
+
+        assert metadata == {"calls": ["ready", "info", "Widget"], "complexity": 4}
@@ -0,0 +1,117 @@
+"""Tests for file event coalescing in the watcher."""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from claude_indexer.watcher.debounce import (
+    CREATED,
+    DELETED,
+    MODIFIED,
+    FileChangeCoalescer,
+)
+
+
+@pytest.fixture
+def coalescer():
+    batches = []
+    flushed = threading.Event()
+
+    def callback(files):
+        batches.append(files)
+        flushed.set()
+
+    coalescer = FileChangeCoalescer(delay=0.05, callback=callback)
+    coalescer.batches = batches
+    coalescer.flushed = flushed
+    yield coalescer
+    coalescer.stop()
+
+
+class TestFileChangeCoalescer:
+    """Tests for FileChangeCoalescer event folding and timing."""
+
+    def test_delete_then_create_is_a_modify(self, coalescer):
+        """Rename-away-then-write saves are not reported as deletions."""
+        coalescer.add_change("/p/a.py", DELETED)
+        coalescer.add_change("/p/a.py", CREATED)
+
+        assert coalescer._pending["/p/a.py"][0] == MODIFIED
+        assert coalescer.flushed.wait(1)
+        assert coalescer.batches == [["/p/a.py"]]
+
+    def test_temp_file_created_and_deleted_is_dropped(self, coalescer):
+        """Files that live and die within the window never reach the callback."""
+        coalescer.add_change("/p/.a.py.tmp", CREATED)
+        coalescer.add_change("/p/.a.py.tmp", MODIFIED)
+        coalescer.add_change("/p/.a.py.tmp", DELETED)
+
+        assert not coalescer.has_pending_files()
+        assert coalescer.get_stats()["dropped_files"] == 1
+
+    def test_modify_then_delete_stays_a_deletion(self, coalescer):
+        """A deletion not followed by another event is kept."""
+        coalescer.add_change("/p/a.py", MODIFIED)
+        coalescer.add_change("/p/a.py", DELETED)
+
+        assert coalescer._pending["/p/a.py"][0] == DELETED
+
+    def test_paths_wait_for_quiet_period(self, coalescer):
+        """Each new event for a path restarts its window."""
+        coalescer.add_change("/p/a.py")
+        time.sleep(0.03)
+        coalescer.add_change("/p/b.py")
+        coalescer.add_change("/p/a.py")
+
+        assert coalescer.flushed.wait(1)
+        time.sleep(0.1)
+
+        assert sorted(sum(coalescer.batches, [])) == ["/p/a.py", "/p/b.py"]
+
+    def test_no_timer_while_idle(self, coalescer):
+        """The timer is only armed while changes are pending."""
+        assert coalescer._timer is None
+
+        coalescer.add_change("/p/a.py")
+        assert coalescer._timer is not None
+        assert coalescer.flushed.wait(1)
+        time.sleep(0.02)
+
+        assert coalescer._timer is None
+
+    def test_stop_cancels_pending_flush(self, coalescer):
+        """Stopping cancels the timer without invoking the callback."""
+        coalescer.delay = 10
+        coalescer.add_change("/p/a.py")
+        coalescer.stop()
+
+        assert coalescer.force_batch() == ["/p/a.py"]
+        assert coalescer.batches == []
+
+
+class TestHandlerBatch:
+    """Tests for IndexingEventHandler._process_file_batch."""
+
+    def test_batch_does_not_sleep(self, tmp_path: Path):
+        """Missing files are deleted and existing ones indexed without waiting."""
+        pytest.importorskip("watchdog")
+        from claude_indexer.watcher.handler import IndexingEventHandler
+
+        (tmp_path / "kept.py").write_text("x = 1\n")
+        handler = IndexingEventHandler(str(tmp_path), "proj", debounce_seconds=30)
+        handler.coalescer.stop()
+
+        with patch(
+            "claude_indexer.main.run_indexing_with_specific_files", return_value=True
+        ) as index, patch.object(handler, "_process_file_deletion") as delete:
+            start = time.monotonic()
+            handler._process_file_batch(
+                [tmp_path / "kept.py", tmp_path / "gone.py"]
+            )
+
+        assert time.monotonic() - start < 5
+        assert index.call_args.args[2] == [tmp_path / "kept.py"]
+        delete.assert_called_once_with(tmp_path / "gone.py")
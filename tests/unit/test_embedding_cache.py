@@ -0,0 +1,231 @@
+"""Unit tests for the segment-based persistent embedding cache."""
+
+import json
+import struct
+
+import numpy as np
+import pytest
+
+from claude_indexer.embeddings import cache as cache_module
+from claude_indexer.embeddings.base import CachingEmbedder, Embedder, EmbeddingResult
+from claude_indexer.embeddings.cache import PersistentEmbeddingCache
+
+
+def _vector(seed: int, dimension: int = 8) -> list[float]:
+    return [float(seed + i) / 10 for i in range(dimension)]
+
+
+class TestPersistentEmbeddingCache:
+    """Test storage, lookup and persistence of cached embeddings."""
+
+    def test_roundtrip(self, tmp_path):
+        """Stored vectors come back unchanged."""
+        cache = PersistentEmbeddingCache(tmp_path)
+        key = cache.content_hash("def foo(): pass")
+        cache.set(key, _vector(1))
+
+        assert cache.contains(key)
+        assert cache.get(key) == pytest.approx(_vector(1))
+        assert cache.get(cache.content_hash("missing")) is None
+
+    def test_segments_replace_per_embedding_files(self, tmp_path):
+        """Many embeddings share one segment file and one index file."""
+        cache = PersistentEmbeddingCache(tmp_path)
+        cache.set_batch({cache.content_hash(str(i)): _vector(i) for i in range(50)})
+
+        segments = list(cache.segments_dir.glob("*.seg"))
+        assert len(segments) == 1
+        assert segments[0].stat().st_size == 50 * 8 * 4
+        assert cache.index_file.exists()
+
+    def test_get_batch_returns_numpy_views(self, tmp_path):
+        """Batch lookups return float32 arrays backed by the mapped segment."""
+        cache = PersistentEmbeddingCache(tmp_path)
+        keys = [cache.content_hash(str(i)) for i in range(3)]
+        cache.set_batch({k: _vector(i) for i, k in enumerate(keys)})
+
+        results = cache.get_batch(keys + ["0000000000000000"])
+
+        assert results["0000000000000000"] is None
+        for i, key in enumerate(keys):
+            assert isinstance(results[key], np.ndarray)
+            assert results[key].dtype == np.float32
+            assert not results[key].flags.writeable
+            np.testing.assert_allclose(results[key], _vector(i), rtol=1e-6)
+
+    def test_persists_across_instances(self, tmp_path):
+        """A reopened cache sees entries written by a previous instance."""
+        cache = PersistentEmbeddingCache(tmp_path, model_name="m")
+        keys = [cache.content_hash(str(i)) for i in range(10)]
+        cache.set_batch({k: _vector(i) for i, k in enumerate(keys)})
+        cache.close()
+
+        reopened = PersistentEmbeddingCache(tmp_path, model_name="m")
+        assert len(reopened) == 10
+        assert reopened.get(keys[7]) == pytest.approx(_vector(7))
+
+    def test_truncated_segment_entries_are_dropped(self, tmp_path):
+        """Index records pointing past the end of a segment are ignored on load."""
+        cache = PersistentEmbeddingCache(tmp_path)
+        keys = [cache.content_hash(str(i)) for i in range(4)]
+        cache.set_batch({k: _vector(i) for i, k in enumerate(keys)})
+        cache.close()
+
+        segment = next(cache.segments_dir.glob("*.seg"))
+        with open(segment, "r+b") as f:
+            f.truncate(3 * 8 * 4)
+
+        reopened = PersistentEmbeddingCache(tmp_path)
+        assert len(reopened) == 3
+        assert reopened.get(keys[3]) is None
+
+    def test_corrupt_index_is_replaced(self, tmp_path):
+        """An index with a bad header is reset instead of appended to."""
+        cache = PersistentEmbeddingCache(tmp_path)
+        cache.set_batch({cache.content_hash(str(i)): _vector(i) for i in range(2)})
+        cache.close()
+        with open(cache.index_file, "r+b") as f:
+            f.write(b"X")
+
+        recovered = PersistentEmbeddingCache(tmp_path)
+        assert len(recovered) == 0
+        assert list(recovered.segments_dir.glob("*.seg")) == []
+        keys = [recovered.content_hash(f"new{i}") for i in range(3)]
+        recovered.set_batch({k: _vector(i) for i, k in enumerate(keys)})
+        recovered.close()
+
+        reopened = PersistentEmbeddingCache(tmp_path)
+        assert len(reopened) == 3
+        assert reopened.get(keys[2]) == pytest.approx(_vector(2))
+
+    def test_segment_rollover(self, tmp_path, monkeypatch):
+        """A new segment is started once the active one is full."""
+        monkeypatch.setattr(cache_module, "SEGMENT_MAX_BYTES", 10 * 8 * 4)
+        cache = PersistentEmbeddingCache(tmp_path)
+        keys = [cache.content_hash(str(i)) for i in range(25)]
+        cache.set_batch({k: _vector(i) for i, k in enumerate(keys)})
+
+        assert len(list(cache.segments_dir.glob("*.seg"))) == 3
+        assert cache.get(keys[24]) == pytest.approx(_vector(24))
+
+    def test_reopened_cache_appends_to_last_segment(self, tmp_path):
+        """Short-lived writers share the newest segment instead of adding one each."""
+        for run in range(5):
+            cache = PersistentEmbeddingCache(tmp_path)
+            cache.set(cache.content_hash(f"run{run}"), _vector(run))
+            cache.close()
+
+        reopened = PersistentEmbeddingCache(tmp_path)
+        assert len(list(reopened.segments_dir.glob("*.seg"))) == 1
+        assert len(reopened) == 5
+        assert reopened.get(reopened.content_hash("run4")) == pytest.approx(_vector(4))
+
+    def test_concurrent_writers_use_separate_segments(self, tmp_path):
+        """A segment another writer holds open is not appended to."""
+        first = PersistentEmbeddingCache(tmp_path)
+        second = PersistentEmbeddingCache(tmp_path)
+        first.set(first.content_hash("a"), _vector(1))
+        second.set(second.content_hash("b"), _vector(2))
+
+        assert len(list(first.segments_dir.glob("*.seg"))) == 2
+        assert second.get(second.content_hash("b")) == pytest.approx(_vector(2))
+
+    def test_dimension_mismatch_is_not_cached(self, tmp_path):
+        """Vectors whose length differs from the expected dimension are skipped."""
+        cache = PersistentEmbeddingCache(tmp_path)
+        cache.set_batch({cache.content_hash("a"): _vector(1)}, dimension=16)
+
+        assert len(cache) == 0
+
+    def test_eviction_compacts_segments(self, tmp_path):
+        """Eviction drops the oldest entries and rewrites survivors."""
+        cache = PersistentEmbeddingCache(tmp_path, max_size_mb=1)
+        dimension = 1024  # 4KB per vector, 256 vectors per MB
+        keys = [cache.content_hash(str(i)) for i in range(300)]
+        for i, key in enumerate(keys):
+            cache.set(key, _vector(i, dimension))
+        cache.flush()
+
+        stats = cache.get_stats()
+        assert stats["entries"] < 300
+        assert stats["size_mb"] <= 1
+        assert stats["disk_size_mb"] == pytest.approx(stats["size_mb"], abs=0.5)
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[-1]) == pytest.approx(_vector(299, dimension))
+
+        reopened = PersistentEmbeddingCache(tmp_path, max_size_mb=1)
+        assert len(reopened) == stats["entries"]
+
+    def test_clear(self, tmp_path):
+        """Clearing removes segments and entries."""
+        cache = PersistentEmbeddingCache(tmp_path)
+        cache.set_batch({cache.content_hash(str(i)): _vector(i) for i in range(5)})
+        cache.clear()
+
+        assert len(cache) == 0
+        assert not list(cache.segments_dir.glob("*.seg"))
+        assert len(PersistentEmbeddingCache(tmp_path)) == 0
+
+    def test_migrates_legacy_layout(self, tmp_path):
+        """Caches written as one .bin file per embedding are imported once."""
+        legacy_dir = tmp_path / ".embedding_cache" / "default"
+        (legacy_dir / "embeddings").mkdir(parents=True)
+        legacy_index = {}
+        for i in range(3):
+            key = PersistentEmbeddingCache.content_hash(str(i))
+            vector = _vector(i)
+            with open(legacy_dir / "embeddings" / f"{key}.bin", "wb") as f:
+                f.write(struct.pack("I", len(vector)))
+                f.write(struct.pack(f"{len(vector)}f", *vector))
+            legacy_index[key] = {"dimension": 8, "last_access": 1.0}
+        (legacy_dir / "index.json").write_text(json.dumps(legacy_index))
+
+        cache = PersistentEmbeddingCache(tmp_path)
+
+        assert len(cache) == 3
+        assert cache.get(PersistentEmbeddingCache.content_hash("2")) == pytest.approx(
+            _vector(2)
+        )
+        assert not (legacy_dir / "index.json").exists()
+        assert not (legacy_dir / "embeddings").exists()
+
+
+class _CountingEmbedder(Embedder):
+    def __init__(self):
+        self.calls = 0
+
+    def embed_text(self, text):
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts, item_type="general"):  # noqa: ARG002
+        self.calls += len(texts)
+        return [
+            EmbeddingResult(text=t, embedding=_vector(len(t)), model="counting")
+            for t in texts
+        ]
+
+    def get_model_info(self):
+        return {"model": "counting"}
+
+    def get_max_tokens(self):
+        return 8192
+
+
+class TestCachingEmbedderWithSegments:
+    """Test the CachingEmbedder disk tier backed by the segment store."""
+
+    def test_disk_hits_after_restart(self, tmp_path):
+        """A fresh CachingEmbedder serves previous results from disk."""
+        texts = ["alpha", "beta", "gamma"]
+        first = CachingEmbedder.with_persistent_cache(_CountingEmbedder(), tmp_path)
+        first.embed_batch(texts)
+        first.flush_persistent_cache()
+
+        inner = _CountingEmbedder()
+        second = CachingEmbedder.with_persistent_cache(inner, tmp_path)
+        results = second.embed_batch(texts + ["delta"])
+
+        assert inner.calls == 1
+        assert second.get_cache_stats()["disk_hits"] == 3
+        assert all(isinstance(r.embedding, list) for r in results)
+        assert results[0].embedding == pytest.approx(_vector(len("alpha")))
@@ -5,7 +5,7 @@ from unittest.mock import MagicMock, patch
 import numpy as np
 import pytest
 
-from claude_indexer.embeddings.base import EmbeddingResult
+from claude_indexer.embeddings.base import EmbeddingResult, SparseEmbedding
 from claude_indexer.embeddings.openai import OpenAIEmbedder
 
 
@@ -451,6 +451,32 @@ class TestEmbeddingResult:
         assert result.error is None
 
 
+class TestSparseEmbedding:
+    """Test the SparseEmbedding dataclass."""
+
+    def test_sparse_embedding_length_is_non_zero_count(self):
+        """Length and dimension reflect stored entries, not vocabulary size."""
+        sparse = SparseEmbedding(indices=[3, 17], values=[0.5, 1.25])
+        result = EmbeddingResult(text="foo bar", embedding=sparse, model="bm25")
+
+        assert len(sparse) == 2
+        assert result.dimension == 2
+        assert result.success
+
+    def test_sparse_embedding_to_dense(self):
+        """to_dense expands the sparse entries into a full vector."""
+        sparse = SparseEmbedding(indices=[1, 4], values=[0.5, 2.0])
+
+        assert sparse.to_dense(5) == [0.0, 0.5, 0.0, 0.0, 2.0]
+
+    def test_empty_sparse_embedding_is_not_success(self):
+        """An empty sparse vector is not a usable embedding."""
+        result = EmbeddingResult(
+            text="", embedding=SparseEmbedding(indices=[], values=[]), model="bm25"
+        )
+
+        assert not result.success
+
 class TestDummyEmbedder:
     """Test the dummy embedder used in tests."""
 
@@ -502,3 +528,143 @@ class TestDummyEmbedder:
         embedding = custom_embedder.embed_single("test")
         assert len(embedding) == 512
         assert embedding.dtype == np.float32
+
+
+class TestBM25Statistics:
+    """Test the incrementally maintained BM25 document-frequency table."""
+
+    def test_remove_file_restores_previous_counts(self):
+        """Adding then removing a file leaves the table as it was."""
+        from claude_indexer.embeddings.bm25 import BM25Statistics
+
+        stats = BM25Statistics()
+        stats.add_documents("a.py", [["parse", "file"], ["parse", "tree"]])
+        before = (dict(stats.doc_freq), stats.doc_count)
+
+        stats.add_documents("b.py", [["parse", "token"]])
+        assert stats.doc_freq["parse"] == 3
+        assert stats.doc_count == 3
+
+        assert stats.remove_file("b.py")
+        assert (dict(stats.doc_freq), stats.doc_count) == before
+        assert not stats.remove_file("b.py")
+
+    def test_term_ids_are_stable(self):
+        """Term ids survive removals and are never reassigned."""
+        from claude_indexer.embeddings.bm25 import BM25Statistics
+
+        stats = BM25Statistics()
+        stats.add_documents("a.py", [["alpha", "beta"]])
+        beta_id = stats.term_id("beta")
+
+        stats.remove_file("a.py")
+        stats.add_documents("b.py", [["gamma"], ["beta"]])
+
+        assert stats.term_id("beta") == beta_id
+        assert stats.term_id("gamma") not in {stats.term_id("alpha"), beta_id}
+
+    def test_persistence_roundtrip(self, tmp_path):
+        """Saved statistics reload with identical counts and file entries."""
+        from claude_indexer.embeddings.bm25 import BM25Statistics
+
+        path = tmp_path / "collection.bm25.json"
+        stats = BM25Statistics(path)
+        stats.add_documents("a.py", [["alpha", "beta"], ["beta"]])
+        stats.rename_file("a.py", "renamed.py")
+        stats.save()
+
+        loaded = BM25Statistics.load(path)
+        assert loaded.doc_count == 2
+        assert loaded.doc_freq == stats.doc_freq
+        assert loaded.term_ids == stats.term_ids
+        assert "renamed.py" in loaded
+        assert "a.py" not in loaded
+
+    def test_embedder_uses_statistics_without_fitting(self, tmp_path):
+        """Sparse weights come from the table and cover the whole corpus."""
+        from claude_indexer.embeddings.bm25 import BM25Embedder, BM25Statistics
+
+        stats = BM25Statistics()
+        embedder = BM25Embedder(cache_dir=str(tmp_path), statistics=stats, corpus_size_limit=2)
+        embedder.record_documents("a.py", ["common rare", "common other"])
+        embedder.record_documents("b.py", ["common third", "common fourth", "common fifth"])
+
+        result = embedder.embed_batch(["rare common"])[0]
+
+        assert not embedder.is_fitted
+        assert result.embedding.indices == [stats.term_id("rare")]
+        assert result.embedding.values == pytest.approx([stats.idf("rare")])
+
+    def test_embedding_unknown_terms_leaves_term_ids_unchanged(self, tmp_path):
+        """Query text does not assign term ids or mark the table for saving."""
+        from claude_indexer.embeddings.bm25 import BM25Embedder, BM25Statistics
+
+        path = tmp_path / "collection.bm25.json"
+        stats = BM25Statistics(path)
+        embedder = BM25Embedder(cache_dir=str(tmp_path), statistics=stats)
+        embedder.record_documents("a.py", ["alpha beta", "alpha gamma", "alpha delta"])
+        stats.save()
+        term_ids = dict(stats.term_ids)
+
+        result = embedder.embed_batch(["beta unseen words"])[0]
+
+        assert stats.term_ids == term_ids
+        assert not stats._dirty
+        assert result.embedding.indices == [stats.term_ids["beta"]]
+
+
+class TestBM25BatchEncoding:
+    """Test single-pass tokenization and CSR batch encoding."""
+
+    def test_tokenizer_matches_legacy_rules(self, tmp_path):
+        """Batch tokens are lowercase alphanumeric runs longer than one char."""
+        import re
+
+        from claude_indexer.embeddings.bm25 import BM25Embedder
+
+        embedder = BM25Embedder(cache_dir=str(tmp_path))
+        texts = ["Parse_File(a, Bx) -> 42", "", "x y ZZ", "camelCase snake_case"]
+
+        expected = [
+            [t for t in re.findall(r"\b[a-zA-Z0-9]+\b", text.lower()) if len(t) > 1]
+            for text in texts
+        ]
+        assert embedder._tokenize_batch(texts) == expected
+        assert [embedder._preprocess_text(t) for t in texts] == expected
+
+    def test_encode_batch_matches_per_text_vectors(self, tmp_path):
+        """Each CSR row equals the vector generated for that text alone."""
+        from claude_indexer.embeddings.bm25 import BM25Embedder
+
+        corpus = [
+            "def parse file tree",
+            "class token stream",
+            "parse token value",
+            "walk tree nodes",
+        ]
+        embedder = BM25Embedder(cache_dir=str(tmp_path), corpus_size_limit=4)
+        embedder.fit_corpus(corpus)
+
+        queries = ["parse tree", "unknown words", "", "stream nodes nodes"]
+        matrix = embedder.encode_batch(queries)
+        results = embedder.embed_batch(queries)
+
+        assert matrix.shape[0] == len(queries)
+        for row, (query, result) in enumerate(zip(queries, results, strict=True)):
+            single = embedder._generate_sparse_vector(query)
+            start, end = matrix.indptr[row], matrix.indptr[row + 1]
+            assert matrix.indices[start:end].tolist() == single.indices
+            assert matrix.data[start:end].tolist() == pytest.approx(single.values)
+            assert result.embedding == single
+            assert result.token_count == len(embedder._preprocess_text(query))
+
+    def test_failed_batch_returns_empty_sparse_vectors(self, tmp_path):
+        """Error results still carry a SparseEmbedding with indices and values."""
+        from claude_indexer.embeddings.bm25 import BM25Embedder
+
+        embedder = BM25Embedder(cache_dir=str(tmp_path))
+        with patch.object(embedder, "_tokenize_batch", side_effect=ValueError("bad")):
+            results = embedder.embed_batch(["one text", "two"])
+
+        assert [r.error for r in results] == ["bad", "bad"]
+        assert all(r.embedding == SparseEmbedding([], []) for r in results)
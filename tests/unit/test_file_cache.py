@@ -0,0 +1,19 @@
+"""Tests for FileHashCache parse time history."""
+
+from pathlib import Path
+
+from claude_indexer.storage.file_cache import FileHashCache
+
+
+def test_parse_times_survive_update_and_reload(tmp_path: Path):
+    """Recorded parse times are kept by update_batch and saved to disk."""
+    source = tmp_path / "a.py"
+    source.write_text("x = 1\n")
+    cache = FileHashCache(tmp_path, "proj")
+
+    cache.record_parse_times({source: 12.345})
+    cache.update_batch([source])
+
+    reloaded = FileHashCache(tmp_path, "proj")
+    assert reloaded.get_parse_times([source, tmp_path / "b.py"]) == {source: 12.35}
+    assert not reloaded.has_changed(source)
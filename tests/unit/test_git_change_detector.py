@@ -449,3 +449,86 @@ R100\told.py\trenamed.py"""
         assert detector._should_skip(Path("/project/node_modules/pkg/index.js"))
         assert detector._should_skip(Path("/project/__pycache__/module.pyc"))
         assert not detector._should_skip(Path("/project/src/main.py"))
+
+
+def _git(repo: Path, *args: str) -> str:
+    import subprocess
+
+    return subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    """A repository with two committed files."""
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "a.py").write_text("a = 1\n")
+    (tmp_path / "b.py").write_text("b = 1\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+class TestBlobIds:
+    """Tests for GitChangeDetector.get_blob_ids."""
+
+    def test_clean_files_use_index_ids(self, git_repo: Path):
+        """Files matching the index are not hashed."""
+        detector = GitChangeDetector(git_repo)
+        files = [git_repo / "a.py", git_repo / "b.py"]
+
+        with patch.object(
+            detector, "_run_git_command", wraps=detector._run_git_command
+        ) as run:
+            blob_ids = detector.get_blob_ids(files)
+
+        assert blob_ids[git_repo / "a.py"] == _git(git_repo, "rev-parse", "HEAD:a.py").strip()
+        assert not any("hash-object" in c.args[0] for c in run.call_args_list)
+
+    def test_dirty_and_untracked_files_are_hashed(self, git_repo: Path):
+        """Modified and untracked files get the IDs git would give them."""
+        (git_repo / "a.py").write_text("a = 2\n")
+        (git_repo / "new.py").write_text("n = 1\n")
+        detector = GitChangeDetector(git_repo)
+
+        blob_ids = detector.get_blob_ids([git_repo / "a.py", git_repo / "new.py"])
+
+        for name in ("a.py", "new.py"):
+            expected = _git(git_repo, "hash-object", name).strip()
+            assert blob_ids[git_repo / name] == expected
+
+    def test_touch_does_not_change_id(self, git_repo: Path):
+        """A new mtime with the same content keeps the blob ID."""
+        import os
+
+        detector = GitChangeDetector(git_repo)
+        before = detector.get_blob_ids([git_repo / "a.py"])
+        stat = (git_repo / "a.py").stat()
+        os.utime(git_repo / "a.py", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert detector.get_blob_ids([git_repo / "a.py"]) == before
+
+    def test_non_git_returns_empty(self, tmp_path: Path):
+        """Outside git, callers fall back to content hashing."""
+        (tmp_path / "a.py").write_text("a = 1\n")
+
+        assert GitChangeDetector(tmp_path).get_blob_ids([tmp_path / "a.py"]) == {}
+
+    def test_detect_via_hash_compares_blob_ids(self, git_repo: Path):
+        """State recorded with blob IDs detects only real modifications."""
+        detector = GitChangeDetector(git_repo)
+        files = [git_repo / "a.py", git_repo / "b.py"]
+        state = {
+            f.name: {"oid": oid} for f, oid in detector.get_blob_ids(files).items()
+        }
+        (git_repo / "b.py").write_text("b = 2\n")
+
+        result = detector._detect_via_hash(state)
+
+        assert result.modified_files == [git_repo / "b.py"]
+        assert result.added_files == []
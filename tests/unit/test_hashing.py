@@ -1,6 +1,7 @@
 """Unit tests for file hashing functionality."""
 
 import hashlib
+from unittest.mock import MagicMock, patch
 
 from claude_indexer.indexer import CoreIndexer
 
@@ -388,3 +389,85 @@ class TestIncrementalIndexing:
         # All files should be found in full mode
         assert len(all_files) == 3
         assert set(all_files) == set(files)
+
+    def test_parse_times_persist_in_state(self, tmp_path):
+        """Measured parse times are saved and loaded for the next run."""
+        from claude_indexer.config import IndexerConfig
+
+        config = IndexerConfig()
+        config.state_directory = tmp_path
+        indexer = CoreIndexer(config, None, None, tmp_path)
+        files = [tmp_path / "slow.py", tmp_path / "new.py"]
+        for file_path in files:
+            file_path.write_text("x = 1")
+        indexer.parallel_processor = MagicMock(parse_times={str(files[0]): 1234.56})
+
+        indexer._update_state(files, "test", full_rebuild=True)
+
+        assert indexer._load_state("test")["slow.py"]["parse_ms"] == 1234.6
+        assert indexer._load_parse_times("test", files) == {files[0]: 1234.6}
+
+
+class TestGitBlobState:
+    """Tests for blob-ID based state in git repositories."""
+
+    @staticmethod
+    def _indexer(repo):
+        import subprocess
+
+        from claude_indexer.config import IndexerConfig
+
+        def git(*args):
+            subprocess.run(
+                ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+                cwd=repo,
+                capture_output=True,
+                check=True,
+            )
+
+        git("init", "-q")
+        for name in ("a.py", "b.py"):
+            (repo / name).write_text(f"{name[0]} = 1\n")
+        git("add", ".")
+        git("commit", "-q", "-m", "init")
+
+        config = IndexerConfig()
+        config.state_directory = repo / ".state"
+        return CoreIndexer(config, None, None, repo), git
+
+    def test_state_records_blob_ids(self, tmp_path):
+        """Tracked files are stored by blob ID instead of SHA256."""
+        indexer, _ = self._indexer(tmp_path)
+
+        state = indexer._get_current_state([tmp_path / "a.py"])
+
+        assert len(state["a.py"]["oid"]) == 40
+        assert "hash" not in state["a.py"]
+
+    def test_branch_switch_finds_changed_files(self, tmp_path):
+        """Checkout changes are found by blob ID, whatever their mtimes."""
+        indexer, git = self._indexer(tmp_path)
+        files = [tmp_path / "a.py", tmp_path / "b.py"]
+        indexer._update_state(files, "test", full_rebuild=True)
+
+        git("checkout", "-q", "-b", "feature")
+        (tmp_path / "b.py").write_text("b = 2\n")
+        git("commit", "-q", "-am", "change b")
+        git("checkout", "-q", "-")
+        indexer._update_state(files, "test", full_rebuild=True)
+        git("checkout", "-q", "feature")
+
+        with patch.object(indexer, "_find_all_files", return_value=files):
+            changed, deleted = indexer._find_changed_files(collection_name="test")
+
+        assert changed == [tmp_path / "b.py"]
+        assert deleted == []
+
+    def test_sha256_state_is_still_honoured(self, tmp_path):
+        """State written before blob IDs does not force a re-index."""
+        indexer, _ = self._indexer(tmp_path)
+        file_path = tmp_path / "a.py"
+        previous = {"a.py": {"hash": indexer._get_file_hash(file_path)}}
+        current = indexer._get_current_state([file_path])
+
+        assert not indexer._file_changed(file_path, "a.py", current, previous)
@@ -0,0 +1,189 @@
+"""Parity tests for the Jedi-free import resolution fast path."""
+
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from claude_indexer.analysis.entities import RelationType
+from claude_indexer.analysis.import_resolver import ImportResolver
+from claude_indexer.analysis.parser import PythonParser
+from claude_indexer.analysis.source_file import SourceFile
+
+PROJECT_FILES = {
+    "pkg/__init__.py": "from .models import Model\n",
+    "pkg/models.py": '''"""Models."""
+
+try:
+    import json as _json
+except ImportError:
+    _json = None
+
+
+class Model:
+    pass
+
+
+DEFAULT = Model()
+''',
+    "pkg/sub.py": "VALUE = 1\n",
+    "pkg/nested/__init__.py": "",
+    "pkg/nested/deep.py": '''from .. import sub
+from ..models import Model, DEFAULT
+from . import sibling
+from .missing import Ghost
+''',
+    "pkg/nested/sibling.py": "",
+    "app.py": '''"""Application entry point.
+
+import this_is_not_an_import
+"""
+from __future__ import annotations
+
+import os
+import os.path
+import json as j, sys
+import pkg.sub
+import pkg.sub as sub_alias
+from pkg import sub, Model
+from pkg import undefined_name
+from pkg.models import Model as M, DEFAULT
+from collections import OrderedDict, abc
+from concurrent import futures
+from typing import (
+    Any,
+    Optional,
+)
+from not_installed_anywhere import thing
+
+
+def main():
+    import pkg.nested.deep
+    from pkg.nested import sibling
+
+    class Local:
+        from pkg import models
+
+    return sibling, Local
+
+
+if __name__ == "__main__":
+    import argparse
+''',
+}
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Small project exercising absolute, relative and nested imports."""
+    for relative, content in PROJECT_FILES.items():
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return tmp_path
+
+
+def _imports(parser: PythonParser, file_path: Path) -> Counter:
+    result = parser.parse(file_path)
+    assert result.success, result.errors
+    return Counter(
+        r.to_entity for r in result.relations if r.relation_type == RelationType.IMPORTS
+    )
+
+
+class TestImportParity:
+    """The tree-sitter path produces the same IMPORTS relations as Jedi."""
+
+    @pytest.mark.parametrize("relative", sorted(PROJECT_FILES))
+    def test_imports_match_jedi(self, project, relative):
+        file_path = project / relative
+
+        jedi_imports = _imports(PythonParser(project, use_jedi=True), file_path)
+        fast_imports = _imports(PythonParser(project, use_jedi=False), file_path)
+
+        assert fast_imports == jedi_imports
+
+    def test_parity_on_indexer_sources(self):
+        """Parity holds on a real package: this repository's analysis modules."""
+        package = Path(__file__).parents[2] / "claude_indexer"
+        jedi_parser = PythonParser(package.parent, use_jedi=True)
+        fast_parser = PythonParser(package.parent, use_jedi=False)
+
+        for file_path in sorted((package / "analysis").glob("*.py")):
+            assert _imports(fast_parser, file_path) == _imports(
+                jedi_parser, file_path
+            ), file_path.name
+
+
+class TestImportResolver:
+    """Tests for ImportResolver module detection."""
+
+    def _names(self, project: Path, relative: str) -> dict[str, bool]:
+        parser = PythonParser(project, use_jedi=False)
+        file_path = project / relative
+        tree = parser._parse_with_tree_sitter(SourceFile.read(file_path))
+        resolver = ImportResolver(project)
+        return {
+            n.name: n.is_module for n in resolver.imported_names(tree.root_node, file_path)
+        }
+
+    def test_submodules_and_attributes(self, project):
+        """Submodules are modules; classes and values defined in a module are not."""
+        names = self._names(project, "app.py")
+
+        assert names["sub"] is True
+        assert names["Model"] is False
+        assert names["DEFAULT"] is False
+        assert names["futures"] is True
+
+    def test_unresolvable_names_are_modules(self, project):
+        """Like Jedi, names that cannot be inferred are reported as modules."""
+        names = self._names(project, "app.py")
+
+        assert names["thing"] is True
+        assert names["undefined_name"] is True
+
+    def test_relative_imports(self, project):
+        """Relative imports resolve against the importing file's package."""
+        names = self._names(project, "pkg/nested/deep.py")
+
+        assert names == {
+            "sub": True,
+            "Model": False,
+            "DEFAULT": False,
+            "sibling": True,
+            "Ghost": True,
+        }
+
+    def test_edited_modules_are_read_again(self, project):
+        """A name defined after the first parse is no longer reported as a module."""
+        parser = PythonParser(project, use_jedi=False)
+        file_path = project / "use_foo.py"
+        file_path.write_text("from pkg import foo\n")
+        assert _imports(parser, file_path)["foo"] == 1
+
+        init = project / "pkg" / "__init__.py"
+        init.write_text(init.read_text() + "\n\ndef foo():\n    pass\n")
+
+        assert _imports(parser, file_path)["foo"] == 0
+
+    def test_clear_cache_finds_added_modules(self, project):
+        """Modules added since a lookup are found once the cache is cleared."""
+        resolver = ImportResolver(project)
+        location = resolver._locate(project / "app.py", 0, ("pkg", "extra"))
+        assert location.kind == "missing"
+
+        (project / "pkg" / "extra.py").write_text("")
+        resolver.clear_cache()
+
+        assert resolver._locate(project / "app.py", 0, ("pkg", "extra")).kind == "module"
+
+    def test_parser_uses_jedi_only_for_deep_tier(self, project):
+        """Without an override, only deep-tier files are analyzed with Jedi."""
+        parser = PythonParser(project)
+        (project / "services").mkdir()
+        core_file = project / "services" / "billing.py"
+        core_file.write_text("import pkg\n")
+
+        assert parser._should_use_jedi(core_file)
+        assert not parser._should_use_jedi(project / "pkg" / "sub.py")
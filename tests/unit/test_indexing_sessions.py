@@ -0,0 +1,147 @@
+"""Tests for warm indexing sessions reused by long-running callers."""
+
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from claude_indexer import main
+from claude_indexer.analysis.entities import Entity, EntityType
+from claude_indexer.analysis.symbol_index import SymbolIndex
+from claude_indexer.indexer import CoreIndexer
+
+
+@pytest.fixture(autouse=True)
+def no_sessions():
+    """Each test starts and ends without cached sessions or clients."""
+    main.close_indexing_sessions()
+    yield
+    main.close_indexing_sessions()
+
+
+def _fake_components(project_path, *args, **kwargs):
+    indexer = MagicMock()
+    return (Path(project_path), MagicMock(), MagicMock(), MagicMock(), MagicMock(), indexer)
+
+
+class TestIndexingSessions:
+    """Tests for acquire_indexing_session and run_indexing_with_specific_files."""
+
+    def test_session_is_created_once_per_collection(self, tmp_path):
+        """Later batches reuse the components built for the first one."""
+        with patch.object(
+            main, "_create_indexer_components", side_effect=_fake_components
+        ) as create:
+            first = main.acquire_indexing_session(str(tmp_path), "proj")
+            first.release()
+            second = main.acquire_indexing_session(str(tmp_path), "proj")
+            second.release()
+            other = main.acquire_indexing_session(str(tmp_path), "other")
+            other.release()
+
+        assert first is second
+        assert other is not first
+        assert create.call_count == 2
+        assert create.call_args.kwargs["shared_clients"] is True
+
+    def test_acquire_resets_metrics_and_release_flushes(self, tmp_path):
+        """Each batch starts with fresh metrics and commits the parse cache."""
+        with patch.object(
+            main, "_create_indexer_components", side_effect=_fake_components
+        ):
+            session = main.acquire_indexing_session(str(tmp_path), "proj")
+            assert session.lock.locked()
+            session.release()
+
+        session.indexer.reset_session_metrics.assert_called_once()
+        session.indexer.parser_registry.flush_cache.assert_called_once()
+        assert not session.lock.locked()
+
+    def test_batches_for_one_collection_are_serialized(self, tmp_path):
+        """A second batch waits until the first releases the session."""
+        with patch.object(
+            main, "_create_indexer_components", side_effect=_fake_components
+        ):
+            session = main.acquire_indexing_session(str(tmp_path), "proj")
+            acquired = threading.Event()
+
+            def second_batch():
+                main.acquire_indexing_session(str(tmp_path), "proj")
+                acquired.set()
+
+            thread = threading.Thread(target=second_batch)
+            thread.start()
+            assert not acquired.wait(0.1)
+            session.release()
+            assert acquired.wait(2)
+            thread.join()
+            session.release()
+
+    def test_run_with_reuse_session_releases_on_error(self, tmp_path):
+        """The session is released even when indexing fails."""
+        with patch.object(
+            main, "_create_indexer_components", side_effect=_fake_components
+        ) as create:
+            session = main.acquire_indexing_session(str(tmp_path), "proj")
+            session.release()
+            session.indexer._get_state_file.side_effect = RuntimeError("boom")
+
+            ok = main.run_indexing_with_specific_files(
+                str(tmp_path), "proj", [tmp_path / "a.py"], quiet=True, reuse_session=True
+            )
+
+        assert ok is False
+        assert create.call_count == 1
+        assert not session.lock.locked()
+
+    def test_shared_clients_across_projects(self, tmp_path):
+        """Projects with the same settings share one vector store."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        config = MagicMock(embedding_provider="openai", openai_api_key="key")
+
+        with patch.object(main, "setup_logging"), patch.object(
+            main, "load_config", return_value=config
+        ), patch.object(
+            main, "create_embedder_from_config", side_effect=lambda _config: MagicMock()
+        ), patch.object(
+            main, "create_store_from_config", side_effect=lambda _config: MagicMock()
+        ) as create_store, patch.object(main, "CoreIndexer"):
+            a = main._create_indexer_components(
+                str(tmp_path / "a"), "a", quiet=True, shared_clients=True
+            )
+            b = main._create_indexer_components(
+                str(tmp_path / "b"), "b", quiet=True, shared_clients=True
+            )
+
+        assert a[4] is b[4]
+        assert a[3] is not b[3]  # embedders keep per-project disk caches
+        assert create_store.call_count == 1
+
+
+class TestSymbolIndexRefresh:
+    """Tests for CoreIndexer._extend_symbol_index."""
+
+    def test_stored_entities_join_cached_index(self):
+        """Names stored by one batch resolve in the next batch's parses."""
+        indexer = CoreIndexer.__new__(CoreIndexer)
+        indexer._cached_global_entities = {"existing"}
+        indexer._cached_symbol_index = SymbolIndex(indexer._cached_global_entities)
+
+        indexer._extend_symbol_index(
+            [Entity(name="added", entity_type=EntityType.FUNCTION)]
+        )
+
+        assert "added" in indexer._cached_symbol_index
+        assert "existing" in indexer._cached_symbol_index
+
+    def test_no_index_is_built_eagerly(self):
+        """Without a cached index there is nothing to extend."""
+        indexer = CoreIndexer.__new__(CoreIndexer)
+
+        indexer._extend_symbol_index(
+            [Entity(name="added", entity_type=EntityType.FUNCTION)]
+        )
+
+        assert getattr(indexer, "_cached_symbol_index", None) is None
@@ -0,0 +1,223 @@
+"""Tests for the persistent parallel parsing worker pool."""
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from claude_indexer import parallel_processor
+from claude_indexer.analysis.symbol_index import SymbolIndex
+from claude_indexer.parallel_processor import (
+    ParallelFileProcessor,
+    entity_to_dict,
+    parse_chunk_worker,
+    result_from_worker,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_worker_state():
+    """In-process worker state does not leak between tests."""
+    parallel_processor._worker_registries.clear()
+    parallel_processor._worker_symbol_version = 0
+    yield
+    parallel_processor._worker_registries.clear()
+    parallel_processor._worker_symbol_version = 0
+
+
+def _hanging_chunk_worker(args):
+    """Chunk worker that never finishes files named slow*."""
+    if any(path.name.startswith("slow") for path in args[0]):
+        time.sleep(60)
+    return parse_chunk_worker(args)
+
+
+def _crashing_chunk_worker(args):
+    """Chunk worker whose process dies on files named crash*."""
+    if any(path.name.startswith("crash") for path in args[0]):
+        os._exit(1)
+    return parse_chunk_worker(args)
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    (tmp_path / "a.py").write_text("def helper():\n    return 1\n")
+    (tmp_path / "b.py").write_text("def main():\n    return helper()\n")
+    return tmp_path
+
+
+class TestWorkerState:
+    """Tests for per-process state reused across tasks."""
+
+    def test_registry_built_once_per_project(self, project: Path):
+        """Chunks for the same project share one ParserRegistry."""
+        files = [project / "a.py", project / "b.py"]
+        with patch.object(
+            parallel_processor, "ParserRegistry", wraps=parallel_processor.ParserRegistry
+        ) as registry:
+            parse_chunk_worker((files[:1], "c", {}, project, None))
+            results = parse_chunk_worker((files[1:], "c", {}, project, None))
+
+        assert registry.call_count == 1
+        assert results[0]["status"] == "success"
+
+    def test_symbol_index_loaded_once_per_version(self, project: Path):
+        """Workers reload the published index only when its version changes."""
+        processor = ParallelFileProcessor(max_workers=1)
+        try:
+            ref = processor._publish_symbol_index(SymbolIndex({"helper"}))
+            assert processor._publish_symbol_index(processor._published_index) == ref
+
+            with patch.object(
+                parallel_processor.pickle, "load", wraps=parallel_processor.pickle.load
+            ) as load:
+                results = parse_chunk_worker(([project / "b.py"], "c", {}, project, ref))
+                parse_chunk_worker(([project / "a.py"], "c", {}, project, ref))
+
+            assert load.call_count == 1
+            relations = result_from_worker(results[0]).relations
+            calls = [r for r in relations if r.relation_type.value == "calls"]
+            assert [r.to_entity for r in calls] == ["helper"]
+        finally:
+            processor.shutdown()
+
+
+class TestParallelFileProcessor:
+    """Tests for ParallelFileProcessor pool reuse."""
+
+    def test_pool_is_reused_across_batches(self, project: Path):
+        """Batches run on the same worker processes until shutdown."""
+        processor = ParallelFileProcessor(max_workers=2)
+        files = [project / "a.py", project / "b.py"]
+        try:
+            first = processor.process_files_parallel(
+                files, "c", {}, symbol_index=SymbolIndex({"helper"}), project_root=project
+            )
+            executor = processor._executor
+            second = processor.process_files_parallel(
+                files, "c", {}, project_root=project
+            )
+
+            assert processor._executor is executor
+            assert sorted(r["file_path"] for r in first) == sorted(map(str, files))
+            assert all(r["status"] == "success" for r in first + second)
+        finally:
+            processor.shutdown()
+
+        assert processor._executor is None
+        assert processor._symbol_dir is None
+
+
+class TestCostScheduling:
+    """Tests for cost-ordered chunking and runaway parse cancellation."""
+
+    def test_estimate_prefers_measured_time(self, project: Path):
+        """Recorded parse times replace the size-based estimate."""
+        processor = ParallelFileProcessor(max_workers=1)
+        (project / "big.py").write_text("x = 1\n" * 5000)
+
+        assert processor.estimate_cost(project / "big.py") > processor.estimate_cost(
+            project / "a.py"
+        )
+        processor.parse_times[str(project / "a.py")] = 5000.0
+        assert processor.estimate_cost(project / "a.py") == 5000.0
+
+    def test_longest_first_and_tiny_files_grouped(self, project: Path):
+        """Expensive files run alone and first; cheap ones share a task."""
+        processor = ParallelFileProcessor(max_workers=2)
+        tiny = [project / f"t{i}.py" for i in range(6)]
+        for path in tiny:
+            path.write_text("x = 1\n")
+        processor.parse_times[str(project / "a.py")] = 100.0
+
+        chunks = processor._plan_chunks(tiny + [project / "a.py"])
+
+        assert chunks[0] == ([project / "a.py"], 100.0)
+        assert len(chunks) == 2
+        assert sorted(chunks[1][0]) == sorted(tiny)
+
+    def test_runaway_parse_kills_worker(self, project: Path):
+        """A parse past its deadline is reported without blocking the batch."""
+        (project / "slow.py").write_text("x = 1\n")
+        processor = ParallelFileProcessor(max_workers=2, parse_timeout=3)
+        files = [project / "a.py", project / "slow.py"]
+        processor.parse_times.update({str(f): 1.0 for f in files})
+        try:
+            with patch.object(
+                parallel_processor, "parse_chunk_worker", _hanging_chunk_worker
+            ):
+                start = time.monotonic()
+                results = processor.process_files_parallel(
+                    files, "c", {}, project_root=project
+                )
+            elapsed = time.monotonic() - start
+        finally:
+            processor.shutdown()
+
+        by_file = {Path(r["file_path"]).name: r for r in results}
+        assert elapsed < 30
+        assert by_file["a.py"]["status"] == "success"
+        assert "timed out" in by_file["slow.py"]["error"]
+        assert processor.parse_times[str(project / "slow.py")] == 3000.0
+
+
+    def test_estimated_timeout_is_capped(self):
+        """Costly estimates extend the timeout only up to a fixed multiple."""
+        processor = ParallelFileProcessor(max_workers=1, parse_timeout=30)
+
+        assert processor._task_timeout(1.0) == 30
+        assert processor._task_timeout(3000.0) == 60
+        assert processor._task_timeout(30_000.0) == (
+            parallel_processor.MAX_TIMEOUT_FACTOR * 30
+        )
+
+    def test_tasks_lost_to_crashed_worker_are_retried(self, project: Path):
+        """Only the file that keeps killing its worker is reported."""
+        (project / "crash.py").write_text("x = 1\n")
+        processor = ParallelFileProcessor(max_workers=2)
+        files = [project / "a.py", project / "b.py", project / "crash.py"]
+        try:
+            with patch.object(
+                parallel_processor, "parse_chunk_worker", _crashing_chunk_worker
+            ):
+                results = processor.process_files_parallel(
+                    files, "c", {}, project_root=project
+                )
+        finally:
+            processor.shutdown()
+
+        by_file = {Path(r["file_path"]).name: r for r in results}
+        assert len(results) == 3
+        assert by_file["a.py"]["status"] == "success"
+        assert by_file["b.py"]["status"] == "success"
+        assert by_file["crash.py"]["error"] == "Worker pool terminated abruptly"
+
+
+class TestResultTransport:
+    """Tests for the encoded worker result format."""
+
+    def test_payload_round_trips_parse(self, project: Path):
+        """Decoded payloads match parsing the file in-process."""
+        from claude_indexer.analysis.parser import ParserRegistry
+
+        result = parse_chunk_worker(([project / "a.py"], "c", {}, project, None))[0]
+        expected = ParserRegistry(project).parse_file(project / "a.py")
+        decoded = result_from_worker(result)
+
+        assert "entities" not in result
+        assert decoded.entities == expected.entities
+        assert decoded.relations == expected.relations
+        assert decoded.implementation_chunks == expected.implementation_chunks
+
+    def test_dict_fallback_when_not_encodable(self, project: Path):
+        """Results the row format cannot hold are sent as dictionaries."""
+        with patch.object(
+            parallel_processor, "encode_result", side_effect=ValueError("unencodable")
+        ):
+            result = parse_chunk_worker(([project / "a.py"], "c", {}, project, None))[0]
+
+        assert "payload" not in result
+        decoded = result_from_worker(result)
+        assert [entity_to_dict(e) for e in decoded.entities] == result["entities"]
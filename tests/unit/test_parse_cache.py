@@ -0,0 +1,207 @@
+"""Tests for the SQLite-backed parse result cache."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from claude_indexer.analysis.entities import Entity, EntityType, RelationType
+from claude_indexer.analysis.parse_cache import CachedParserResult, ParseResultCache
+from claude_indexer.analysis.parser import ParserRegistry, ParserResult
+
+SOURCE = '''"""Example module."""
+
+import os
+
+
+class Greeter:
+    """Says hello."""
+
+    def greet(self, name):
+        return format_name(name)
+
+
+def format_name(name):
+    return os.path.basename(name).title()
+'''
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    (tmp_path / "example.py").write_text(SOURCE)
+    return tmp_path
+
+
+@pytest.fixture
+def cache(project: Path):
+    cache = ParseResultCache(project / ".index_cache")
+    yield cache
+    cache.close()
+
+
+def _parse(project: Path, cache: ParseResultCache) -> ParserResult:
+    return ParserRegistry(project, parse_cache=cache).parse_file(project / "example.py")
+
+
+class TestParseResultCache:
+    """Tests for ParseResultCache storage and lookup."""
+
+    def test_cached_result_matches_parse(self, project, cache):
+        """A cache hit reproduces the parsed entities, relations and chunks."""
+        parsed = _parse(project, cache)
+        cache.flush()
+
+        cached = _parse(project, cache)
+
+        assert isinstance(cached, CachedParserResult)
+        assert cached.entities == parsed.entities
+        assert cached.relations == parsed.relations
+        assert cached.implementation_chunks == parsed.implementation_chunks
+        assert cached.file_hash == parsed.file_hash
+        assert cached.success
+
+    def test_relations_record_their_source_file(self, project, cache):
+        """Parsed and cached relations carry the file they were parsed from."""
+        parsed = _parse(project, cache)
+        cache.flush()
+        cached = _parse(project, cache)
+
+        source = str(project / "example.py")
+        assert parsed.relations
+        assert all(r.metadata["file_path"] == source for r in parsed.relations)
+        assert all(r.metadata["file_path"] == source for r in cached.relations)
+
+    def test_calls_resolve_against_current_project_names(self, tmp_path, cache):
+        """Cache hits resolve CALLS against the names known at lookup time."""
+        path = tmp_path / "main.py"
+        path.write_text("def main():\n    helper()\n")
+        registry = ParserRegistry(tmp_path, parse_cache=cache)
+
+        def calls(result):
+            return [
+                (r.from_entity, r.to_entity)
+                for r in result.relations
+                if r.relation_type == RelationType.CALLS
+            ]
+
+        assert calls(registry.parse_file(path)) == []
+        cache.flush()
+        cached = registry.parse_file(path, global_entity_names={"helper"})
+
+        assert isinstance(cached, CachedParserResult)
+        assert calls(cached) == [("main", "helper")]
+        assert calls(registry.parse_file(path)) == []
+
+    def test_unchanged_file_is_not_read(self, project, cache):
+        """Files whose size and mtime match the manifest skip reading and hashing."""
+        _parse(project, cache)
+
+        with patch(
+            "claude_indexer.analysis.parser.SourceFile.read",
+            side_effect=AssertionError("file was read"),
+        ):
+            cached = _parse(project, cache)
+
+        assert isinstance(cached, CachedParserResult)
+
+    def test_modified_file_is_reparsed(self, project, cache):
+        """A content change misses the manifest and the content hash."""
+        _parse(project, cache)
+        file_path = project / "example.py"
+        file_path.write_text(SOURCE + "\n\ndef added():\n    pass\n")
+        stat = file_path.stat()
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        result = _parse(project, cache)
+
+        assert not isinstance(result, CachedParserResult)
+        assert "added" in {e.name for e in result.entities}
+
+    def test_touched_file_is_served_by_content_hash(self, project, cache):
+        """A new mtime with the same content re-hashes but does not re-parse."""
+        _parse(project, cache)
+        file_path = project / "example.py"
+        stat = file_path.stat()
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert isinstance(_parse(project, cache), CachedParserResult)
+        assert cache.lookup(file_path, file_path.stat()) is not None
+
+    def test_persists_across_instances(self, project, cache):
+        """Flushed entries are found by a new cache on the same directory."""
+        parsed = _parse(project, cache)
+        cache.close()
+
+        reopened = ParseResultCache(project / ".index_cache")
+        try:
+            cached = _parse(project, reopened)
+            assert isinstance(cached, CachedParserResult)
+            assert cached.entities == parsed.entities
+            assert len(reopened) == 1
+        finally:
+            reopened.close()
+
+    def test_other_path_with_same_content_misses(self, project, cache):
+        """Results hold file paths, so they are not shared between files."""
+        _parse(project, cache)
+        copy = project / "copy.py"
+        copy.write_text(SOURCE)
+
+        result = ParserRegistry(project, parse_cache=cache).parse_file(copy)
+
+        assert not isinstance(result, CachedParserResult)
+        assert all(e.file_path == copy for e in result.entities if e.file_path)
+
+    def test_unencodable_results_are_not_cached(self, project, cache):
+        """Results holding values the encoder cannot store are skipped."""
+        entity = Entity(
+            name="x",
+            entity_type=EntityType.FUNCTION,
+            metadata={"path": Path("/not/encodable")},
+        )
+        result = ParserResult(project / "x.py", entities=[entity], relations=[])
+
+        cache.set("deadbeef", result)
+
+        assert cache.get("deadbeef", project / "x.py") is None
+
+    def test_evicts_least_recently_used(self, project):
+        """Exceeding max_entries evicts the oldest quarter of entries."""
+        cache = ParseResultCache(project / ".index_cache", max_entries=4)
+        try:
+            for i in range(5):
+                result = ParserResult(project / f"f{i}.py", entities=[], relations=[])
+                cache.set(f"hash{i}", result)
+                cache.flush()
+
+            assert len(cache) == 4
+            assert cache.get("hash0", project / "f0.py") is None
+            assert cache.get("hash4", project / "f4.py") is not None
+        finally:
+            cache.close()
+
+
+class TestCachedParserResult:
+    """Tests for lazy hydration of cached results."""
+
+    def test_counts_do_not_hydrate(self, project, cache):
+        """Counting entities and relations leaves them encoded."""
+        parsed = _parse(project, cache)
+        cached = _parse(project, cache)
+
+        assert cached.entity_count == parsed.entity_count
+        assert cached._entities is None
+        # Resolving CALLS reads entities and chunks; relation rows stay encoded
+        assert cached.relation_count == parsed.relation_count
+        assert cached._relations is None
+
+    def test_hydrated_entities_share_file_paths(self, project, cache):
+        """Entities of one file share a single Path object."""
+        _parse(project, cache)
+        cached = _parse(project, cache)
+
+        paths = {id(e.file_path) for e in cached.entities if e.file_path}
+
+        assert len(paths) == 1
+        assert all(isinstance(e.entity_type, EntityType) for e in cached.entities)
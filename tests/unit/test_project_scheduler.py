@@ -0,0 +1,168 @@
+"""Tests for the shared multi-project indexing scheduler."""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from claude_indexer.watcher.scheduler import ProjectScheduler
+
+
+def _optimizer(batch_size=10, memory_pressure=False):
+    optimizer = MagicMock()
+    optimizer.get_batch_size.return_value = batch_size
+    optimizer.current_size = batch_size
+    optimizer.check_memory.return_value = (100.0, memory_pressure)
+    return optimizer
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = ProjectScheduler(max_workers=1, batch_optimizer=_optimizer())
+    yield scheduler
+    scheduler.stop(timeout=2)
+
+
+class TestProjectScheduler:
+    """Tests for ProjectScheduler queueing and fairness."""
+
+    def test_status_reports_depth_and_lag(self, scheduler):
+        """Queued files are counted and aged per project."""
+        scheduler.register("/a", "coll-a", MagicMock())
+        scheduler.submit("/a", [Path("/a/x.py"), Path("/a/y.py"), Path("/a/x.py")])
+        time.sleep(0.05)
+
+        status = scheduler.get_status()["/a"]
+
+        assert status["collection"] == "coll-a"
+        assert status["queue_depth"] == 2
+        assert status["lag_seconds"] >= 0.05
+        assert not status["in_flight"]
+
+    def test_most_recently_active_project_goes_first(self, scheduler):
+        """The project changed last is indexed before idle ones."""
+        order = []
+        scheduler.register("/a", "a", lambda _paths: order.append("a"))
+        scheduler.register("/b", "b", lambda _paths: order.append("b"))
+        scheduler.submit("/a", [Path("/a/x.py")])
+        scheduler.submit("/b", [Path("/b/x.py")])
+
+        scheduler.start()
+        _wait_for(lambda: len(order) == 2)
+
+        assert order == ["b", "a"]
+
+    def test_overdue_project_is_not_starved(self, scheduler):
+        """A project past the lag budget runs before the active one."""
+        scheduler.max_lag_seconds = 0.05
+        order = []
+        scheduler.register("/a", "a", lambda _paths: order.append("a"))
+        scheduler.register("/b", "b", lambda _paths: order.append("b"))
+        scheduler.submit("/a", [Path("/a/x.py")])
+        time.sleep(0.1)
+        scheduler.submit("/b", [Path("/b/x.py")])
+
+        scheduler.start()
+        _wait_for(lambda: len(order) == 2)
+
+        assert order == ["a", "b"]
+
+    def test_batches_are_sized_by_optimizer(self):
+        """Each batch takes at most the optimizer's batch size and is recorded."""
+        optimizer = _optimizer(batch_size=2)
+        batches = []
+        scheduler = ProjectScheduler(max_workers=1, batch_optimizer=optimizer)
+        scheduler.register("/a", "a", batches.append)
+        scheduler.submit("/a", [Path(f"/a/{i}.py") for i in range(5)])
+
+        scheduler.start()
+        try:
+            _wait_for(lambda: sum(map(len, batches)) == 5)
+        finally:
+            scheduler.stop(timeout=2)
+
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert optimizer.record_batch.call_count == 3
+
+    def test_one_batch_in_flight_per_project(self):
+        """A project's next batch waits for its previous one, others proceed."""
+        release = threading.Event()
+        started = []
+
+        def slow(paths):
+            started.append(paths[0])
+            release.wait(2)
+
+        scheduler = ProjectScheduler(max_workers=3, batch_optimizer=_optimizer(1))
+        scheduler.register("/a", "a", slow)
+        scheduler.register("/b", "b", slow)
+        scheduler.submit("/a", [Path("/a/1.py"), Path("/a/2.py")])
+        scheduler.submit("/b", [Path("/b/1.py")])
+
+        scheduler.start()
+        try:
+            _wait_for(lambda: len(started) == 2)
+            time.sleep(0.05)
+            assert sorted(map(str, started)) == ["/a/1.py", "/b/1.py"]
+            assert scheduler.get_status()["/a"]["queue_depth"] == 1
+            release.set()
+            _wait_for(lambda: len(started) == 3)
+        finally:
+            release.set()
+            scheduler.stop(timeout=2)
+
+    def test_memory_pressure_limits_concurrency(self):
+        """Over the memory threshold only one batch runs at a time."""
+        release = threading.Event()
+        running = []
+
+        def slow(paths):
+            running.append(paths[0])
+            release.wait(2)
+
+        scheduler = ProjectScheduler(
+            max_workers=2, batch_optimizer=_optimizer(memory_pressure=True)
+        )
+        scheduler.register("/a", "a", slow)
+        scheduler.register("/b", "b", slow)
+        scheduler.submit("/a", [Path("/a/1.py")])
+        scheduler.submit("/b", [Path("/b/1.py")])
+
+        scheduler.start()
+        try:
+            _wait_for(lambda: len(running) == 1)
+            time.sleep(0.1)
+            assert len(running) == 1
+        finally:
+            release.set()
+            scheduler.stop(timeout=2)
+
+    def test_failed_batch_is_recorded_as_errors(self, scheduler):
+        """An exception from the project callback does not kill the worker."""
+        done = []
+        scheduler.register("/a", "a", MagicMock(side_effect=RuntimeError("boom")))
+        scheduler.register("/b", "b", done.append)
+        scheduler.submit("/a", [Path("/a/x.py")])
+
+        scheduler.start()
+        _wait_for(lambda: scheduler.get_status()["/a"]["batches_processed"] == 1)
+        scheduler.submit("/b", [Path("/b/x.py")])
+        _wait_for(lambda: done)
+
+        metrics = scheduler.batch_optimizer.record_batch.call_args_list[0].args[0]
+        assert metrics.error_count == 1
+
+    def test_submit_to_unregistered_project_is_dropped(self, scheduler):
+        """Batches for removed projects are ignored."""
+        scheduler.submit("/gone", [Path("/gone/x.py")])
+
+        assert scheduler.get_status() == {}
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
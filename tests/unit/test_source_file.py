@@ -0,0 +1,102 @@
+"""Unit tests for single-read source file ingestion."""
+
+import builtins
+import hashlib
+from unittest.mock import patch
+
+import pytest
+
+from claude_indexer.analysis.parser import PythonParser
+from claude_indexer.analysis.source_file import SourceFile
+
+PYTHON_CODE = '''"""Module docstring."""
+import os
+
+
+def read(path):
+    """Read a file."""
+    with open(path) as f:
+        return f.read()
+
+
+class Reader:
+    def run(self):
+        return read(os.getcwd())
+'''
+
+
+class TestSourceFile:
+    """Tests for SourceFile views."""
+
+    def test_hash_matches_raw_bytes(self, tmp_path):
+        """sha256 is the digest of the bytes on disk."""
+        path = tmp_path / "a.py"
+        path.write_bytes(b"x = 1\r\ny = 2\r\n")
+
+        source = SourceFile.read(path)
+
+        assert source.sha256 == hashlib.sha256(b"x = 1\r\ny = 2\r\n").hexdigest()
+        assert source.text == "x = 1\ny = 2\n"
+
+    @pytest.mark.parametrize("text", ["", "a", "a\nb", "a\nb\n", "\n\nc\n\n"])
+    def test_line_span_matches_join(self, tmp_path, text):
+        """line_span is equivalent to joining a slice of lines."""
+        path = tmp_path / "a.py"
+        path.write_text(text)
+        source = SourceFile.read(path)
+        lines = text.split("\n")
+
+        for start in range(len(lines) + 1):
+            for end in range(start, len(lines) + 1):
+                assert source.line_span(start, end) == "\n".join(
+                    lines[start : end + 1]
+                )
+
+    def test_invalid_utf8_fails_on_text_access(self, tmp_path):
+        """Bytes and hash stay available for files that do not decode."""
+        path = tmp_path / "a.py"
+        path.write_bytes(b"\xff\xfe")
+        source = SourceFile.read(path)
+
+        assert source.sha256
+        with pytest.raises(UnicodeDecodeError):
+            _ = source.text
+
+
+class TestSingleReadParsing:
+    """Tests that PythonParser reads each file once."""
+
+    def test_parse_reads_file_once(self, tmp_path):
+        """Hashing, tree-sitter, Jedi and chunking share one read."""
+        path = tmp_path / "reader.py"
+        path.write_text(PYTHON_CODE)
+        parser = PythonParser(tmp_path)
+        real_open = builtins.open
+        opened = []
+
+        def tracking_open(file, *args, **kwargs):
+            if str(file) == str(path):
+                opened.append(file)
+            return real_open(file, *args, **kwargs)
+
+        with patch("builtins.open", side_effect=tracking_open):
+            result = parser.parse(path)
+
+        assert result.success
+        assert len(opened) == 1
+        assert result.file_hash == hashlib.sha256(PYTHON_CODE.encode()).hexdigest()
+        assert any(e.name == "Reader" for e in result.entities)
+
+    def test_parse_accepts_preread_source(self, tmp_path):
+        """A caller-supplied SourceFile is parsed instead of the file on disk."""
+        path = tmp_path / "reader.py"
+        path.write_text(PYTHON_CODE)
+        source = SourceFile.read(path)
+        path.write_text("def replaced():\n    pass\n")
+
+        result = PythonParser(tmp_path).parse(path, source=source)
+
+        assert result.success
+        assert source.tree is not None
+        chunks = {c.entity_name: c for c in result.implementation_chunks or []}
+        assert chunks["read"].content.startswith("def read(path):")
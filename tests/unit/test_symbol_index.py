@@ -0,0 +1,73 @@
+"""Unit tests for the shared global symbol index."""
+
+import pickle
+from pathlib import Path
+
+from claude_indexer.analysis.entities import EntityChunk, RelationType
+from claude_indexer.analysis.parser import PythonParser
+from claude_indexer.analysis.symbol_index import EMPTY_SYMBOL_INDEX, SymbolIndex
+
+
+def _chunk(name: str, calls: list[str]) -> EntityChunk:
+    return EntityChunk(
+        id=f"a.py::{name}::implementation",
+        entity_name=name,
+        chunk_type="implementation",
+        content=f"def {name}(): ...",
+        metadata={"semantic_metadata": {"calls": calls}},
+    )
+
+
+class TestSymbolIndex:
+    """Tests for SymbolIndex construction and lookup."""
+
+    def test_membership_and_size(self):
+        """Empty names are dropped; the rest are members."""
+        index = SymbolIndex(["parse", "", "Indexer"])
+
+        assert "parse" in index
+        assert "missing" not in index
+        assert len(index) == 2
+
+    def test_resolves_local_before_global(self):
+        """Names defined in the current file resolve without being indexed."""
+        index = SymbolIndex(["remote"])
+
+        assert index.resolves("remote")
+        assert index.resolves("local", {"local"})
+        assert not index.resolves("unknown", {"local"})
+
+    def test_of_reuses_existing_storage(self):
+        """Indexes pass through and sets are wrapped without copying."""
+        index = SymbolIndex(["a"])
+        names = {"a", "b"}
+
+        assert SymbolIndex.of(index) is index
+        assert SymbolIndex.of(None) is EMPTY_SYMBOL_INDEX
+        assert SymbolIndex.of(names)._names is names
+
+    def test_pickles_as_frozen_index(self):
+        """Worker processes receive an equivalent read-only index."""
+        restored = pickle.loads(pickle.dumps(SymbolIndex.of({"a", "b"})))
+
+        assert isinstance(restored._names, frozenset)
+        assert set(restored) == {"a", "b"}
+
+
+class TestIndexedCallsResolution:
+    """Tests for CALLS resolution against the symbol index."""
+
+    def test_calls_resolved_against_local_and_global_names(self, tmp_path):
+        """Only calls to known entities become relations."""
+        parser = PythonParser(tmp_path)
+        chunks = [_chunk("main", ["helper", "remote", "print"])]
+
+        relations = parser._create_calls_relations_from_chunks(
+            chunks, Path("a.py"), {"main", "helper"}, SymbolIndex(["remote"])
+        )
+
+        assert [(r.from_entity, r.to_entity) for r in relations] == [
+            ("main", "helper"),
+            ("main", "remote"),
+        ]
+        assert all(r.relation_type == RelationType.CALLS for r in relations)
@@ -241,6 +241,104 @@ class TestQdrantStore:
                 assert not result.success
                 assert "does not exist" in result.errors[0]
 
+    def test_upsert_points_pipelined_batches(self):
+        """Multiple batches are sent unacknowledged, then one barrier write."""
+        with patch("claude_indexer.storage.qdrant.QDRANT_AVAILABLE", True):
+            with patch(
+                "claude_indexer.storage.qdrant.QdrantClient"
+            ) as mock_client_class:
+                mock_client = MagicMock()
+                mock_client.get_collections.return_value = MagicMock()
+                mock_client.count.return_value = MagicMock(count=5)
+                mock_client_class.return_value = mock_client
+
+                store = QdrantStore(upsert_concurrency=3)
+
+                qdrant_points = [MagicMock(id=i, payload={}) for i in range(5)]
+                result = store._reliable_batch_upsert(
+                    "test_collection",
+                    qdrant_points,
+                    start_time=0.0,
+                    max_batch_size=2,
+                    max_in_flight=store.upsert_concurrency,
+                )
+
+                assert result.success
+                assert result.items_processed == 5
+
+                calls = mock_client.upsert.call_args_list
+                batch_calls, barrier_call = calls[:-1], calls[-1]
+                assert len(batch_calls) == 3
+                assert all(call[1]["wait"] is False for call in batch_calls)
+                assert barrier_call[1]["wait"] is True
+                assert len(barrier_call[1]["points"]) == 1
+
+    def test_upsert_points_pipelined_batch_retry(self):
+        """A timed-out batch is retried on its own without failing the others."""
+        from qdrant_client.http.exceptions import ResponseHandlingException
+
+        with patch("claude_indexer.storage.qdrant.QDRANT_AVAILABLE", True):
+            with patch(
+                "claude_indexer.storage.qdrant.QdrantClient"
+            ) as mock_client_class, patch(
+                "claude_indexer.storage.qdrant.time.sleep"
+            ):
+                mock_client = MagicMock()
+                mock_client.get_collections.return_value = MagicMock()
+                mock_client.count.return_value = MagicMock(count=4)
+                mock_client_class.return_value = mock_client
+
+                failures = {"left": 1}
+
+                def flaky_upsert(collection_name, points, wait):
+                    if points[0].id == 2 and failures["left"]:
+                        failures["left"] -= 1
+                        raise ResponseHandlingException(TimeoutError("timed out"))
+                    return True
+
+                mock_client.upsert.side_effect = flaky_upsert
+
+                store = QdrantStore(upsert_concurrency=2)
+                result = store._reliable_batch_upsert(
+                    "test_collection",
+                    [MagicMock(id=i, payload={}) for i in range(4)],
+                    start_time=0.0,
+                    max_batch_size=2,
+                    max_in_flight=2,
+                )
+
+                assert result.success
+                assert result.items_processed == 4
+                # Two batches, one retry, one barrier
+                assert mock_client.upsert.call_count == 4
+
+    def test_upsert_workers_leave_warning_filters_alone(self):
+        """Concurrent batch upserts never swap the process-wide warning filters."""
+        with patch("claude_indexer.storage.qdrant.QDRANT_AVAILABLE", True):
+            with patch(
+                "claude_indexer.storage.qdrant.QdrantClient"
+            ) as mock_client_class:
+                mock_client = MagicMock()
+                mock_client.get_collections.return_value = MagicMock()
+                mock_client.count.return_value = MagicMock(count=6)
+                mock_client_class.return_value = mock_client
+
+                store = QdrantStore(upsert_concurrency=3)
+                with patch(
+                    "claude_indexer.storage.qdrant.warnings.catch_warnings",
+                    side_effect=AssertionError("catch_warnings in upsert worker"),
+                ):
+                    result = store._reliable_batch_upsert(
+                        "test_collection",
+                        [MagicMock(id=i, payload={}) for i in range(6)],
+                        start_time=0.0,
+                        max_batch_size=2,
+                        max_in_flight=3,
+                    )
+
+                assert result.success
+                assert result.items_processed == 6
+
     def test_delete_points_success(self):
         """Test successful point deletion."""
         with patch("claude_indexer.storage.qdrant.QDRANT_AVAILABLE", True):
@@ -264,6 +362,28 @@ class TestQdrantStore:
                     collection_name="test_collection", points_selector=point_ids
                 )
 
+    def test_find_existing_point_ids_batches_lookups(self):
+        """Test point existence lookup by ID in batches."""
+        with patch("claude_indexer.storage.qdrant.QDRANT_AVAILABLE", True):
+            with patch(
+                "claude_indexer.storage.qdrant.QdrantClient"
+            ) as mock_client_class:
+                mock_client = MagicMock()
+                mock_client.retrieve.side_effect = lambda ids, **_: [
+                    MagicMock(id=point_id) for point_id in ids if point_id % 2 == 0
+                ]
+                mock_client_class.return_value = mock_client
+
+                store = QdrantStore()
+                with patch.object(store, "collection_exists", return_value=True):
+                    existing = store.find_existing_point_ids(
+                        "test_collection", [1, 2, 3, 4, 2], batch_size=2
+                    )
+
+                assert existing == {2, 4}
+                assert mock_client.retrieve.call_count == 2
+                assert mock_client.retrieve.call_args.kwargs["with_vectors"] is False
+
     def test_search_similar_success(self):
         """Test successful similarity search."""
         with patch("claude_indexer.storage.qdrant.QDRANT_AVAILABLE", True):
@@ -706,15 +826,15 @@ class TestQdrantStore:
                 ),  # Valid
             ]
 
-            # Mock the _scroll_collection method directly
+            # Mock the streaming scroll directly
             with (
-                patch.object(store, "_scroll_collection") as mock_scroll_collection,
+                patch.object(store, "_iter_scroll_collection") as mock_scroll_collection,
                 patch.object(store, "collection_exists", return_value=True),
                 patch.object(store, "delete_points") as mock_delete_points,
             ):
-                # The new implementation gets all points in one call and processes them
+                # The implementation streams all points in one scan and processes them
                 all_points = mock_entity_points + mock_relation_points
-                mock_scroll_collection.return_value = all_points
+                mock_scroll_collection.return_value = iter(all_points)
 
                 mock_delete_points.return_value = StorageResult(
                     success=True, operation="delete", items_processed=2
@@ -735,6 +855,7 @@ class TestQdrantStore:
 
                 # Verify scroll was called once (unified approach)
                 assert mock_scroll_collection.call_count == 1
+                assert "content" not in mock_scroll_collection.call_args[1]["with_payload"]
 
     @patch("claude_indexer.storage.qdrant.QdrantClient")
     def test_cleanup_orphaned_relations_no_orphans(self, mock_client_class):
@@ -844,6 +965,121 @@ class TestQdrantStore:
                 # Verify error handled gracefully
                 assert result == 0
 
+    @patch("claude_indexer.storage.qdrant.QdrantClient")
+    def test_iter_scroll_collection_streams_pages(self, mock_client_class):
+        """Pages are fetched lazily with the requested payload projection."""
+        with patch("claude_indexer.storage.qdrant.QDRANT_AVAILABLE", True):
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            mock_client.scroll.side_effect = [
+                ([MagicMock(id=1), MagicMock(id=2)], "page2"),
+                ([MagicMock(id=3)], None),
+            ]
+
+            store = QdrantStore()
+            points = store._iter_scroll_collection(
+                "test_collection", limit=2, with_payload=["entity_name"]
+            )
+
+            assert next(points).id == 1
+            assert mock_client.scroll.call_count == 1
+            assert [p.id for p in points] == [2, 3]
+            assert mock_client.scroll.call_count == 2
+
+            second_call = mock_client.scroll.call_args[1]
+            assert second_call["offset"] == "page2"
+            assert second_call["with_payload"] == ["entity_name"]
+            assert second_call["with_vectors"] is False
+
+    @patch("claude_indexer.storage.qdrant.QdrantClient")
+    def test_iter_scroll_collection_propagates_errors(self, mock_client_class):
+        """A failed page raises instead of silently truncating the scan."""
+        with patch("claude_indexer.storage.qdrant.QDRANT_AVAILABLE", True):
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            mock_client.scroll.side_effect = [
+                ([MagicMock(id=1)], "page2"),
+                Exception("Connection error"),
+            ]
+
+            store = QdrantStore()
+
+            with pytest.raises(Exception, match="Connection error"):
+                list(store._iter_scroll_collection("test_collection"))
+
+    @patch("claude_indexer.storage.qdrant.QdrantClient")
+    def test_cleanup_detects_phantom_calls_from_source_implementations(
+        self, mock_client_class
+    ):
+        """Phantom checks fetch implementation chunks only for call sources."""
+        with patch("claude_indexer.storage.qdrant.QDRANT_AVAILABLE", True):
+            mock_client_class.return_value = MagicMock()
+            store = QdrantStore()
+
+            entities = [
+                MagicMock(payload={"entity_name": name, "chunk_type": "metadata"})
+                for name in ("caller", "kept", "dropped")
+            ]
+            relations = [
+                MagicMock(
+                    id=rel_id,
+                    payload={
+                        "type": "chunk",
+                        "chunk_type": "relation",
+                        "entity_name": "caller",
+                        "relation_target": target,
+                        "relation_type": "calls",
+                    },
+                )
+                for rel_id, target in (("rel_kept", "kept"), ("rel_dropped", "dropped"))
+            ]
+            implementation = MagicMock(
+                payload={
+                    "entity_name": "caller",
+                    "chunk_type": "implementation",
+                    "content": "def caller():\n    kept()\n",
+                }
+            )
+
+            with (
+                patch.object(
+                    store,
+                    "_iter_scroll_collection",
+                    side_effect=[iter(entities + relations), iter([implementation])],
+                ) as mock_scroll,
+                patch.object(store, "collection_exists", return_value=True),
+                patch.object(store, "delete_points") as mock_delete_points,
+            ):
+                mock_delete_points.return_value = StorageResult(
+                    success=True, operation="delete", items_processed=1
+                )
+
+                result = store._cleanup_orphaned_relations("test_collection", force=True)
+
+                assert result == 1
+                mock_delete_points.assert_called_once_with(
+                    "test_collection", ["rel_dropped"]
+                )
+                phantom_scan = mock_scroll.call_args_list[1][1]
+                assert phantom_scan["scroll_filter"].must[1].match.any == ["caller"]
+
+    def test_to_sparse_vector_from_sparse_embedding(self):
+        """SparseEmbedding converts to a Qdrant SparseVector without densifying."""
+        from claude_indexer.embeddings.base import SparseEmbedding
+
+        sparse = QdrantStore._to_sparse_vector(
+            SparseEmbedding(indices=[2, 90000], values=[0.5, 1.5])
+        )
+
+        assert sparse.indices == [2, 90000]
+        assert sparse.values == [0.5, 1.5]
+
+    def test_to_sparse_vector_from_dense_list(self):
+        """Legacy dense lists keep only their positive weights."""
+        sparse = QdrantStore._to_sparse_vector([0.0, 0.7, 0.0, 0.2])
+
+        assert sparse.indices == [1, 3]
+        assert sparse.values == pytest.approx([0.7, 0.2])
 
 class TestVectorPoint:
     """Test VectorPoint data structure."""